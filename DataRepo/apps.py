@@ -3,3 +3,11 @@ from django.apps import AppConfig
 
 class DatarepoConfig(AppConfig):
     name = "DataRepo"
+
+    def ready(self):
+        from DataRepo.models.hier_cached_model import (
+            connect_data_write_signals,
+        )
+
+        # Values derived from the data (e.g. search indexes) are versioned by every write (see get_data_version)
+        connect_data_write_signals(self.get_models())
@@ -20,6 +20,7 @@ from DataRepo.formats.dataformat_group_query import (
     set_first_empty_query,
 )
 from DataRepo.models.utilities import get_model_by_name
+from DataRepo.profiling import profile_scope
 
 SAFE_TIMEOUT_SECS = max(settings.GATEWAY_TIMEOUT - 5, 0)
 
@@ -584,9 +585,10 @@ class FormatGroup:
             "available": self.stats_available(fmt),
         }
         if generate_stats:
-            data, based_on = self.get_query_stats(
-                results, fmt, time_limit_secs=SAFE_TIMEOUT_SECS
-            )
+            with profile_scope("search_format", fmt):
+                data, based_on = self.get_query_stats(
+                    results, fmt, time_limit_secs=SAFE_TIMEOUT_SECS
+                )
             stats["data"] = data
             stats["based_on"] = based_on
             stats["show"] = True
@@ -617,7 +619,8 @@ class FormatGroup:
         results = results.distinct(*distinct_fields)
 
         # Count the total results after employing distinct.  Limit/offset are only used for paging.
-        cnt = results.count()
+        with profile_scope("search_format", fmt):
+            cnt = results.count()
 
         # Limit
         if limit is not None:
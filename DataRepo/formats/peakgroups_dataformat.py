@@ -127,7 +127,7 @@ class PeakGroupsFormat(Format):
                 },
                 "total_abundance": {
                     "displayname": "Total Abundance",
-                    "searchable": False,  # Cannot search cached property
+                    "searchable": True,
                     "displayed": True,
                     "type": "number",
                 },
@@ -155,13 +155,13 @@ class PeakGroupsFormat(Format):
                 },
                 "enrichment_fraction": {
                     "displayname": "Enrichment Fraction",
-                    "searchable": False,  # Cannot search cached property
+                    "searchable": True,
                     "displayed": True,
                     "type": "number",
                 },
                 "enrichment_abundance": {
                     "displayname": "Enrichment Abundance",
-                    "searchable": False,  # Cannot search cached property
+                    "searchable": False,  # Cannot search property
                     "displayed": True,
                     "type": "number",
                 },
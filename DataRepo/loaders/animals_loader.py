@@ -500,6 +500,7 @@ class AnimalsLoader(TableLoader):
             elif created:
                 rec.full_clean()
                 self.created(Animal.__name__)
+                self.loaded_animal_ids.add(rec.id)
             else:
                 self.existed(Animal.__name__)
         except Exception as e:
@@ -514,8 +515,32 @@ class AnimalsLoader(TableLoader):
             # The timedelta error should cause a rollback, if no other exception occurred.
             raise RollbackException()
 
+        self.lookup_index.add(rec, name=name)
+
         return rec, created
 
+    def preload_lookups(self):
+        """Bulk-loads the infusates, treatments, and studies referenced in the sheet into the shared lookup index.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.lookup_index.preload(
+            Infusate, "name", self.get_column_values(self.headers.INFUSATE)
+        )
+        self.lookup_index.preload(
+            Protocol, "name", self.get_column_values(self.headers.TREATMENT)
+        )
+        study_names = set()
+        for names_str in self.get_column_values(self.headers.STUDY):
+            for name in str(names_str).split(self.study_delimiter):
+                study_names.add(name.strip())
+        self.lookup_index.preload(Study, "name", study_names)
+
     def get_infusate(self, name):
         """Get an Infusate record.
 
@@ -537,7 +562,10 @@ class AnimalsLoader(TableLoader):
         try:
             # This will only work for pre-existing records, but it produces a simpler error.  Records created during the
             # current load will not have names yet (due to deferred autoupdates).
-            rec = Infusate.objects.get(**query_dict)
+            rec = self.lookup_index.get(Infusate, **query_dict)
+            if rec is None:
+                rec = Infusate.objects.get(**query_dict)
+                self.lookup_index.add(rec, **query_dict)
         except Exception as e:
             try:
                 # The infusate name can have a value that doesn't follow the format using significant figures (see
@@ -579,7 +607,10 @@ class AnimalsLoader(TableLoader):
         query_dict = {"name": name}
 
         try:
-            rec = Protocol.objects.get(**query_dict)
+            rec = self.lookup_index.get(Protocol, **query_dict)
+            if rec is None:
+                rec = Protocol.objects.get(**query_dict)
+                self.lookup_index.add(rec, **query_dict)
         except Exception as e:
             # Package errors (like IntegrityError and ValidationError) with relevant details
             # This also updates the skip row indexes
@@ -610,7 +641,10 @@ class AnimalsLoader(TableLoader):
             query_dict = {"name": name.strip()}
 
             try:
-                rec = Study.objects.get(**query_dict)
+                rec = self.lookup_index.get(Study, **query_dict)
+                if rec is None:
+                    rec = Study.objects.get(**query_dict)
+                    self.lookup_index.add(rec, **query_dict)
                 recs.append(rec)
             except Exception as e:
                 # Package errors (like IntegrityError and ValidationError) with relevant details
@@ -0,0 +1,339 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Type
+
+from django.db.models import F, Model
+from django.db.models.functions import Lower
+
+
+class LookupIndex:
+    """An in-memory index of database records, keyed on the values that loaders use to look them up (e.g. names and
+    synonyms).
+
+    Loaders resolve foreign keys one row at a time, which results in repeated queries for the same records.  A
+    LookupIndex is bulk-loaded with the records matching the (unique) values in a loader's dataframe (see
+    TableLoader.preload_lookups) and is shared by every loader in a StudyLoader run, which adds the records it creates.
+
+    The index only ever contains positive matches.  A miss does not mean that a record does not exist (it could have
+    been created by code that does not update the index), so loaders must fall back to their original query upon a miss
+    (and add the result).  That fallback is also what generates the errors about missing or ambiguous records.
+
+    Records indexed inside a rolled back transaction may no longer exist, so loaders index records inside atomic() (see
+    TableLoader.load_wrapper), which undoes the changes made to the index if the (transaction's) block raises.
+
+    Example:
+        index = LookupIndex()
+        index.preload(Tissue, "name", ["Brain", "Serum"])
+        tissue = index.get(Tissue, name="Brain")
+        if tissue is None:
+            tissue = Tissue.objects.get(name="Brain")
+            index.add(tissue, name="Brain")
+
+    Instance Attributes:
+        index (Dict[tuple, dict]): Records (or AMBIGUOUS) keyed on normalized value tuples, in a dict keyed on index
+            keys.  See _get_index_key.
+        journal (List[Tuple[tuple, tuple, object]]): The index key, value key, and previous value (None if there was
+            none) of every change made to the index inside atomic(), to be able to undo them.
+        atomic_depth (int): The number of nested atomic() blocks.
+    """
+
+    # Value stored when a lookup value matches multiple distinct records.  It causes get() to return None, so that the
+    # loader performs its original query, which raises/buffers the appropriate error.
+    AMBIGUOUS = "AMBIGUOUS"
+
+    # The number of values to include in each bulk IN query
+    CHUNK_SIZE = 5000
+
+    # Compounds are looked up by name or synonym (case-insensitive).  See Compound.get_name_query_expression.
+    COMPOUND_LOOKUP_FIELDS = ["name", "synonyms__name"]
+
+    def __init__(self):
+        self.index: Dict[tuple, dict] = defaultdict(dict)
+        self.journal: List[Tuple[tuple, tuple, object]] = []
+        self.atomic_depth = 0
+
+    @classmethod
+    def _get_index_key(
+        cls, model: Type[Model], fields: Iterable, iexact: bool = False
+    ) -> tuple:
+        """Returns the key of the index for the supplied model and lookup fields.
+
+        Args:
+            model (Type[Model])
+            fields (Iterable[str]): Field paths, e.g. ["name"] or ["lc_method__name", "date"].
+            iexact (bool) [False]: Whether the lookup is case-insensitive.
+        Exceptions:
+            None
+        Returns:
+            (tuple)
+        """
+        return (model.__name__, tuple(sorted(fields)), iexact)
+
+    @classmethod
+    def _normalize(cls, value, iexact: bool = False):
+        """Normalizes a lookup value.
+
+        Args:
+            value (object)
+            iexact (bool) [False]: Whether the lookup is case-insensitive.
+        Exceptions:
+            None
+        Returns:
+            value (object)
+        """
+        if iexact and isinstance(value, str):
+            return value.lower()
+        return value
+
+    @classmethod
+    def _get_value_key(cls, lookups: dict, iexact: bool = False) -> tuple:
+        """Returns the tuple of normalized values, ordered by field path.
+
+        Args:
+            lookups (dict): Values keyed on field path.
+            iexact (bool) [False]: Whether the lookup is case-insensitive.
+        Exceptions:
+            None
+        Returns:
+            (tuple)
+        """
+        return tuple(cls._normalize(lookups[f], iexact=iexact) for f in sorted(lookups))
+
+    def _set(self, index_key: tuple, value_key: tuple, rec: Model):
+        """Adds a record to the index, marking the value as AMBIGUOUS if a different record is already indexed.
+
+        Args:
+            index_key (tuple)
+            value_key (tuple)
+            rec (Model)
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        existing = self.index[index_key].get(value_key)
+        if self.atomic_depth > 0:
+            self.journal.append((index_key, value_key, existing))
+        if existing is None or (
+            existing is not self.AMBIGUOUS and existing.pk == rec.pk
+        ):
+            self.index[index_key][value_key] = rec
+        else:
+            self.index[index_key][value_key] = self.AMBIGUOUS
+
+    def preload(
+        self, model: Type[Model], field: str, values: Iterable, iexact=False
+    ) -> int:
+        """Bulk-loads the records whose field value is among the supplied values.
+
+        Args:
+            model (Type[Model])
+            field (str): A field path, e.g. "name" or "synonyms__name".
+            values (Iterable): Lookup values, e.g. from a dataframe column.  None values are ignored.
+            iexact (bool) [False]: Whether the lookup is case-insensitive.
+        Exceptions:
+            None
+        Returns:
+            (int): The number of records indexed.
+        """
+        index_key = self._get_index_key(model, [field], iexact=iexact)
+        # Only query for values that have not already been indexed
+        unique_values: List = sorted(
+            set(
+                self._normalize(v, iexact=iexact)
+                for v in values
+                if v is not None
+                and (self._normalize(v, iexact=iexact),) not in self.index[index_key]
+            ),
+            key=str,
+        )
+        expression = Lower(field) if iexact else F(field)
+        num = 0
+        for start in range(0, len(unique_values), self.CHUNK_SIZE):
+            end = start + self.CHUNK_SIZE
+            chunk = unique_values[start:end]
+            for rec in model.objects.annotate(_lookup_key=expression).filter(
+                _lookup_key__in=chunk
+            ):
+                self._set(index_key, (rec._lookup_key,), rec)
+                num += 1
+        return num
+
+    def get(self, model: Type[Model], iexact=False, **lookups) -> Optional[Model]:
+        """Returns the indexed record matching the lookups, if any.
+
+        Args:
+            model (Type[Model])
+            iexact (bool) [False]: Whether the lookup is case-insensitive.
+            lookups (dict): Values keyed on field path, e.g. name="Brain".
+        Exceptions:
+            None
+        Returns:
+            rec (Optional[Model]): None if the record is not indexed or the lookup is ambiguous.
+        """
+        index_key = self._get_index_key(model, lookups.keys(), iexact=iexact)
+        rec = self.index[index_key].get(self._get_value_key(lookups, iexact=iexact))
+        if rec is self.AMBIGUOUS:
+            return None
+        return rec
+
+    def get_by_any(
+        self, model: Type[Model], value, fields: List[str], iexact=False
+    ) -> Optional[Model]:
+        """Returns the indexed record whose value for any of the supplied fields matches the value, as long as every
+        match is the same record (i.e. an OR query expecting a distinct result).
+
+        Args:
+            model (Type[Model])
+            value (object)
+            fields (List[str]): Field paths, e.g. ["name", "synonyms__name"].
+            iexact (bool) [False]: Whether the lookup is case-insensitive.
+        Exceptions:
+            None
+        Returns:
+            rec (Optional[Model])
+        """
+        rec = None
+        for field in fields:
+            index_key = self._get_index_key(model, [field], iexact=iexact)
+            match = self.index[index_key].get((self._normalize(value, iexact=iexact),))
+            if match is None:
+                continue
+            if match is self.AMBIGUOUS or (rec is not None and rec.pk != match.pk):
+                return None
+            rec = match
+        return rec
+
+    def add(self, rec: Optional[Model], iexact=False, **lookups):
+        """Adds a (e.g. newly created) record to the index.
+
+        Args:
+            rec (Optional[Model]): None is ignored (for convenience).
+            iexact (bool) [False]: Whether the lookup is case-insensitive.
+            lookups (dict): Values keyed on field path, e.g. name="Brain".
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if rec is None:
+            return
+        self._set(
+            self._get_index_key(type(rec), lookups.keys(), iexact=iexact),
+            self._get_value_key(lookups, iexact=iexact),
+            rec,
+        )
+
+    def preload_compounds(self, names: Iterable) -> int:
+        """Bulk-loads Compound records by name or synonym.
+
+        Args:
+            names (Iterable[str]): Compound names and/or synonyms.
+        Exceptions:
+            None
+        Returns:
+            (int): The number of records indexed.
+        """
+        # This avoids circular import
+        from DataRepo.models.compound import Compound
+
+        names = list(names)
+        return sum(
+            self.preload(Compound, field, names, iexact=True)
+            for field in self.COMPOUND_LOOKUP_FIELDS
+        )
+
+    def get_compound(self, name: Optional[str]):
+        """Returns the Compound whose name or synonym matches the supplied name (case-insensitive), if indexed.
+
+        Args:
+            name (Optional[str]): Compound name or synonym.
+        Exceptions:
+            None
+        Returns:
+            rec (Optional[Compound])
+        """
+        # This avoids circular import
+        from DataRepo.models.compound import Compound
+
+        if name is None:
+            return None
+        return self.get_by_any(Compound, name, self.COMPOUND_LOOKUP_FIELDS, iexact=True)
+
+    def add_compound(self, rec, name: Optional[str] = None):
+        """Adds a Compound record to the index under the supplied name or synonym (or its own name if not supplied).
+
+        Args:
+            rec (Optional[Compound])
+            name (Optional[str]): The compound's name or one of its synonyms.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if rec is None:
+            return
+        if name is None or name.lower() == rec.name.lower():
+            self.add(rec, iexact=True, name=rec.name)
+        else:
+            self.add(rec, iexact=True, synonyms__name=name)
+
+    @contextmanager
+    def atomic(self):
+        """Undoes the changes made to the index inside the block if the block raises an exception, e.g. along with a
+        rolled back transaction.atomic block, so that records that were rolled back are not resolved from the index.
+        Blocks can be nested.
+
+        Usage:
+            with index.atomic(), transaction.atomic():
+                load_records()
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        start = len(self.journal)
+        self.atomic_depth += 1
+        try:
+            yield
+        except BaseException:
+            self.rollback(start)
+            raise
+        finally:
+            self.atomic_depth -= 1
+            if self.atomic_depth == 0:
+                self.journal = []
+
+    def rollback(self, start: int = 0):
+        """Undoes the changes to the index recorded in the journal (see atomic) from the supplied position onward.
+
+        Args:
+            start (int) [0]: A position in the journal.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        for index_key, value_key, previous in reversed(self.journal[start:]):
+            if previous is None:
+                self.index[index_key].pop(value_key, None)
+            else:
+                self.index[index_key][value_key] = previous
+        del self.journal[start:]
+
+    def clear(self):
+        """Empties the index.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.index = defaultdict(dict)
+        self.journal = []
@@ -0,0 +1,347 @@
+from io import StringIO
+from typing import Dict, List, Set, Tuple, Type
+
+from django.db import connections, transaction
+from django.db.models import ForeignKey, Model, UniqueConstraint
+
+
+class StagingTable:
+    """A buffer of new records of one model that are inserted into the model's table with a single set-based merge,
+    instead of 1 ORM create per record.
+
+    Records are assigned primary keys from the table's sequence (in blocks) as they are added, so that records of other
+    models (e.g. PeakDataLabel) can reference them before they are inserted.  flush() then:
+
+    1. COPYs the buffered records into a temporary (i.e. session-local, unlogged) copy of the model's table.
+    2. Validates them with SQL joins against the live tables: unresolvable foreign keys and unique constraint conflicts
+       (with the live table or among the staged records themselves).
+    3. Inserts the valid records into the live table with a single INSERT ... SELECT.
+
+    It is up to the caller to validate field values (e.g. via full_clean) before adding records, and to handle the
+    records that flush rejects (e.g. by processing them individually via the ORM, to generate the usual errors).
+
+    This is PostgreSQL-specific.  Note that no model methods (e.g. save overrides or signals) are called for the
+    inserted records, so the caller must do what they would have done (e.g. auto-update the maintained fields of the
+    records' parents, see MaintainedModel.trigger_autoupdates).
+
+    Example:
+        stage = StagingTable(PeakData)
+        rec = stage.add(PeakData(peak_group=pgrec, corrected_abundance=10.0))
+        inserted_ids, rejected_ids = stage.flush()
+
+    Instance Attributes:
+        model (Type[Model])
+        using (str): The database alias.
+        records (Dict[int, Model]): Buffered records keyed on their (pre-assigned) primary keys.
+    """
+
+    # The number of primary keys to allocate from the sequence at a time
+    ID_BLOCK_SIZE = 1000
+
+    def __init__(self, model: Type[Model], using: str = "default"):
+        self.model = model
+        self.using = using
+        self.records: Dict[int, Model] = {}
+        self.id_pool: List[int] = []
+        self.fields = list(model._meta.concrete_fields)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, pk):
+        return pk in self.records
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def quote(self, name: str) -> str:
+        """Quotes a table or column name.
+
+        Args:
+            name (str)
+        Exceptions:
+            None
+        Returns:
+            (str)
+        """
+        return self.connection.ops.quote_name(name)
+
+    def get_staging_table_name(self) -> str:
+        """Returns the name of the temporary table the records are copied into.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (str)
+        """
+        return f"staging_{self.model._meta.db_table.lower()}"
+
+    def allocate_id(self) -> int:
+        """Returns the next primary key value from the table's sequence, fetching them in blocks.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (int)
+        """
+        if len(self.id_pool) == 0:
+            pk_column = self.model._meta.pk.column
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+                    [
+                        self.quote(self.model._meta.db_table),
+                        pk_column,
+                        self.ID_BLOCK_SIZE,
+                    ],
+                )
+                # Reversed, so that pop() returns them in ascending order
+                self.id_pool = [row[0] for row in cursor.fetchall()][::-1]
+        return self.id_pool.pop()
+
+    def add(self, rec: Model) -> Model:
+        """Buffers an unsaved record, assigning it a primary key (if it does not already have one).
+
+        Args:
+            rec (Model): An unsaved record.
+        Exceptions:
+            None
+        Returns:
+            rec (Model): The same record, with its primary key set.
+        """
+        if rec.pk is None:
+            rec.pk = self.allocate_id()
+        self.records[rec.pk] = rec
+        return rec
+
+    def get_column_names(self) -> List[str]:
+        """Returns the names of the table's columns.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (List[str])
+        """
+        return [f.column for f in self.fields]
+
+    @classmethod
+    def to_csv_value(cls, value) -> str:
+        """Converts a database value to a value in a CSV line for COPY.  Strings are always quoted, because (in CSV
+        format) COPY interprets an unquoted empty value as NULL.
+
+        Args:
+            value (object)
+        Exceptions:
+            None
+        Returns:
+            (str)
+        """
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return '"' + value.replace('"', '""') + '"'
+        return str(value)
+
+    def get_unique_fields(self) -> List[list]:
+        """Returns the field sets of the model's unconditional unique constraints (other than the primary key).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (List[List[Field]])
+        """
+        unique_sets = []
+        for field in self.fields:
+            if field.unique and not field.primary_key:
+                unique_sets.append([field])
+        for fields in self.model._meta.unique_together:
+            unique_sets.append([self.model._meta.get_field(f) for f in fields])
+        for constraint in self.model._meta.constraints:
+            if (
+                isinstance(constraint, UniqueConstraint)
+                and constraint.condition is None
+                and len(constraint.fields) > 0
+            ):
+                unique_sets.append(
+                    [self.model._meta.get_field(f) for f in constraint.fields]
+                )
+        return unique_sets
+
+    def get_unique_field_sets(self) -> List[List[str]]:
+        """Returns the column sets of the model's unconditional unique constraints (other than the primary key).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (List[List[str]]): Lists of column names.
+        """
+        return [[f.column for f in fields] for fields in self.get_unique_fields()]
+
+    def get_duplicate_ids(self) -> Set[int]:
+        """Returns the primary keys of the buffered records that conflict on a unique constraint with a buffered record
+        with a lower primary key.  Unlike get_invalid_ids, this does not query the database, i.e. it does not check for
+        conflicts with live records (e.g. for records whose foreign keys refer to other buffered records, which cannot
+        conflict with live records).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            duplicate_ids (Set[int])
+        """
+        duplicate_ids = set()
+        for fields in self.get_unique_fields():
+            seen = set()
+            for pk in sorted(self.records.keys()):
+                key = tuple(getattr(self.records[pk], f.attname) for f in fields)
+                if key in seen:
+                    duplicate_ids.add(pk)
+                else:
+                    seen.add(key)
+        return duplicate_ids
+
+    def clear(self):
+        """Discards the buffered records, e.g. after validating them with get_duplicate_ids (in a mode that does not
+        insert them).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.records = {}
+
+    def copy_to_staging_table(self, cursor):
+        """Creates the (temporary) staging table and COPYs the buffered records into it.
+
+        Args:
+            cursor (CursorWrapper)
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        staging_table = self.quote(self.get_staging_table_name())
+        columns = ", ".join(self.quote(c) for c in self.get_column_names())
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {staging_table} "
+            f"(LIKE {self.quote(self.model._meta.db_table)} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        buffer = StringIO()
+        for rec in self.records.values():
+            buffer.write(
+                ",".join(
+                    self.to_csv_value(
+                        field.get_db_prep_value(
+                            getattr(rec, field.attname), self.connection
+                        )
+                    )
+                    for field in self.fields
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor.copy_expert(
+            f"COPY {staging_table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+
+    def get_invalid_ids(self, cursor) -> Set[int]:
+        """Returns the primary keys of the staged records that cannot be inserted, i.e. those with foreign keys that do
+        not resolve to a record and those that conflict on a unique constraint with a live record or with a staged
+        record with a lower primary key.
+
+        Args:
+            cursor (CursorWrapper)
+        Exceptions:
+            None
+        Returns:
+            invalid_ids (Set[int])
+        """
+        staging_table = self.quote(self.get_staging_table_name())
+        live_table = self.quote(self.model._meta.db_table)
+        pk = self.quote(self.model._meta.pk.column)
+        queries = []
+
+        for field in self.fields:
+            if not isinstance(field, ForeignKey):
+                continue
+            related_table = self.quote(field.related_model._meta.db_table)
+            related_column = self.quote(field.target_field.column)
+            column = self.quote(field.column)
+            queries.append(
+                f"SELECT s.{pk} FROM {staging_table} s LEFT JOIN {related_table} r ON r.{related_column} = s.{column} "
+                f"WHERE s.{column} IS NOT NULL AND r.{related_column} IS NULL"
+            )
+
+        for columns in self.get_unique_field_sets():
+            conditions = " AND ".join(
+                f"o.{self.quote(c)} = s.{self.quote(c)}" for c in columns
+            )
+            queries.append(
+                f"SELECT s.{pk} FROM {staging_table} s JOIN {live_table} o ON {conditions}"
+            )
+            queries.append(
+                f"SELECT s.{pk} FROM {staging_table} s JOIN {staging_table} o ON {conditions} AND o.{pk} < s.{pk}"
+            )
+
+        if len(queries) == 0:
+            return set()
+
+        cursor.execute(" UNION ".join(queries))
+        return set(row[0] for row in cursor.fetchall())
+
+    def flush(self) -> Tuple[List[int], List[int]]:
+        """Inserts the valid buffered records into the live table and empties the buffer.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            inserted_ids (List[int]): Primary keys of the inserted records.
+            rejected_ids (List[int]): Primary keys of the records that were not inserted.  See get_invalid_ids.
+        """
+        if len(self.records) == 0:
+            return [], []
+
+        staging_table = self.quote(self.get_staging_table_name())
+        live_table = self.quote(self.model._meta.db_table)
+        pk = self.quote(self.model._meta.pk.column)
+        columns = ", ".join(self.quote(c) for c in self.get_column_names())
+
+        with transaction.atomic(using=self.using):
+            with self.connection.cursor() as cursor:
+                self.copy_to_staging_table(cursor)
+                rejected_ids = self.get_invalid_ids(cursor)
+                if len(rejected_ids) > 0:
+                    cursor.execute(
+                        f"DELETE FROM {staging_table} WHERE {pk} = ANY(%s)",
+                        [list(rejected_ids)],
+                    )
+                cursor.execute(
+                    f"INSERT INTO {live_table} ({columns}) SELECT {columns} FROM {staging_table} ORDER BY {pk}"
+                )
+                cursor.execute(f"DROP TABLE {staging_table}")
+
+        inserted_ids = [pk for pk in self.records.keys() if pk not in rejected_ids]
+        for rec_id in inserted_ids:
+            self.records[rec_id]._state.adding = False
+            self.records[rec_id]._state.db = self.using
+        rejected = sorted(rejected_ids)
+        self.records = {}
+
+        return inserted_ids, rejected
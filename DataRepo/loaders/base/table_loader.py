@@ -3,7 +3,7 @@ import re
 from abc import ABC, abstractmethod
 from collections import defaultdict, namedtuple
 from collections.abc import Iterable
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Set, Type
 
 import pandas as pd
 from django.core.exceptions import (
@@ -16,12 +16,14 @@ from django.db.models import Model, Q, UniqueConstraint
 from django.db.utils import ProgrammingError
 from django.forms import model_to_dict
 
+from DataRepo.loaders.base.lookup_index import LookupIndex
 from DataRepo.models.maintained_model import AutoUpdateFailed
 from DataRepo.models.utilities import (
     get_model_fields,
     is_key_field,
     is_many_related_to_parent,
 )
+from DataRepo.profiling import profile_scope
 from DataRepo.utils.exceptions import (
     AggregatedErrors,
     AggregatedErrorsSet,
@@ -227,6 +229,7 @@ class TableLoader(ABC):
         headers=None,
         defaults=None,
         extra_headers=None,
+        lookup_index=None,
         _validate=False,
     ):
         """Constructor.
@@ -251,6 +254,8 @@ class TableLoader(ABC):
             defaults (Optional[DefaultsTableHeaders namedtuple]): default values by header key.
             extra_headers (Optional[List[str]]): Use for dynamic headers (different in every file).  To allow any
                 unknown header, supply an empty list.
+            lookup_index (Optional[LookupIndex]): An index of records used to resolve foreign keys, shared by the
+                loaders called by another loader (e.g. StudyLoader).  A new one is created if not supplied.
             _validate (bool): If true, runs in validate mode, perhaps better described as "non-curator mode".  This is
                 intended for use by the web validation interface.  It's similar to dry-run mode, in that it never
                 commits anything, but it also raises warnings as fatal (so they can be reported through the web
@@ -335,6 +340,12 @@ class TableLoader(ABC):
         # For dynamic headers
         self.extra_headers = extra_headers
 
+        # For bulk foreign key resolution (see preload_lookups)
+        self.lookup_index = LookupIndex() if lookup_index is None else lookup_index
+
+        # The IDs of the animals whose data the load created or changed (see refresh_last_peak_groups)
+        self.loaded_animal_ids: Set[int] = set()
+
         # Metadata
         self.initialize_metadata()
 
@@ -2222,6 +2233,58 @@ class TableLoader(ABC):
         """
         return self.tableheaders_to_dict_by_header_name(self.get_defaults())
 
+    def preload_lookups(self):
+        """Derived classes can override this method to bulk-load the records they will look up by value (e.g. name)
+        into self.lookup_index, restricted to the values in self.df.  It is called by the load_data wrapper, before
+        load_data.
+
+        Example:
+            self.lookup_index.preload(Tissue, "name", self.get_column_values(self.headers.TISSUE))
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        pass
+
+    def prefetch(self):
+        """Derived classes can override this method to start work that depends neither on the database nor on other
+        loaders (e.g. reading input files) in the background.  StudyLoader calls it on all of its loaders before any of
+        them load, so that the work overlaps with the loading of the preceding sheets.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        pass
+
+    def get_column_values(self, header: str) -> List:
+        """Returns the unique non-empty (stripped) values of a column in self.df.
+
+        Args:
+            header (str): Header name.
+        Exceptions:
+            None
+        Returns:
+            values (List[object])
+        """
+        if self.df is None or header not in self.df.columns:
+            return []
+        values = set()
+        for val in self.df[header].unique():
+            if isinstance(val, str):
+                # get_row_val strips values by default
+                val = val.strip()
+            if val is not None and str(val) not in self.none_vals:
+                values.add(val)
+        return list(values)
+
     @classmethod
     def _loader(cls):
         """Class method that returns a decorator function.
@@ -2259,13 +2322,26 @@ class TableLoader(ABC):
                 """
                 retval = None
                 aes_set = None
-                with transaction.atomic():
+                # The changes to the (possibly shared) lookup index are undone if the transaction is rolled back
+                with self.lookup_index.atomic(), transaction.atomic():
                     try:
+                        loader_name = type(self).__name__
+
                         # Caller may have already manually checked the dataframes
                         if not self.df_checked:
-                            self.check_dataframe()
+                            with profile_scope(
+                                "loader", f"{loader_name}.check_dataframe"
+                            ):
+                                self.check_dataframe()
+
+                        if self.df is not None:
+                            with profile_scope(
+                                "loader", f"{loader_name}.preload_lookups"
+                            ):
+                                self.preload_lookups()
 
-                        retval = fn(*args, **kwargs)
+                        with profile_scope("loader", f"{loader_name}.load_data"):
+                            retval = fn(*args, **kwargs)
 
                     except MultiLoadStatus:
                         # In the event that a MultiLoadStatus exception is raised, there is nothing left to do.  All
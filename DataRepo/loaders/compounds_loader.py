@@ -258,6 +258,7 @@ class CompoundsLoader(TableLoader):
                 self.created(Compound.__name__)
             else:
                 self.existed(Compound.__name__)
+            self.lookup_index.add_compound(rec)
 
         except Exception as e:
             if isinstance(e, IntegrityError) and "DataRepo_compoundsynonym_pkey" in str(
@@ -311,6 +312,7 @@ class CompoundsLoader(TableLoader):
                 self.created(CompoundSynonym.__name__)
             else:
                 self.existed(CompoundSynonym.__name__)
+            self.lookup_index.add_compound(cmpd_rec, synonym)
 
         except SynonymExistsAsMismatchedCompound as seamc:
             self.aggregated_errors_object.buffer_error(seamc)
@@ -1385,7 +1385,10 @@ class InfusatesLoader(TableLoader):
             tmp_compound_name = tmptndata["compound_name"]
 
             # See if we can find the compound record using the parsed compound name
-            compound = Compound.compound_matching_name_or_synonym(tmp_compound_name)
+            compound = self.lookup_index.get_compound(tmp_compound_name)
+            if compound is None:
+                compound = Compound.compound_matching_name_or_synonym(tmp_compound_name)
+                self.lookup_index.add_compound(compound, tmp_compound_name)
 
             # If we got a compound, and the parsed name from the tracer does not match, it must be a synonym
             if (
@@ -235,6 +235,7 @@ class LCProtocolsLoader(TableLoader):
                 self.created(LCMethod.__name__)
             else:
                 self.existed(LCMethod.__name__)
+            self.lookup_index.add(rec, name=computed_name)
 
         except Exception as e:
             # Package errors (like IntegrityError and ValidationError) with relevant details
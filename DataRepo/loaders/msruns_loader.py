@@ -30,6 +30,11 @@ from DataRepo.models.hier_cached_model import (
     disable_caching_updates,
     enable_caching_updates,
 )
+from DataRepo.models.last_peak_group import (
+    get_current_animal_ids,
+    refresh_last_peak_groups,
+)
+from DataRepo.storage import open_archived_file
 from DataRepo.utils.exceptions import (
     AggregatedErrors,
     AmbiguousMzxmlSampleMatch,
@@ -986,7 +991,12 @@ class MSRunsLoader(TableLoader):
         if not self.defer_rollback:
             enable_caching_updates()
             if not self.dry_run and not self.validate:
+                current_animal_ids = get_current_animal_ids()
                 delete_all_caches()
+                refresh_last_peak_groups(
+                    animal_ids=sorted(self.loaded_animal_ids),
+                    current_animal_ids=current_animal_ids,
+                )
 
     def check_seqname_column(self):
         """This method checks the sequence name column.  If any values are missing (and not skipped) and there is no
@@ -1992,6 +2002,7 @@ class MSRunsLoader(TableLoader):
 
             if created:
                 self.created(MSRunSample.__name__)
+                self.loaded_animal_ids.add(sample.animal_id)
             else:
                 self.existed(MSRunSample.__name__)
 
@@ -2065,6 +2076,7 @@ class MSRunsLoader(TableLoader):
                         pg_rec.full_clean()
                         pg_rec.save()
                         self.updated(PeakGroup.__name__)
+                        self.loaded_animal_ids.add(sample.animal_id)
 
             elif placeholder_msrs_rec is not None:
                 # This case is when an mzXML is being added after-the-fact.  If there exist peak groups only for the
@@ -2078,6 +2090,7 @@ class MSRunsLoader(TableLoader):
                     pg_rec.full_clean()
                     pg_rec.save()
                     self.updated(PeakGroup.__name__)
+                    self.loaded_animal_ids.add(sample.animal_id)
 
                 # Now the placeholder record is empty, so there's no need to keep it around
                 placeholder_msrs_rec.delete()
@@ -2100,6 +2113,21 @@ class MSRunsLoader(TableLoader):
                     pg_rec.full_clean()
                     pg_rec.save()
                     self.updated(PeakGroup.__name__)
+                    self.loaded_animal_ids.add(sample.animal_id)
+
+    def preload_lookups(self):
+        """Bulk-loads the samples referenced in the sheet into the shared lookup index.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.lookup_index.preload(
+            Sample, "name", self.get_column_values(self.headers.SAMPLENAME)
+        )
 
     def get_sample_by_name(
         self, sample_name: str, from_mzxmls: Optional[List[str]] = None
@@ -2124,9 +2152,12 @@ class MSRunsLoader(TableLoader):
         Returns:
             Optional[Sample]
         """
-        rec = None
+        rec = self.lookup_index.get(Sample, name=sample_name)
+        if rec is not None:
+            return rec
         try:
             rec = Sample.objects.get(name=sample_name)
+            self.lookup_index.add(rec, name=sample_name)
         except Sample.DoesNotExist as dne:
             # If this sample was derived from an mzXML filename
             if from_mzxmls:
@@ -2401,6 +2432,7 @@ class MSRunsLoader(TableLoader):
 
             if created:
                 self.created(MSRunSample.__name__)
+                self.loaded_animal_ids.add(sample.animal_id)
             else:
                 self.existed(MSRunSample.__name__)
 
@@ -2669,7 +2701,11 @@ class MSRunsLoader(TableLoader):
 
             # Don't perform the query if no query exists (i.e. None will be returned)
             if len(query_dict.keys()) > 0:
-                rec = MSRunSequence.objects.get(**query_dict)
+                # Sequences are shared by every MSRunsLoader instance (e.g. 1 per peak annotation file) in a study load
+                rec = self.lookup_index.get(MSRunSequence, **query_dict)
+                if rec is None:
+                    rec = MSRunSequence.objects.get(**query_dict)
+                    self.lookup_index.add(rec, **query_dict)
 
         except MSRunSequence.DoesNotExist as dne:
             self.aggregated_errors_object.buffer_error(
@@ -3015,7 +3051,7 @@ class MSRunsLoader(TableLoader):
         If not all polarities of all the scans are the same, an error will be buffered.
 
         Args:
-            mzxml_path (str or Path): mzXML file path
+            mzxml_path (str or Path): mzXML file path (or the path of an mzXML file compressed in the archive)
             full_dict (boolean): Whether to return the raw/full dict of the mzXML file
         Exceptions:
             Raises:
@@ -3055,10 +3091,9 @@ class MSRunsLoader(TableLoader):
             # but not the file, so just return None if what we have isn't a real file.
             raise FileNotFoundError(f"File not found: {mzxml_path}")
 
-        # Parse the xml content
-        with mzxml_path_obj.open(mode="r") as f:
-            xml_content = f.read()
-        mzxml_dict = xmltodict.parse(xml_content)
+        # Parse the xml content as it is read (decompressing it if it is a compressed archive file)
+        with open_archived_file(mzxml_path_obj) as f:
+            mzxml_dict = xmltodict.parse(f)
 
         if "scan" not in mzxml_dict["mzXML"]["msRun"].keys():
             raise NoScans(mzxml_path)
@@ -1,7 +1,9 @@
 import os
 from collections import defaultdict, namedtuple
-from typing import Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
 
+from django.conf import settings
 from django.db import transaction
 
 from DataRepo.loaders.base.table_column import ColumnReference, TableColumn
@@ -169,6 +171,8 @@ class PeakAnnotationFilesLoader(TableLoader):
                     peak_annotation_details_df (Optional[pandas DataFrame]): The DataFrame of the Peak Annotation
                         Details sheet/file that will be supplied to the MSRunsLoader class (that is an instance meber of
                         this instance)
+                max_workers (Optional[int]) [settings.LOAD_MAX_WORKERS]: The maximum number of threads used to read the
+                    peak annotation files in advance.  See prefetch.
                 PeakGroup conflicts (a.k.a. "multiple representations"):
                     peak_group_conflicts_file (Optional[str]): The name of the file that the Peak Group conflict
                         resolutions came from.
@@ -203,14 +207,40 @@ class PeakAnnotationFilesLoader(TableLoader):
         self.peak_group_conflicts_sheet = kwargs.pop("peak_group_conflicts_sheet", None)
         self.peak_group_conflicts_df = kwargs.pop("peak_group_conflicts_df", None)
 
+        self.max_workers = kwargs.pop("max_workers", None)
+        if self.max_workers is None:
+            self.max_workers = settings.LOAD_MAX_WORKERS
+
         super().__init__(*args, **kwargs)
 
         # For tracking exceptions of the individual peak annotation loaders
         self.aggregated_errors_dict = {}
 
+        # Data parsed from the peak annotation files (or Futures of it), keyed on file path.  See get_annot_df.
+        self.annot_dfs: Dict[str, object] = {}
+        self.executor: Optional[ThreadPoolExecutor] = None
+
     def load_data(self):
         """Loads the ArchiveFile table from the dataframe and calls the PeakAnnotationsLoader for each file.
 
+        Args:
+            None
+        Exceptions:
+            Raises:
+                AggregatedErrorsSet
+            Buffers:
+                None
+        Returns:
+            None
+        """
+        try:
+            self._load_data()
+        finally:
+            self.shutdown_prefetch()
+
+    def _load_data(self):
+        """Helper of load_data that loops over the rows of the dataframe.
+
         Args:
             None
         Exceptions:
@@ -261,21 +291,16 @@ class PeakAnnotationFilesLoader(TableLoader):
             if aes.should_raise():
                 raise AggregatedErrorsSet(self.aggregated_errors_dict)
 
-    def get_file_and_format(self, row):
-        """Gets the file path and determines the file format.
+    def get_annot_filepath(self, filepath_str):
+        """Determines the actual path of a peak annotation file listed in the file column.
 
         Args:
-            row (pd.Series)
+            filepath_str (str): The path (or name) of a peak annotation file, as supplied in the file column.
         Exceptions:
-            InfileError
+            None
         Returns:
-            filename (str): The user's given name for the file (in case the path has a hashed temp name from a web form)
-            filepath (str)
-            format_code (str)
+            filepath (str): Note, the file may not exist.
         """
-        filepath_str = self.get_row_val(row, self.headers.FILE)
-        format_code = self.get_row_val(row, self.headers.FORMAT)
-
         filename = os.path.basename(filepath_str)
 
         # Determine the actual filepath.  It can be obtained from self.annot_files_dict if this can from the web
@@ -312,6 +337,97 @@ class PeakAnnotationFilesLoader(TableLoader):
                 # We will look relative to the current directory
                 filepath = filepath_str
 
+        return filepath
+
+    def prefetch(self):
+        """Starts reading the peak annotation files in background threads, so that they are parsed while other loaders
+        (e.g. those of the other sheets in a StudyLoader run) are loading.  Reading a file does not touch the database,
+        so this is safe to do during the load's database transaction.
+
+        Nothing is buffered here.  Files that do not exist are skipped (get_file_and_format reports them), and any
+        exception from reading a file is raised when its data is retrieved (see get_annot_df).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if self.df is None or self.max_workers < 2 or self.executor is not None:
+            return
+
+        filepaths = []
+        for filepath_str in self.get_column_values(self.headers.FILE):
+            filepath = self.get_annot_filepath(str(filepath_str))
+            if os.path.isfile(filepath) and filepath not in filepaths:
+                filepaths.append(filepath)
+
+        if len(filepaths) == 0:
+            return
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(filepaths)),
+            thread_name_prefix="peak_annotations_reader",
+        )
+        for filepath in filepaths:
+            self.annot_dfs[filepath] = self.executor.submit(
+                read_from_file, filepath, sheet=None
+            )
+
+    def shutdown_prefetch(self):
+        """Cancels any outstanding reads started by prefetch and releases the parsed data.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.annot_dfs = {}
+
+    def get_annot_df(self, filepath):
+        """Returns the data parsed from a peak annotation file, waiting on the prefetch of the file if it is still being
+        read.  A file that was not prefetched is read now.  Either way, the data is retained (until the file is loaded),
+        because it is used both to determine the file's format and to load it.
+
+        Args:
+            filepath (str)
+        Exceptions:
+            None
+        Returns:
+            df (dict|pd.DataFrame): A dict of dataframes keyed on sheet name if the file is an excel file.
+        """
+        df = self.annot_dfs.get(filepath)
+        if isinstance(df, Future):
+            df = df.result()
+        elif df is None:
+            df = read_from_file(filepath, sheet=None)
+        self.annot_dfs[filepath] = df
+        return df
+
+    def get_file_and_format(self, row):
+        """Gets the file path and determines the file format.
+
+        Args:
+            row (pd.Series)
+        Exceptions:
+            InfileError
+        Returns:
+            filename (str): The user's given name for the file (in case the path has a hashed temp name from a web form)
+            filepath (str)
+            format_code (str)
+        """
+        filepath_str = self.get_row_val(row, self.headers.FILE)
+        format_code = self.get_row_val(row, self.headers.FORMAT)
+
+        filename = os.path.basename(filepath_str)
+        filepath = self.get_annot_filepath(filepath_str)
+
         if not os.path.isfile(filepath):
             self.buffer_infile_exception(
                 FileFromInputNotFound(filepath_str, tmpfile=filepath),
@@ -331,7 +447,7 @@ class PeakAnnotationFilesLoader(TableLoader):
 
         matching_formats = PeakAnnotationsLoader.determine_matching_formats(
             # Do not enforce column types when we don't know what columns exist yet
-            read_from_file(filepath, sheet=None)
+            self.get_annot_df(filepath)
         )
 
         if format_code is not None:
@@ -548,7 +664,7 @@ class PeakAnnotationFilesLoader(TableLoader):
         # Create an instance of the specific peak annotations loader for this format
         peak_annot_loader = peak_annot_loader_class(
             # These are the essential arguments
-            df=read_from_file(filepath, sheet=None),
+            df=self.get_annot_df(filepath),
             file=filepath,
             filename=filename,  # In case filepath is a temp file with a nonsense name
             # Then we need either these 3 peak annotation details inputs
@@ -568,8 +684,12 @@ class PeakAnnotationFilesLoader(TableLoader):
             _validate=self.validate,
             defer_rollback=self.defer_rollback,
             debug=self.debug,
+            lookup_index=self.lookup_index,
         )
 
+        # Release the data (the loader has it now)
+        self.annot_dfs.pop(filepath, None)
+
         try:
             # Load this peak annotations file
             peak_annot_loader.load_data()
@@ -584,6 +704,7 @@ class PeakAnnotationFilesLoader(TableLoader):
                     peak_annot_loader.aggregated_errors_object
                 )
             self.update_load_stats(peak_annot_loader.get_load_stats())
+            self.loaded_animal_ids.update(peak_annot_loader.loaded_animal_ids)
 
     def get_dir_to_sequence_dict(self):
         """This traverses self.df to return a dict that maps the peak annotation file's directory path (relative to the
@@ -5,11 +5,13 @@ from collections import namedtuple
 from typing import Dict, List, Optional
 
 import pandas as pd
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
 from django.db.utils import ProgrammingError
 
 from DataRepo.loaders.base.converted_table_loader import ConvertedTableLoader
+from DataRepo.loaders.base.staging_table import StagingTable
 from DataRepo.loaders.base.table_column import TableColumn
 from DataRepo.loaders.compounds_loader import CompoundsLoader
 from DataRepo.loaders.samples_loader import SamplesLoader
@@ -31,6 +33,11 @@ from DataRepo.models.hier_cached_model import (
     disable_caching_updates,
     enable_caching_updates,
 )
+from DataRepo.models.last_peak_group import (
+    get_current_animal_ids,
+    refresh_last_peak_groups,
+)
+from DataRepo.models.peak_group import PeakGroupConflictDetector
 from DataRepo.utils.exceptions import (
     AggregatedErrors,
     ComplexPeakGroupDuplicate,
@@ -236,6 +243,9 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
         PeakGroupCompound,
     ]
 
+    # The maximum number of staged PeakData records to buffer before inserting them.  See flush_staged_records.
+    STAGE_FLUSH_SIZE = 10000
+
     name_fix_suggestion = (
         f"You may choose to manually edit the automatically fixed compound name in the peak annotation file, but be "
         f"sure to also fix any occurrences in the '{CompoundsLoader.DataHeaders.NAME}' and/or "
@@ -305,6 +315,9 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
                         instance member of this instance) and is used to skip peak groups based on user selections.
                 multrep_suggestion (Optional[str]): A description of what to do if you encounter a
                     MultiplePeakGroupRepresentation exception, which will be appended to the text of those exceptions.
+                staged (Optional[bool]) [settings.LOAD_STAGED_INSERTS]: Whether to insert the PeakData and
+                    PeakDataLabel records of newly created PeakGroups via staging tables (see StagingTable), instead of
+                    with 1 get_or_create per record.
         Exceptions:
             Raises:
                 AggregatedErrors
@@ -342,6 +355,11 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
         # A suggestion of how to resolve MultiplePeakGroupRepresentation exceptions
         self.multrep_suggestion = multrep_suggestion
 
+        # Validate mode always stages, because staged records are validated without being inserted in that mode
+        self.staged = kwargs.pop("staged", None)
+        if self.staged is None:
+            self.staged = settings.LOAD_STAGED_INSERTS or kwargs.get("_validate", False)
+
         # Require the file argument if df is supplied
         if kwargs.get("file") is None and (
             kwargs.get("df") is not None
@@ -371,6 +389,7 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
             lc_protocol_name=kwargs.pop("lc_protocol_name", None),
             instrument=kwargs.pop("instrument", None),
             skip_mzxmls=True,
+            lookup_index=kwargs.get("lookup_index"),
         )
 
         # Example: self.peak_group_selections[sample][pgname.lower()]["filename"] = selected_peak_annotation_filename
@@ -448,6 +467,21 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
         # Compound lookup is slow and compounds are repeatedly looked up, so this will buffer the results
         self.compound_lookup = {}
 
+        # PeakData records of PeakGroups created by this load cannot already exist, so (in staged mode) they and their
+        # labels are buffered in staging tables and inserted in bulk.  See flush_staged_records.
+        self.created_peak_group_ids = set()
+        # Conflicts of new PeakGroups with existing ones (including those created by this load) are determined in memory
+        # (see preload_lookups)
+        self.peak_group_conflict_detector = PeakGroupConflictDetector()
+        self.peak_data_stage = StagingTable(PeakData)
+        self.peak_data_label_stage = StagingTable(PeakDataLabel)
+        # Data for processing records individually if they are rejected by the merge, keyed on primary key
+        self.staged_peak_data_dicts = {}
+        self.staged_peak_data_label_dicts = {}
+        # Staged records keyed on the values PeakData.get_or_create and the PeakDataLabel unique constraint match on
+        self.staged_peak_data_recs = {}
+        self.staged_peak_data_label_recs = {}
+
         # Suggestions about failed header lookups depend on the supplied inputs.
         # TODO: Replace the sample sheet/column strings in the values below with a sheet/column reference from the
         # sample loader once the sample loader inherits from TableLoader
@@ -586,14 +620,21 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
             pgrec = None
             pdrec = None
 
+            # In validate mode, staged records are never inserted, so they must all be validated together
+            if not self.validate and len(self.peak_data_stage) >= self.STAGE_FLUSH_SIZE:
+                self.flush_staged_records()
+
             # Get compounds
             cmpdrecs_dict = self.get_peak_group_compounds_dict(row=row)
 
             # Get or create PeakGroups
             try:
-                pgrec, _ = self.get_or_create_peak_group(
+                pgrec, pg_created = self.get_or_create_peak_group(
                     row, annot_file_rec, cmpdrecs_dict
                 )
+                if pg_created:
+                    self.created_peak_group_ids.add(pgrec.pk)
+                    self.peak_group_conflict_detector.add(pgrec)
             except RollbackException:
                 pass
 
@@ -640,6 +681,17 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
                 except RollbackException:
                     continue
 
+        self.flush_staged_records()
+        self.staged_peak_data_recs = {}
+        self.staged_peak_data_label_recs = {}
+
+        if annot_file_rec is not None:
+            self.loaded_animal_ids.update(
+                PeakGroup.objects.filter(peak_annotation_file=annot_file_rec)
+                .values_list("msrun_sample__sample__animal_id", flat=True)
+                .distinct()
+            )
+
         # This currently only repackages DuplicateValues exceptions, but may do more WRT mapping to original file
         # locations of errors later.  It could be called at the top of this method (bec dupes are handled before this
         # method is called), but given the plan to have it handle more exceptions, having it here at the bottom is
@@ -652,7 +704,12 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
         if not self.defer_rollback:
             enable_caching_updates()
             if not self.dry_run and not self.validate:
+                current_animal_ids = get_current_animal_ids()
                 delete_all_caches()
+                refresh_last_peak_groups(
+                    animal_ids=sorted(self.loaded_animal_ids),
+                    current_animal_ids=current_animal_ids,
+                )
 
     @transaction.atomic
     def get_or_create_annot_file(self):
@@ -771,11 +828,72 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
 
         return recs
 
+    def preload_lookups(self):
+        """Bulk-loads the compounds in the COMPOUND column into the shared lookup index, and the existing PeakGroups
+        that the file's peak groups could conflict with into the peak group conflict detector.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        names = set()
+        pgnames = set()
+        for names_str in self.get_column_values(self.headers.COMPOUND):
+            names_str = self.fix_elmaven_compound(str(names_str))
+            synonyms = [
+                Compound.validate_compound_name(name.strip(), fix=True)
+                for name in names_str.split(PeakGroup.NAME_DELIM)
+            ]
+            names.update(synonyms)
+            # Like get_or_create_peak_group, which names the peak group using the keys of a dict of the synonyms
+            pgnames.add(
+                PeakGroup.compound_synonyms_to_peak_group_name(
+                    list(dict.fromkeys(synonyms))
+                )
+            )
+        self.lookup_index.preload_compounds(names)
+        self.peak_group_conflict_detector.preload(pgnames, self.get_header_sample_ids())
+
+    def get_header_sample_ids(self) -> List[int]:
+        """Returns the IDs of the samples that the sample headers in the SAMPLEHEADER column map to, according to the
+        peak annotation details or (otherwise) by matching sample names.  This does not buffer errors about headers that
+        do not map to samples.  See get_msrun_sample.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            sample_ids (List[int])
+        """
+        sample_ids = set()
+        unmapped_headers = []
+        for header in self.get_column_values(self.headers.SAMPLEHEADER):
+            header = str(header)
+            msrun_sample = self.msrun_sample_dict.get(header, {}).get(
+                MSRunSample.__name__
+            )
+            if msrun_sample is not None:
+                sample_ids.add(msrun_sample.sample_id)
+            else:
+                unmapped_headers.append(header)
+        if len(unmapped_headers) > 0:
+            sample_ids.update(
+                Sample.objects.filter(name__in=unmapped_headers).values_list(
+                    "pk", flat=True
+                )
+            )
+        return list(sample_ids)
+
     def get_compound(self, name, buffer_errors=True):
         """Cached compound lookups.  Loading of a study was profiled and Compound.compound_matching_name_or_synonym was
         found to be a bottleneck (particularly when there are repeated lookups of compunds that don't exist in the
         database), so this method utilizes a "cache" in the form of the self.compound_lookup dict, which saves the
-        result of every lookup to return the cached results, if they exist.
+        result of every lookup to return the cached results, if they exist.  Compounds that exist are first looked up
+        in the shared self.lookup_index (see preload_lookups).
 
         Args:
             name (str): Compound name or synonym.
@@ -796,7 +914,11 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
             rec, exc, query = self.compound_lookup[name]
         else:
             try:
-                rec = Compound.compound_matching_name_or_synonym(name)
+                # Compounds in the file were bulk-loaded into the shared index (see preload_lookups)
+                rec = self.lookup_index.get_compound(name)
+                if rec is None:
+                    rec = Compound.compound_matching_name_or_synonym(name)
+                    self.lookup_index.add_compound(rec, name)
             except (ValidationError, ObjectDoesNotExist) as cmpderr:
                 exc = cmpderr
                 query = Compound.get_name_query_expression(name)
@@ -892,8 +1014,16 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
         }
 
         try:
-            rec, created = PeakGroup.objects.get_or_create(**rec_dict)
+            # This is effectively a get_or_create, except that the conflicts that PeakGroup.save checks for are
+            # determined in memory, using the representations preloaded by preload_lookups
+            rec = self.peak_group_conflict_detector.get(**rec_dict)
+            created = rec is None
             if created:
+                rec = PeakGroup(**rec_dict)
+                self.peak_group_conflict_detector.check(rec)
+                # A savepoint, like get_or_create's, so that an IntegrityError does not break the enclosing transaction
+                with transaction.atomic():
+                    rec.save(check_representations=False)
                 rec.full_clean()
                 self.created(PeakGroup.__name__)
             else:
@@ -1064,6 +1194,7 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
                     is_error=False,
                     is_fatal=self.validate,
                 )
+                self.peak_group_conflict_detector.remove(conflicting_pgrec)
                 delete_counts_dict = tuple(conflicting_pgrec.delete())[1]
                 for qual_mdl_name, cnt in delete_counts_dict.items():
                     mdl_name = list(qual_mdl_name.split("."))[-1]
@@ -1385,14 +1516,14 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
 
         return rec, created
 
-    @transaction.atomic
     def get_or_create_peak_data(
         self,
         row,
         peak_group: Optional[PeakGroup],
         label_obs: Optional[List[ObservedIsotopeData]],
     ):
-        """Get or create a PeakData record.  Handles exceptions, updates stats, and triggers a rollback.
+        """Get or create a PeakData record.  Handles exceptions, updates stats, and triggers a rollback.  In staged
+        mode, the PeakData records of newly created PeakGroups are buffered (see stage_peak_data).
 
         Args:
             row (pandas.Series)
@@ -1423,6 +1554,30 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
             "med_rt": med_rt,
         }
 
+        if self.staged and peak_group.pk in self.created_peak_group_ids:
+            return self.stage_peak_data(rec_dict, label_obs)
+
+        return self.get_or_create_peak_data_rec(rec_dict, label_obs)
+
+    @transaction.atomic
+    def get_or_create_peak_data_rec(
+        self, rec_dict: dict, label_obs: List[ObservedIsotopeData]
+    ):
+        """Get or create a PeakData record from a dict of field values.  Handles exceptions, updates stats, and triggers
+        a rollback.
+
+        Args:
+            rec_dict (dict): PeakData field values keyed on field name.
+            label_obs (List[ObservedIsotopeData])
+        Exceptions:
+            Buffers:
+                None
+            Raises:
+                RollbackException
+        Returns:
+            rec (Optional[PeakData])
+            created (boolean)
+        """
         # A prior processing of this file could have created this record, or a previous row of the file could have
         # created a PeakData record with identical values (e.g. med_mz=0, med_rt=0, raw_abundance=0, and
         # corrected_abundance=0).  The only way to tell them apart is by their associated labels (PeakDataLabel
@@ -1442,6 +1597,189 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
 
         return rec, created
 
+    def stage_peak_data(self, rec_dict: dict, label_obs: List[ObservedIsotopeData]):
+        """Buffers a new PeakData record (of a PeakGroup created by this load) in self.peak_data_stage, after validating
+        its field values.  Equivalent to get_or_create_peak_data_rec, except that the record is inserted (and counted as
+        created) by flush_staged_records.
+
+        Args:
+            rec_dict (dict): PeakData field values keyed on field name.
+            label_obs (List[ObservedIsotopeData])
+        Exceptions:
+            Buffers:
+                None
+            Raises:
+                RollbackException
+        Returns:
+            rec (PeakData): Unsaved, but with its primary key set.
+            created (boolean)
+        """
+        # Like PeakData.get_or_create, a PeakData record is identified by its values and its labels
+        key = (
+            rec_dict["peak_group"].pk,
+            rec_dict["raw_abundance"],
+            rec_dict["corrected_abundance"],
+            rec_dict["med_mz"],
+            rec_dict["med_rt"],
+            frozenset(
+                (obs["element"], obs["count"], obs["mass_number"]) for obs in label_obs
+            ),
+        )
+        if key in self.staged_peak_data_recs.keys():
+            self.existed(PeakData.__name__)
+            return self.staged_peak_data_recs[key], False
+
+        rec = PeakData(**rec_dict)
+        try:
+            # Validating the peak_group field would query the database, but it was just created
+            rec.full_clean(
+                exclude=["peak_group"],
+                validate_unique=False,
+                validate_constraints=False,
+            )
+        except ValidationError as ve:
+            self.handle_load_db_errors(ve, PeakData, rec_dict)
+            self.errored(PeakData.__name__)
+            raise RollbackException()
+
+        self.peak_data_stage.add(rec)
+        self.staged_peak_data_recs[key] = rec
+        self.staged_peak_data_dicts[rec.pk] = (self.row_index, rec_dict, label_obs)
+
+        return rec, True
+
+    def flush_staged_records(self):
+        """Inserts the staged PeakData and PeakDataLabel records (see stage_peak_data and stage_peak_data_label) with a
+        set-based merge.  Records rejected by the merge (see StagingTable.get_invalid_ids) are processed individually
+        (via get_or_create), which handles and reports their errors the same way as when not in staged mode.  The merge
+        does not call save, so the maintained fields of the inserted records' peak groups are then auto-updated (or
+        buffered for the mass auto-update) explicitly (see MaintainedModel.trigger_autoupdates).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if self.validate:
+            self.validate_staged_records()
+            return
+
+        # The peak groups whose maintained fields (e.g. total_abundance) depend on the inserted records
+        updated_peak_groups: Dict[int, PeakGroup] = {}
+
+        staged_peak_data_recs = dict(self.peak_data_stage.records)
+        inserted_ids, rejected_ids = self.peak_data_stage.flush()
+        self.created(PeakData.__name__, num=len(inserted_ids))
+        for inserted_id in inserted_ids:
+            pgrec = staged_peak_data_recs[inserted_id].peak_group
+            updated_peak_groups[pgrec.pk] = pgrec
+
+        replacements = {}
+        for rejected_id in rejected_ids:
+            row_index, rec_dict, label_obs = self.staged_peak_data_dicts[rejected_id]
+            self.set_row_index(row_index)
+            try:
+                replacements[rejected_id], _ = self.get_or_create_peak_data_rec(
+                    rec_dict, label_obs
+                )
+            except RollbackException:
+                replacements[rejected_id] = None
+
+        # Point the staged labels of rejected PeakData records to their replacements
+        for rec_id in list(self.peak_data_label_stage.records.keys()):
+            rec = self.peak_data_label_stage.records[rec_id]
+            if rec.peak_data_id not in replacements.keys():
+                continue
+            if replacements[rec.peak_data_id] is None:
+                del self.peak_data_label_stage.records[rec_id]
+                self.skipped(PeakDataLabel.__name__)
+            else:
+                rec.peak_data = replacements[rec.peak_data_id]
+                self.staged_peak_data_label_dicts[rec_id][1][
+                    "peak_data"
+                ] = rec.peak_data
+
+        staged_peak_data_label_recs = dict(self.peak_data_label_stage.records)
+        inserted_ids, rejected_ids = self.peak_data_label_stage.flush()
+        self.created(PeakDataLabel.__name__, num=len(inserted_ids))
+        for inserted_id in inserted_ids:
+            pgrec = staged_peak_data_label_recs[inserted_id].peak_data.peak_group
+            updated_peak_groups[pgrec.pk] = pgrec
+
+        for rejected_id in rejected_ids:
+            row_index, rec_dict = self.staged_peak_data_label_dicts[rejected_id]
+            self.set_row_index(row_index)
+            try:
+                self.get_or_create_peak_data_label_rec(rec_dict)
+            except RollbackException:
+                pass
+
+        MaintainedModel.trigger_autoupdates(updated_peak_groups.values())
+
+        self.clear_staged_records()
+
+    def validate_staged_records(self):
+        """Validates the staged PeakData and PeakDataLabel records without inserting them (see flush_staged_records).
+        This is used in validate mode, where everything is rolled back anyway.  These records are the bulk of the rows
+        in a load, and nothing else in the load depends on them, so validation does not have to write them.
+
+        The staged records' field values were already validated (see stage_peak_data and stage_peak_data_label), and
+        the PeakData records' peak groups were created by this load, so they cannot conflict with existing records.  The
+        only remaining possible conflicts are between the staged labels themselves, which are checked in memory.  To
+        report those errors the same way as in a load, the conflicting records (only) are created and the rejected label
+        is processed individually.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.created(PeakData.__name__, num=len(self.peak_data_stage))
+
+        rejected_ids = self.peak_data_label_stage.get_duplicate_ids()
+        self.created(
+            PeakDataLabel.__name__,
+            num=len(self.peak_data_label_stage) - len(rejected_ids),
+        )
+
+        for rejected_id in sorted(rejected_ids):
+            row_index, rec_dict = self.staged_peak_data_label_dicts[rejected_id]
+            conflicting_label = self.staged_peak_data_label_recs[
+                (rec_dict["peak_data"].pk, rec_dict["element"])
+            ]
+            for rec in [rec_dict["peak_data"], conflicting_label]:
+                if rec._state.adding:
+                    rec.save(force_insert=True)
+            self.set_row_index(row_index)
+            try:
+                self.get_or_create_peak_data_label_rec(rec_dict)
+            except RollbackException:
+                pass
+
+        self.clear_staged_records()
+
+    def clear_staged_records(self):
+        """Empties the staging tables and the data about their records.  Note, the staged records are retained in
+        self.staged_peak_data_recs and self.staged_peak_data_label_recs (until the end of load_data), so that subsequent
+        rows can be matched to them.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.set_row_index(None)
+        self.peak_data_stage.clear()
+        self.peak_data_label_stage.clear()
+        self.staged_peak_data_dicts = {}
+        self.staged_peak_data_label_dicts = {}
+
     def get_label_observations(self, row, pgrec: Optional[PeakGroup]):
         """Parse the isotopeLabel and add in labels from the tracers (whose elements are present in the observed
         compound) to record 0 counts.
@@ -1565,9 +1903,9 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
 
         return rec, created
 
-    @transaction.atomic
     def get_or_create_peak_data_label(self, peak_data, element, count, mass_number):
-        """Get or create a PeakDataLabel record.  Handles exceptions, updates stats, and triggers a rollback.
+        """Get or create a PeakDataLabel record.  Handles exceptions, updates stats, and triggers a rollback.  The
+        labels of staged PeakData records are staged as well (see stage_peak_data_label).
 
         Args:
             row (pandas.Series)
@@ -1601,6 +1939,27 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
             "mass_number": mass_number,
         }
 
+        if peak_data.pk in self.peak_data_stage:
+            return self.stage_peak_data_label(rec_dict)
+
+        return self.get_or_create_peak_data_label_rec(rec_dict)
+
+    @transaction.atomic
+    def get_or_create_peak_data_label_rec(self, rec_dict: dict):
+        """Get or create a PeakDataLabel record from a dict of field values.  Handles exceptions, updates stats, and
+        triggers a rollback.
+
+        Args:
+            rec_dict (dict): PeakDataLabel field values keyed on field name.
+        Exceptions:
+            Buffers:
+                None
+            Raises:
+                RollbackException
+        Returns:
+            rec (Optional[PeakDataLabel])
+            created (boolean)
+        """
         try:
             rec, created = PeakDataLabel.objects.get_or_create(**rec_dict)
             if created:
@@ -1615,6 +1974,52 @@ class PeakAnnotationsLoader(ConvertedTableLoader, ABC):
 
         return rec, created
 
+    def stage_peak_data_label(self, rec_dict: dict):
+        """Buffers a new PeakDataLabel record (of a staged PeakData record) in self.peak_data_label_stage, after
+        validating it.  Equivalent to get_or_create_peak_data_label_rec, except that the record is inserted (and counted
+        as created) by flush_staged_records.
+
+        Args:
+            rec_dict (dict): PeakDataLabel field values keyed on field name.
+        Exceptions:
+            Buffers:
+                None
+            Raises:
+                RollbackException
+        Returns:
+            rec (PeakDataLabel): Unsaved, but with its primary key set.
+            created (boolean)
+        """
+        key = (rec_dict["peak_data"].pk, rec_dict["element"])
+        existing = self.staged_peak_data_label_recs.get(key)
+        if (
+            existing is not None
+            and existing.count == rec_dict["count"]
+            and existing.mass_number == rec_dict["mass_number"]
+        ):
+            self.existed(PeakDataLabel.__name__)
+            return existing, False
+
+        rec = PeakDataLabel(**rec_dict)
+        try:
+            # The peak_data field is excluded because validating it would query the database for the staged record
+            rec.full_clean(
+                exclude=["peak_data"], validate_unique=False, validate_constraints=False
+            )
+        except ValidationError as ve:
+            self.handle_load_db_errors(ve, PeakDataLabel, rec_dict)
+            self.errored(PeakDataLabel.__name__)
+            raise RollbackException()
+
+        # A conflicting label (same element, different count) is staged anyway.  The merge will reject it, so that it
+        # is processed (and its error reported) individually.
+        self.peak_data_label_stage.add(rec)
+        if existing is None:
+            self.staged_peak_data_label_recs[key] = rec
+        self.staged_peak_data_label_dicts[rec.pk] = (self.row_index, rec_dict)
+
+        return rec, True
+
     def report_discrepant_headers(self):
         """This removes RecordDoesNotExist exceptions (from the aggregated errors) about missing Sample records in the
         peak annotation details sheet and replaces them.  Among those not found in the peak annotation details, it
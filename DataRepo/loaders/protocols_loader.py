@@ -218,6 +218,7 @@ class ProtocolsLoader(TableLoader):
                 self.created()
             else:
                 self.existed()
+            self.lookup_index.add(rec, name=name)
 
         except Exception as e:
             # Package errors (like IntegrityError and ValidationError) with relevant details
@@ -438,8 +438,10 @@ class SamplesLoader(TableLoader):
             if created:
                 rec.full_clean()
                 self.created(Sample.__name__)
+                self.loaded_animal_ids.add(animal.id)
             else:
                 self.existed(Sample.__name__)
+            self.lookup_index.add(rec, name=name)
         except Exception as e:
             # Add this sample name to the failed samples for this animal.  This is so we can later check for animals
             # that have no serum samples, and if so, issue a warning (unless the sample is present, but just had an
@@ -455,6 +457,23 @@ class SamplesLoader(TableLoader):
 
         return rec, created
 
+    def preload_lookups(self):
+        """Bulk-loads the animals and tissues referenced in the sheet into the shared lookup index.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.lookup_index.preload(
+            Animal, "name", self.get_column_values(self.headers.ANIMAL)
+        )
+        self.lookup_index.preload(
+            Tissue, "name", self.get_column_values(self.headers.TISSUE)
+        )
+
     def get_animal(self, row):
         """Get an Animal record.
 
@@ -475,7 +494,10 @@ class SamplesLoader(TableLoader):
         query_dict = {"name": name}
 
         try:
-            rec = Animal.objects.get(**query_dict)
+            rec = self.lookup_index.get(Animal, **query_dict)
+            if rec is None:
+                rec = Animal.objects.get(**query_dict)
+                self.lookup_index.add(rec, **query_dict)
             if rec is not None and rec.name not in self.animals:
                 self.animals.append(rec.name)
         except Exception as e:
@@ -508,7 +530,10 @@ class SamplesLoader(TableLoader):
         query_dict = {"name": name}
 
         try:
-            rec = Tissue.objects.get(**query_dict)
+            rec = self.lookup_index.get(Tissue, **query_dict)
+            if rec is None:
+                rec = Tissue.objects.get(**query_dict)
+                self.lookup_index.add(rec, **query_dict)
         except Exception as e:
             # Package errors (like IntegrityError and ValidationError) with relevant details
             # This also updates the skip row indexes
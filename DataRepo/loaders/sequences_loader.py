@@ -246,6 +246,20 @@ class SequencesLoader(TableLoader):
                 # Continue processing rows to find more errors
                 pass
 
+    def preload_lookups(self):
+        """Bulk-loads the LC methods referenced in the sheet into the shared lookup index.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.lookup_index.preload(
+            LCMethod, "name", self.get_column_values(self.headers.LCNAME)
+        )
+
     def get_lc_method(self, name):
         """Gets an LCMethod record from the supplied row.
         Args:
@@ -261,7 +275,10 @@ class SequencesLoader(TableLoader):
         rec = None
         query_dict = {"name": name}
         try:
-            rec = LCMethod.objects.get(**query_dict)
+            rec = self.lookup_index.get(LCMethod, **query_dict)
+            if rec is None:
+                rec = LCMethod.objects.get(**query_dict)
+                self.lookup_index.add(rec, **query_dict)
         except LCMethod.DoesNotExist:
             self.aggregated_errors_object.buffer_error(
                 RecordDoesNotExist(
@@ -338,6 +355,14 @@ class SequencesLoader(TableLoader):
                 self.created(MSRunSequence.__name__)
             else:
                 self.existed(MSRunSequence.__name__)
+            # Indexed the same way that MSRunsLoader.get_msrun_sequence looks sequences up
+            self.lookup_index.add(
+                rec,
+                researcher=researcher,
+                date=date,
+                lc_method__name=lc_rec.name,
+                instrument=instrument,
+            )
 
         except Exception as e:
             # Package errors (like IntegrityError and ValidationError) with relevant details
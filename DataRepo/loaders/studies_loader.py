@@ -136,6 +136,7 @@ class StudiesLoader(TableLoader):
                 self.created()
             else:
                 self.existed()
+            self.lookup_index.add(study_rec, name=name)
 
         except Exception as e:
             # Package errors (like IntegrityError and ValidationError) with relevant details
@@ -53,9 +53,14 @@ from DataRepo.models.hier_cached_model import (
     enable_caching_updates,
 )
 from DataRepo.models.infusate import Infusate
+from DataRepo.models.last_peak_group import (
+    get_current_animal_ids,
+    refresh_last_peak_groups,
+)
 from DataRepo.models.maintained_model import MaintainedModel
 from DataRepo.models.protocol import Protocol
 from DataRepo.models.sample import Sample
+from DataRepo.profiling import profile_scope
 from DataRepo.utils.exceptions import (
     AggregatedErrors,
     AggregatedErrorsSet,
@@ -251,6 +256,26 @@ class StudyLoader(ConvertedTableLoader, ABC):
         ERRORS=None,
     )
 
+    # The sheet keys of the loaders whose records each loader looks up, i.e. the edges of the dependency graph of the
+    # study load.  Loaders are run in a topological order of this graph (see get_load_order).
+    LoaderDependencies = DataTableHeaders(
+        STUDY=[],
+        COMPOUNDS=[],
+        TRACERS=["COMPOUNDS"],
+        INFUSATES=["TRACERS"],
+        TREATMENTS=[],
+        ANIMALS=["STUDY", "INFUSATES", "TREATMENTS"],
+        TISSUES=[],
+        SAMPLES=["ANIMALS", "TISSUES"],
+        LCPROTOCOLS=[],
+        SEQUENCES=["LCPROTOCOLS"],
+        HEADERS=["SAMPLES", "SEQUENCES"],
+        FILES=["COMPOUNDS", "HEADERS"],
+        PGCONFLICTS=[],
+        DEFAULTS=None,
+        ERRORS=None,
+    )
+
     DataSheetDisplayOrder = [
         STUDY_SHEET,
         TRACERS_SHEET,
@@ -315,6 +340,9 @@ class StudyLoader(ConvertedTableLoader, ABC):
                 exclude_sheets (Optional[List[str]]): A list of default DataSheetNames (i.e. the values in the list must
                     match the value of the in each of the cls.Loaders' DataSheetName class attribute - not any custom
                     sheet name, so that it can be scripted on the data repo).
+                progress_callback (Optional[Callable[[TableLoader, int, int], bool]]): Called after each sheet is loaded
+                    with the sheet's loader, the number of sheets loaded, and the total number of sheets.  If it returns
+                    False, the remaining sheets are skipped (e.g. to cancel a validation job).
         Exceptions:
             Raises:
                 ProgrammingError
@@ -338,6 +366,7 @@ class StudyLoader(ConvertedTableLoader, ABC):
         self.annot_files_dict = kwargs.pop("annot_files_dict", {})
         self.skip_mzxmls = kwargs.pop("skip_mzxmls", False)
         self.exclude_sheets = kwargs.pop("exclude_sheets", []) or []
+        self.progress_callback = kwargs.pop("progress_callback", None)
 
         clkwa = self.custom_loader_kwargs._asdict()
         clkwa["FILES"]["annot_files_dict"] = self.annot_files_dict
@@ -394,6 +423,60 @@ class StudyLoader(ConvertedTableLoader, ABC):
             raise ProgrammingError(
                 "DataTableHeaders and DataSheetDisplayOrder must have the same sheet keys"
             )
+        # Raises a ProgrammingError if the dependency graph is invalid
+        cls.get_load_order()
+
+    @classmethod
+    def get_load_order(cls) -> List[str]:
+        """Returns the sheet keys of the loaders in a topological order of the dependency graph defined by
+        LoaderDependencies, i.e. every loader comes after the loaders whose records it looks up.  Among the loaders
+        whose dependencies have been satisfied, the order in which they were defined in the namedtuple is preserved.
+
+        Note that the loaders are run one at a time.  Independent loaders are not run concurrently, because all of them
+        must share the study load's database transaction (so that everything can be rolled back, e.g. in validate
+        mode).  Work that does not require the database is started in advance instead (see TableLoader.prefetch).
+
+        Args:
+            None
+        Exceptions:
+            Raises:
+                ProgrammingError
+            Buffers:
+                None
+        Returns:
+            load_order (List[str]): Sheet keys, e.g. "ANIMALS"
+        """
+        loader_keys = [
+            loader_key
+            for loader_key in cls.Loaders._fields
+            if getattr(cls.Loaders, loader_key) is not None
+        ]
+        dependencies = {}
+        for loader_key in loader_keys:
+            deps = getattr(cls.LoaderDependencies, loader_key) or []
+            unknown = [dep for dep in deps if dep not in loader_keys]
+            if len(unknown) > 0:
+                raise ProgrammingError(
+                    f"The dependencies of loader '{loader_key}' in LoaderDependencies are not loader keys: {unknown}."
+                )
+            dependencies[loader_key] = set(deps)
+
+        load_order: List[str] = []
+        while len(load_order) < len(loader_keys):
+            ready = [
+                loader_key
+                for loader_key in loader_keys
+                if loader_key not in load_order
+                and dependencies[loader_key] <= set(load_order)
+            ]
+            if len(ready) == 0:
+                raise ProgrammingError(
+                    "LoaderDependencies contains a cycle among loaders: "
+                    f"{[k for k in loader_keys if k not in load_order]}."
+                )
+            load_order.append(ready[0])
+
+        return load_order
 
     def check_exclude_sheets(self):
         """This buffers an error if any supplied sheet names to not match any of the loader classes' DataSheetName class
@@ -528,12 +611,15 @@ class StudyLoader(ConvertedTableLoader, ABC):
 
         disable_caching_updates()
 
-        # This cycles through the loaders in the order in which they were defined in the namedtuple
-        all_aggregated_errors = []
-        for loader_key in self.Loaders._fields:
-            if loader_key not in loaders.keys():
-                continue
+        # Start any work that can be done in advance (e.g. reading the peak annotation files) while the sheets load
+        for loader in loaders.values():
+            with profile_scope("loader", f"{type(loader).__name__}.prefetch"):
+                loader.prefetch()
 
+        # This cycles through the loaders in dependency order
+        all_aggregated_errors = []
+        load_order = [k for k in self.get_load_order() if k in loaders.keys()]
+        for num_loaded, loader_key in enumerate(load_order, start=1):
             loader: TableLoader = loaders[loader_key]
 
             try:
@@ -541,8 +627,15 @@ class StudyLoader(ConvertedTableLoader, ABC):
             except Exception as e:
                 all_aggregated_errors.append(e)
 
+            if (
+                self.progress_callback is not None
+                and self.progress_callback(loader, num_loaded, len(load_order)) is False
+            ):
+                break
+
         # Perform cross-loader checks
-        self.perform_checks(loaders)
+        with profile_scope("loader", f"{type(self).__name__}.perform_checks"):
+            self.perform_checks(loaders)
 
         # Package up all of the exceptions.  This changes the error states of the various loaders, to emphasis the
         # summaries and deemphasize (and/or remove) potentially repeated errors.
@@ -575,7 +668,14 @@ class StudyLoader(ConvertedTableLoader, ABC):
             raise self.load_statuses.get_final_exception()
 
         if not self.dry_run:
+            for loader in loaders.values():
+                self.loaded_animal_ids.update(loader.loaded_animal_ids)
+            current_animal_ids = get_current_animal_ids()
             delete_all_caches()
+            refresh_last_peak_groups(
+                animal_ids=sorted(self.loaded_animal_ids),
+                current_animal_ids=current_animal_ids,
+            )
 
         # dry_run and defer_rollback are handled by the load_data wrapper
 
@@ -615,6 +715,8 @@ class StudyLoader(ConvertedTableLoader, ABC):
             "file": self.file,
             "filename": self.get_friendly_filename(),
             "defaults_file": self.defaults_file,
+            # All loaders share 1 index of the records they look up and create
+            "lookup_index": self.lookup_index,
             "_validate": self.validate,
         }
 
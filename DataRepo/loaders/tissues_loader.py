@@ -131,6 +131,7 @@ class TissuesLoader(TableLoader):
                 self.created()
             else:
                 self.existed()
+            self.lookup_index.add(tissue, name=name)
 
         except Exception as e:
             # Package errors (like IntegrityError and ValidationError) with relevant details
@@ -803,8 +803,23 @@ class TracersLoader(TableLoader):
 
         return rec
 
+    def preload_lookups(self):
+        """Bulk-loads the compounds in the COMPOUND column into the shared lookup index.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.lookup_index.preload_compounds(
+            self.get_column_values(self.headers.COMPOUND)
+        )
+
     def get_compound(self, compound_name):
-        """Retrieves a Compound record whose name or synonym matches the supplied name.
+        """Retrieves a Compound record whose name or synonym matches the supplied name (using the shared lookup index,
+        if the compound has been indexed).
 
         Args:
             compound_name (string)
@@ -823,7 +838,12 @@ class TracersLoader(TableLoader):
 
         # If we got here, we are creating, so first, try to retrieve the compound
         try:
+            rec = self.lookup_index.get_compound(compound_name)
+            if rec is not None:
+                return rec
+
             rec = Compound.compound_matching_name_or_synonym(compound_name)
+            self.lookup_index.add_compound(rec, compound_name)
 
             if rec is None:
                 raise ProgrammingError(
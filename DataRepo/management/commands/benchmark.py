@@ -0,0 +1,109 @@
+import json
+import tempfile
+
+from django.core.management import BaseCommand, call_command
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from DataRepo.utils.benchmark import Benchmark, SyntheticStudyGenerator
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Benchmarks loaders, cached functions, BST list pages, advanced searches, and downloads using synthetic "
+        "studies of the supplied size, loaded into a (newly created) test database.  The results are output as JSON "
+        "for regression tracking."
+    )
+
+    # The fixtures the test cases use
+    fixtures = ["data_types.yaml", "data_formats.yaml", "lc_methods.yaml"]
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--studies",
+            type=int,
+            default=1,
+            help="The number of synthetic studies.  Default: %(default)s.",
+        )
+        parser.add_argument(
+            "--animals",
+            type=int,
+            default=2,
+            help="The number of animals per study.  Default: %(default)s.",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=3,
+            help="The number of samples per animal.  Default: %(default)s.",
+        )
+        parser.add_argument(
+            "--peak-groups",
+            type=int,
+            default=10,
+            help="The number of peak groups (i.e. compounds) per sample.  Default: %(default)s.",
+        )
+        parser.add_argument(
+            "--labels",
+            type=int,
+            default=3,
+            help="The number of labeled peak data per peak group.  Default: %(default)s.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="The seed of the synthetic abundances.  Default: %(default)s.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="The number of times every benchmark (other than loads) is run.  Default: %(default)s.",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default=None,
+            help="The JSON results file.  Default: standard output.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            default=False,
+            help="Do not destroy the test database afterwards.  Note, synthetic studies are loaded into it regardless.",
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_config = setup_databases(
+            verbosity=0, interactive=False, keepdb=options["keepdb"]
+        )
+        try:
+            call_command("loaddata", *self.fixtures, verbosity=0)
+            with tempfile.TemporaryDirectory() as outdir:
+                generator = SyntheticStudyGenerator(
+                    outdir,
+                    studies=options["studies"],
+                    animals=options["animals"],
+                    samples=options["samples"],
+                    peak_groups=options["peak_groups"],
+                    labels=options["labels"],
+                    seed=options["seed"],
+                )
+                results = Benchmark(generator, repeat=options["repeat"]).run()
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        results_json = json.dumps(results, indent=2)
+        if options["output"] is None:
+            self.stdout.write(results_json)
+        else:
+            with open(options["output"], "w") as fh:
+                fh.write(results_json)
@@ -3,9 +3,9 @@ from argparse import RawTextHelpFormatter
 from django.core.management import BaseCommand
 
 from DataRepo.models.hier_cached_model import (
-    CACHING_RETRIEVALS,
-    CACHING_UPDATES,
     HierCachedModel,
+    caching_retrievals_enabled,
+    caching_updates_enabled,
     delete_all_caches,
     disable_caching_retrievals,
     disable_caching_updates,
@@ -13,6 +13,7 @@ from DataRepo.models.hier_cached_model import (
     enable_caching_updates,
     get_cached_method_names,
 )
+from DataRepo.models.utilities import get_model_by_name
 
 # This builds a string to use in the help text when the user supplied -h
 NLT = "\n  "
@@ -47,19 +48,24 @@ class Command(BaseCommand):
             "--clear",
             action="store_true",
             default=False,
-            help="Clear existing cached values first.",
+            help="Clear existing cached values (of the supplied --models, if any) first.",
         )
 
     def handle(self, *args, **options):
-        save_retrievals = CACHING_RETRIEVALS
-        save_updates = CACHING_UPDATES
-        if not CACHING_RETRIEVALS:
+        save_retrievals = caching_retrievals_enabled()
+        save_updates = caching_updates_enabled()
+        if not save_retrievals:
             enable_caching_retrievals()
-        if not CACHING_UPDATES:
+        if not save_updates:
             enable_caching_updates()
 
         if options["clear"]:
-            delete_all_caches()
+            if len(options["models"]) > 0:
+                # Only invalidate the cached values of the supplied models
+                for model_name in options["models"]:
+                    get_model_by_name(model_name).delete_model_caches()
+            else:
+                delete_all_caches()
 
         try:
             HierCachedModel.build_cached_fields(
@@ -1,8 +1,8 @@
-from django.core.cache import cache
 from django.core.management import BaseCommand
 
 from DataRepo.models import *  # noqa: F401, F403
 from DataRepo.models.hier_cached_model import (
+    delete_all_caches,
     enable_caching_errors,
     enable_caching_retrievals,
     enable_caching_updates,
@@ -20,7 +20,7 @@ def build_caches(clear):
     func_name_lists = get_cached_method_names()
 
     if clear:
-        cache.clear()
+        delete_all_caches()
 
     for class_name in func_name_lists.keys():
         cls = eval(class_name)
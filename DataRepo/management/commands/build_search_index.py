@@ -0,0 +1,67 @@
+from django.core.management import BaseCommand, CommandError
+
+from DataRepo.views.models.bst.search_index import (
+    BSTSearchIndex,
+    get_search_indexed_views,
+)
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Refreshes the search documents of the BST list views' global search indexes (see BSTSearchIndex).  Searches "
+        "do not use an index after data changes (e.g. loads) until it has been refreshed, so run this after loads (or "
+        "enable the SEARCH_INDEX_BACKGROUND_REFRESH setting)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--views",
+            type=str,
+            nargs="+",
+            required=False,
+            default=None,
+            help="The names of the list views whose indexes to refresh, e.g. StudyListView.  Default: all.",
+        )
+        parser.add_argument(
+            "--stale-only",
+            action="store_true",
+            default=False,
+            help="Only refresh the indexes that are not current.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            default=False,
+            help=(
+                "Recompute every search document, instead of only the documents of the records related to the records "
+                "saved or deleted since the last refresh."
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            required=False,
+            default=BSTSearchIndex.REFRESH_CHUNK_SIZE,
+            help="The number of search documents to compute at a time.",
+        )
+
+    def handle(self, *args, **options):
+        views = {view.__name__: view for view in get_search_indexed_views()}
+        if options["views"] is not None:
+            unknown = [name for name in options["views"] if name not in views.keys()]
+            if len(unknown) > 0:
+                raise CommandError(
+                    f"Unknown search indexed views: {unknown}.  Must be among {list(views.keys())}."
+                )
+            views = {name: views[name] for name in options["views"]}
+
+        for name, view_class in views.items():
+            search_index = BSTSearchIndex.from_view(view_class())
+            if options["stale_only"] and search_index.is_current():
+                self.stdout.write(f"{name}: current")
+                continue
+            changed = search_index.refresh(
+                chunk_size=options["chunk_size"], full=options["full"]
+            )
+            self.stdout.write(f"{name}: {changed} search documents changed")
@@ -0,0 +1,65 @@
+from collections import defaultdict
+
+from django.core.management import BaseCommand, CommandError
+
+from DataRepo.models.maintained_model import MaintainedModel
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Dry run: Count the number of records, per model, whose maintained fields would be updated if the supplied "
+        "records were changed (e.g. to fix a compound name).  Nothing is saved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "records",
+            nargs="*",
+            help="The changed records, as 'Model.pk' (e.g. 'Tracer.5 Compound.12').",
+        )
+        parser.add_argument(
+            "--graph",
+            action="store_true",
+            default=False,
+            help="Print the model-level dependency graph of maintained field updates.",
+        )
+        parser.add_argument(
+            "--max-depth",
+            type=int,
+            required=False,
+            default=None,
+            help="The maximum number of relation steps to follow.  Default: unlimited.",
+        )
+
+    def handle(self, *args, **options):
+        if options["graph"]:
+            graph = MaintainedModel.get_dependency_graph("DataRepo.models")
+            for model_name, related_models in graph.items():
+                for related_field, related_model_name in related_models.items():
+                    self.stdout.write(
+                        f"{model_name}.{related_field} -> {related_model_name}"
+                    )
+
+        if len(options["records"]) == 0:
+            if not options["graph"]:
+                raise CommandError("No records supplied.")
+            return
+
+        record_ids = defaultdict(list)
+        for record in options["records"]:
+            try:
+                model_name, pk = record.split(".")
+                record_ids[model_name].append(int(pk))
+            except ValueError:
+                raise CommandError(
+                    f"Invalid record: '{record}'.  Expected 'Model.pk', e.g. 'Tracer.5'."
+                )
+            if model_name not in MaintainedModel.updater_list.keys():
+                raise CommandError(f"{model_name} is not a MaintainedModel.")
+
+        affected_counts = MaintainedModel.estimate_propagation(
+            record_ids, models_path="DataRepo.models", max_depth=options["max_depth"]
+        )
+        for model_name, count in affected_counts.items():
+            self.stdout.write(f"{model_name}: {count} records")
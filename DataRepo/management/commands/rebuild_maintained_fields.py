@@ -31,16 +31,40 @@ class Command(BaseCommand):
             help="Invert the --labels option.  I.e. Exclude records whose decorators contain the labels specified by "
             "--labels.",
         )
+        parser.add_argument(
+            "--per-record",
+            action="store_true",
+            default=False,
+            help="Save every record individually (running each model's save method), instead of computing the values "
+            "in chunks and only updating the changed values in bulk.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            required=False,
+            default=MaintainedModel.BULK_REBUILD_CHUNK_SIZE,
+            help="The number of records to compute and update at a time (ignored when --per-record is supplied).",
+        )
 
     def handle(self, *args, **options):
         try:
             disable_caching_retrievals()
             disable_caching_updates()
-            MaintainedModel.rebuild_maintained_fields(
-                "DataRepo.models",  # optional - should work without this, but supplying anyway
-                label_filters=options["labels"],
-                filter_in=not options["exclude"],
-            )
+            if options["per_record"]:
+                MaintainedModel.rebuild_maintained_fields(
+                    "DataRepo.models",  # optional - should work without this, but supplying anyway
+                    label_filters=options["labels"],
+                    filter_in=not options["exclude"],
+                )
+            else:
+                changed_counts = MaintainedModel.bulk_rebuild_maintained_fields(
+                    "DataRepo.models",
+                    label_filters=options["labels"],
+                    filter_in=not options["exclude"],
+                    chunk_size=options["chunk_size"],
+                )
+                for field, count in changed_counts.items():
+                    self.stdout.write(f"{field}: {count} records changed")
             delete_all_caches()
         finally:
             enable_caching_updates()
@@ -0,0 +1,41 @@
+from django.core.management import BaseCommand
+
+from DataRepo.models.hier_cached_model import delete_all_caches
+from DataRepo.models.maintained_model import MaintainedModel
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Update the maintained fields of the records queued for repair (e.g. by web requests, which do not update "
+        "maintained fields - see the MAINTAINED_FIELDS_READONLY_REQUESTS setting) in bulk, and remove them from the "
+        "queue.  Run this periodically (e.g. via cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            required=False,
+            default=None,
+            help="The maximum number of queued records to repair.  Default: all.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            required=False,
+            default=MaintainedModel.BULK_REBUILD_CHUNK_SIZE,
+            help="The number of records to compute and update at a time.",
+        )
+
+    def handle(self, *args, **options):
+        changed_counts = MaintainedModel.repair_maintained_fields(
+            limit=options["limit"],
+            chunk_size=options["chunk_size"],
+            models_path="DataRepo.models",
+        )
+        for field, count in changed_counts.items():
+            self.stdout.write(f"{field}: {count} records changed")
+        # Bulk updates do not invalidate the cached values (or the search indexes) derived from the changed fields
+        if sum(changed_counts.values()) > 0:
+            delete_all_caches()
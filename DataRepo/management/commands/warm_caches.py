@@ -0,0 +1,65 @@
+from django.core.management import BaseCommand
+
+from DataRepo.models.hier_cached_model import (
+    caching_retrievals_enabled,
+    caching_updates_enabled,
+    disable_caching_retrievals,
+    disable_caching_updates,
+    enable_caching_retrievals,
+    enable_caching_updates,
+    flush_access_stats,
+    is_cache_warm,
+    warm_caches,
+)
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Computes missing cached values of the most accessed cached functions, for the most accessed studies first "
+        "(see the CACHE_ACCESS_STATS_FLUSH_INTERVAL setting).  Run this after loads or periodically (e.g. via cron) "
+        "with a --budget until the cache is warm."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--budget",
+            type=float,
+            required=False,
+            default=None,
+            help="The maximum number of seconds to spend warming the cache.  Default: no limit.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            default=False,
+            help="Warm the cache even if it is already warm.",
+        )
+
+    def handle(self, *args, **options):
+        if is_cache_warm() and not options["force"]:
+            self.stdout.write("The cache is already warm.")
+            return
+
+        save_retrievals = caching_retrievals_enabled()
+        save_updates = caching_updates_enabled()
+        if not save_retrievals:
+            enable_caching_retrievals()
+        if not save_updates:
+            enable_caching_updates()
+
+        try:
+            flush_access_stats()
+            warm = warm_caches(budget=options["budget"])
+        finally:
+            if not save_updates:
+                disable_caching_updates()
+            if not save_retrievals:
+                disable_caching_retrievals()
+
+        if warm:
+            self.stdout.write("The cache is warm.")
+        else:
+            self.stdout.write(
+                "The budget was exhausted (or the cache was invalidated) before the cache was warm."
+            )
@@ -0,0 +1,142 @@
+from django.conf import settings
+from django.http import JsonResponse
+
+from DataRepo.models.hier_cached_model import memoized_namespace_stamps
+from DataRepo.models.maintained_model import (
+    MaintainedModel,
+    MaintainedModelCoordinator,
+)
+from DataRepo.profiling import RequestProfile, profiling
+
+
+class ReadOnlyMaintainedFieldsMiddleware:
+    """Processes each request (including the iteration of streaming responses, e.g. downloads) under a "readonly"
+    MaintainedModelCoordinator (if settings.MAINTAINED_FIELDS_READONLY_REQUESTS is True), so that records with empty
+    maintained fields are queued for repair instead of being saved while query results are iterated over.  See the
+    repair_maintained_fields management command.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.MAINTAINED_FIELDS_READONLY_REQUESTS:
+            return self.get_response(request)
+
+        with MaintainedModel.custom_coordinator(
+            MaintainedModelCoordinator(auto_update_mode="readonly")
+        ):
+            response = self.get_response(request)
+
+        if response.streaming:
+            response.streaming_content = self.stream_readonly(
+                response.streaming_content
+            )
+
+        return response
+
+    @staticmethod
+    def stream_readonly(streaming_content):
+        """Generates the content of a streaming response under a "readonly" MaintainedModelCoordinator.
+
+        Args:
+            streaming_content (Iterator[bytes])
+        Exceptions:
+            None
+        Returns:
+            (Generator[bytes])
+        """
+        with MaintainedModel.custom_coordinator(
+            MaintainedModelCoordinator(auto_update_mode="readonly")
+        ):
+            yield from streaming_content
+
+
+class NamespaceStampsMiddleware:
+    """Memoizes the cache namespace versions of cached_function values for the duration of each request (see
+    memoized_namespace_stamps), so that each version is only retrieved from the cache once per request.  The content of
+    streaming responses (e.g. downloads) is generated after the request, without memoization, because it can take long
+    enough for versions bumped elsewhere to matter.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with memoized_namespace_stamps():
+            return self.get_response(request)
+
+
+class RequestProfilingMiddleware:
+    """Profiles each request (if settings.REQUEST_PROFILING is True), attributing database query counts and times,
+    cached_function hits and misses, and render times to BST columns, advanced search formats, and loader phases (see
+    DataRepo.profiling).
+
+    The profile totals are added to the response's Server-Timing header (shown in the browser's developer tools), the
+    profile is saved as request.profile (for the debug toolbar's RequestProfilePanel), and adding the URL parameter
+    "profile=json" replaces the response with the profile as JSON (after generating the content of streaming responses,
+    e.g. downloads).
+    """
+
+    JSON_PARAM = "profile"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REQUEST_PROFILING:
+            return self.get_response(request)
+
+        export_json = request.GET.get(self.JSON_PARAM) == "json"
+
+        with profiling(f"{request.method} {request.path}") as profile:
+            request.profile = profile
+            response = self.get_response(request)
+            if export_json and response.streaming:
+                for _ in response.streaming_content:
+                    pass
+
+        if export_json:
+            return JsonResponse(profile.as_dict())
+
+        if response.streaming:
+            response.streaming_content = self.stream_profiled(
+                response.streaming_content, profile
+            )
+        else:
+            response["Server-Timing"] = self.get_server_timing(profile)
+
+        return response
+
+    @staticmethod
+    def stream_profiled(streaming_content, profile: RequestProfile):
+        """Generates the content of a streaming response while continuing the request's profile.
+
+        Args:
+            streaming_content (Iterator[bytes])
+            profile (RequestProfile)
+        Exceptions:
+            None
+        Returns:
+            (Generator[bytes])
+        """
+        with profiling(profile.name, profile=profile):
+            yield from streaming_content
+
+    @staticmethod
+    def get_server_timing(profile: RequestProfile) -> str:
+        """Returns a Server-Timing header value with the profile's totals.
+
+        Args:
+            profile (RequestProfile)
+        Exceptions:
+            None
+        Returns:
+            (str)
+        """
+        data = profile.as_dict()
+        return (
+            f'db;dur={data["query_time"] * 1000:.1f};desc="{data["queries"]} queries", '
+            f'cache;desc="{data["cache_hits"]} hits {data["cache_misses"]} misses", '
+            f'total;dur={data["time"] * 1000:.1f}'
+        )
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("DataRepo", "0060_merge_20250731_1350"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MaintainedFieldRepair",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "model_name",
+                    models.CharField(
+                        help_text="The name of the MaintainedModel class of the record to repair.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "record_id",
+                    models.IntegerField(
+                        help_text="The primary key of the record to repair."
+                    ),
+                ),
+                (
+                    "propagate",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the record was changed (e.g. saved), meaning that the maintained fields of its related records need to be updated as well.",
+                    ),
+                ),
+                ("queued", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "maintained field repair",
+                "verbose_name_plural": "maintained field repairs",
+                "ordering": ["id"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="maintainedfieldrepair",
+            constraint=models.UniqueConstraint(
+                fields=("model_name", "record_id"), name="unique_maintainedfieldrepair"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("DataRepo", "0061_maintainedfieldrepair"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="peakgroup",
+            name="total_abundance",
+            field=models.FloatField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Total ion counts for this compound (the sum of the corrected abundances of the peak group's peak data).  Maintained field.  Do not edit/set.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="peakgrouplabel",
+            name="enrichment_fraction",
+            field=models.FloatField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="The weighted average of the fraction of labeled atoms of this element in the peak group's compound.  Maintained field.  Do not edit/set.",
+                null=True,
+            ),
+        ),
+    ]
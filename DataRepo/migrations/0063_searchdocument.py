@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("DataRepo", "0062_peak_values"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "index_name",
+                    models.CharField(
+                        help_text="The name of the search index (i.e. the BST list view) that the document belongs to.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "record_id",
+                    models.IntegerField(
+                        help_text="The primary key of the list view's model record that the document describes."
+                    ),
+                ),
+                (
+                    "document",
+                    models.TextField(
+                        help_text="The lower-cased, newline-delimited, distinct searchable column values of the record."
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "search document",
+                "verbose_name_plural": "search documents",
+                "ordering": ["index_name", "record_id"],
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["document"],
+                        name="searchdocument_trgm_idx",
+                        opclasses=["gin_trgm_ops"],
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchdocument",
+            constraint=models.UniqueConstraint(
+                fields=("index_name", "record_id"), name="unique_searchdocument"
+            ),
+        ),
+    ]
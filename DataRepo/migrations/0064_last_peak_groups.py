@@ -0,0 +1,112 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("DataRepo", "0063_searchdocument"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LastTracerPeakGroup",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "peak_group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="last_tracer_links",
+                        to="DataRepo.peakgroup",
+                    ),
+                ),
+                (
+                    "sample",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="last_tracer_peak_group_links",
+                        to="DataRepo.sample",
+                    ),
+                ),
+                (
+                    "tracer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="last_tracer_peak_group_links",
+                        to="DataRepo.tracer",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "last tracer peak group",
+                "verbose_name_plural": "last tracer peak groups",
+                "ordering": ["sample", "tracer"],
+            },
+        ),
+        migrations.CreateModel(
+            name="LastSerumTracerPeakGroup",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "element",
+                    models.CharField(
+                        choices=[
+                            ("C", "Carbon"),
+                            ("N", "Nitrogen"),
+                            ("H", "Hydrogen"),
+                            ("O", "Oxygen"),
+                            ("S", "Sulfur"),
+                            ("P", "Phosphorus"),
+                        ],
+                        help_text="An element that is labeled in the tracer.",
+                        max_length=1,
+                    ),
+                ),
+                (
+                    "animal",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="last_serum_tracer_peak_group_links",
+                        to="DataRepo.animal",
+                    ),
+                ),
+                (
+                    "peak_group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="last_serum_tracer_links",
+                        to="DataRepo.peakgroup",
+                    ),
+                ),
+                (
+                    "tracer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="last_serum_tracer_peak_group_links",
+                        to="DataRepo.tracer",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "last serum tracer peak group",
+                "verbose_name_plural": "last serum tracer peak groups",
+                "ordering": ["animal", "tracer", "element"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="lasttracerpeakgroup",
+            constraint=models.UniqueConstraint(
+                fields=("sample", "tracer"), name="unique_lasttracerpeakgroup"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="lastserumtracerpeakgroup",
+            constraint=models.UniqueConstraint(
+                fields=("animal", "tracer", "element"),
+                name="unique_lastserumtracerpeakgroup",
+            ),
+        ),
+    ]
@@ -0,0 +1,96 @@
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from DataRepo.models.utilities import atom_count_in_formula
+
+CHUNK_SIZE = 1000
+
+
+def populate_peak_values(apps, _):
+    """Populates the maintained fields added by 0062_peak_values (PeakGroup.total_abundance and
+    PeakGroupLabel.enrichment_fraction) for the existing records, computed the same way as their setters
+    (PeakGroup._total_abundance and PeakGroupLabel._enrichment_fraction).  Values that the setters cannot compute (e.g.
+    due to a missing formula, labeled peak data, or total abundance) are left null."""
+
+    PeakGroup = apps.get_model("DataRepo", "PeakGroup")
+    PeakGroupLabel = apps.get_model("DataRepo", "PeakGroupLabel")
+    PeakData = apps.get_model("DataRepo", "PeakData")
+    PeakDataLabel = apps.get_model("DataRepo", "PeakDataLabel")
+
+    PeakGroup.objects.update(
+        total_abundance=Coalesce(
+            Subquery(
+                PeakData.objects.filter(peak_group=OuterRef("pk"))
+                .values("peak_group")
+                .annotate(total=Sum("corrected_abundance"))
+                .values("total")
+            ),
+            Value(0.0),
+        )
+    )
+
+    pg_ids = list(
+        PeakGroupLabel.objects.order_by("peak_group_id")
+        .values_list("peak_group_id", flat=True)
+        .distinct()
+    )
+    for start in range(0, len(pg_ids), CHUNK_SIZE):
+        chunk_ids = pg_ids[start : start + CHUNK_SIZE]
+
+        # The sum of each labeled peak data's corrected abundance times its label count, keyed on peak group and element
+        enrichment_sums = defaultdict(float)
+        invalid_keys = set()
+        for pg_id, element, abundance, count in PeakDataLabel.objects.filter(
+            peak_data__peak_group_id__in=chunk_ids
+        ).values_list(
+            "peak_data__peak_group_id",
+            "element",
+            "peak_data__corrected_abundance",
+            "count",
+        ):
+            if abundance is None or count is None:
+                invalid_keys.add((pg_id, element))
+            else:
+                enrichment_sums[(pg_id, element)] += abundance * count
+
+        labels = list(
+            PeakGroupLabel.objects.filter(peak_group_id__in=chunk_ids).select_related(
+                "peak_group"
+            )
+        )
+        for label in labels:
+            label.enrichment_fraction = None
+            key = (label.peak_group_id, label.element)
+            total_abundance = label.peak_group.total_abundance
+            if (
+                key not in enrichment_sums.keys()
+                or key in invalid_keys
+                or not total_abundance
+            ):
+                continue
+            try:
+                atom_count = atom_count_in_formula(
+                    label.peak_group.formula, label.element
+                )
+            except Exception:
+                continue
+            if not atom_count:
+                continue
+            label.enrichment_fraction = (
+                enrichment_sums[key] / total_abundance / atom_count
+            )
+        PeakGroupLabel.objects.bulk_update(labels, ["enrichment_fraction"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("DataRepo", "0064_last_peak_groups"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_peak_values, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:27
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("DataRepo", "0065_populate_peak_values"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="searchdocument",
+            name="exact_document",
+            field=models.TextField(
+                default="",
+                help_text="The lower-cased, newline-delimited (including a leading and trailing newline), distinct searchable column values of the record that must be matched whole (e.g. values of columns with a select list).",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="searchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["exact_document"],
+                name="searchdocument_exact_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -7,7 +7,12 @@ from DataRepo.models.fcirc import FCirc
 from DataRepo.models.hier_cached_model import HierCachedModel
 from DataRepo.models.infusate import Infusate
 from DataRepo.models.infusate_tracer import InfusateTracer
+from DataRepo.models.last_peak_group import (
+    LastSerumTracerPeakGroup,
+    LastTracerPeakGroup,
+)
 from DataRepo.models.lc_method import LCMethod
+from DataRepo.models.maintained_field_repair import MaintainedFieldRepair
 from DataRepo.models.maintained_model import MaintainedModel
 from DataRepo.models.msrun_sample import MSRunSample
 from DataRepo.models.msrun_sequence import MSRunSequence
@@ -18,6 +23,7 @@ from DataRepo.models.peak_group_label import PeakGroupLabel
 from DataRepo.models.protocol import Protocol
 from DataRepo.models.researcher import Researcher
 from DataRepo.models.sample import Sample
+from DataRepo.models.search_document import SearchDocument
 from DataRepo.models.study import Study
 from DataRepo.models.tissue import Tissue
 from DataRepo.models.tracer import Tracer
@@ -38,7 +44,10 @@ __all__ = [
     "FCirc",
     "Compound",
     "CompoundSynonym",
+    "LastSerumTracerPeakGroup",
+    "LastTracerPeakGroup",
     "LCMethod",
+    "MaintainedFieldRepair",
     "MaintainedModel",
     "MSRunSample",
     "MSRunSequence",
@@ -48,6 +57,7 @@ __all__ = [
     "Protocol",
     "Researcher",
     "Sample",
+    "SearchDocument",
     "Study",
     "Tissue",
     "ElementLabel",
@@ -28,6 +28,7 @@ from .tissue import Tissue
     generation=3,
     parent_field_name="infusate",
     update_label="tracer_stat",
+    input_field_names=["infusate"],
 )
 class Animal(MaintainedModel, HierCachedModel):
     # No parent_related_key_name, because this is a root
@@ -156,6 +157,8 @@ class Animal(MaintainedModel, HierCachedModel):
         child_field_names=["samples"],
         update_label="fcirc_calcs",
         update_field_name="last_serum_sample",
+        # Changes to samples trigger this update via the Sample decorator
+        input_field_names=[],
     )
     def _last_serum_sample(self):
         """
@@ -185,6 +188,8 @@ class Animal(MaintainedModel, HierCachedModel):
         generation=0,
         update_field_name="label_combo",
         update_label="label_combo",
+        prefetch_lookups=["infusate__tracers__labels"],
+        input_field_names=["infusate"],
     )
     def _label_combo(self):
         """Generates a string to populate the label_combo field.
@@ -197,8 +202,9 @@ class Animal(MaintainedModel, HierCachedModel):
     @cached_function
     def last_serum_tracer_peak_groups(self):
         """
-        Retrieves the last Peak Group for each tracer compound
+        Retrieves the last serum sample Peak Group for each tracer compound (see LastSerumTracerPeakGroup)
         """
+        from DataRepo.models.last_peak_group import LastSerumTracerPeakGroup
         from DataRepo.models.peak_group import PeakGroup
 
         if self.tracers.count() == 0:
@@ -206,34 +212,15 @@ class Animal(MaintainedModel, HierCachedModel):
             return PeakGroup.objects.none()
 
         # Get the last peakgroup for each tracer
-        last_serum_peakgroup_ids = []
-        tc_extra_args, tc_is_null_field = create_is_null_field(
-            "msrun_sample__sample__time_collected"
-        )
+        last_serum_peakgroup_ids = LastSerumTracerPeakGroup.get_peak_group_ids(self)
         for tracer in self.tracers.all():
-            tracer_peak_group = (
-                PeakGroup.objects.filter(
-                    msrun_sample__sample__animal__id__exact=self.id
-                )
-                .filter(compounds__id__exact=tracer.compound.id)
-                .filter(Tissue.serum_q_expression("msrun_sample__sample__tissue__name"))
-                .extra(**tc_extra_args)
-                .order_by(
-                    f"-{tc_is_null_field}",
-                    "msrun_sample__sample__time_collected",
-                    "msrun_sample__msrun_sequence__date",
-                )
-                .last()
-            )
-            if tracer_peak_group:
-                last_serum_peakgroup_ids.append(tracer_peak_group.id)
-            else:
+            if tracer.id not in last_serum_peakgroup_ids.keys():
                 warnings.warn(
                     f"Animal {self} has no serum sample peak group for {tracer.compound}."
                 )
                 return PeakGroup.objects.none()
 
-        return PeakGroup.objects.filter(id__in=last_serum_peakgroup_ids)
+        return PeakGroup.objects.filter(id__in=last_serum_peakgroup_ids.values())
 
     @property  # type: ignore
     @cached_function
@@ -3,7 +3,10 @@ from __future__ import annotations
 import hashlib
 import os
 from pathlib import Path
+from typing import Tuple
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.files import File
 from django.db import ProgrammingError, models, transaction
 from django.db.models.signals import post_delete
@@ -12,6 +15,16 @@ from django.forms import model_to_dict
 from django.utils.text import get_valid_filename
 
 from DataRepo.models.utilities import exists_in_db
+from DataRepo.storage import CONTENT_ADDRESSED_DIR
+
+# The number of bytes read at a time when hashing files
+HASH_BLOCK_SIZE = 1024 * 1024
+# The number of leading bytes of a file that are inspected to guess whether it is binary
+BINARY_SAMPLE_SIZE = 1024
+# Bytes that occur in text files
+TEXT_CHARS = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+# The cache key prefix of file checksums (see ArchiveFile.scan_file)
+CHECKSUM_CACHE_KEY_PREFIX = "ArchiveFile.checksum"
 
 
 class DataTypeManager(models.Manager):
@@ -90,6 +103,13 @@ class DataFormat(models.Model):
 
 
 def data_type_path(instance, filename):
+    """Returns the archive path of an ArchiveFile's file.  If settings.ARCHIVE_CONTENT_ADDRESSED is True, the path is
+    derived from the checksum (see ArchiveStorage), otherwise from the import date and data type.
+    """
+    if settings.ARCHIVE_CONTENT_ADDRESSED and instance.checksum:
+        filename_clean = get_valid_filename(filename)
+        checksum = instance.checksum
+        return f"{CONTENT_ADDRESSED_DIR}/{checksum[:2]}/{checksum}/{filename_clean}"
     date_folder = instance.imported_timestamp.strftime("%Y-%m")
     data_type_folder = get_valid_filename(instance.data_type.code)
     filename_clean = get_valid_filename(filename)
@@ -173,9 +193,9 @@ class ArchiveFileQuerySet(models.QuerySet):
         if kwargs.get("filename") is None:
             kwargs["filename"] = path_obj.name
 
-        # Compute and/or check the checksum.
+        # Compute and/or check the checksum.  The same read determines whether the file is binary.
         supplied_checksum = kwargs.get("checksum", None)
-        computed_checksum = ArchiveFile.hash_file(path_obj)
+        computed_checksum, scanned_is_binary = ArchiveFile.scan_file(path_obj)
         if supplied_checksum is not None and computed_checksum != supplied_checksum:
             raise ValueError(
                 f"The supplied checksum [{supplied_checksum}] does not match the computed checksum "
@@ -195,9 +215,7 @@ class ArchiveFileQuerySet(models.QuerySet):
         if created or archivefile_rec.file_location is None:
             # Create a File object
             mode = "r"
-            if (is_binary is not None and is_binary) or ArchiveFile.file_is_binary(
-                file_location
-            ):
+            if (is_binary is not None and is_binary) or scanned_is_binary:
                 mode = "rb"
             with path_obj.open(mode=mode) as file_handle:
                 tmp_file_location = File(file_handle, name=kwargs["filename"])
@@ -293,15 +311,12 @@ class ArchiveFile(models.Model):
         Returns:
             is_binary (boolean)
         """
-        textchars = bytearray(
-            {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F}
-        )
         file_sample = None
         is_binary = False
         try:
             with open(filepath, "rb") as fl:
-                file_sample = fl.read(1024)
-            is_binary = bool(file_sample.translate(None, textchars))
+                file_sample = fl.read(BINARY_SAMPLE_SIZE)
+            is_binary = cls.sample_is_binary(file_sample)
         except Exception:
             # Fall back to guessing by extension
             supported_binary_exts = ["xlsx", "xls"]
@@ -311,7 +326,12 @@ class ArchiveFile(models.Model):
         return is_binary
 
     @classmethod
-    def hash_file(cls, path_obj: File):
+    def sample_is_binary(cls, file_sample: bytes) -> bool:
+        """Guesses whether a file is binary from its leading bytes (see file_is_binary)."""
+        return bool(file_sample.translate(None, TEXT_CHARS))
+
+    @classmethod
+    def hash_file(cls, path_obj: Path):
         """Determine the SHA-1 hash of a file.  Note, it does not matter if the file is binary or not.
         Args:
             path_obj (Path)
@@ -320,16 +340,67 @@ class ArchiveFile(models.Model):
         Returns:
             hex (string): the hex representation of digest
         """
+        checksum, _ = cls.scan_file(path_obj)
+        return checksum
+
+    @classmethod
+    def scan_file(cls, path_obj: Path) -> Tuple[str, bool]:
+        """Determine the SHA-1 hash of a file and guess whether it is binary (see file_is_binary) in a single pass over
+        the file, reading HASH_BLOCK_SIZE bytes at a time.
+
+        If settings.ARCHIVE_CHECKSUM_CACHE is True, the results are cached, keyed on the file's path, size, and
+        modification time, so that unchanged files (e.g. files that are validated and then loaded) are only read once.
+
+        Args:
+            path_obj (Path)
+        Exceptions:
+            None
+        Returns:
+            checksum (str): the hex representation of the SHA-1 digest
+            is_binary (bool)
+        """
+        cache_key = None
+        if settings.ARCHIVE_CHECKSUM_CACHE:
+            cache_key = cls.get_checksum_cache_key(path_obj)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         hash_obj = hashlib.sha1()
+        is_binary = None
+        buffer = bytearray(HASH_BLOCK_SIZE)
+        view = memoryview(buffer)
 
         with path_obj.open("rb") as file_handle:
-            chunk = file_handle.read(1024)
-            hash_obj.update(chunk)
-            while chunk != b"":
-                chunk = file_handle.read(1024)
-                hash_obj.update(chunk)
+            while size := file_handle.readinto(buffer):
+                if is_binary is None:
+                    is_binary = cls.sample_is_binary(
+                        bytes(view[: min(size, BINARY_SAMPLE_SIZE)])
+                    )
+                hash_obj.update(view[:size])
+
+        result = (hash_obj.hexdigest(), bool(is_binary))
+
+        if cache_key is not None:
+            cache.set(cache_key, result)
+
+        return result
+
+    @classmethod
+    def get_checksum_cache_key(cls, path_obj: Path) -> str:
+        """Returns the scan_file cache key of a file, which changes when the file is modified.
 
-        return hash_obj.hexdigest()
+        Args:
+            path_obj (Path)
+        Exceptions:
+            FileNotFoundError: if the file does not exist.
+        Returns:
+            (str)
+        """
+        stat = path_obj.stat()
+        path_digest = hashlib.md5(str(path_obj.resolve()).encode()).hexdigest()
+        version = f"{stat.st_size}.{stat.st_mtime_ns}"
+        return f"{CHECKSUM_CACHE_KEY_PREFIX}.{path_digest}.{version}"
 
     def get_absolute_url(self):
         """Get the URL to the detail page.
@@ -380,5 +451,10 @@ def delete_archive_file(deleted_rec: ArchiveFile) -> None:
             raise ProgrammingError(
                 f"Calling delete_archive_file on existing database record: {model_to_dict(deleted_rec)} is not allowed."
             )
+        elif ArchiveFile.objects.filter(
+            file_location=deleted_rec.file_location.name
+        ).exists():
+            # Content-addressed files (see ArchiveStorage) can be referenced by other records
+            return
         else:
             os.remove(deleted_rec.file_location.path)
@@ -1,15 +1,77 @@
-from functools import wraps
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial, wraps
+from typing import Dict, List, Optional, Set
+from uuid import uuid4
 from warnings import warn
 
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connections, transaction
 from django.db.models import Model
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
 
-CACHING_RETRIEVALS = True
-CACHING_UPDATES = True
+from DataRepo.profiling import record_cache_access
+
+# Whether cached values are retrieved and stored (or invalidated) is set per thread (see caching_updates_enabled), so
+# that a load in a web server worker thread (e.g. a submission validation) does not disable caching for the requests
+# handled concurrently by the other threads
+CACHING_STATE = threading.local()
 THROW_CACHE_ERRORS = False
 FUNC_NAME_LISTS: Dict[str, List] = {}
+# Cache keys of the namespace version stamps (see get_namespace_stamps)
+NAMESPACE_KEY_PREFIX = "HierCachedModel.namespace"
+# Cache key of the version of the data that is bumped after every committed write of a data record (see
+# record_data_write)
+DATA_WRITES_KEY = "HierCachedModel.data_writes"
+# Cache key prefix of the records written by the transaction that bumped the data write version to a given value (see
+# get_data_writes)
+DATA_WRITES_LOG_KEY_PREFIX = "HierCachedModel.data_writes.log"
+# Seconds that the records written per data write version are kept (older versions require a full refresh of the values
+# derived from the data)
+DATA_WRITES_LOG_TIMEOUT = 60 * 60 * 24 * 7
+# The maximum number of data write versions whose written records are combined (see get_data_writes)
+DATA_WRITES_LOG_MAX = 1000
+# Models whose records are derived from other records or are bookkeeping, so writing them does not change the data
+DATA_WRITES_IGNORED_MODELS = [
+    "LastSerumTracerPeakGroup",
+    "LastTracerPeakGroup",
+    "MaintainedFieldRepair",
+    "SearchDocument",
+]
+# Models whose records are only deleted along with their parent records (so that they can still be deleted in bulk,
+# which delete signal receivers prevent)
+DATA_WRITES_IGNORED_DELETE_MODELS = ["PeakData", "PeakDataLabel"]
+# The commit hooks (and the records written) of the transactions (per database) in which a data write version bump is
+# pending
+DATA_WRITES_STATE = threading.local()
+# Cache keys of the access statistics (see record_access) and the warmup state (see warm_caches)
+FUNC_ACCESS_STATS_KEY = "HierCachedModel.access_stats.functions"
+ROOT_ACCESS_STATS_KEY = "HierCachedModel.access_stats.roots"
+WARM_KEY = "HierCachedModel.warm"
+WARMING_KEY = "HierCachedModel.warming"
+# Access counts (per process) that have not yet been added to the access statistics in the cache
+FUNC_ACCESS_COUNTS: Dict[str, int] = defaultdict(int)
+ROOT_ACCESS_COUNTS: Dict[str, int] = defaultdict(int)
+ACCESS_COUNTS_LOCK = threading.Lock()
+# Set while a background flush of the access counts is pending (see schedule_access_stats_flush)
+ACCESS_FLUSH_PENDING = threading.Event()
+# The background cache warmup of this process (see schedule_cache_warmup)
+WARMUP_EXECUTOR: Optional[ThreadPoolExecutor] = None
+WARMUP_FUTURE: Optional[Future] = None
+WARMUP_LOCK = threading.Lock()
+# Accesses made by warmups are not counted
+WARMUP_STATE = threading.local()
+# Namespace versions memoized for the duration of a request (see memoized_namespace_stamps)
+STAMPS_STATE = threading.local()
 
 
 def cached_function(f):
@@ -24,10 +86,15 @@ def cached_function(f):
         whether the use the cache or call the original function and save its output in the cache before returning the
         result
         """
-        result, is_cache_good = get_cache(self, f.__name__)
+        # The value is set under the namespace versions it was looked up with, so that a value computed while its
+        # namespace is bumped is not cached under the new version (and the versions are only retrieved once)
+        stamps = get_cache_stamps(self)
+        result, is_cache_good = get_cache(self, f.__name__, stamps=stamps)
+        if caching_retrievals_enabled():
+            record_access(self, f.__name__)
         if not is_cache_good:
             result = f(self, *args, **kwargs)
-            set_cache(self, f.__name__, result)
+            set_cache(self, f.__name__, result, stamps=stamps)
         return result
 
     class_name = f.__qualname__.split(".")[0]
@@ -40,20 +107,35 @@ def cached_function(f):
     return get_result
 
 
-def get_cache(rec, cache_func_name):
+def get_cache_stamps(rec):
+    """
+    Returns the namespace versions (see get_namespace_stamps) of the supplied record's cached values, or None if caching
+    is disabled or the versions could not be retrieved (in which case get_cache and set_cache report the error).
+    """
+    if not caching_retrievals_enabled() and not caching_updates_enabled():
+        return None
+    try:
+        return get_namespace_stamps(rec)
+    except Exception:
+        return None
+
+
+def get_cache(rec, cache_func_name, stamps=None):
     """
-    Returns a cached value and a boolean as to whether the cached value was good or not (e.g. not cached)
+    Returns a cached value and a boolean as to whether the cached value was good or not (e.g. not cached).  Supply the
+    stamps (from get_namespace_stamps) to avoid retrieving them again.
     """
-    if not CACHING_RETRIEVALS:
+    if not caching_retrievals_enabled():
         return None, False
     try:
         good_cache = True
         uncached = object()
-        cachekey = get_cache_key(rec, cache_func_name)
+        cachekey = get_cache_key(rec, cache_func_name, stamps=stamps)
         result = cache.get(cachekey, uncached)
         if result is uncached:
             result = None
             good_cache = False
+        record_cache_access(rec, cache_func_name, good_cache)
     except Exception as e:
         # Allow tracebase to still work, just without caching
         print(e)
@@ -68,15 +150,16 @@ def get_cache(rec, cache_func_name):
     return result, good_cache
 
 
-def set_cache(rec, cache_func_name, value):
+def set_cache(rec, cache_func_name, value, stamps=None):
     """
-    Caches a given value
+    Caches a given value.  Supply the stamps (from get_namespace_stamps) the value was looked up with to avoid
+    retrieving them again.
     """
-    if not CACHING_UPDATES:
+    if not caching_updates_enabled():
         return False
     try:
-        cachekey = get_cache_key(rec, cache_func_name)
-        cache.set(cachekey, value, timeout=None, version=1)
+        cachekey = get_cache_key(rec, cache_func_name, stamps=stamps)
+        cache.set(cachekey, value, timeout=None)
         if settings.DEBUG:
             print(f"Setting cache {cachekey} to {value}")
         root_rec, first_method_name = rec.get_representative_root_rec_and_method()
@@ -90,7 +173,7 @@ def set_cache(rec, cache_func_name, value):
             rep_cachekey = get_cache_key(root_rec, first_method_name)
             if not is_rep_cache_good:
                 rep_result = getattr(root_rec, first_method_name)
-                cache.set(rep_cachekey, rep_result, timeout=None, version=1)
+                cache.set(rep_cachekey, rep_result, timeout=None)
     except Exception as e:
         # Allow tracebase to still work, just without caching
         print(f"{type(e).__name__}: {e}")
@@ -104,15 +187,556 @@ def set_cache(rec, cache_func_name, value):
     return True
 
 
-def get_cache_key(rec, cache_func_name):
+def get_cache_key(rec, cache_func_name, stamps=None):
+    """
+    Generates a cache key given a record and the cached_property method name.  The key is stamped with the current
+    versions of the global, model, and root record namespaces (see get_namespace_stamps), so that bumping any of those
+    versions invalidates the key without having to delete it.  Invalidated values are aged out by the cache backend's
+    eviction (e.g. MAX_ENTRIES culling).  Supply the stamps (from get_namespace_stamps) to generate multiple keys for
+    the same record without retrieving them each time.
+    """
+    if stamps is None:
+        stamps = get_namespace_stamps(rec)
+    global_stamp, model_stamp, root_stamp = stamps
+    return ".".join(
+        [
+            rec.__class__.__name__,
+            str(rec.pk),
+            cache_func_name,
+            f"v{global_stamp}-{model_stamp}-{root_stamp}",
+        ]
+    )
+
+
+def get_namespace_keys(rec):
+    """
+    Returns the cache keys of the global namespace version, the version of the namespace of the supplied record's model,
+    and the version of the namespace of the supplied record's root record (e.g. its Animal).
+    """
+    if isinstance(rec, HierCachedModel):
+        root_ns_key = rec.get_root_namespace_key()
+    else:
+        root_ns_key = f"{NAMESPACE_KEY_PREFIX}.{rec.__class__.__name__}.{rec.pk}"
+    return (
+        NAMESPACE_KEY_PREFIX,
+        f"{NAMESPACE_KEY_PREFIX}.{rec.__class__.__name__}",
+        root_ns_key,
+    )
+
+
+def get_namespace_stamps(rec):
+    """
+    Returns the current global, model, and root record namespace versions that apply to the supplied record's cached
+    values.  Namespaces without a version yet are initialized.  Inside memoized_namespace_stamps (e.g. during a
+    request), each version is only retrieved from the cache once.
+    """
+    ns_keys = get_namespace_keys(rec)
+    memo = getattr(STAMPS_STATE, "memo", None)
+    if memo is None:
+        stamps = cache.get_many(ns_keys)
+    else:
+        stamps = {ns_key: memo[ns_key] for ns_key in ns_keys if ns_key in memo}
+        missing_keys = [ns_key for ns_key in ns_keys if ns_key not in stamps.keys()]
+        if len(missing_keys) > 0:
+            stamps.update(cache.get_many(missing_keys))
+    for ns_key in ns_keys:
+        if ns_key not in stamps.keys():
+            # Another process may initialize the version at the same time, so only add it if it does not exist
+            cache.add(ns_key, new_namespace_stamp(), timeout=None)
+            stamps[ns_key] = cache.get(ns_key)
+    if memo is not None:
+        memo.update(stamps)
+    return tuple(stamps[ns_key] for ns_key in ns_keys)
+
+
+@contextmanager
+def memoized_namespace_stamps():
+    """
+    Memoizes the namespace versions retrieved by get_namespace_stamps in the current thread (e.g. for the duration of a
+    request), so that looking up multiple cached values under the same namespaces only retrieves their versions once.
+    Namespaces bumped in this thread are forgotten (see bump_namespace).  Versions bumped by other threads or processes
+    are not noticed until the context exits, so only use this around short units of work.
+    """
+    outer_memo = getattr(STAMPS_STATE, "memo", None)
+    if outer_memo is None:
+        STAMPS_STATE.memo = {}
+    try:
+        yield
+    finally:
+        if outer_memo is None:
+            STAMPS_STATE.memo = None
+
+
+def new_namespace_stamp():
     """
-    Generates a cache key given a record and the cached_property method name
+    Returns an initial namespace version.  The version is based on the current time so that if a namespace version is
+    evicted from the cache, its re-initialized version will not coincide with a version used before the eviction (and
+    thereby resurrect stale values).
     """
-    return ".".join([rec.__class__.__name__, str(rec.pk), cache_func_name])
+    return time.time_ns()
+
+
+def bump_namespace(ns_key):
+    """
+    Increments the version of the namespace with the supplied key, which invalidates every cached value in the namespace
+    in O(1).
+    """
+    try:
+        cache.incr(ns_key)
+    except ValueError:
+        # The version does not exist (yet or anymore)
+        cache.add(ns_key, new_namespace_stamp(), timeout=None)
+    memo = getattr(STAMPS_STATE, "memo", None)
+    if memo is not None:
+        memo.pop(ns_key, None)
+    # The cache is no longer warm, and any running warmup is warming values that are no longer current
+    cache.delete_many([WARM_KEY, WARMING_KEY])
 
 
 def delete_all_caches():
-    cache.clear()
+    """
+    Invalidates every cached value by bumping the global namespace version.
+    """
+    bump_namespace(NAMESPACE_KEY_PREFIX)
+
+
+def get_data_version():
+    """
+    Returns a version of the data, which changes whenever data is changed in bulk (i.e. the global namespace version,
+    bumped by e.g. loads and maintained field rebuilds, which call delete_all_caches) and after every committed save or
+    delete of a data record (see record_data_write).  Use it to stamp values derived from the data (e.g. search indexes)
+    that are not cached functions.
+    """
+    version_keys = [NAMESPACE_KEY_PREFIX, DATA_WRITES_KEY]
+    versions = cache.get_many(version_keys)
+    for version_key in version_keys:
+        if version_key not in versions.keys():
+            cache.add(version_key, new_namespace_stamp(), timeout=None)
+            versions[version_key] = cache.get(version_key)
+    return "-".join(str(versions[version_key]) for version_key in version_keys)
+
+
+def new_data_writes() -> dict:
+    """
+    Returns an empty record of data writes (see get_data_writes), containing:
+        pks (Dict[str, Set[int]]): Primary keys of the written records and of the records whose relations they changed,
+            keyed on model name.
+        deleted (bool): Whether any record was deleted.
+        complete (bool): Whether every written record is known (e.g. a many-to-many clear does not say which records
+            were unlinked).
+    """
+    return {"pks": defaultdict(set), "deleted": False, "complete": True}
+
+
+def get_data_writes(since_version: str, version: str) -> Optional[dict]:
+    """
+    Returns the records written between the supplied data versions (see get_data_version and new_data_writes), so that
+    values derived from the data can be updated for just those records.
+
+    Args:
+        since_version (str): The data version that derived values were last updated at.
+        version (str): The current data version.
+    Exceptions:
+        None
+    Returns:
+        writes (Optional[dict]): None if the written records are unknown, e.g. the data was changed in bulk (i.e. the
+            namespace version changed) or the written records of a version have been evicted from the cache.
+    """
+    since_namespace, since_writes = since_version.split("-")
+    namespace, writes_version = version.split("-")
+    if since_namespace != namespace:
+        return None
+    log_keys = [
+        f"{DATA_WRITES_LOG_KEY_PREFIX}.{v}"
+        for v in range(int(since_writes) + 1, int(writes_version) + 1)
+    ]
+    if len(log_keys) > DATA_WRITES_LOG_MAX:
+        return None
+    logs = cache.get_many(log_keys)
+    writes = new_data_writes()
+    for log_key in log_keys:
+        if log_key not in logs.keys() or not logs[log_key]["complete"]:
+            return None
+        for model_name, pks in logs[log_key]["pks"].items():
+            writes["pks"][model_name].update(pks)
+        writes["deleted"] = writes["deleted"] or logs[log_key]["deleted"]
+    return writes
+
+
+def bump_data_writes(writes: Optional[dict] = None):
+    """
+    Increments the data write version (see get_data_version) and saves the supplied records written (see
+    new_data_writes) under the new version (see get_data_writes).
+    """
+    try:
+        version = cache.incr(DATA_WRITES_KEY)
+    except ValueError:
+        # The version does not exist (yet or anymore), and neither do the records written before it
+        cache.add(DATA_WRITES_KEY, new_namespace_stamp(), timeout=None)
+        return
+    if writes is not None:
+        writes["pks"] = dict(writes["pks"])
+        cache.set(
+            f"{DATA_WRITES_LOG_KEY_PREFIX}.{version}",
+            writes,
+            timeout=DATA_WRITES_LOG_TIMEOUT,
+        )
+
+
+def get_foreign_keys(rec) -> Dict[str, Set[int]]:
+    """
+    Returns the primary keys of the records that the supplied record links to via its foreign keys, keyed on model name.
+    """
+    pks: Dict[str, Set[int]] = defaultdict(set)
+    for field in get_foreign_key_fields(type(rec)):
+        pk = getattr(rec, field.attname)
+        if pk is not None:
+            pks[field.related_model.__name__].add(pk)
+    return pks
+
+
+def get_foreign_key_fields(model) -> list:
+    """
+    Returns the supplied model's foreign key (and one-to-one) fields that link to the primary keys of other models.
+    """
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if field.is_relation
+        and field.related_model is not None
+        and field.target_field.primary_key
+    ]
+
+
+def record_data_update(sender, instance=None, raw=False, using=None, **kwargs):
+    """
+    Signal receiver (see connect_data_write_signals) that records the records that an existing record is about to be
+    unlinked from (i.e. its current foreign keys) by a save (see record_data_write), because the values derived from
+    those records may change too.  Writes made while caching updates are disabled are ignored.
+    """
+    if not caching_updates_enabled() or raw or instance._state.adding:
+        return
+    try:
+        if len(get_foreign_key_fields(sender)) == 0:
+            return
+        current = sender._base_manager.using(using).filter(pk=instance.pk).first()
+        if current is not None:
+            record_data_write(sender, using=using, linked=get_foreign_keys(current))
+    except Exception as e:
+        # Allow tracebase to still work, just without incremental updates of values derived from the data
+        if THROW_CACHE_ERRORS:
+            raise CacheError(f"{sender.__name__} update ERROR: {e}")
+        print(
+            f"WARNING: CacheError: Unable to record a {sender.__name__} update: {type(e).__name__}: {e}"
+        )
+
+
+def record_data_write(sender, using=None, instance=None, linked=None, **kwargs):
+    """
+    Signal receiver (see connect_data_write_signals) that bumps the data write version (see get_data_version) when the
+    transaction of a save or delete of a data record commits (so that no value is derived from uncommitted data under
+    the new version).  The version is bumped once per transaction, along with the records that the transaction wrote
+    (see get_data_writes).  Writes made while caching updates are disabled (i.e. loads, which call delete_all_caches
+    when done) are ignored.
+
+    Args:
+        sender (Type[Model]): The model (or many-to-many through model) of the written record.
+        using (Optional[str]): The database alias.
+        instance (Optional[Model]): The written record.
+        linked (Optional[Dict[str, Set[int]]]): Primary keys of records whose relations changed, keyed on model name.
+        kwargs (dict): Other signal arguments, e.g. the action, model, and pk_set of many-to-many changes.
+    Exceptions:
+        None
+    Returns:
+        None
+    """
+    if not caching_updates_enabled():
+        return
+    try:
+        connection = transaction.get_connection(using)
+        # The commit hooks list is replaced when the transaction commits or (partially) rolls back, so a bump that was
+        # added to the current list is still pending
+        pending_hooks = getattr(DATA_WRITES_STATE, "pending_hooks", {})
+        pending_writes = getattr(DATA_WRITES_STATE, "pending_writes", {})
+        if (
+            connection.in_atomic_block
+            and pending_hooks.get(connection.alias) is connection.run_on_commit
+        ):
+            writes = pending_writes[connection.alias]
+        else:
+            writes = new_data_writes()
+
+        if linked is not None:
+            for model_name, pks in linked.items():
+                writes["pks"][model_name].update(pks)
+        if instance is not None:
+            writes["pks"][type(instance).__name__].add(instance.pk)
+            if "action" in kwargs.keys():
+                # A many-to-many change
+                if kwargs.get("pk_set") is None:
+                    writes["complete"] = False
+                else:
+                    writes["pks"][kwargs["model"].__name__].update(kwargs["pk_set"])
+            elif "created" not in kwargs.keys():
+                # A delete, which changes the records it was linked to
+                writes["deleted"] = True
+                for model_name, pks in get_foreign_keys(instance).items():
+                    writes["pks"][model_name].update(pks)
+
+        if not connection.in_atomic_block:
+            bump_data_writes(writes)
+        elif writes is not pending_writes.get(connection.alias):
+            transaction.on_commit(partial(bump_data_writes, writes), using=using)
+            pending_hooks[connection.alias] = connection.run_on_commit
+            pending_writes[connection.alias] = writes
+            DATA_WRITES_STATE.pending_hooks = pending_hooks
+            DATA_WRITES_STATE.pending_writes = pending_writes
+    except Exception as e:
+        # Allow tracebase to still work, just without invalidation of values derived from the data
+        if THROW_CACHE_ERRORS:
+            raise CacheError(f"{sender.__name__} write ERROR: {e}")
+        print(
+            f"WARNING: CacheError: Unable to record a {sender.__name__} write: {type(e).__name__}: {e}"
+        )
+
+
+def connect_data_write_signals(models):
+    """
+    Connects record_data_write to the save, delete, and many-to-many change signals of the supplied models (e.g. every
+    model of the DataRepo app, see DatarepoConfig.ready), except DATA_WRITES_IGNORED_MODELS (and the delete signals of
+    DATA_WRITES_IGNORED_DELETE_MODELS), and record_data_update to their pre-save signals.
+    """
+    for model in models:
+        if model.__name__ in DATA_WRITES_IGNORED_MODELS:
+            continue
+        pre_save.connect(record_data_update, sender=model)
+        post_save.connect(record_data_write, sender=model)
+        if model.__name__ not in DATA_WRITES_IGNORED_DELETE_MODELS:
+            post_delete.connect(record_data_write, sender=model)
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(record_data_write, sender=field.remote_field.through)
+
+
+def record_access(rec, cache_func_name):
+    """
+    Counts an access of a cached function (per class and method) and of the root record (e.g. Animal) it belongs to.
+    The counts are kept in memory and added to the access statistics in the cache (which are used to prioritize cache
+    warmups) every CACHE_ACCESS_STATS_FLUSH_INTERVAL accesses, in the background (see schedule_access_stats_flush).
+    """
+    if getattr(WARMUP_STATE, "active", False):
+        return
+    try:
+        # The root namespace key (e.g. "HierCachedModel.namespace.Animal.1") is memoized on the record by the cache
+        # lookup, so the root record does not need to be retrieved
+        root_key = get_namespace_keys(rec)[2].removeprefix(f"{NAMESPACE_KEY_PREFIX}.")
+        with ACCESS_COUNTS_LOCK:
+            FUNC_ACCESS_COUNTS[f"{rec.__class__.__name__}.{cache_func_name}"] += 1
+            ROOT_ACCESS_COUNTS[root_key] += 1
+            flush = (
+                not ACCESS_FLUSH_PENDING.is_set()
+                and sum(FUNC_ACCESS_COUNTS.values())
+                >= settings.CACHE_ACCESS_STATS_FLUSH_INTERVAL
+            )
+            if flush:
+                ACCESS_FLUSH_PENDING.set()
+        if flush:
+            schedule_access_stats_flush()
+    except Exception as e:
+        # Allow tracebase to still work, just without access statistics
+        print(
+            f"WARNING: CacheError: Unable to record access statistics: {type(e).__name__}: {e}"
+        )
+
+
+def flush_access_stats():
+    """
+    Adds the access counts recorded in this process to the access statistics in the cache.  Concurrent flushes from
+    different processes can lose counts, which is acceptable for prioritization.
+    """
+    with ACCESS_COUNTS_LOCK:
+        func_counts = dict(FUNC_ACCESS_COUNTS)
+        root_counts = dict(ROOT_ACCESS_COUNTS)
+        FUNC_ACCESS_COUNTS.clear()
+        ROOT_ACCESS_COUNTS.clear()
+    stats = cache.get_many([FUNC_ACCESS_STATS_KEY, ROOT_ACCESS_STATS_KEY])
+    for stats_key, counts in (
+        (FUNC_ACCESS_STATS_KEY, func_counts),
+        (ROOT_ACCESS_STATS_KEY, root_counts),
+    ):
+        merged = stats.get(stats_key, {})
+        for key, count in counts.items():
+            merged[key] = merged.get(key, 0) + count
+        stats[stats_key] = merged
+    cache.set_many(stats, timeout=None)
+
+
+def schedule_access_stats_flush():
+    """
+    Flushes the access statistics (see flush_access_stats) and then schedules a cache warmup (see
+    schedule_cache_warmup) in the background worker thread of this process, so that neither delays the request that
+    triggered it.
+    """
+    global WARMUP_EXECUTOR
+
+    with WARMUP_LOCK:
+        if WARMUP_EXECUTOR is None:
+            WARMUP_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="cache_warmup"
+            )
+        return WARMUP_EXECUTOR.submit(flush_access_stats_in_worker)
+
+
+def flush_access_stats_in_worker():
+    """
+    Runs flush_access_stats and schedule_cache_warmup in the background worker thread (see schedule_access_stats_flush).
+    """
+    try:
+        flush_access_stats()
+        schedule_cache_warmup()
+    except Exception as e:
+        print(
+            f"WARNING: CacheError: Unable to flush access statistics: {type(e).__name__}: {e}"
+        )
+    finally:
+        ACCESS_FLUSH_PENDING.clear()
+
+
+def get_access_stats():
+    """
+    Returns the function access counts (keyed on "Class.method") and the root record access counts (keyed on
+    "Class.pk") from the cache.
+    """
+    stats = cache.get_many([FUNC_ACCESS_STATS_KEY, ROOT_ACCESS_STATS_KEY])
+    return stats.get(FUNC_ACCESS_STATS_KEY, {}), stats.get(ROOT_ACCESS_STATS_KEY, {})
+
+
+def is_cache_warm():
+    """
+    Returns whether a cache warmup has completed since the last invalidation.
+    """
+    return cache.get(WARM_KEY, False) is True
+
+
+def schedule_cache_warmup():
+    """
+    Starts a background cache warmup (limited to CACHE_WARMUP_BUDGET seconds) in this process, unless warmups are
+    disabled (i.e. the budget is 0), the cache is already warm, or a warmup is already running.  This is called after
+    every background flush of the access statistics (see schedule_access_stats_flush), so warmups keep being scheduled
+    after loads or invalidations until the cache is warm.
+    """
+    global WARMUP_EXECUTOR, WARMUP_FUTURE
+
+    if settings.CACHE_WARMUP_BUDGET <= 0 or is_cache_warm():
+        return None
+
+    with WARMUP_LOCK:
+        if WARMUP_FUTURE is not None and not WARMUP_FUTURE.done():
+            return None
+        if WARMUP_EXECUTOR is None:
+            WARMUP_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="cache_warmup"
+            )
+        WARMUP_FUTURE = WARMUP_EXECUTOR.submit(
+            warm_caches_in_worker, settings.CACHE_WARMUP_BUDGET
+        )
+    return WARMUP_FUTURE
+
+
+def warm_caches_in_worker(budget):
+    """
+    Runs warm_caches in a worker thread, which must close the database connections it opens.
+    """
+    try:
+        return warm_caches(budget=budget)
+    except Exception as e:
+        print(f"WARNING: CacheError: Cache warmup failed: {type(e).__name__}: {e}")
+        return False
+    finally:
+        connections.close_all()
+
+
+def warm_caches(budget=None):
+    """
+    Computes and caches the values of the cached functions that have been accessed (see record_access), most accessed
+    first.  Functions of models that do not belong to an Animal are warmed first.  The rest are warmed one study at a
+    time, starting with the study whose animals' cached values were accessed most.
+
+    Args:
+        budget (Optional[float]): Stop after this many seconds.  None means no limit.
+    Exceptions:
+        None
+    Returns:
+        warm (bool): Whether the warmup completed (in which case the cache is marked as warm, unless it was invalidated
+            during the warmup).
+    """
+    from DataRepo.models.study import Study
+    from DataRepo.models.utilities import get_model_by_name
+
+    start = time.monotonic()
+    token = uuid4().hex
+    cache.set(WARMING_KEY, token, timeout=None)
+
+    func_stats, root_stats = get_access_stats()
+    # Most accessed functions first
+    func_keys = sorted(
+        [k for k, v in func_stats.items() if v > 0],
+        key=lambda k: func_stats[k],
+        reverse=True,
+    )
+
+    study_funcs = []
+    other_funcs = []
+    for func_key in func_keys:
+        class_name, func_name = func_key.split(".")
+        if func_name not in FUNC_NAME_LISTS.get(class_name, []):
+            # E.g. a function that has since been removed
+            continue
+        model = get_model_by_name(class_name)
+        animal_path = model.get_animal_path()
+        if animal_path is None:
+            other_funcs.append((model.objects.all(), func_name))
+        else:
+            study_funcs.append((model, animal_path, func_name))
+
+    # Most accessed studies first
+    study_scores: Dict[int, int] = defaultdict(int)
+    for study_id, animal_id in Study.objects.values_list("id", "animals__id"):
+        study_scores[study_id] += root_stats.get(f"Animal.{animal_id}", 0)
+    study_ids = sorted(study_scores.keys(), key=lambda k: study_scores[k], reverse=True)
+
+    batches = other_funcs + [
+        (
+            model.objects.filter(**{f"{animal_path}studies__id": study_id}).distinct(),
+            func_name,
+        )
+        for study_id in study_ids
+        for model, animal_path, func_name in study_funcs
+    ]
+
+    WARMUP_STATE.active = True
+    try:
+        for queryset, func_name in batches:
+            for rec in queryset.order_by("pk"):
+                if budget is not None and time.monotonic() - start > budget:
+                    return False
+                try:
+                    # The cached_function decorator only computes the value if it is not already cached
+                    getattr(rec, func_name)
+                except Exception as e:
+                    if settings.DEBUG:
+                        warn(
+                            f"Exception when warming '{func_name}' for '{type(rec).__name__}' record: '{rec}': "
+                            f"{type(e).__name__}: {e}"
+                        )
+    finally:
+        WARMUP_STATE.active = False
+
+    # Only mark the cache as warm if it was not invalidated during the warmup
+    if cache.get(WARMING_KEY) == token:
+        cache.set(WARM_KEY, True, timeout=None)
+        cache.delete(WARMING_KEY)
+        return True
+    return False
 
 
 def get_cached_method_names():
@@ -123,36 +747,46 @@ def get_cached_method_names():
     return FUNC_NAME_LISTS
 
 
+def caching_retrievals_enabled():
+    """
+    Returns whether cached values are retrieved in the current thread (see disable_caching_retrievals).
+    """
+    return getattr(CACHING_STATE, "retrievals", True)
+
+
+def caching_updates_enabled():
+    """
+    Returns whether cached values are stored and invalidated in the current thread (see disable_caching_updates).
+    """
+    return getattr(CACHING_STATE, "updates", True)
+
+
 def disable_caching_updates():
     """
-    Prevents storage and deletion of cached values.  Currently only used for loading scripts.
+    Prevents storage and deletion of cached values in the current thread.  Currently only used for loading scripts.
     """
-    global CACHING_UPDATES
-    CACHING_UPDATES = False
+    CACHING_STATE.updates = False
 
 
 def enable_caching_updates():
     """
-    Reenables storage and deletion of cached values.  Currently only used for loading scripts.
+    Reenables storage and deletion of cached values in the current thread.  Currently only used for loading scripts.
     """
-    global CACHING_UPDATES
-    CACHING_UPDATES = True
+    CACHING_STATE.updates = True
 
 
 def disable_caching_retrievals():
     """
-    Prevents storage and deletion of cached values.  Currently only used for loading scripts.
+    Prevents retrieval of cached values in the current thread.  Currently only used for loading scripts.
     """
-    global CACHING_RETRIEVALS
-    CACHING_RETRIEVALS = False
+    CACHING_STATE.retrievals = False
 
 
 def enable_caching_retrievals():
     """
-    Reenables storage and deletion of cached values.  Currently only used for loading scripts.
+    Reenables retrieval of cached values in the current thread.  Currently only used for loading scripts.
     """
-    global CACHING_RETRIEVALS
-    CACHING_RETRIEVALS = True
+    CACHING_STATE.retrievals = True
 
 
 def disable_caching_errors():
@@ -194,35 +828,49 @@ class HierCachedModel(Model):
         # tarversed without a record existing in the database:
         # ValueError: '<model name>' instance needs to have a primary key value before this relationship can be used.
         super().save(*args, **kwargs)  # Call the "real" save() method.
-        if CACHING_UPDATES:
+        if caching_updates_enabled():
             self.delete_related_caches()
 
     def delete(self, *args, **kwargs):
         """
         If caching updates are enabled, trigger the deletion of every cached value under the linked Animal record
         """
-        if CACHING_UPDATES:
+        if caching_updates_enabled():
             self.delete_related_caches()
         return super().delete(*args, **kwargs)  # Call the "real" delete() method.
 
     def delete_related_caches(self):
         """
-        If caching updates are enabled, trigger the deletion of every cached value under the linked Animal record
+        If caching updates are enabled, invalidate every cached value under the linked Animal record (by bumping the
+        root record's namespace version)
+        """
+        if caching_updates_enabled():
+            bump_namespace(self.get_root_namespace_key())
+
+    @classmethod
+    def delete_model_caches(cls):
+        """
+        If caching updates are enabled, invalidate every cached value of the calling model (by bumping the model's
+        namespace version)
         """
-        if CACHING_UPDATES:
-            self.get_root_record().delete_descendant_caches()
+        if caching_updates_enabled():
+            bump_namespace(f"{NAMESPACE_KEY_PREFIX}.{cls.__name__}")
 
     def delete_descendant_caches(self):
         """
         Cascading cache deletion from self, downward. Call from a root record to delete all belonging to the same root
-        parent
+        parent (which only bumps the root record's namespace version instead of traversing the hierarchy)
         """
-        if not CACHING_UPDATES:
+        if not caching_updates_enabled():
+            return
+        if self.parent_related_key_name is None:
+            bump_namespace(get_namespace_keys(self)[2])
             return
         delete_keys = []
+        stamps = get_namespace_stamps(self)
         # For every cached property, delete the cache value
         for cached_function in self.get_my_cached_method_names():
-            cache_key = get_cache_key(self, cached_function)
+            cache_key = get_cache_key(self, cached_function, stamps=stamps)
             if settings.DEBUG:
                 print(f"Deleting cache {cache_key}")
             delete_keys.append(cache_key)
@@ -231,8 +879,9 @@ class HierCachedModel(Model):
         # For every child model for which we have a related name
         for child_rel_name in self.child_related_key_names:
             child_instance = getattr(self, child_rel_name)
-            # For every child record, call its delete_descendant_caches()
-            for rec in child_instance.all():
+            # For every child record, call its delete_descendant_caches().  Only the keys are needed, so no other field
+            # values are retrieved (which also avoids triggering lazy auto-updates of maintained fields).
+            for rec in child_instance.only("pk"):
                 rec.delete_descendant_caches()
 
     @classmethod
@@ -293,6 +942,29 @@ class HierCachedModel(Model):
                 "maintain hierarchical cached values."
             )
 
+    @classmethod
+    def get_root_model_and_path(cls):
+        """
+        Returns the root model of the calling model and the field path (ending in "__") from the calling model to it via
+        the parent_related_key_names (e.g. Animal and "animal__" for Sample, or the calling model and "" for a root
+        model).
+        """
+        model = cls
+        path = ""
+        while model.parent_related_key_name is not None:
+            path += f"{model.parent_related_key_name}__"
+            model = model._meta.get_field(model.parent_related_key_name).related_model
+        return model, path
+
+    @classmethod
+    def get_animal_path(cls):
+        """
+        Returns the field path (ending in "__") from the calling model to Animal via the parent_related_key_names (e.g.
+        "animal__" for Sample), "" for Animal itself, or None if the model's root model is not Animal.
+        """
+        model, path = cls.get_root_model_and_path()
+        return path if model.__name__ == "Animal" else None
+
     def get_root_record(self):
         """
         From any record in the hierarchy, obtain the root record it is associated with.
@@ -303,6 +975,52 @@ class HierCachedModel(Model):
         else:
             return self
 
+    def get_root_pk(self):
+        """
+        Returns the primary key of the root record (see get_root_record) without retrieving the records in between.
+        Parent records that are already loaded (e.g. via select_related) are used, the parent's key is read from the
+        foreign key field if the parent is the root, and otherwise it is retrieved with a single query.
+        """
+        rec = self
+        while rec.parent_related_key_name is not None:
+            field = rec._meta.get_field(rec.parent_related_key_name)
+            if field.is_cached(rec):
+                rec = getattr(rec, rec.parent_related_key_name)
+                continue
+            root_model, path = type(rec).get_root_model_and_path()
+            if path == f"{rec.parent_related_key_name}__":
+                return getattr(rec, field.attname)
+            if rec.pk is None:
+                # An unsaved record cannot be queried
+                return rec.get_root_record().pk
+            return (
+                type(rec)
+                .objects.filter(pk=rec.pk)
+                .values_list(f"{path}pk", flat=True)
+                .first()
+            )
+        return rec.pk
+
+    def get_root_namespace_key(self):
+        """
+        Returns the cache key of the namespace version of the root record (see get_namespace_stamps).  The key is
+        memoized on the record (until its parent changes), so the root record's primary key is only looked up once.
+        """
+        if self.parent_related_key_name is None:
+            return f"{NAMESPACE_KEY_PREFIX}.{self.__class__.__name__}.{self.pk}"
+        parent_id = getattr(
+            self, self._meta.get_field(self.parent_related_key_name).attname
+        )
+        memo = self.__dict__.get("_root_namespace_key")
+        if memo is not None and memo[0] == parent_id:
+            return memo[1]
+        root_model, _ = self.get_root_model_and_path()
+        root_ns_key = (
+            f"{NAMESPACE_KEY_PREFIX}.{root_model.__name__}.{self.get_root_pk()}"
+        )
+        self._root_namespace_key = (parent_id, root_ns_key)
+        return root_ns_key
+
     @classmethod
     def build_cached_fields(
         cls,
@@ -135,6 +135,7 @@ class InfusateQuerySet(models.QuerySet):
     generation=2,
     parent_field_name="tracers",
     update_label="tracer_stat",
+    input_field_names=[],
 )
 class Infusate(MaintainedModel, HierCachedModel):
     objects: InfusateQuerySet = InfusateQuerySet().as_manager()
@@ -189,26 +190,38 @@ class Infusate(MaintainedModel, HierCachedModel):
     def __str__(self):
         return str(self._name())
 
-    @MaintainedModel.setter(generation=0, update_field_name="name", update_label="name")
+    @MaintainedModel.setter(
+        generation=0,
+        update_field_name="name",
+        update_label="name",
+        prefetch_lookups=[
+            "tracer_links__tracer__compound",
+            "tracer_links__tracer__labels",
+        ],
+        # Changes to tracers trigger this update via the InfusateTracer decorators
+        input_field_names=["tracer_group_name"],
+    )
     def _name(self):
         # Format: `tracer_group_name {tracername[concentration];tracername[concentration]}`
 
         # Need to check self.id to see if the record exists yet or not, because if it does not yet exist, we cannot use
-        # the reverse self.tracers reference until it exists (besides, another update will trigger when the
+        # the reverse self.tracer_links reference until it exists (besides, another update will trigger when the
         # InfusateTracer records are created).  Otherwise, the following exception is thrown:
-        # ValueError: "<Infusate: >" needs to have a value for field "id" before this many-to-many relationship can be
-        # used.
-        if self.id is None or self.tracers is None or self.tracers.count() == 0:
+        # ValueError: "<Infusate: >" needs to have a value for field "id" before this relationship can be used.
+        if self.id is None:
             return self.tracer_group_name
 
-        link_recs = self.tracers.through.objects.filter(infusate__id__exact=self.id)
+        # Iterating .all() (instead of filtering) uses the prefetched links
+        link_recs = list(self.tracer_links.all())
+        if len(link_recs) == 0:
+            return self.tracer_group_name
 
         name = self.TRACER_DELIMITER.join(
             sorted(
                 map(
                     lambda o: o.tracer._name()
                     + f"[{o.concentration:.{self.CONCENTRATION_SIGNIFICANT_FIGURES}g}]",
-                    link_recs.all(),
+                    link_recs,
                 )
             )
         )
@@ -223,6 +236,8 @@ class Infusate(MaintainedModel, HierCachedModel):
         update_field_name="label_combo",
         parent_field_name="animals",
         update_label="label_combo",
+        prefetch_lookups=["tracers__labels"],
+        input_field_names=[],
     )
     def _label_combo(self):
         """Generates a string to populate the label_combo field.
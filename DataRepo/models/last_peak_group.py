@@ -0,0 +1,369 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from DataRepo.models.element_label import ElementLabel
+from DataRepo.models.hier_cached_model import (
+    get_namespace_keys,
+    get_namespace_stamps,
+)
+
+# The cache key prefix of the namespace stamps (see get_namespace_stamps) of the animals whose last peak groups were
+# last refreshed
+VERSION_KEY_PREFIX = "LastPeakGroup.version"
+
+
+class LastTracerPeakGroup(models.Model):
+    """
+    The last peak group (by MSRunSequence date) of every tracer compound in every sample, i.e. the precomputed result of
+    Sample.last_tracer_peak_groups.  Refreshed (for the animals the load changed) at the end of every load (see
+    refresh_last_peak_groups).
+    """
+
+    id = models.AutoField(primary_key=True)
+    sample = models.ForeignKey(
+        to="DataRepo.Sample",
+        on_delete=models.CASCADE,
+        related_name="last_tracer_peak_group_links",
+    )
+    tracer = models.ForeignKey(
+        to="DataRepo.Tracer",
+        on_delete=models.CASCADE,
+        related_name="last_tracer_peak_group_links",
+    )
+    peak_group = models.ForeignKey(
+        to="DataRepo.PeakGroup",
+        on_delete=models.CASCADE,
+        related_name="last_tracer_links",
+    )
+
+    class Meta:
+        verbose_name = "last tracer peak group"
+        verbose_name_plural = "last tracer peak groups"
+        ordering = ["sample", "tracer"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sample", "tracer"],
+                name="unique_lasttracerpeakgroup",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"Last {self.tracer} peak group in sample {self.sample}: {self.peak_group}"
+        )
+
+    @classmethod
+    def compute(cls, animal_ids: Optional[List[int]] = None):
+        """Computes the last peak group of every tracer compound in every sample (of the supplied animals) using a
+        single window function query.
+
+        Args:
+            animal_ids (Optional[List[int]]): Limit the computation to these animals' samples.  Default: all.
+        Exceptions:
+            None
+        Returns:
+            (List[LastTracerPeakGroup]): Unsaved records.
+        """
+        from DataRepo.models.peak_group import PeakGroup
+
+        tracer_path = "msrun_sample__sample__animal__infusate__tracers"
+        qs = PeakGroup.objects.filter(compounds=F(f"{tracer_path}__compound"))
+        if animal_ids is not None:
+            qs = qs.filter(msrun_sample__sample__animal__id__in=animal_ids)
+        rows = (
+            qs.annotate(
+                last_sample_id=F("msrun_sample__sample"),
+                last_tracer_id=F(tracer_path),
+                last_rank=Window(
+                    expression=RowNumber(),
+                    partition_by=[F("msrun_sample__sample"), F(tracer_path)],
+                    order_by=[
+                        F("msrun_sample__msrun_sequence__date").desc(),
+                        F("id").desc(),
+                    ],
+                ),
+            )
+            .filter(last_rank=1)
+            .values_list("last_sample_id", "last_tracer_id", "id")
+        )
+        return [
+            cls(sample_id=sample_id, tracer_id=tracer_id, peak_group_id=pg_id)
+            for sample_id, tracer_id, pg_id in rows
+        ]
+
+    @classmethod
+    def get_peak_group_ids(cls, sample) -> Dict[int, int]:
+        """Returns the ID of the last peak group of every tracer compound in the supplied sample, from the table if it
+        is current for the sample's animal (see is_current), otherwise computed.
+
+        Args:
+            sample (Sample)
+        Exceptions:
+            None
+        Returns:
+            (Dict[int, int]): Peak group IDs keyed on tracer ID.
+        """
+        if is_current(sample.animal):
+            links = cls.objects.filter(sample=sample).values_list(
+                "tracer_id", "peak_group_id"
+            )
+            return dict(links)
+        return {
+            link.tracer_id: link.peak_group_id
+            for link in cls.compute(animal_ids=[sample.animal_id])
+            if link.sample_id == sample.id
+        }
+
+
+class LastSerumTracerPeakGroup(models.Model):
+    """
+    The last serum sample peak group (by Sample time_collected and MSRunSequence date) of every tracer compound (and
+    each of the tracer's labeled elements) in every animal, i.e. the precomputed result of
+    Animal.last_serum_tracer_peak_groups.  The (animal, tracer, element) rows correspond to the FCirc records of the
+    animal's serum samples.  Refreshed (for the animals the load changed) at the end of every load (see
+    refresh_last_peak_groups).
+    """
+
+    id = models.AutoField(primary_key=True)
+    animal = models.ForeignKey(
+        to="DataRepo.Animal",
+        on_delete=models.CASCADE,
+        related_name="last_serum_tracer_peak_group_links",
+    )
+    tracer = models.ForeignKey(
+        to="DataRepo.Tracer",
+        on_delete=models.CASCADE,
+        related_name="last_serum_tracer_peak_group_links",
+    )
+    element = models.CharField(
+        max_length=1,
+        choices=ElementLabel.LABELED_ELEMENT_CHOICES,
+        help_text="An element that is labeled in the tracer.",
+    )
+    peak_group = models.ForeignKey(
+        to="DataRepo.PeakGroup",
+        on_delete=models.CASCADE,
+        related_name="last_serum_tracer_links",
+    )
+
+    class Meta:
+        verbose_name = "last serum tracer peak group"
+        verbose_name_plural = "last serum tracer peak groups"
+        ordering = ["animal", "tracer", "element"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["animal", "tracer", "element"],
+                name="unique_lastserumtracerpeakgroup",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"Last serum {self.tracer} peak group (element {self.element}) in animal {self.animal}: "
+            f"{self.peak_group}"
+        )
+
+    @classmethod
+    def compute(cls, animal_ids: Optional[List[int]] = None):
+        """Computes the last serum sample peak group of every tracer compound in every animal (of the supplied animals)
+        using a single window function query (plus a query of the tracers' labeled elements).
+
+        Args:
+            animal_ids (Optional[List[int]]): Limit the computation to these animals.  Default: all.
+        Exceptions:
+            None
+        Returns:
+            (List[LastSerumTracerPeakGroup]): Unsaved records.
+        """
+        from DataRepo.models.peak_group import PeakGroup
+        from DataRepo.models.tissue import Tissue
+        from DataRepo.models.tracer_label import TracerLabel
+
+        tracer_path = "msrun_sample__sample__animal__infusate__tracers"
+        qs = PeakGroup.objects.filter(
+            Tissue.serum_q_expression("msrun_sample__sample__tissue__name"),
+            compounds=F(f"{tracer_path}__compound"),
+        )
+        if animal_ids is not None:
+            qs = qs.filter(msrun_sample__sample__animal__id__in=animal_ids)
+        rows = list(
+            qs.annotate(
+                last_animal_id=F("msrun_sample__sample__animal"),
+                last_tracer_id=F(tracer_path),
+                last_rank=Window(
+                    expression=RowNumber(),
+                    partition_by=[F("msrun_sample__sample__animal"), F(tracer_path)],
+                    # Like Animal._last_serum_sample, samples without a time collected are considered to be first
+                    order_by=[
+                        F("msrun_sample__sample__time_collected").desc(nulls_last=True),
+                        F("msrun_sample__msrun_sequence__date").desc(),
+                        F("id").desc(),
+                    ],
+                ),
+            )
+            .filter(last_rank=1)
+            .values_list("last_animal_id", "last_tracer_id", "id")
+        )
+
+        elements = defaultdict(list)
+        for tracer_id, element in (
+            TracerLabel.objects.filter(tracer__id__in=set(row[1] for row in rows))
+            .order_by("tracer_id", "element")
+            .values_list("tracer_id", "element")
+            .distinct()
+        ):
+            elements[tracer_id].append(element)
+
+        return [
+            cls(
+                animal_id=animal_id,
+                tracer_id=tracer_id,
+                element=element,
+                peak_group_id=pg_id,
+            )
+            for animal_id, tracer_id, pg_id in rows
+            for element in elements[tracer_id]
+        ]
+
+    @classmethod
+    def get_peak_group_ids(cls, animal) -> Dict[int, int]:
+        """Returns the ID of the last serum sample peak group of every tracer compound in the supplied animal, from the
+        table if it is current for the animal (see is_current), otherwise computed.
+
+        Args:
+            animal (Animal)
+        Exceptions:
+            None
+        Returns:
+            (Dict[int, int]): Peak group IDs keyed on tracer ID.
+        """
+        if is_current(animal):
+            links = (
+                cls.objects.filter(animal=animal)
+                .values_list("tracer_id", "peak_group_id")
+                .distinct()
+            )
+            return dict(links)
+        return {
+            link.tracer_id: link.peak_group_id
+            for link in cls.compute(animal_ids=[animal.id])
+        }
+
+
+def get_version_key(animal_id: int) -> str:
+    return f"{VERSION_KEY_PREFIX}.{animal_id}"
+
+
+def is_current(animal) -> bool:
+    """Returns whether the last peak group tables were refreshed since the last change to the supplied animal's data (or
+    to data in bulk), i.e. whether the animal's cache namespaces (which are bumped by such changes) are unchanged.
+
+    Args:
+        animal (Animal)
+    Exceptions:
+        None
+    Returns:
+        (bool)
+    """
+    return cache.get(get_version_key(animal.id)) == get_namespace_stamps(animal)
+
+
+def get_current_animal_ids() -> List[int]:
+    """Returns the IDs of the animals for which the last peak group tables are current (see is_current), using a single
+    cache lookup.  Call before delete_all_caches, so that a refresh of only the animals a load changed can keep the
+    others current (see refresh_last_peak_groups).
+
+    Args:
+        None
+    Exceptions:
+        None
+    Returns:
+        (List[int])
+    """
+    from DataRepo.models.animal import Animal
+
+    ns_keys = {
+        animal_id: get_namespace_keys(Animal(id=animal_id))
+        for animal_id in Animal.objects.values_list("id", flat=True)
+    }
+    lookup_keys = set(get_version_key(animal_id) for animal_id in ns_keys.keys())
+    for keys in ns_keys.values():
+        lookup_keys.update(keys)
+    values = cache.get_many(lookup_keys)
+    return [
+        animal_id
+        for animal_id, keys in ns_keys.items()
+        if all(key in values.keys() for key in keys)
+        and values.get(get_version_key(animal_id)) == tuple(values[key] for key in keys)
+    ]
+
+
+def refresh_last_peak_groups(
+    animal_ids: Optional[List[int]] = None,
+    current_animal_ids: Optional[List[int]] = None,
+) -> int:
+    """Replaces the LastTracerPeakGroup and LastSerumTracerPeakGroup records of the supplied animals with newly computed
+    ones, and (once the transaction is committed) marks the tables as current for those animals.  Call after
+    delete_all_caches (which makes the tables stale for every animal).
+
+    Args:
+        animal_ids (Optional[List[int]]): Default: all animals.
+        current_animal_ids (Optional[List[int]]): The animals for which the tables were current before
+            delete_all_caches (see get_current_animal_ids).  Those not in animal_ids are marked as current again
+            (without recomputing their records), unless their own data changed since.
+    Exceptions:
+        None
+    Returns:
+        (int): The number of created records.
+    """
+    from DataRepo.models.animal import Animal
+
+    animals = Animal.objects.all()
+    if animal_ids is not None:
+        animals = animals.filter(id__in=animal_ids)
+    unchanged_animals = Animal.objects.none()
+    if animal_ids is not None and current_animal_ids is not None:
+        unchanged_animals = Animal.objects.filter(id__in=current_animal_ids).exclude(
+            id__in=animal_ids
+        )
+
+    with transaction.atomic():
+        tracer_links = LastTracerPeakGroup.compute(animal_ids=animal_ids)
+        serum_links = LastSerumTracerPeakGroup.compute(animal_ids=animal_ids)
+        if animal_ids is None:
+            LastTracerPeakGroup.objects.all().delete()
+            LastSerumTracerPeakGroup.objects.all().delete()
+        else:
+            LastTracerPeakGroup.objects.filter(
+                sample__animal__id__in=animal_ids
+            ).delete()
+            LastSerumTracerPeakGroup.objects.filter(animal__id__in=animal_ids).delete()
+        LastTracerPeakGroup.objects.bulk_create(tracer_links)
+        LastSerumTracerPeakGroup.objects.bulk_create(serum_links)
+
+    def mark_current():
+        # Stamped after the commit, so that a rolled back refresh is never considered current
+        versions = {
+            get_version_key(animal.id): get_namespace_stamps(animal)
+            for animal in animals.only("id")
+        }
+        unchanged_versions = {
+            get_version_key(animal.id): get_namespace_stamps(animal)
+            for animal in unchanged_animals.only("id")
+        }
+        old_versions = cache.get_many(unchanged_versions.keys())
+        for version_key, stamps in unchanged_versions.items():
+            # Only the global namespace (bumped by delete_all_caches) may have changed since the tables were current
+            old_stamps = old_versions.get(version_key)
+            if old_stamps is not None and tuple(old_stamps[1:]) == stamps[1:]:
+                versions[version_key] = stamps
+        cache.set_many(versions, timeout=None)
+
+    transaction.on_commit(mark_current)
+
+    return len(tracer_links) + len(serum_links)
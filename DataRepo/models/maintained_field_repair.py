@@ -0,0 +1,73 @@
+from typing import Dict, Tuple
+
+from django.db import models
+
+
+class MaintainedFieldRepair(models.Model):
+    """
+    A queue of records whose maintained fields (see MaintainedModel) need to be updated.  Records are queued (instead of
+    being updated) by "readonly" MaintainedModelCoordinators (e.g. during web requests) and the queue is drained in
+    bulk by the repair_maintained_fields management command (see MaintainedModel.repair_maintained_fields).
+    """
+
+    id = models.AutoField(primary_key=True)
+    model_name = models.CharField(
+        max_length=64,
+        help_text="The name of the MaintainedModel class of the record to repair.",
+    )
+    record_id = models.IntegerField(
+        help_text="The primary key of the record to repair.",
+    )
+    propagate = models.BooleanField(
+        default=False,
+        help_text=(
+            "Whether the record was changed (e.g. saved), meaning that the maintained fields of its related records "
+            "need to be updated as well."
+        ),
+    )
+    queued = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "maintained field repair"
+        verbose_name_plural = "maintained field repairs"
+        ordering = ["id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model_name", "record_id"],
+                name="unique_maintainedfieldrepair",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.model_name}.{self.record_id}"
+
+    @classmethod
+    def queue(cls, repairs: Dict[Tuple[str, int], bool]):
+        """Queues records for repair, ignoring records that are already queued (unless propagation is newly required).
+
+        Args:
+            repairs (Dict[Tuple[str, int], bool]): Whether to propagate the update, keyed on model name and primary key.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        propagated = [
+            cls(model_name=model_name, record_id=record_id, propagate=True)
+            for (model_name, record_id), propagate in repairs.items()
+            if propagate
+        ]
+        unpropagated = [
+            cls(model_name=model_name, record_id=record_id, propagate=False)
+            for (model_name, record_id), propagate in repairs.items()
+            if not propagate
+        ]
+        if len(propagated) > 0:
+            cls.objects.bulk_create(
+                propagated,
+                update_conflicts=True,
+                unique_fields=["model_name", "record_id"],
+                update_fields=["propagate"],
+            )
+        if len(unpropagated) > 0:
+            cls.objects.bulk_create(unpropagated, ignore_conflicts=True)
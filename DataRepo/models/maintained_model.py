@@ -2,15 +2,18 @@ import importlib
 import warnings
 from collections import defaultdict
 from contextlib import contextmanager
+from copy import deepcopy
 from threading import local
-from typing import Dict, List, Type
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import ProgrammingError, transaction
-from django.db.models import Model
+from django.db.models import Model, prefetch_related_objects
 from django.db.models.signals import m2m_changed
 
+from DataRepo.models.maintained_field_repair import MaintainedFieldRepair
+
 
 class MaintainedModelCoordinator:
     """
@@ -19,13 +22,16 @@ class MaintainedModelCoordinator:
     (i.e. its running mode based on "context") during calls to save, delete, and m2m_propagation_handler.  It does this
     by providing a context manager.
 
-    There are 5 running modes that determine when and if autoupdates should occur:
+    There are 6 running modes that determine when and if autoupdates should occur:
         always: (the default, meaning both lazy and immediate)
         lazy: Auto-updates occuras query results are iterated over (see MaintainedModel.from_db()).
         immediate: Auto-updates occur immediately upon record creation (e.g. via calls to save()).
         deferred: Auto-updates are buffered upon save() and occur when the last nested context has been exited (see
             MaintainedModel.deferred).
         disabled: No buffering or autoupdates are performed at all (see MaintainedModel.disabled).
+        readonly: No autoupdates are performed.  Instead, saved records and queried records with empty maintained fields
+            are queued for repair (see MaintainedFieldRepair) when the last nested context has been exited, e.g. during
+            web requests (see ReadOnlyMaintainedFieldsMiddleware).
 
     Attributes:
         None
@@ -52,16 +58,19 @@ class MaintainedModelCoordinator:
             self.lazy_updates = False
             self.immediate_updates = False
             self.buffering = True
-        elif auto_update_mode == "disabled":
+        elif auto_update_mode == "disabled" or auto_update_mode == "readonly":
             self.lazy_updates = False
             self.immediate_updates = False
             self.buffering = False
         else:
             raise ValueError(
                 f"Invalid auto_update_mode: [{auto_update_mode}].  Valid values are: [always, lazy, immediate, "
-                "deferred, and disabled]."
+                "deferred, disabled, and readonly]."
             )
 
+        # Whether to queue records for repair instead of auto-updating them
+        self.queue_repairs = auto_update_mode == "readonly"
+
         # This tracks whether the underlying modes (autoupdates and buffering) have been overridden or not, e.g. by a
         # parent context.  This is only used to override an immediate or lazy mode to a deferred mode.  disabled cannot
         # be overridden.
@@ -78,8 +87,14 @@ class MaintainedModelCoordinator:
             (label_filters is None or len(label_filters) == 0) and filter_in is True
         )
 
-        # This is for buffering a large quantity of auto-updates in order to get speed improvements during loading
-        self.update_buffer = []
+        # This is for buffering a large quantity of auto-updates in order to get speed improvements during loading.
+        # Buffered model objects are keyed on their record and filter signatures (see get_buffer_key), so that checking
+        # whether an object is already buffered takes constant time.
+        self.update_buffer: Dict[tuple, Model] = {}
+
+        # Records to queue for repair (in readonly mode).  Whether the repair needs to propagate to related records is
+        # keyed on the record's model name and primary key.
+        self.repair_queue: Dict[Tuple[str, int], bool] = {}
 
     def __str__(self):
         return self.auto_update_mode
@@ -105,6 +120,7 @@ class MaintainedModelCoordinator:
         self.lazy_updates = False
         self.immediate_updates = False
         self.buffering = False
+        self.queue_repairs = False
 
     def get_mode(self):
         return self.auto_update_mode
@@ -128,7 +144,7 @@ class MaintainedModelCoordinator:
         if filter_in is None:
             filter_in = True
         cnt = 0
-        for buffered_item in self.update_buffer:
+        for buffered_item in self.update_buffer.values():
             updaters_list = buffered_item._filter_updaters(
                 buffered_item.get_my_updaters(),
                 generation=generation,
@@ -165,12 +181,12 @@ class MaintainedModelCoordinator:
             )  # Clear everything by default, regardless of default filters
             filter_in = True
         if generation is None and (label_filters is None or len(label_filters) == 0):
-            self.update_buffer = []
+            self.update_buffer = {}
             return
 
-        new_buffer = []
+        new_buffer = {}
         gen_warns = 0
-        for buffered_item in self.update_buffer:
+        for key, buffered_item in self.update_buffer.items():
             # Buffered items are entire model objects.  We are going to filter model objects when they DO match the
             # filtering criteria.  A model object matches the filtering criteria based on whether ANY of its updaters
             # (fields to be updated specified by the decorators on the methods that produce their values) match the
@@ -198,7 +214,7 @@ class MaintainedModelCoordinator:
 
             # If the buffered item didn't have any updaters that met the filtering criteria, keep it in the buffer
             if len(matching_updaters) == 0:
-                new_buffer.append(buffered_item)
+                new_buffer[key] = buffered_item
                 # There are no matching filters among the updaters of the buffered_item, but the max generation MUST be
                 # auto-updated first in order for breadth-first mass autoupdates to happen in the proper order, so if
                 # we're keeping a generation higher than the current filter generation being cleared, this is a problem.
@@ -218,8 +234,60 @@ class MaintainedModelCoordinator:
         # populate the buffer with what's left
         self.update_buffer = new_buffer
 
+    def queue_repair(self, mdl_obj, propagate=False):
+        """Adds a record to the repair queue (which is saved by save_repair_queue).
+
+        Args:
+            mdl_obj (MaintainedModel)
+            propagate (bool): Whether the record changed and its related records need to be updated as well.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if mdl_obj.pk is None:
+            return
+        key = (mdl_obj.__class__.__name__, mdl_obj.pk)
+        self.repair_queue[key] = self.repair_queue.get(key, False) or propagate
+
+    def save_repair_queue(self):
+        """Saves the queued records (see queue_repair) to the MaintainedFieldRepair model, to be repaired by the
+        repair_maintained_fields management command, and empties the queue.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if len(self.repair_queue) == 0:
+            return
+        MaintainedFieldRepair.queue(self.repair_queue)
+        self.repair_queue = {}
+
     def _peek_update_buffer(self, index=0):
-        return self.update_buffer[index]
+        return list(self.update_buffer.values())[index]
+
+    @classmethod
+    def get_buffer_key(cls, mdl_obj):
+        """Returns the key of a model object in the update buffer, made up of its record signature and the filtering
+        criteria saved in it.  Objects without a primary key are keyed on their identity.
+
+        Args:
+            mdl_obj (MaintainedModel)
+        Exceptions:
+            None
+        Returns:
+            (tuple)
+        """
+        rec_sig = mdl_obj.get_record_signature()
+        if rec_sig is None:
+            rec_sig = id(mdl_obj)
+        label_filters = mdl_obj.label_filters
+        if label_filters is not None:
+            label_filters = tuple(label_filters)
+        return rec_sig, label_filters, mdl_obj.filter_in
 
     def buffer_update(self, mdl_obj):
         """
@@ -245,25 +313,20 @@ class MaintainedModelCoordinator:
             # Do not buffer - nothing to update
             return
 
+        # Changed records are queued for repair in readonly mode
+        if self.queue_repairs:
+            self.queue_repair(mdl_obj, propagate=True)
+
         # Do not buffer if it's already buffered.  Note, this class isn't designed to support auto-updates in a
         # sepecific order.  All auto-update functions should use non-auto-update fields.
         if self.buffering:
-            if mdl_obj not in self.update_buffer:
-                self.update_buffer.append(mdl_obj)
-            else:
-                # This allows the same object to be updated more than once (in the order encountered) if the fields to
-                # be auto-updated in each instance, differ.  This can cause redundant updates (e.g. when a field matches
-                # the filters in both cases), but given the possibility that update order may depend on the update of
-                # related records, it's better to be on the safe side and do each auto-update, so...
-                # If this is the same object but a different set of fields will be updated...
-                # Note, Django model object equivalence (obj1 == obj2) compares primary key values
-                for same_obj in [bo for bo in self.update_buffer if bo == mdl_obj]:
-                    if (
-                        same_obj.filter_in != mdl_obj.filter_in
-                        or same_obj.label_filters != same_obj.label_filters
-                    ):
-                        self.update_buffer.append(mdl_obj)
-                        break
+            # The key includes the filtering criteria, which allows the same record to be buffered more than once if the
+            # fields to be auto-updated in each instance differ.  This can cause redundant updates (e.g. when a field
+            # matches the filters in both cases), but given the possibility that update order may depend on the update
+            # of related records, it's better to be on the safe side and do each auto-update.
+            key = self.get_buffer_key(mdl_obj)
+            if key not in self.update_buffer:
+                self.update_buffer[key] = mdl_obj
 
     # Added transaction.atomic, because even after catching an intentional AutoUpdateFailed in test
     # DataRepo.tests.models.test_infusate.MaintainedModelImmediateTests.test_error_when_buffer_not_clear and ending the
@@ -273,12 +336,14 @@ class MaintainedModelCoordinator:
     @transaction.atomic
     def perform_buffered_updates(self, label_filters=None, filter_in=None):
         """
-        Performs a mass update of records in the buffer in a depth-first fashion without repeated updates to the same
-        record over and over.  It goes through the buffer in the order added and triggers each record's DFS updates,
-        which returns the signatures of every updated record.  Those updates are maintained through the traversal of
-        the entire buffer and checked before each update, thereby preventing repeated updates.  If a record has already
-        been updated, the records it triggers updates to are not propagated either.  The goal is to trigger the updates
-        in the order they were designed to follow governed by the parent/child links created in each decorator.
+        Performs a mass update of records in the buffer without repeated updates to the same record over and over.  It
+        goes through the buffer in the order added and collects each record along with the related records its changes
+        affect (found via a depth-first traversal of the parent/child links created in each decorator).  Each record is
+        collected once, and if a record has already been collected, the records it triggers updates to are not
+        traversed again.  The collected records are then updated in batches, one generation at a time (see the
+        generation argument of the MaintainedModel.setter decorator), from the leaves (the largest generation) to the
+        root (0), in the same way that rebuild_maintained_fields does.  Records of the same generation are updated in
+        the order they were collected.
 
         Note that this can fail if a record is changed and then its child (who triggers its parent) is changed (each
         being added to the buffer during a mass auto-update).  This however is not expected to happen, as mass auto-
@@ -307,13 +372,14 @@ class MaintainedModelCoordinator:
         if len(self.update_buffer) == 0:
             return
 
-        # Track what's been updated to prevent repeated updates triggered by multiple child updates
-        updated = []
-        new_buffer = []
+        # The records to update (keyed on their record signatures), in the order they were collected.  Tracking them
+        # prevents repeated updates triggered by multiple child updates.
+        updates: Dict[object, MaintainedModel] = {}
+        skipped = {}
         no_filters = label_filters is None or len(label_filters) == 0
 
         # For each record in the buffer
-        for buffer_item in self.update_buffer:
+        for buffer_key, buffer_item in self.update_buffer.items():
             updater_dicts = buffer_item.get_my_updaters()
 
             if use_object_label_filters:
@@ -323,41 +389,107 @@ class MaintainedModelCoordinator:
                     label_filters = self.default_label_filters
                     filter_in = self.default_filter_in
 
-            # Track updated records to avoid repeated updates
-            key = f"{buffer_item.__class__.__name__}.{buffer_item.pk}"
+            if buffer_key[0] in updates:
+                continue
 
-            # Try to perform the update. It could fail if the affected record was deleted
-            try:
-                if key not in updated and (
-                    no_filters
-                    or buffer_item.updater_list_has_matching_labels(
-                        updater_dicts, label_filters, filter_in
-                    )
-                ):
-                    # Saving the record while mass_updates is True, causes auto-updates of every field
-                    # included among the model's decorated functions.  It does not only update the fields indicated in
-                    # decorators that contain the labels indicated in the label_filters.  The filters are only used to
-                    # decide which records should be updated.  Currently, this is not an issue because we only have 1
-                    # update_label in use.  And if/when we add another label, it will only end up causing extra
-                    # repeated updates of the same record.
-                    buffer_item.save(mass_updates=True)
-
-                    # Propagate the changes (if necessary), keeping track of what is updated and what's not.
+            if no_filters or buffer_item.updater_list_has_matching_labels(
+                updater_dicts, label_filters, filter_in
+            ):
+                try:
                     # Note: all the manual changes are assumed to have been made already, so auto-updates only need to
                     # be issued once per record
-                    updated = buffer_item.call_dfs_related_updaters(
-                        updated=updated, mass_updates=True
-                    )
+                    buffer_item.get_dfs_related_records(related=updates)
+                except Exception as e:
+                    # The traversal could fail if a related record was deleted
+                    raise AutoUpdateFailed(buffer_item, e, updater_dicts)
+            else:
+                skipped[buffer_key] = buffer_item
+
+        # Group the records by generation.  Each record's generation is the max generation of its model's updaters.
+        generations: Dict[int, List[MaintainedModel]] = defaultdict(list)
+        model_generations: Dict[str, int] = {}
+        for rec in updates.values():
+            class_name = rec.__class__.__name__
+            if class_name not in model_generations:
+                model_generations[class_name] = (
+                    rec.get_max_generation(rec.get_my_updaters()) or 0
+                )
+            generations[model_generations[class_name]].append(rec)
+
+        # For every generation from the youngest leaves/children to root/parent
+        for gen in sorted(generations.keys(), reverse=True):
+            gen_recs = generations[gen]
+            chunk_size = MaintainedModel.BULK_REBUILD_CHUNK_SIZE
+            for start in range(0, len(gen_recs), chunk_size):
+                end = start + chunk_size
+                chunk = gen_recs[start:end]
+                # Prefetching the relations the setters use allows the values to be computed in bulk
+                self.prefetch_updater_lookups(chunk)
+                for rec in chunk:
+                    self.update_buffered_record(rec)
 
-                elif key not in updated and buffer_item not in new_buffer:
-                    new_buffer.append(buffer_item)
+        # Eliminate the updated items from the buffer
+        self.update_buffer = {
+            key: buffer_item
+            for key, buffer_item in skipped.items()
+            if key[0] not in updates
+        }
 
-            except Exception as e:
-                # Any exception can be raised from the derived model's decorated updater function
-                raise AutoUpdateFailed(buffer_item, e, updater_dicts)
+    @staticmethod
+    def prefetch_updater_lookups(recs):
+        """Prefetches the related lookups declared in the setter decorators (see prefetch_lookups) of the given records'
+        models, so that the values of their maintained fields can be computed in bulk.
 
-        # Eliminate the updated items from the buffer
-        self.update_buffer = new_buffer
+        Args:
+            recs (List[MaintainedModel])
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        model_recs = defaultdict(list)
+        for rec in recs:
+            # Records that no longer exist (i.e. deleted after being buffered) have no relations to prefetch
+            if rec.pk is not None:
+                model_recs[type(rec)].append(rec)
+        for mdl_cls, mdl_recs in model_recs.items():
+            lookups = []
+            for updater_dict in mdl_cls.get_my_updaters():
+                for lookup in updater_dict["prefetch_lookups"]:
+                    if lookup not in lookups:
+                        lookups.append(lookup)
+            if len(lookups) > 0:
+                prefetch_related_objects(mdl_recs, *lookups)
+
+    @staticmethod
+    def update_buffered_record(rec):
+        """Performs the auto-update of a record collected during a mass auto-update.
+
+        Args:
+            rec (MaintainedModel)
+        Exceptions:
+            Raises:
+                AutoUpdateFailed
+            Buffers:
+                None
+        Returns:
+            None
+        """
+        # Try to perform the update. It could fail if the affected record was deleted
+        try:
+            # Saving the record while mass_updates is True, causes auto-updates of every field included among the
+            # model's decorated functions.  It does not only update the fields indicated in decorators that contain the
+            # labels indicated in the label_filters.  The filters are only used to decide which records should be
+            # updated.  Currently, this is not an issue because we only have 1 update_label in use.  And if/when we
+            # add another label, it will only end up causing extra repeated updates of the same record.
+            rec.save(mass_updates=True)
+        except Exception as e:
+            # Any exception can be raised from the derived model's decorated updater function
+            raise AutoUpdateFailed(rec, e, rec.get_my_updaters())
+        finally:
+            # Do not retain the prefetched (possibly stale) relations
+            if hasattr(rec, "_prefetched_objects_cache"):
+                rec._prefetched_objects_cache.clear()
 
 
 class MaintainedModel(Model):
@@ -394,6 +526,9 @@ class MaintainedModel(Model):
     # retrieved when needed.
     model_packages: Dict[str, str] = defaultdict(str)
 
+    # The default number of records computed and updated at a time by bulk_rebuild_maintained_fields
+    BULK_REBUILD_CHUNK_SIZE = 1000
+
     def __init__(self, *args, **kwargs):
         """
         This over-ride of the constructor is to prevent developers from explicitly setting values for automatically
@@ -521,6 +656,19 @@ class MaintainedModel(Model):
         propagate = kwargs.pop("propagate", not mass_updates and not via_query)
         # fields_to_autoupdate: List of fields to auto-update. - default None = update all maintained fields
         fields_to_autoupdate = kwargs.pop("fields_to_autoupdate", None)
+        # skip_if_unchanged: Whether to skip auto-updates (and their propagation) if none of the input fields declared
+        # in the decorators changed - default True (except for mass and lazy auto-updates)
+        skip_if_unchanged = kwargs.pop(
+            "skip_if_unchanged", not mass_updates and not via_query
+        )
+
+        inputs_changed = self.maintained_inputs_changed()
+        self.maintained_input_values = self.get_maintained_input_values()
+        if skip_if_unchanged and not inputs_changed:
+            # No maintained field (here or in related records) depends on what changed (if anything), so there is
+            # nothing to update, buffer, or propagate
+            super().save(*args, **kwargs)
+            return
 
         # If the object is None, then what has happened is, there was a call to create an object off of the class.  That
         # means that __init__ was not called, so we are going to handle the initialization of MaintainedModel (including
@@ -659,7 +807,7 @@ class MaintainedModel(Model):
             self.label_filters = coordinator.default_label_filters
             self.filter_in = coordinator.default_filter_in
 
-            if coordinator.buffering:
+            if coordinator.buffering or coordinator.queue_repairs:
                 parents = self.get_parent_instances()
                 for parent_inst in parents:
                     coordinator.buffer_update(parent_inst)
@@ -683,7 +831,7 @@ class MaintainedModel(Model):
 
         if coordinator.are_immediate_updates_enabled() and propagate:
             # Percolate changes up to the parents (if any) and mark the deleted record as updated
-            self.call_dfs_related_updaters(updated=[self_sig])
+            self.call_dfs_related_updaters(updated=set([self_sig]))
 
         return retval
 
@@ -708,8 +856,13 @@ class MaintainedModel(Model):
         # Instantiate the model object
         rec = super().from_db(*args, **kwargs)
 
-        # If autoupdates are not enabled (i.e. we're not in "lazy" mode)
-        if not cls.get_coordinator().are_lazy_updates_enabled():
+        # Record the values of the fields the maintained fields depend on, to be able to tell if they change
+        rec.maintained_input_values = rec.get_maintained_input_values()
+
+        # If autoupdates are not enabled (i.e. we're not in "lazy" mode) and records are not being queued for repair
+        # (i.e. we're not in "readonly" mode)
+        coordinator = cls.get_coordinator()
+        if not coordinator.are_lazy_updates_enabled() and not coordinator.queue_repairs:
             return rec
 
         # Get the field names
@@ -721,6 +874,11 @@ class MaintainedModel(Model):
         # Look for maintained field values that are None
         lazy_update_fields = [fld for fld in common_fields if getattr(rec, fld) is None]
 
+        # In readonly mode, the record is queued for repair instead of being updated
+        if len(lazy_update_fields) > 0 and coordinator.queue_repairs:
+            coordinator.queue_repair(rec)
+            return rec
+
         # If any maintained fields are to be lazy-updated
         if len(lazy_update_fields) > 0:
             cs = ", "
@@ -737,9 +895,36 @@ class MaintainedModel(Model):
 
         return rec
 
+    @classmethod
+    def trigger_autoupdates(cls, recs: Iterable["MaintainedModel"]):
+        """Auto-updates the maintained fields of the supplied (existing) records (and propagates the changes) the way
+        saving them would in the current coordinator's mode, i.e. immediately, buffered (for a mass auto-update), or
+        queued for repair.  Use it for the parents of records that were inserted without calling save (e.g. via
+        bulk_create or a StagingTable), whose maintained fields would otherwise never be updated.
+
+        Args:
+            recs (Iterable[MaintainedModel])
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        coordinator = cls.get_coordinator()
+        for rec in recs:
+            rec.label_filters = coordinator.default_label_filters
+            rec.filter_in = coordinator.default_filter_in
+            if coordinator.are_immediate_updates_enabled():
+                rec.save(skip_if_unchanged=False)
+            elif coordinator.buffering or coordinator.queue_repairs:
+                coordinator.buffer_update(rec)
+
     @staticmethod
     def relation(
-        generation, parent_field_name=None, child_field_names=[], update_label=None
+        generation,
+        parent_field_name=None,
+        child_field_names=[],
+        update_label=None,
+        input_field_names=None,
     ):
         """
         Use this decorator to add connections between classes when it does not have any maintained fields.  For example,
@@ -793,6 +978,8 @@ class MaintainedModel(Model):
                 "child_fields": child_field_names,
                 "update_label": update_label,  # Used as a filter to trigger specific series' of (mass) updates
                 "generation": generation,  # Used to update from leaf to root for mass updates
+                "prefetch_lookups": [],
+                "input_fields": input_field_names,  # Used to skip updates when no inputs changed
             }
 
             class_name = cls.__name__
@@ -835,6 +1022,8 @@ class MaintainedModel(Model):
         parent_field_name=None,
         update_label=None,
         child_field_names=[],
+        prefetch_lookups=[],
+        input_field_names=None,
     ):
         """
         This is a decorator factory for functions in a Model class that are identified to be used to update a supplied
@@ -864,6 +1053,16 @@ class MaintainedModel(Model):
 
         Note, if there are many decorated methods updating different fields, and all of the "parent"/"child" fields are
         the same, only 1 of those decorators needs to set a parent field.
+
+        prefetch_lookups is an optional list of the related lookups (as supplied to QuerySet.prefetch_related) that the
+        decorated function accesses.  They are prefetched for each chunk of records when maintained field values are
+        computed in bulk (see bulk_rebuild_maintained_fields).
+
+        input_field_names is an optional list of the fields of "this" model whose values the decorated function's value
+        (and the maintained fields of the parent/child records it triggers updates to) depend on.  If every decorator of
+        a model class declares its input fields, saves of existing records in which none of the input fields changed
+        (since the record was retrieved or last saved) skip the auto-updates and their propagation.  Changes to related
+        records are expected to trigger their own updates (e.g. via their own decorators' parent/child fields).
         """
 
         if update_field_name is None and (
@@ -890,6 +1089,8 @@ class MaintainedModel(Model):
                 "child_fields": child_field_names,
                 "update_label": update_label,  # Used as a filter to trigger specific series' of (mass) updates
                 "generation": generation,  # Used to update from leaf to root for mass updates
+                "prefetch_lookups": prefetch_lookups,  # Used to compute values in bulk
+                "input_fields": input_field_names,  # Used to skip updates when no inputs changed
             }
 
             # Try to register the model class.  If this fails, fallback methods will be used when it is needed later.
@@ -1168,6 +1369,21 @@ class MaintainedModel(Model):
             yield
 
             # If the above raised an exception, we will not get here...
+            # Queued repairs are saved once the (outermost) readonly context is exited
+            if coordinator.queue_repairs:
+                parent_readonly_coordinator = next(
+                    (c for c in coordinator_stack[:-1] if c.queue_repairs), None
+                )
+                if parent_readonly_coordinator is not None:
+                    for key, propagate in coordinator.repair_queue.items():
+                        parent_readonly_coordinator.repair_queue[key] = (
+                            parent_readonly_coordinator.repair_queue.get(key, False)
+                            or propagate
+                        )
+                    coordinator.repair_queue = {}
+                else:
+                    coordinator.save_repair_queue()
+
             # If we are in fact in deferred mode, now is the time for the mass auto-update
             if effective_mode == "deferred":
                 # Check if there exists a parent coordinator that is also deferred, because we only want to
@@ -1176,7 +1392,7 @@ class MaintainedModel(Model):
                 # If there is a parent deferred coordinator
                 if parent_deferred_coordinator is not None:
                     # Transfer the buffer to the next-to-last deferred coordinator
-                    for buffered_item in coordinator.update_buffer:
+                    for buffered_item in coordinator.update_buffer.values():
                         parent_deferred_coordinator.buffer_update(buffered_item)
                 else:
                     # Note, the pre/post mass update funcs are ignored if deferring updates to parents, so that
@@ -1612,6 +1828,360 @@ class MaintainedModel(Model):
                         except Exception as e:
                             raise AutoUpdateFailed(rec, e, updater_dicts)
 
+    @classmethod
+    def bulk_rebuild_maintained_fields(
+        cls,
+        models_path=None,
+        label_filters=None,
+        filter_in=None,
+        chunk_size=None,
+        record_ids: Optional[Dict[str, Iterable[int]]] = None,
+        delete_caches: bool = False,
+    ) -> Dict[str, int]:
+        """A set-based alternative to rebuild_maintained_fields.  For every generation from the youngest leaves/children
+        to the root/parent, the records of each model class are streamed in chunks (with the relations declared in the
+        setter decorators' prefetch_lookups prefetched), the values of the maintained fields matching the filters are
+        computed, and only the values that differ from the stored values are written, using 1 bulk_update per chunk and
+        field.
+
+        Unlike rebuild_maintained_fields, records are not saved, so no save overrides or signals are run (e.g. cached
+        values are not deleted, unless delete_caches is True - see the rebuild_maintained_fields management command) and
+        changes are not propagated (which is unnecessary, since every record is rebuilt).
+
+        Args:
+            models_path (Optional[str]): Python path to the models, E.g. "DataRepo.models".
+            label_filters (Optional[List[str]]): Only maintained fields whose update_label matches are rebuilt.
+            filter_in (Optional[bool]): Whether label_filters are included (True) or excluded (False).
+            chunk_size (Optional[int]): The number of records to compute and update at a time.
+            record_ids (Optional[Dict[str, Iterable[int]]]): Only rebuild these records (primary keys, keyed on model
+                name).  Models that are not included are skipped.  Default: all records.
+            delete_caches (bool): Whether to delete the related cached values of changed records (see HierCachedModel).
+        Exceptions:
+            Raises:
+                AutoUpdateFailed
+            Buffers:
+                None
+        Returns:
+            changed_counts (Dict[str, int]): The number of changed records, keyed on "Model.field".
+        """
+        if chunk_size is None:
+            chunk_size = cls.BULK_REBUILD_CHUNK_SIZE
+        if label_filters is None or filter_in is None:
+            cur_coordinator = cls.get_coordinator()
+            if label_filters is None:
+                label_filters = cur_coordinator.default_label_filters
+            if filter_in is None:
+                filter_in = cur_coordinator.default_filter_in
+
+        changed_counts: Dict[str, int] = {}
+
+        # Querying MaintainedModel records must not trigger (lazy) auto-updates.  See rebuild_maintained_fields.
+        coordinator = MaintainedModelCoordinator(
+            auto_update_mode="disabled",
+            label_filters=label_filters,
+            filter_in=filter_in,
+        )
+
+        with cls.custom_coordinator(coordinator):
+            youngest_generation = cls.get_max_generation(
+                cls.get_all_updaters(),
+                label_filters=label_filters,
+                filter_in=filter_in,
+            )
+            if youngest_generation is None:
+                return changed_counts
+
+            done = []
+
+            # For every generation from the youngest leaves/children to root/parent
+            for gen in sorted(range(youngest_generation + 1), reverse=True):
+                for mdl_cls in cls._get_classes(
+                    gen,
+                    label_filters,
+                    filter_in,
+                    models_path=models_path,
+                ):
+                    if mdl_cls in done or (
+                        record_ids is not None and mdl_cls.__name__ not in record_ids
+                    ):
+                        continue
+                    done.append(mdl_cls)
+
+                    if not issubclass(mdl_cls, __class__):
+                        raise ModelNotMaintained(mdl_cls)
+
+                    updater_dicts = [
+                        updater_dict
+                        for updater_dict in cls._filter_updaters(
+                            mdl_cls.get_my_updaters(),
+                            generation=None,
+                            label_filters=label_filters,
+                            filter_in=filter_in,
+                        )
+                        if updater_dict["update_field"] is not None
+                    ]
+                    if len(updater_dicts) == 0:
+                        continue
+
+                    for updater_dict in updater_dicts:
+                        changed_counts[
+                            f"{mdl_cls.__name__}.{updater_dict['update_field']}"
+                        ] = 0
+
+                    for chunk in cls._get_record_chunks(
+                        mdl_cls,
+                        updater_dicts,
+                        chunk_size,
+                        pks=(
+                            None if record_ids is None else record_ids[mdl_cls.__name__]
+                        ),
+                    ):
+                        changed_chunk_recs = {}
+                        for update_fld, changed_recs in cls._compute_changed_values(
+                            chunk, updater_dicts
+                        ).items():
+                            if len(changed_recs) > 0:
+                                mdl_cls.objects.bulk_update(changed_recs, [update_fld])
+                                changed_counts[
+                                    f"{mdl_cls.__name__}.{update_fld}"
+                                ] += len(changed_recs)
+                                changed_chunk_recs.update(
+                                    {rec.pk: rec for rec in changed_recs}
+                                )
+                        if delete_caches:
+                            for rec in changed_chunk_recs.values():
+                                if hasattr(rec, "delete_related_caches"):
+                                    rec.delete_related_caches()
+
+        return changed_counts
+
+    @classmethod
+    @transaction.atomic
+    def repair_maintained_fields(
+        cls, limit=None, chunk_size=None, models_path=None
+    ) -> Dict[str, int]:
+        """Drains the repair queue (see MaintainedFieldRepair and the "readonly" coordinator mode).  The maintained
+        fields of the queued records (and of the records related to queued records that changed - see
+        get_dfs_related_records) are updated in bulk (see bulk_rebuild_maintained_fields), their related cached values
+        are deleted, and they are removed from the queue.
+
+        Args:
+            limit (Optional[int]): The maximum number of queued records to process.  Default: all.
+            chunk_size (Optional[int]): The number of records to compute and update at a time.
+            models_path (Optional[str]): Python path to the models, E.g. "DataRepo.models".
+        Exceptions:
+            Raises:
+                AutoUpdateFailed
+            Buffers:
+                None
+        Returns:
+            changed_counts (Dict[str, int]): The number of changed records, keyed on "Model.field".
+        """
+        repairs = MaintainedFieldRepair.objects.all()
+        if limit is not None:
+            repairs = repairs[:limit]
+        repairs = list(repairs)
+        if len(repairs) == 0:
+            return {}
+
+        record_ids: Dict[str, set] = defaultdict(set)
+        propagated_ids: Dict[str, list] = defaultdict(list)
+        for repair in repairs:
+            record_ids[repair.model_name].add(repair.record_id)
+            if repair.propagate:
+                propagated_ids[repair.model_name].append(repair.record_id)
+
+        # Querying MaintainedModel records must not trigger (lazy) auto-updates
+        with cls.custom_coordinator(MaintainedModelCoordinator("disabled")):
+            for model_name, pks in propagated_ids.items():
+                mdl_cls = cls.get_model_class(model_name, models_path)
+                for rec in mdl_cls.objects.filter(pk__in=pks):
+                    for related_rec in rec.get_dfs_related_records().values():
+                        record_ids[related_rec.__class__.__name__].add(related_rec.pk)
+
+        changed_counts = cls.bulk_rebuild_maintained_fields(
+            models_path=models_path,
+            label_filters=[],
+            filter_in=True,
+            chunk_size=chunk_size,
+            record_ids=record_ids,
+            delete_caches=True,
+        )
+
+        MaintainedFieldRepair.objects.filter(
+            id__in=[repair.id for repair in repairs]
+        ).delete()
+
+        return changed_counts
+
+    @classmethod
+    def get_dependency_graph(cls, models_path=None) -> Dict[str, Dict[str, str]]:
+        """Builds the model-level dependency graph of maintained field propagation from the parent/child fields
+        registered by the relation and setter decorators.  An edge from a model to a related model means that changes
+        to a record of the model trigger updates to the maintained fields of its related records (see
+        call_dfs_related_updaters).  Note that the graph contains cycles (e.g. changes to a Tracer propagate to its
+        Infusates, whose changes propagate to their Tracers).
+
+        Args:
+            models_path (Optional[str]): Python path to the models, E.g. "DataRepo.models".
+        Exceptions:
+            None
+        Returns:
+            graph (Dict[str, Dict[str, str]]): The names of the related models, keyed on the names of the models and the
+                names of the parent/child fields linking them.
+        """
+        graph: Dict[str, Dict[str, str]] = {}
+        for model_name in sorted(cls.updater_list.keys()):
+            mdl_cls = cls.get_model_class(model_name, models_path)
+            graph[model_name] = {}
+            for updater_dict in cls.updater_list[model_name]:
+                related_fields = list(updater_dict["child_fields"])
+                if updater_dict["parent_field"] is not None:
+                    related_fields.append(updater_dict["parent_field"])
+                for related_field in related_fields:
+                    graph[model_name][related_field] = mdl_cls._meta.get_field(
+                        related_field
+                    ).related_model.__name__
+        return graph
+
+    @classmethod
+    def estimate_propagation(
+        cls,
+        record_ids: Dict[str, Iterable[int]],
+        models_path=None,
+        max_depth=None,
+    ) -> Dict[str, int]:
+        """A dry run of the propagation of changes to the given records.  It counts the records (including the given
+        records) whose maintained fields would be updated (see get_dfs_related_records), without retrieving or saving
+        any records.  Starting from the given records, the relations in the dependency graph (see get_dependency_graph)
+        are followed one step at a time, only from the records that were newly reached in the previous step (querying
+        primary keys only), until no new records are reached.  Since the graph contains cycles, this is done in sets
+        instead of 1 query per path.
+
+        Args:
+            record_ids (Dict[str, Iterable[int]]): Primary keys of the changed records, keyed on model name.
+            models_path (Optional[str]): Python path to the models, E.g. "DataRepo.models".
+            max_depth (Optional[int]): The maximum number of steps.  If reached, the counts are lower bounds.  Default:
+                unlimited.
+        Exceptions:
+            None
+        Returns:
+            affected_counts (Dict[str, int]): The number of affected records, keyed on the names of the affected models.
+        """
+        graph = cls.get_dependency_graph(models_path=models_path)
+        affected: Dict[str, set] = defaultdict(set)
+        new_ids: Dict[str, set] = {}
+        for model_name, pks in record_ids.items():
+            new_ids[model_name] = set(pks)
+            affected[model_name].update(pks)
+
+        depth = 0
+        while len(new_ids) > 0 and (max_depth is None or depth < max_depth):
+            depth += 1
+            reached_ids: Dict[str, set] = defaultdict(set)
+            for model_name, pks in new_ids.items():
+                mdl_cls = cls.get_model_class(model_name, models_path)
+                for related_field, related_model_name in graph.get(
+                    model_name, {}
+                ).items():
+                    # The name of the relation from the related model back to the current model
+                    reverse_name = mdl_cls._meta.get_field(
+                        related_field
+                    ).remote_field.name
+                    related_mdl_cls = cls.get_model_class(
+                        related_model_name, models_path
+                    )
+                    reached_ids[related_model_name].update(
+                        related_mdl_cls.objects.filter(
+                            **{f"{reverse_name}__pk__in": pks}
+                        ).values_list("pk", flat=True)
+                    )
+            new_ids = {}
+            for model_name, pks in reached_ids.items():
+                pks = pks - affected[model_name]
+                if len(pks) > 0:
+                    new_ids[model_name] = pks
+                    affected[model_name].update(pks)
+
+        return {
+            model_name: len(pks)
+            for model_name, pks in sorted(affected.items())
+            if len(pks) > 0
+        }
+
+    @classmethod
+    def _get_record_chunks(cls, mdl_cls, updater_dicts, chunk_size, pks=None):
+        """Generates lists of (at most chunk_size) records of the given model, with the relations declared in the
+        updaters' prefetch_lookups prefetched.
+
+        Args:
+            mdl_cls (Type[MaintainedModel])
+            updater_dicts (List[dict])
+            chunk_size (int)
+            pks (Optional[Iterable[int]]): Only retrieve these records.  Default: all records.
+        Exceptions:
+            None
+        Returns:
+            (Generator[List[MaintainedModel]])
+        """
+        lookups = []
+        for updater_dict in updater_dicts:
+            for lookup in updater_dict.get("prefetch_lookups", []):
+                if lookup not in lookups:
+                    lookups.append(lookup)
+
+        queryset = mdl_cls.objects.prefetch_related(*lookups)
+        if pks is not None:
+            queryset = queryset.filter(pk__in=list(pks))
+
+        chunk = []
+        for rec in queryset.order_by("pk").iterator(chunk_size=chunk_size):
+            chunk.append(rec)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if len(chunk) > 0:
+            yield chunk
+
+    @classmethod
+    def _compute_changed_values(cls, records, updater_dicts):
+        """Computes the maintained field values of the given records (without saving them) and returns the records whose
+        values changed, keyed on the field.  The new values are set in the returned records.
+
+        Args:
+            records (List[MaintainedModel])
+            updater_dicts (List[dict]): Updaters with an update_field.
+        Exceptions:
+            Raises:
+                AutoUpdateFailed
+            Buffers:
+                None
+        Returns:
+            changed_recs (Dict[str, List[MaintainedModel]])
+        """
+        changed_recs = defaultdict(list)
+        for rec in records:
+            for updater_dict in updater_dicts:
+                update_fld = updater_dict["update_field"]
+                field = rec._meta.get_field(update_fld)
+                try:
+                    new_val = getattr(rec, updater_dict["update_function"])()
+                except Exception as e:
+                    raise AutoUpdateFailed(rec, e, updater_dicts)
+
+                # Compare relations by their keys, so that the stored related record does not need to be retrieved
+                if field.is_relation:
+                    old_val = getattr(rec, field.attname)
+                    changed = old_val != (None if new_val is None else new_val.pk)
+                else:
+                    changed = getattr(rec, update_fld) != new_val
+
+                if changed:
+                    setattr(rec, update_fld, new_val)
+                    changed_recs[update_fld].append(rec)
+
+        return changed_recs
+
     def update_decorated_fields(self, fields_to_autoupdate=None):
         """
         Updates every field identified in each MaintainedModel.setter decorator using the decorated function that
@@ -1711,22 +2281,120 @@ class MaintainedModel(Model):
 
         return changed
 
+    @classmethod
+    def get_my_input_fields(cls) -> Optional[List[str]]:
+        """Returns the input fields declared in all of the model's decorators (see the input_field_names argument of
+        the MaintainedModel.setter decorator), or None if any decorator did not declare its input fields.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            input_fields (Optional[List[str]])
+        """
+        input_fields: List[str] = []
+        for updater_dict in cls.get_my_updaters():
+            if updater_dict.get("input_fields") is None:
+                return None
+            for input_field in updater_dict["input_fields"]:
+                if input_field not in input_fields:
+                    input_fields.append(input_field)
+        return input_fields
+
+    def get_maintained_input_values(self) -> Optional[dict]:
+        """Returns a copy of the current values of the model's input fields (see get_my_input_fields), keyed on field
+        name.  Relations are represented by their keys and deferred fields are omitted (so that no queries are made).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            input_values (Optional[dict]): None if the model's input fields are not declared.
+        """
+        input_fields = self.get_my_input_fields()
+        if input_fields is None:
+            return None
+        input_values = {}
+        for input_field in input_fields:
+            attname = self._meta.get_field(input_field).attname
+            if attname in self.__dict__:
+                input_values[input_field] = deepcopy(self.__dict__[attname])
+        return input_values
+
+    def maintained_inputs_changed(self) -> bool:
+        """Determines whether any of the model's input fields (see get_my_input_fields) changed since the record was
+        retrieved from (or last saved to) the database.  Records that have not been saved and records whose input fields
+        are not declared are always considered changed.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (bool)
+        """
+        saved_values = getattr(self, "maintained_input_values", None)
+        if self._state.adding or saved_values is None:
+            return True
+        current_values = self.get_maintained_input_values()
+        if current_values is None:
+            return True
+        for input_field in current_values.keys() | saved_values.keys():
+            if (
+                input_field not in current_values
+                or input_field not in saved_values
+                or current_values[input_field] != saved_values[input_field]
+            ):
+                return True
+        return False
+
     def get_record_signature(self):
         if self.pk is None:
             return None
         return f"{self.__class__.__name__}.{self.pk}"
 
     def call_dfs_related_updaters(self, updated=None, mass_updates=False):
-        # Assume I've been called after I've been updated, so add myself to the updated list
+        # Assume I've been called after I've been updated, so add myself to the updated set
         if updated is None:
-            updated = []
+            updated = set()
         self_sig = self.get_record_signature()
-        if self_sig is not None and self_sig not in updated:
-            updated.append(self_sig)
+        if self_sig is not None:
+            updated.add(self_sig)
         updated = self.call_child_updaters(updated=updated, mass_updates=mass_updates)
         updated = self.call_parent_updaters(updated=updated, mass_updates=mass_updates)
         return updated
 
+    def get_dfs_related_records(self, related=None):
+        """Collects this record and the related records whose maintained fields its changes affect, without updating
+        them.  The records are collected in the (depth-first) order in which call_dfs_related_updaters would update
+        them.  The related records of a record that has already been collected are not traversed again.
+
+        Args:
+            related (Optional[Dict[object, MaintainedModel]]): The records collected so far, keyed on their record
+                signatures.
+        Exceptions:
+            None
+        Returns:
+            related (Dict[object, MaintainedModel]): The same dict, with the newly collected records added.
+        """
+        if related is None:
+            related = {}
+        self_sig = self.get_record_signature()
+        if self_sig is None:
+            # A record that no longer exists (e.g. it was deleted after it was buffered) has no relations to traverse.
+            # It is keyed on its identity so that its (failing) update is still attempted.
+            related[id(self)] = self
+            return related
+        if self_sig in related:
+            return related
+        related[self_sig] = self
+        for related_inst in self.get_child_instances() + self.get_parent_instances():
+            if related_inst.get_record_signature() not in related:
+                related_inst.get_dfs_related_records(related=related)
+        return related
+
     def call_parent_updaters(self, updated, mass_updates=False):
         """
         This calls parent record's `save` method to trigger updates to their maintained fields (if any) and further
@@ -1750,7 +2418,9 @@ class MaintainedModel(Model):
                 # None (at least, that's my guess as to why I was getting back None when I tried it).  So instead, I
                 # implemented the propagation outside of the .save calls using the call_dfs_related_updaters call
                 # below.
-                parent_inst.save(propagate=False, mass_updates=mass_updates)
+                parent_inst.save(
+                    propagate=False, mass_updates=mass_updates, skip_if_unchanged=False
+                )
 
                 # Propagate manually
                 updated = parent_inst.call_dfs_related_updaters(
@@ -1850,7 +2520,9 @@ class MaintainedModel(Model):
                 # Don't let the save call propagate, because we cannot rely on it returning the updated list (because
                 # it could be overridden by another class that doesn't return it (at least, that's my guess as to why I
                 # was getting back None when I tried it.)
-                child_inst.save(propagate=False, mass_updates=mass_updates)
+                child_inst.save(
+                    propagate=False, mass_updates=mass_updates, skip_if_unchanged=False
+                )
 
                 # Instead, we will propagate manually:
                 updated = child_inst.call_dfs_related_updaters(
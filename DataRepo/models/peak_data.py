@@ -3,8 +3,16 @@ from django.db import models
 from django.db.models import Q
 from django.utils.functional import cached_property
 
+from DataRepo.models.maintained_model import MaintainedModel
 
-class PeakData(models.Model):
+
+@MaintainedModel.relation(
+    generation=4,
+    parent_field_name="peak_group",
+    update_label="peak_values",
+    input_field_names=["peak_group", "corrected_abundance"],
+)
+class PeakData(MaintainedModel):
     """
     PeakData is a single observation (at the most atomic level) of a MS-detected molecule.
     For example, this could describe the data for M+2 in glucose from mouse 345 brain tissue.
@@ -62,8 +70,12 @@ class PeakData(models.Model):
         Returns:
             fraction (Optional[float])
         """
+        total_abundance = self.peak_group.total_abundance
+        if total_abundance is None:
+            # The maintained field has not been populated yet (e.g. auto-updates are deferred)
+            total_abundance = self.peak_group._total_abundance()
         try:
-            fraction = self.corrected_abundance / self.peak_group.total_abundance
+            fraction = self.corrected_abundance / total_abundance
         except ZeroDivisionError:
             fraction = None
         return fraction
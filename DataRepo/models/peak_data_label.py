@@ -4,10 +4,17 @@ from django.core.validators import MinValueValidator
 from django.db import models
 
 from DataRepo.models.element_label import ElementLabel
+from DataRepo.models.maintained_model import MaintainedModel
 from DataRepo.models.utilities import atom_count_in_formula
 
 
-class PeakDataLabel(models.Model, ElementLabel):
+@MaintainedModel.relation(
+    generation=5,
+    parent_field_name="peak_data",
+    update_label="peak_values",
+    input_field_names=["peak_data", "element", "count"],
+)
+class PeakDataLabel(MaintainedModel, ElementLabel):
     """
     PeakDataLabel is a single observation of MS-detected labels in measured compounds.
     """
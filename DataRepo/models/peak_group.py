@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from typing import Dict, Iterable, List, Optional, Tuple
+
 from django.db import ProgrammingError, models
-from django.db.models import Max, Min, Sum
+from django.db.models import Max, Min
 from django.utils.functional import cached_property
 
 from DataRepo.models.hier_cached_model import HierCachedModel, cached_function
@@ -62,6 +64,16 @@ class PeakGroup(HierCachedModel, MaintainedModel):
         related_name="peak_groups",
         help_text="The data file from which this PeakGroup was imported.",
     )
+    total_abundance = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=(
+            "Total ion counts for this compound (the sum of the corrected abundances of the peak group's peak data).  "
+            "Maintained field.  Do not edit/set."
+        ),
+    )
 
     def __init__(self, *args, **kwargs):
         from DataRepo.models.compound import Compound
@@ -73,9 +85,16 @@ class PeakGroup(HierCachedModel, MaintainedModel):
             )
         super().__init__(*args, **kwargs)
 
-    # @cached_function is *slower* than uncached
-    @cached_property
-    def total_abundance(self):
+    @MaintainedModel.setter(
+        generation=3,
+        update_field_name="total_abundance",
+        parent_field_name="msrun_sample",
+        # PeakGroupLabel.enrichment_fraction depends on the formula and peak data
+        child_field_names=["labels"],
+        update_label="peak_values",
+        prefetch_lookups=["peak_data"],
+    )
+    def _total_abundance(self):
         """
         Total ion counts for this compound.
         Accucor provides this in the tab "pool size".
@@ -85,9 +104,8 @@ class PeakGroup(HierCachedModel, MaintainedModel):
         # counts from peakdata records linked to a label of an atom that is not in the measured compound would be
         # invalid.  However, such records should not exist, and if they do, their abundance would be 0, so this code
         # assumes that to be the case.
-        return self.peak_data.all().aggregate(
-            total_abundance=Sum("corrected_abundance", default=0)
-        )["total_abundance"]
+        # Note: Iterating over the (possibly prefetched) peak data allows the value to be computed in bulk.
+        return sum(peak_data.corrected_abundance for peak_data in self.peak_data.all())
 
     @cached_property
     def min_med_mz(self):
@@ -219,20 +237,47 @@ class PeakGroup(HierCachedModel, MaintainedModel):
 
         return possible_observations
 
-    def save(self, *args, **kwargs):
+    def save(self, *args, check_representations: bool = True, **kwargs):
         """This is an override of Model.save().  Multiple representations must be checked BEFORE saving or else they
         won't be caught and will cryptically manifest as a unique constraint-related IntegrityError about the peak
         annotation file (ArchiveFile) conflicting.  So putting this in the clean method does nothing, because it never
-        executes when there ARE multiple representations."""
-        self.check_for_multiple_representations()
+        executes when there ARE multiple representations.
+
+        Supply check_representations=False when the check was already performed, e.g. by a PeakGroupConflictDetector
+        during a peak annotation file load."""
+        if check_representations:
+            self.check_for_multiple_representations()
         return super().save(*args, **kwargs)
 
-    def check_for_multiple_representations(self):
+    def get_representations(self) -> List[PeakGroup]:
+        """Retrieves every PeakGroup record with the same name for the same sample (including self if it exists in the
+        database), along with their MSRunSample and peak annotation file records.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (List[PeakGroup])
+        """
+        return list(
+            PeakGroup.objects.filter(
+                name=self.name,
+                msrun_sample__sample__pk=self.msrun_sample.sample_id,
+            )
+            .select_related("msrun_sample", "peak_annotation_file")
+            .order_by("pk")
+        )
+
+    def check_for_multiple_representations(
+        self, representations: Optional[List[PeakGroup]] = None
+    ):
         """This checks the PeakGroup record (self) to see if its compound was already measured for this sample from a
         different peak annotation file and raises an exception if it was.
 
         Args:
-            None
+            representations (Optional[List[PeakGroup]]): The result of get_representations.  Supply it to check many
+                peak groups without querying for each one's (see PeakGroupConflictDetector).
         Exceptions:
             ComplexPeakGroupDuplicate
             DuplicatePeakGroup
@@ -241,7 +286,6 @@ class PeakGroup(HierCachedModel, MaintainedModel):
         Returns:
             None
         """
-        from DataRepo.models.utilities import exists_in_db
         from DataRepo.utils.exceptions import (
             ComplexPeakGroupDuplicate,
             DuplicatePeakGroup,
@@ -249,61 +293,72 @@ class PeakGroup(HierCachedModel, MaintainedModel):
             TechnicalPeakGroupDuplicate,
         )
 
+        if representations is None:
+            representations = self.get_representations()
+
+        def get_queryset(recs: List[PeakGroup]):
+            # The exceptions take querysets
+            return PeakGroup.objects.filter(pk__in=[rec.pk for rec in recs])
+
         # Ignore if a unique constraint violation will happen due to something other than the msrun_sample or
         # peak_annotation_file differing.  E.g. only the formula differs.  Cases where the msrun_samples or
         # peak_annotation_files differ are handled below.
-        if PeakGroup.objects.filter(
-            name=self.name,
-            msrun_sample=self.msrun_sample,
-            peak_annotation_file=self.peak_annotation_file,
-        ).exists():
+        if any(
+            rec.msrun_sample_id == self.msrun_sample_id
+            and rec.peak_annotation_file_id == self.peak_annotation_file_id
+            for rec in representations
+        ):
             return
 
-        # Look for peak groups with the same name (i.e. compound) for the same sample.
-        conflicts = PeakGroup.objects.filter(
-            name=self.name,
-            msrun_sample__sample__pk=self.msrun_sample.sample.pk,
-        )
-
-        # If the record already exists (e.g. doing an update), exclude self.  (self.pk is None otherwise.)
-        if exists_in_db(self):
-            conflicts = conflicts.exclude(pk=self.pk)
+        # Look for peak groups with the same name (i.e. compound) for the same sample.  If the record already exists
+        # (e.g. doing an update), exclude self.  (self.pk is None otherwise.)
+        conflicts = [
+            rec for rec in representations if self.pk is None or rec.pk != self.pk
+        ]
+        filename = self.peak_annotation_file.filename
 
         # Look for duplicates due solely to business rule changes regarding MSRunSample placeholder records that
         # changes the linked MSRunSample record
-        dupes = conflicts.filter(
-            formula=self.formula,
-            peak_annotation_file=self.peak_annotation_file,
-        ).exclude(msrun_sample=self.msrun_sample)
-        if dupes.exists():
+        dupes = [
+            rec
+            for rec in conflicts
+            if rec.formula == self.formula
+            and rec.peak_annotation_file_id == self.peak_annotation_file_id
+            and rec.msrun_sample_id != self.msrun_sample_id
+        ]
+        if len(dupes) > 0:
             # NOTE: This DuplicatePeakGroup exception occludes the MultiplePeakGroupRepresentation exception.  That's
             # because if it's from the same peak annotation file, it is handled differently: as a warning, and skipped.
-            raise DuplicatePeakGroup(self, dupes)
+            raise DuplicatePeakGroup(self, get_queryset(dupes))
 
         # Look for duplicates solely due to the fact that the peak annotation file was edited
-        file_edit_dupes = conflicts.filter(
-            msrun_sample=self.msrun_sample,
-            formula=self.formula,
-            peak_annotation_file__filename=self.peak_annotation_file.filename,
-        ).exclude(peak_annotation_file=self.peak_annotation_file)
-        if file_edit_dupes.count() > 0:
+        file_edit_dupes = [
+            rec
+            for rec in conflicts
+            if rec.msrun_sample_id == self.msrun_sample_id
+            and rec.formula == self.formula
+            and rec.peak_annotation_file.filename == filename
+            and rec.peak_annotation_file_id != self.peak_annotation_file_id
+        ]
+        if len(file_edit_dupes) > 0:
             # NOTE: This TechnicalPeakGroupDuplicate exception occludes the MultiplePeakGroupRepresentation exception.
             # It is handled as an error to highlight that a disallowed edit of the peak annotation file occurred.
-            raise TechnicalPeakGroupDuplicate(self, file_edit_dupes)
+            raise TechnicalPeakGroupDuplicate(self, get_queryset(file_edit_dupes))
 
         # Finally, look for complex duplicates where either edits to the file and/or business rules (about the
         # linked MSRunSample record) *changed* this PeakGroup (note: if the sample and filename are the same, the
         # only difference can be the formula)
-        complex_dupes = conflicts.filter(
-            name=self.name,
-            msrun_sample__sample=self.msrun_sample.sample,
-            peak_annotation_file__filename=self.peak_annotation_file.filename,
-        ).exclude(
-            formula=self.formula,
-            peak_annotation_file=self.peak_annotation_file,
-            msrun_sample=self.msrun_sample,
-        )
-        if complex_dupes.count() > 0:
+        complex_dupes = [
+            rec
+            for rec in conflicts
+            if rec.peak_annotation_file.filename == filename
+            and not (
+                rec.formula == self.formula
+                and rec.peak_annotation_file_id == self.peak_annotation_file_id
+                and rec.msrun_sample_id == self.msrun_sample_id
+            )
+        ]
+        if len(complex_dupes) > 0:
             # NOTE: This ComplexPeakGroupDuplicate exception occludes the MultiplePeakGroupRepresentation exception.
             # It highlights that the PeakGroup qualitatively differs (e.g. the formula changed), and that that coincides
             # with either a placeholder rule change and/or an edited file.
@@ -314,7 +369,7 @@ class PeakGroup(HierCachedModel, MaintainedModel):
                 "peak_annotation_file": self.peak_annotation_file,
             }
 
-            dupe1 = complex_dupes.first()
+            dupe1 = complex_dupes[0]
             differences = {}
             if (
                 type(dupe1.msrun_sample) is not type(self.msrun_sample)
@@ -346,7 +401,7 @@ class PeakGroup(HierCachedModel, MaintainedModel):
                 }
 
             suggestion = None
-            n_other_dupes = complex_dupes.count() - 1
+            n_other_dupes = len(complex_dupes) - 1
             if n_other_dupes > 0:
                 suggestion = f"Note, there are {n_other_dupes} other complex duplicates not shown."
 
@@ -362,8 +417,8 @@ class PeakGroup(HierCachedModel, MaintainedModel):
         # TODO: appears to be some code that ignores the error, because the loads have been succeeding despite those
         # TODO: errors having been printed.  That code should be located and deleted.
 
-        if conflicts.count() > 0:
-            raise MultiplePeakGroupRepresentation(self, conflicts)
+        if len(conflicts) > 0:
+            raise MultiplePeakGroupRepresentation(self, get_queryset(conflicts))
 
     def clean(self, *args, **kwargs):
         """This checks to ensure that the compound(s) associated with the PeakGroup HAVE an element that is labeled
@@ -455,3 +510,128 @@ class PeakGroup(HierCachedModel, MaintainedModel):
         from django.urls import reverse
 
         return reverse(self.detail_name, kwargs={"pk": self.pk})
+
+
+class PeakGroupConflictDetector:
+    """Checks batches of new PeakGroup records for conflicts (see PeakGroup.check_for_multiple_representations) without
+    querying the database for each one.
+
+    Every existing PeakGroup record whose name and sample are among those of a peak annotation file is retrieved (with
+    its MSRunSample and peak annotation file records) in a single query (see preload), so that each new peak group's
+    conflicts can be determined in memory.  Loaders must add the records they create and remove the records they delete
+    so that conflicts within the file are detected as well.
+
+    Peak groups whose name and sample were not preloaded fall back to retrieving their representations individually.
+
+    Example:
+        detector = PeakGroupConflictDetector()
+        detector.preload(["lactate", "glucose"], [sample1.pk, sample2.pk])
+        rec = detector.get(name="lactate", msrun_sample=msrs, formula="C3H6O3", peak_annotation_file=af)
+        if rec is None:
+            rec = PeakGroup(name="lactate", msrun_sample=msrs, formula="C3H6O3", peak_annotation_file=af)
+            detector.check(rec)  # Raises
+            rec.save(check_representations=False)
+            detector.add(rec)
+
+    Instance Attributes:
+        representations (Dict[Tuple[str, int], List[PeakGroup]]): PeakGroup records keyed on name and sample ID.
+    """
+
+    def __init__(self):
+        self.representations: Dict[Tuple[str, int], List[PeakGroup]] = {}
+
+    def preload(self, names: Iterable[str], sample_ids: Iterable[int]):
+        """Retrieves the existing PeakGroup records with the supplied names for the supplied samples.
+
+        Args:
+            names (Iterable[str]): Peak group names.
+            sample_ids (Iterable[int]): Sample primary keys.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        names = set(names)
+        sample_ids = set(sample_ids)
+        if len(names) == 0 or len(sample_ids) == 0:
+            return
+        for name in names:
+            for sample_id in sample_ids:
+                self.representations[(name, sample_id)] = []
+        for rec in (
+            PeakGroup.objects.filter(
+                name__in=names, msrun_sample__sample__pk__in=sample_ids
+            )
+            .select_related("msrun_sample", "peak_annotation_file")
+            .order_by("pk")
+        ):
+            self.representations[(rec.name, rec.msrun_sample.sample_id)].append(rec)
+
+    def get_representations(self, rec: PeakGroup) -> List[PeakGroup]:
+        """Returns every PeakGroup record with the same name for the same sample as the supplied record (see
+        PeakGroup.get_representations).
+
+        Args:
+            rec (PeakGroup)
+        Exceptions:
+            None
+        Returns:
+            (List[PeakGroup])
+        """
+        key = (rec.name, rec.msrun_sample.sample_id)
+        if key not in self.representations.keys():
+            self.representations[key] = rec.get_representations()
+        return self.representations[key]
+
+    def get(self, **rec_dict) -> Optional[PeakGroup]:
+        """Returns the existing PeakGroup record matching the supplied field values (name, msrun_sample, formula, and
+        peak_annotation_file), like the get of a get_or_create.
+
+        Args:
+            rec_dict (dict): PeakGroup field values.
+        Exceptions:
+            None
+        Returns:
+            (Optional[PeakGroup])
+        """
+        new_rec = PeakGroup(**rec_dict)
+        for rec in self.get_representations(new_rec):
+            if (
+                rec.msrun_sample_id == new_rec.msrun_sample_id
+                and rec.formula == new_rec.formula
+                and rec.peak_annotation_file_id == new_rec.peak_annotation_file_id
+            ):
+                return rec
+        return None
+
+    def check(self, rec: PeakGroup):
+        """Raises the exception about the supplied (unsaved) record's conflicts, if any.  See
+        PeakGroup.check_for_multiple_representations.
+
+        Args:
+            rec (PeakGroup)
+        Exceptions:
+            ComplexPeakGroupDuplicate
+            DuplicatePeakGroup
+            MultiplePeakGroupRepresentation
+            TechnicalPeakGroupDuplicate
+        Returns:
+            None
+        """
+        rec.check_for_multiple_representations(
+            representations=self.get_representations(rec)
+        )
+
+    def add(self, rec: PeakGroup):
+        """Adds a created PeakGroup record."""
+        representations = self.get_representations(rec)
+        if rec not in representations:
+            representations.append(rec)
+
+    def remove(self, rec: PeakGroup):
+        """Removes a deleted PeakGroup record."""
+        key = (rec.name, rec.msrun_sample.sample_id)
+        if key in self.representations.keys():
+            self.representations[key] = [
+                pg for pg in self.representations[key] if pg.pk != rec.pk
+            ]
@@ -7,10 +7,11 @@ from pyparsing import ParseException
 
 from DataRepo.models.element_label import ElementLabel
 from DataRepo.models.hier_cached_model import HierCachedModel, cached_function
+from DataRepo.models.maintained_model import MaintainedModel
 from DataRepo.models.utilities import atom_count_in_formula
 
 
-class PeakGroupLabel(HierCachedModel):
+class PeakGroupLabel(HierCachedModel, MaintainedModel):
     parent_related_key_name = "peak_group"
     # Leaf
 
@@ -30,6 +31,16 @@ class PeakGroupLabel(HierCachedModel):
         default=ElementLabel.CARBON,
         help_text='The type of element that is labeled in this observation (e.g. "C", "H", "O").',
     )
+    enrichment_fraction = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=(
+            "The weighted average of the fraction of labeled atoms of this element in the peak group's compound.  "
+            "Maintained field.  Do not edit/set."
+        ),
+    )
 
     class Meta:
         verbose_name = "labeled element"
@@ -48,9 +59,14 @@ class PeakGroupLabel(HierCachedModel):
     def __str__(self):
         return str(f"{self.element}")
 
-    @property  # type: ignore
-    @cached_function
-    def enrichment_fraction(self):
+    @MaintainedModel.setter(
+        generation=0,
+        update_field_name="enrichment_fraction",  # No change here affects anything else.
+        update_label="peak_values",
+        prefetch_lookups=["peak_group__peak_data__labels"],
+        input_field_names=["peak_group", "element"],
+    )
+    def _enrichment_fraction(self):
         """
         A weighted average of the fraction of labeled atoms for this PeakGroup
         in this sample with this (labeled) element.
@@ -64,6 +80,9 @@ class PeakGroupLabel(HierCachedModel):
         enrichment_fraction = None
         warning = False
         msg = ""
+        label_pd_rec = None
+        label_rec = None
+        fraction = None
 
         try:
             # This assumes that multiple measured compounds for the same PeakGroup are composed of the same elements
@@ -81,23 +100,49 @@ class PeakGroupLabel(HierCachedModel):
             if atom_count == 0:
                 raise NoCommonLabel(self)
 
+            # Iterating over the (possibly prefetched) peak data and their labels allows the value to be computed in
+            # bulk.  The total abundance is computed here (instead of using the maintained PeakGroup.total_abundance
+            # field) because maintained field values must not depend on other maintained fields.
+            peak_data_recs = list(self.get_peak_data_with_labels())
+            total_abundance = sum(
+                peak_data_rec.corrected_abundance for peak_data_rec in peak_data_recs
+            )
+
             # Calculate the numerator
             element_enrichment_sum = 0.0
-            label_pd_recs = self.peak_group.peak_data.filter(
-                labels__element__exact=self.element
-            )
+            label_pd_recs = [
+                peak_data_rec
+                for peak_data_rec in peak_data_recs
+                if any(
+                    pd_label.element == self.element
+                    for pd_label in peak_data_rec.labels.all()
+                )
+            ]
 
             # This assumes that if there are any label_pd_recs for this measured elem, the calculation is valid
-            if label_pd_recs.count() == 0:
+            if len(label_pd_recs) == 0:
                 raise PeakData.DoesNotExist()
 
             for label_pd_rec in label_pd_recs:
                 # This assumes the PeakDataLabel unique constraint: peak_data, element
-                label_rec = label_pd_rec.labels.get(element__exact=self.element)
+                label_recs = [
+                    pd_label
+                    for pd_label in label_pd_rec.labels.all()
+                    if pd_label.element == self.element
+                ]
+                if len(label_recs) > 1:
+                    raise PeakDataLabel.MultipleObjectsReturned()
+                label_rec = label_recs[0]
+
+                # See PeakData.fraction
+                try:
+                    fraction = label_pd_rec.corrected_abundance / total_abundance
+                except ZeroDivisionError:
+                    fraction = None
 
                 # This assumes that label_rec must exist because of the filter above the loop
                 element_enrichment_sum = element_enrichment_sum + (
-                    label_pd_rec.fraction * label_rec.count
+                    fraction * label_rec.count
                 )
 
             enrichment_fraction = element_enrichment_sum / atom_count
@@ -115,18 +160,18 @@ class PeakGroupLabel(HierCachedModel):
                 # NoCommonLabel is meaningless if there is no formula (above)
                 warning = False
                 raise e
-            elif label_pd_rec.fraction is None:
+            elif label_pd_rec is not None and fraction is None:
                 msg = (
                     f"PeakData fraction was None from record [{label_pd_rec}] likely because the PeakGroup total "
                     "abundance was 0"
                 )
-            elif label_rec.count is None:
+            elif label_rec is not None and label_rec.count is None:
                 msg = f"Labeled count missing from PeakDataLabel record [{label_rec}]"
-            elif label_rec.element is None:
+            elif label_rec is not None and label_rec.element is None:
                 msg = f"Labeled element missing from PeakDataLabel record [{label_rec}]"
             else:
                 raise e
-        except (PeakData.DoesNotExist, PeakDataLabel.DoesNotExist):
+        except PeakData.DoesNotExist:
             warning = True
             msg = (
                 f"PeakDataLabel record missing for PeakGroup [{self.peak_group}]'s element {self.element}.  There "
@@ -149,8 +194,22 @@ class PeakGroupLabel(HierCachedModel):
 
         return enrichment_fraction
 
-    @property  # type: ignore
-    @cached_function
+    def get_peak_data_with_labels(self):
+        """Returns the peak group's peak data, with their labels prefetched (unless the peak data were already
+        prefetched, e.g. by bulk_rebuild_maintained_fields).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (QuerySet[PeakData])
+        """
+        if "peak_data" in getattr(self.peak_group, "_prefetched_objects_cache", {}):
+            return self.peak_group.peak_data.all()
+        return self.peak_group.peak_data.prefetch_related("labels")
+
+    @property
     def enrichment_abundance(self):
         """
         The abundance of labeled atoms in this.PeakGroup's measured compound.
@@ -78,6 +78,8 @@ class Sample(MaintainedModel, HierCachedModel):
         child_field_names=["fcircs"],
         update_field_name="is_serum_sample",
         update_label="fcirc_calcs",
+        prefetch_lookups=["tissue"],
+        input_field_names=["animal", "tissue", "time_collected"],
     )
     def _is_serum_sample(self):
         """returns True if the sample is flagged as a "serum" sample"""
@@ -93,8 +95,9 @@ class Sample(MaintainedModel, HierCachedModel):
     @cached_function
     def last_tracer_peak_groups(self):
         """
-        Retrieves the last Peak Group for each tracer compound
+        Retrieves the last Peak Group for each tracer compound (see LastTracerPeakGroup)
         """
+        from DataRepo.models.last_peak_group import LastTracerPeakGroup
 
         # Get every tracer's compound
         if self.animal.tracers.count() == 0:
@@ -102,23 +105,15 @@ class Sample(MaintainedModel, HierCachedModel):
             return PeakGroup.objects.none()
 
         # Get the last peakgroup for each tracer
-        last_peakgroup_ids = []
+        last_peakgroup_ids = LastTracerPeakGroup.get_peak_group_ids(self)
         for tracer in self.animal.tracers.all():
-            tracer_peak_group = (
-                PeakGroup.objects.filter(msrun_sample__sample__id__exact=self.id)
-                .filter(compounds__id__exact=tracer.compound.id)
-                .order_by("msrun_sample__msrun_sequence__date")
-                .last()
-            )
-            if tracer_peak_group:
-                last_peakgroup_ids.append(tracer_peak_group.id)
-            else:
+            if tracer.id not in last_peakgroup_ids.keys():
                 warnings.warn(
                     f"Sample {self} has no peak group for tracer compound: [{tracer.compound}]."
                 )
                 return PeakGroup.objects.none()
 
-        return PeakGroup.objects.filter(id__in=last_peakgroup_ids)
+        return PeakGroup.objects.filter(id__in=last_peakgroup_ids.values())
 
     class Meta:
         verbose_name = "sample"
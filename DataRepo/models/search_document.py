@@ -0,0 +1,56 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    A denormalized, lower-cased document of the searchable column values of a record in a BST list view (see
+    BSTSearchIndex), indexed with a pg_trgm GIN index, so that the list view's global search is a single indexed
+    substring lookup instead of an icontains lookup on every searchable column (and their joins).  The values of columns
+    that are searched using whole matches (iexact) are in a separate document, so that they are not substring matched.
+    """
+
+    id = models.AutoField(primary_key=True)
+    index_name = models.CharField(
+        max_length=64,
+        help_text="The name of the search index (i.e. the BST list view) that the document belongs to.",
+    )
+    record_id = models.IntegerField(
+        help_text="The primary key of the list view's model record that the document describes.",
+    )
+    document = models.TextField(
+        help_text="The lower-cased, newline-delimited, distinct searchable column values of the record.",
+    )
+    exact_document = models.TextField(
+        default="",
+        help_text=(
+            "The lower-cased, newline-delimited (including a leading and trailing newline), distinct searchable column "
+            "values of the record that must be matched whole (e.g. values of columns with a select list)."
+        ),
+    )
+
+    class Meta:
+        verbose_name = "search document"
+        verbose_name_plural = "search documents"
+        ordering = ["index_name", "record_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["index_name", "record_id"],
+                name="unique_searchdocument",
+            )
+        ]
+        indexes = [
+            GinIndex(
+                fields=["document"],
+                name="searchdocument_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["exact_document"],
+                name="searchdocument_exact_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.index_name}.{self.record_id}"
@@ -70,6 +70,7 @@ class TracerQuerySet(models.QuerySet):
     generation=1,
     parent_field_name="compound",
     update_label="tracer_stat",
+    input_field_names=["compound"],
 )
 class Tracer(MaintainedModel, ElementLabel):
     objects: TracerQuerySet = TracerQuerySet().as_manager()
@@ -117,6 +118,9 @@ class Tracer(MaintainedModel, ElementLabel):
         update_field_name="name",
         parent_field_name="infusates",
         update_label="name",
+        prefetch_lookups=["compound", "labels"],
+        # Changes to labels trigger this update via the TracerLabel decorator
+        input_field_names=["compound"],
     )
     def _name(self):
         return self.name_with_synonym()
@@ -126,6 +130,8 @@ class Tracer(MaintainedModel, ElementLabel):
         update_field_name="label_combo",
         parent_field_name="infusates",
         update_label="label_combo",
+        prefetch_lookups=["labels"],
+        input_field_names=[],
     )
     def _label_combo(self):
         """Generates a string to populate the label_combo field.
@@ -138,8 +144,9 @@ class Tracer(MaintainedModel, ElementLabel):
 
         Updates here trigger label_combo updates to linked Infusate records.
         """
+        # Sorted here instead of with order_by, so that prefetched labels are used
         return self.LABELS_COMBO_DELIMITER.join(
-            [str(label.element) for label in self.labels.order_by("element")]
+            sorted(str(label.element) for label in self.labels.all())
         )
 
     def name_with_synonym(self, synonym=None):
@@ -99,6 +99,7 @@ class TracerLabel(MaintainedModel, ElementLabel):
         update_field_name="name",
         parent_field_name="tracer",
         update_label="name",
+        input_field_names=["tracer", "element", "count", "positions", "mass_number"],
     )
     def _name(self):
         # format: `position,position,...-MassNumberElementCount`, e.g. 1,2,3-13C3, positions optional (e.g. 13C3)
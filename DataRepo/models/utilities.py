@@ -51,6 +51,8 @@ ALL_MODELS_IN_SAFE_DELETION_ORDER = [
     "InfusateTracer",
     "Protocol",
     "Study",
+    "MaintainedFieldRepair",
+    "SearchDocument",
 ]
 
 DJANGO_LOOKUPS = [
@@ -0,0 +1,40 @@
+import json
+
+from debug_toolbar.panels import Panel
+
+from DataRepo.profiling import profiling
+
+
+class RequestProfilePanel(Panel):
+    """A django-debug-toolbar panel that displays the request's profile (see DataRepo.profiling): database query counts
+    and times, cached_function hits and misses, and render times per BST column, advanced search format, and loader
+    phase, along with the profile as JSON.
+
+    The panel profiles the request itself, but displays the RequestProfilingMiddleware's profile if
+    settings.REQUEST_PROFILING is True.
+    """
+
+    title = "Request Profile"
+    template = "debug/request_profile_panel.html"
+
+    @property
+    def nav_subtitle(self):
+        profile = self.get_stats().get("profile")
+        if profile is None:
+            return ""
+        return (
+            f"{profile['queries']} queries, {profile['cache_hits']} cache hits, "
+            f"{profile['cache_misses']} cache misses"
+        )
+
+    def process_request(self, request):
+        with profiling(f"{request.method} {request.path}") as profile:
+            request.profile = profile
+            return super().process_request(request)
+
+    def generate_stats(self, request, response):
+        profile = getattr(request, "profile", None)
+        if profile is None:
+            return
+        data = profile.as_dict()
+        self.record_stats({"profile": data, "profile_json": json.dumps(data, indent=2)})
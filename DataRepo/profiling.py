@@ -0,0 +1,208 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional
+
+from django.db import connections
+
+# The scope that queries, cache accesses, and time are attributed to when no other scope is active
+ROOT_SCOPE = "request"
+
+# The active RequestProfile of the current thread (see profiling)
+PROFILE_STATE = threading.local()
+
+
+class RequestProfile:
+    """Database query counts and times, cached_function hits and misses, and elapsed (e.g. render) times, attributed to
+    named scopes, such as a BST column ("bst_column:<column name>"), an advanced search format
+    ("search_format:<format name>"), or a loader phase ("loader:<loader class>.<phase>").
+
+    Queries and cache accesses are attributed to the innermost active scope only, whereas the time of a scope includes
+    the time of the scopes nested inside it.  A scope's "max_repeated_query" is the number of times its most frequent
+    SQL statement (without its parameters) was executed, which (when close to the number of records on the page)
+    identifies N+1 query problems.
+
+    Example:
+        with profiling("my_page") as profile:
+            with profile_scope("bst_column", "name"):
+                ...
+        print(profile.to_json())
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.scopes: Dict[str, dict] = {}
+        self.sql_counts: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self.stack: List[str] = [ROOT_SCOPE]
+        self.get_scope(ROOT_SCOPE)["calls"] = 1
+
+    def get_scope(self, name: str) -> dict:
+        if name not in self.scopes.keys():
+            self.scopes[name] = {
+                "calls": 0,
+                "time": 0.0,
+                "queries": 0,
+                "query_time": 0.0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "cached_functions": defaultdict(lambda: {"hits": 0, "misses": 0}),
+            }
+        return self.scopes[name]
+
+    @property
+    def current_scope(self) -> str:
+        return self.stack[-1]
+
+    def enter_scope(self, name: str):
+        self.get_scope(name)["calls"] += 1
+        self.stack.append(name)
+
+    def exit_scope(self, name: str, elapsed: float):
+        self.stack.pop()
+        # Recursive scopes (e.g. a loader calling itself) are only timed at the outermost level
+        if name not in self.stack:
+            self.get_scope(name)["time"] += elapsed
+
+    def record_query(self, sql: str, elapsed: float):
+        scope = self.get_scope(self.current_scope)
+        scope["queries"] += 1
+        scope["query_time"] += elapsed
+        self.sql_counts[self.current_scope][sql] += 1
+
+    def record_cache_access(self, func_name: str, hit: bool):
+        scope = self.get_scope(self.current_scope)
+        if hit:
+            scope["cache_hits"] += 1
+            scope["cached_functions"][func_name]["hits"] += 1
+        else:
+            scope["cache_misses"] += 1
+            scope["cached_functions"][func_name]["misses"] += 1
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.start
+        self.get_scope(ROOT_SCOPE)["time"] = self.elapsed
+
+    def as_dict(self) -> dict:
+        """Returns the profile as a JSON-serializable dict, with the scopes ordered by decreasing query count.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (dict)
+        """
+        scopes = {}
+        for name, scope in sorted(
+            self.scopes.items(), key=lambda item: -item[1]["queries"]
+        ):
+            scopes[name] = {
+                **scope,
+                "cached_functions": dict(scope["cached_functions"]),
+                "max_repeated_query": max(self.sql_counts[name].values(), default=0),
+            }
+        return {
+            "name": self.name,
+            "time": (
+                self.elapsed
+                if self.elapsed is not None
+                else time.perf_counter() - self.start
+            ),
+            "queries": sum(s["queries"] for s in self.scopes.values()),
+            "query_time": sum(s["query_time"] for s in self.scopes.values()),
+            "cache_hits": sum(s["cache_hits"] for s in self.scopes.values()),
+            "cache_misses": sum(s["cache_misses"] for s in self.scopes.values()),
+            "scopes": scopes,
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """A database execute wrapper (see django.db.connection.execute_wrapper) that records each query."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record_query(sql, time.perf_counter() - start)
+
+
+class ProfileScope:
+    """Context manager that attributes queries, cache accesses, and time to a scope of the active RequestProfile."""
+
+    def __init__(self, profile: RequestProfile, name: str):
+        self.profile = profile
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.profile.enter_scope(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.profile.exit_scope(self.name, time.perf_counter() - self.start)
+
+
+def get_current_profile() -> Optional[RequestProfile]:
+    return getattr(PROFILE_STATE, "profile", None)
+
+
+@contextmanager
+def profiling(
+    name: str, profile: Optional[RequestProfile] = None
+) -> Iterator[RequestProfile]:
+    """Profiles (in the current thread) the database queries and cached_function accesses of the enclosed code.
+
+    Args:
+        name (str): E.g. the request method and path.
+        profile (Optional[RequestProfile]): An existing profile to continue (e.g. while a streaming response is
+            generated).
+    Exceptions:
+        None
+    Yields:
+        profile (RequestProfile)
+    """
+    previous = get_current_profile()
+    if profile is None:
+        profile = RequestProfile(name)
+    PROFILE_STATE.profile = profile
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile.query_wrapper))
+            yield profile
+    finally:
+        profile.finish()
+        PROFILE_STATE.profile = previous
+
+
+def profile_scope(kind: str, name=None):
+    """Returns a context manager that attributes the enclosed code's queries, cache accesses, and time to the scope
+    "<kind>:<name>" of the active profile, or a no-op context manager when nothing is being profiled.
+
+    Args:
+        kind (str): E.g. "bst_column", "search_format", or "loader".
+        name (Optional[object]): E.g. a column name.
+    Exceptions:
+        None
+    Returns:
+        (ContextManager)
+    """
+    profile = get_current_profile()
+    if profile is None:
+        return nullcontext()
+    return ProfileScope(profile, kind if name is None else f"{kind}:{name}")
+
+
+def record_cache_access(rec, cache_func_name: str, hit: bool):
+    """Records a cached_function hit or miss in the active profile (if any)."""
+    profile = get_current_profile()
+    if profile is not None:
+        profile.record_cache_access(f"{type(rec).__name__}.{cache_func_name}", hit)
@@ -0,0 +1,399 @@
+import gzip
+import io
+import os
+import struct
+import tempfile
+import zlib
+from bisect import bisect_right
+from typing import BinaryIO, List, Tuple
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+# The archive directory of content-addressed files, which are named by their checksum (see data_type_path)
+CONTENT_ADDRESSED_DIR = "archive_files/sha1"
+# The suffix of the names of content-addressed files that were compressed by ArchiveStorage.  It is not a conventional
+# suffix (e.g. ".gz"), so that uploaded files are never mistaken for files that the storage compressed.
+COMPRESSED_SUFFIX = ".gzip"
+# The uncompressed size of the independently compressed blocks of compressed archive files (see BlockedGzipWriter)
+COMPRESSED_BLOCK_SIZE = 1024 * 1024
+# The ID of the gzip extra subfield that records the compressed size of each block (see BlockedGzipWriter)
+BLOCK_SUBFIELD_ID = b"TB"
+# The gzip member header of a block: magic, compression method (deflate), flags (FEXTRA), mtime, extra flags, OS
+# (unknown), extra field length, subfield ID, subfield length, and the block's (i.e. the member's) compressed size
+BLOCK_HEADER_FORMAT = "<BBBBIBBH2sHI"
+BLOCK_HEADER_SIZE = struct.calcsize(BLOCK_HEADER_FORMAT)
+
+
+def is_content_addressed(name: str) -> bool:
+    return name.replace("\\", "/").startswith(f"{CONTENT_ADDRESSED_DIR}/")
+
+
+def is_compressed(name: str) -> bool:
+    return is_content_addressed(name) and name.endswith(COMPRESSED_SUFFIX)
+
+
+class BlockedGzipWriter:
+    """Writes a gzip file consisting of independently compressed blocks of COMPRESSED_BLOCK_SIZE uncompressed bytes,
+    each one a gzip member whose header records its compressed size (like BGZF, the format of BAM files, but with larger
+    blocks).  It is a valid (multi-member) gzip file, so it can be decompressed as a stream by any gzip reader, and the
+    recorded sizes allow BlockedGzipReader to seek to any position by decompressing a single block.
+
+    Usage:
+        with BlockedGzipWriter(raw_file) as writer:
+            writer.write(data)
+    """
+
+    def __init__(self, fileobj: BinaryIO, block_size: int = COMPRESSED_BLOCK_SIZE):
+        self.fileobj = fileobj
+        self.block_size = block_size
+        self.buffer = bytearray()
+        self.blocks = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.close()
+
+    def write(self, data: bytes):
+        self.buffer.extend(data)
+        while len(self.buffer) >= self.block_size:
+            self.write_block(bytes(self.buffer[: self.block_size]))
+            del self.buffer[: self.block_size]
+
+    def write_block(self, data: bytes):
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        deflated = compressor.compress(data) + compressor.flush()
+        block_size = BLOCK_HEADER_SIZE + len(deflated) + 8
+        self.fileobj.write(
+            struct.pack(
+                BLOCK_HEADER_FORMAT,
+                0x1F,
+                0x8B,
+                8,
+                4,
+                0,
+                0,
+                255,
+                8,
+                BLOCK_SUBFIELD_ID,
+                4,
+                block_size,
+            )
+        )
+        self.fileobj.write(deflated)
+        self.fileobj.write(struct.pack("<II", zlib.crc32(data), len(data)))
+        self.blocks += 1
+
+    def close(self):
+        # An empty file is written as a single empty block, so that it is still a valid gzip file
+        if len(self.buffer) > 0 or self.blocks == 0:
+            self.write_block(bytes(self.buffer))
+            self.buffer = bytearray()
+
+
+class NotBlockedGzipError(ValueError):
+    pass
+
+
+class BlockedGzipReader(io.RawIOBase):
+    """A seekable, read-only binary stream of the decompressed content of a file written by BlockedGzipWriter.  The
+    block index is built from the block headers and trailers, without decompressing anything, and reads only decompress
+    the blocks they overlap.
+    """
+
+    def __init__(self, path: str):
+        """Constructor.
+
+        Args:
+            path (str)
+        Exceptions:
+            NotBlockedGzipError: if the file was not written by BlockedGzipWriter.
+        Returns:
+            None
+        """
+        super().__init__()
+        self.name = path
+        self.raw = open(path, "rb")
+        try:
+            self.offsets, self.positions, self.size = self.read_index(self.raw)
+        except Exception:
+            self.raw.close()
+            raise
+        self.pos = 0
+        self.block_num = None
+        self.block = b""
+
+    @classmethod
+    def read_index(cls, fileobj: BinaryIO) -> Tuple[List[int], List[int], int]:
+        """Reads the index of a blocked gzip file.
+
+        Args:
+            fileobj (BinaryIO)
+        Exceptions:
+            NotBlockedGzipError
+        Returns:
+            offsets (List[int]): The offset of every block in the file.
+            positions (List[int]): The position of every block in the decompressed content.
+            size (int): The size of the decompressed content.
+        """
+        offsets = []
+        positions = []
+        offset = 0
+        size = 0
+        while True:
+            fileobj.seek(offset)
+            header = fileobj.read(BLOCK_HEADER_SIZE)
+            if len(header) == 0:
+                break
+            if len(header) < BLOCK_HEADER_SIZE:
+                raise NotBlockedGzipError("Truncated block header.")
+            id1, id2, _, flags, _, _, _, _, subfield_id, _, block_size = struct.unpack(
+                BLOCK_HEADER_FORMAT, header
+            )
+            if (id1, id2, flags, subfield_id) != (0x1F, 0x8B, 4, BLOCK_SUBFIELD_ID):
+                raise NotBlockedGzipError("Not a blocked gzip file.")
+            fileobj.seek(offset + block_size - 4)
+            (block_content_size,) = struct.unpack("<I", fileobj.read(4))
+            offsets.append(offset)
+            positions.append(size)
+            offset += block_size
+            size += block_content_size
+        if len(offsets) == 0:
+            raise NotBlockedGzipError("Empty file.")
+        return offsets, positions, size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self.pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+        self.pos = pos
+        return self.pos
+
+    def get_block(self, block_num: int) -> bytes:
+        if block_num != self.block_num:
+            offset = self.offsets[block_num]
+            end = (
+                self.offsets[block_num + 1]
+                if block_num + 1 < len(self.offsets)
+                else None
+            )
+            self.raw.seek(offset)
+            member = self.raw.read() if end is None else self.raw.read(end - offset)
+            self.block = zlib.decompress(member[BLOCK_HEADER_SIZE:-8], -zlib.MAX_WBITS)
+            self.block_num = block_num
+        return self.block
+
+    def readinto(self, buffer) -> int:
+        if self.pos >= self.size:
+            return 0
+        block_num = bisect_right(self.positions, self.pos) - 1
+        block = self.get_block(block_num)
+        start = self.pos - self.positions[block_num]
+        data = block[start : start + len(buffer)]
+        buffer[: len(data)] = data
+        self.pos += len(data)
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self.raw.close()
+        super().close()
+
+
+def open_compressed(path: str) -> BinaryIO:
+    """Opens a file compressed by ArchiveStorage for (buffered) reading of its decompressed content.  Files written by
+    BlockedGzipWriter are randomly accessible.  Other (i.e. single member) gzip files are decompressed sequentially.
+
+    Args:
+        path (str)
+    Exceptions:
+        None
+    Returns:
+        (BinaryIO)
+    """
+    try:
+        return io.BufferedReader(BlockedGzipReader(path), COMPRESSED_BLOCK_SIZE)
+    except NotBlockedGzipError:
+        return gzip.open(path, "rb")
+
+
+def open_archived_file(path: str) -> BinaryIO:
+    """Opens an archived file (compressed by ArchiveStorage or not) for binary reading of its (decompressed) content.
+
+    Args:
+        path (str)
+    Exceptions:
+        None
+    Returns:
+        (BinaryIO)
+    """
+    if str(path).endswith(COMPRESSED_SUFFIX):
+        return open_compressed(str(path))
+    return open(path, "rb")
+
+
+class DecompressedFile(File):
+    """A File whose reads return the decompressed content of a file compressed by ArchiveStorage, including after it
+    is closed and re-opened."""
+
+    def __init__(self, path: str):
+        super().__init__(open_compressed(path), name=path)
+
+    def open(self, mode=None, *args, **kwargs):
+        if not self.closed:
+            self.seek(0)
+        else:
+            self.file = open_compressed(self.name)
+        return self
+
+    @property
+    def size(self):
+        return get_uncompressed_size(self.name)
+
+
+def get_uncompressed_size(path: str) -> int:
+    """Returns the uncompressed size of a file compressed by ArchiveStorage, from the sizes recorded in its blocks.
+    Other (i.e. single member) gzip files are decompressed (as a stream) to count their bytes, because the size
+    recorded in their last 4 bytes is modulo 2^32 (per the gzip format), i.e. wrong for files of 4 GiB or more.
+
+    Args:
+        path (str)
+    Exceptions:
+        None
+    Returns:
+        (int): The size in bytes.
+    """
+    with open(path, "rb") as fl:
+        try:
+            _, _, size = BlockedGzipReader.read_index(fl)
+            return size
+        except NotBlockedGzipError:
+            pass
+    size = 0
+    with gzip.open(path, "rb") as fl:
+        while True:
+            chunk = fl.read(COMPRESSED_BLOCK_SIZE)
+            if len(chunk) == 0:
+                break
+            size += len(chunk)
+    return size
+
+
+class ArchiveStorage(FileSystemStorage):
+    """The file system storage of ArchiveFile.file_location, which stores content-addressed files (see
+    settings.ARCHIVE_CONTENT_ADDRESSED and data_type_path) once per checksum.
+
+    - Content-addressed names are never altered to make them unique (i.e. no random suffix is appended), because files
+      with the same name have the same content.  If the file already exists (e.g. it was archived by a load that was
+      rolled back), the copy is skipped.
+    - Content-addressed files at least settings.ARCHIVE_COMPRESS_MIN_SIZE bytes in size (if set) and (if
+      settings.ARCHIVE_COMPRESS_MZXML is True) mzXML files are stored compressed (see BlockedGzipWriter), with
+      COMPRESSED_SUFFIX appended to their names.  Reading them (e.g. via FieldFile.open) returns the decompressed
+      content, with random access.  (Note, the URLs and paths of such files refer to the compressed files.)
+
+    All other files are stored exactly as FileSystemStorage stores them.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        if not is_content_addressed(name):
+            return super().get_available_name(name, max_length=max_length)
+        if max_length is None:
+            return name
+        # Like FileSystemStorage, the file root is truncated to fit, leaving room for COMPRESSED_SUFFIX
+        excess = len(name) + len(COMPRESSED_SUFFIX) - max_length
+        if excess > 0:
+            dir_name, file_name = os.path.split(name)
+            file_root, file_ext = os.path.splitext(file_name)
+            file_root = file_root[:-excess]
+            if not file_root:
+                raise SuspiciousFileOperation(
+                    f'Storage can not find an available filename for "{name}".  Please make sure that the '
+                    'corresponding file field allows sufficient "max_length".'
+                )
+            name = os.path.join(dir_name, f"{file_root}{file_ext}")
+        return name
+
+    def should_compress(self, name: str, size: int) -> bool:
+        if not is_content_addressed(name):
+            return False
+        # Names that already end with COMPRESSED_SUFFIX are always compressed, so that only compressed files end with it
+        if name.endswith(COMPRESSED_SUFFIX):
+            return True
+        if settings.ARCHIVE_COMPRESS_MZXML and name.lower().endswith(".mzxml"):
+            return True
+        min_size = settings.ARCHIVE_COMPRESS_MIN_SIZE
+        return min_size is not None and min_size > 0 and size >= min_size
+
+    def _open(self, name, mode="rb"):
+        if is_compressed(name):
+            return DecompressedFile(self.path(name))
+        return super()._open(name, mode)
+
+    def _save(self, name, content):
+        if not is_content_addressed(name):
+            return super()._save(name, content)
+
+        # The content of an existing content-addressed file (compressed or not) is identical, so there is no need to
+        # copy it again
+        for existing_name in (name, f"{name}{COMPRESSED_SUFFIX}"):
+            if self.exists(existing_name):
+                return existing_name.replace("\\", "/")
+
+        compress = self.should_compress(name, content.size)
+        if compress:
+            name = f"{name}{COMPRESSED_SUFFIX}"
+
+        full_path = self.path(name)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Written to a temporary file that replaces the destination atomically, so that concurrent saves of the same
+        # content never leave a partial file at the destination
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw_file:
+                if compress:
+                    dest_file = BlockedGzipWriter(raw_file)
+                else:
+                    dest_file = raw_file
+                for chunk in content.chunks():
+                    dest_file.write(chunk.encode() if isinstance(chunk, str) else chunk)
+                if compress:
+                    dest_file.close()
+            if self.file_permissions_mode is not None:
+                os.chmod(tmp_path, self.file_permissions_mode)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return name.replace("\\", "/")
+
+    def size(self, name):
+        if is_compressed(name):
+            return get_uncompressed_size(self.path(name))
+        return super().size(name)
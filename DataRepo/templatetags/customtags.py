@@ -11,6 +11,7 @@ from django.utils.safestring import mark_safe
 
 from DataRepo.formats.search_group import SearchGroup
 from DataRepo.models.utilities import get_model_by_name
+from DataRepo.profiling import profile_scope
 from DataRepo.utils import QuerysetToPandasDataFrame as qs2df
 
 register = template.Library()
@@ -474,5 +475,31 @@ def log(*args, timestamp: bool = True):
     print(*args)
 
 
+class ProfileScopeNode(template.Node):
+    def __init__(self, nodelist, scope_args):
+        self.nodelist = nodelist
+        self.scope_args = scope_args
+
+    def render(self, context):
+        with profile_scope(*[arg.resolve(context) for arg in self.scope_args]):
+            return self.nodelist.render(context)
+
+
+@register.tag(name="profile_scope")
+def profile_scope_tag(parser, token):
+    """Attributes the render time, queries, and cached function accesses of the enclosed template code to a scope of the
+    request profile (see DataRepo.profiling), e.g. `{% profile_scope "bst_column" column.name %}...
+    {% endprofile_scope %}`.  Intended for finding slow columns and N+1 query problems.
+    """
+    bits = token.split_contents()
+    if len(bits) not in [2, 3]:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' takes 1 or 2 arguments: the scope kind and (optionally) its name."
+        )
+    nodelist = parser.parse(("endprofile_scope",))
+    parser.delete_first_token()
+    return ProfileScopeNode(nodelist, [parser.compile_filter(bit) for bit in bits[1:]])
+
+
 class NotYetImplemented(Exception):
     pass
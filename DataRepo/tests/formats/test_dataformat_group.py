@@ -667,6 +667,7 @@ class FormatGroupTests(FormatsTestCase):
                 "Compound (Tracer) (Primary Synonym)",
             ),
             ("msrun_sample__sample__animal__diet", "Diet"),
+            ("labels__enrichment_fraction", "Enrichment Fraction"),
             ("msrun_sample__sample__animal__feeding_status", "Feeding Status"),
             ("formula", "Formula"),
             ("msrun_sample__sample__animal__genotype", "Genotype"),
@@ -690,6 +691,7 @@ class FormatGroupTests(FormatsTestCase):
             ("msrun_sample__sample__animal__studies__name", "Study"),
             ("msrun_sample__sample__time_collected", "Time Collected (since infusion)"),
             ("msrun_sample__sample__tissue__name", "Tissue"),
+            ("total_abundance", "Total Abundance"),
             ("msrun_sample__sample__animal__infusate__tracers__name", "Tracer"),
             (
                 "msrun_sample__sample__animal__infusate__tracer_links__concentration",
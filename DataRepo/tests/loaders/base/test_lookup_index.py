@@ -0,0 +1,113 @@
+from DataRepo.loaders.base.lookup_index import LookupIndex
+from DataRepo.models import Compound, CompoundSynonym, Tissue
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+
+
+class LookupIndexTests(TracebaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.brain = Tissue.objects.create(name="Brain", description="Brain tissue")
+        cls.serum = Tissue.objects.create(name="Serum", description="Serum sample")
+        cls.lysine = Compound.objects.create(
+            name="lysine", formula="C6H14N2O2", hmdb_id="HMDB0000182"
+        )
+        CompoundSynonym.objects.create(name="Lys", compound=cls.lysine)
+        super().setUpTestData()
+
+    def test_preload_and_get(self):
+        li = LookupIndex()
+        with self.assertNumQueries(1):
+            num = li.preload(Tissue, "name", ["Brain", "Liver", None])
+        self.assertEqual(1, num)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.brain, li.get(Tissue, name="Brain"))
+            # Not in the database
+            self.assertIsNone(li.get(Tissue, name="Liver"))
+            # Not preloaded
+            self.assertIsNone(li.get(Tissue, name="Serum"))
+            # Case-sensitive
+            self.assertIsNone(li.get(Tissue, name="brain"))
+
+    def test_preload_skips_indexed_values(self):
+        li = LookupIndex()
+        li.add(self.brain, name="Brain")
+        with self.assertNumQueries(0):
+            self.assertEqual(0, li.preload(Tissue, "name", ["Brain"]))
+
+    def test_add_composite(self):
+        li = LookupIndex()
+        li.add(self.brain, name="Brain", description="Brain tissue")
+        self.assertEqual(
+            self.brain, li.get(Tissue, description="Brain tissue", name="Brain")
+        )
+        self.assertIsNone(li.get(Tissue, name="Brain"))
+
+    def test_ambiguous(self):
+        li = LookupIndex()
+        li.add(self.brain, name="x")
+        li.add(self.serum, name="x")
+        self.assertIsNone(li.get(Tissue, name="x"))
+
+    def test_compounds(self):
+        li = LookupIndex()
+        li.preload_compounds(["LYSINE", "lys", "glucose"])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.lysine, li.get_compound("Lysine"))
+            self.assertEqual(self.lysine, li.get_compound("LYS"))
+            self.assertIsNone(li.get_compound("glucose"))
+            self.assertIsNone(li.get_compound(None))
+
+    def test_get_by_any_mismatch(self):
+        li = LookupIndex()
+        li.add(self.brain, iexact=True, name="x")
+        li.add(self.serum, iexact=True, description="x")
+        self.assertIsNone(
+            li.get_by_any(Tissue, "X", ["name", "description"], iexact=True)
+        )
+        li.clear()
+        li.add(self.brain, iexact=True, name="x")
+        self.assertEqual(
+            self.brain,
+            li.get_by_any(Tissue, "X", ["name", "description"], iexact=True),
+        )
+
+    def test_add_compound(self):
+        li = LookupIndex()
+        li.add_compound(self.lysine)
+        li.add_compound(self.lysine, "Lys")
+        self.assertEqual(self.lysine, li.get(Compound, iexact=True, name="LYSINE"))
+        self.assertEqual(
+            self.lysine, li.get(Compound, iexact=True, synonyms__name="lys")
+        )
+
+    def test_atomic_rollback(self):
+        li = LookupIndex()
+        li.add(self.brain, name="x")
+        with self.assertRaises(ValueError):
+            with li.atomic():
+                li.add(self.serum, name="Serum")
+                # Makes "x" ambiguous
+                li.add(self.serum, name="x")
+                with li.atomic():
+                    li.add(self.brain, name="Brain")
+                raise ValueError("rolled back")
+        self.assertIsNone(li.get(Tissue, name="Serum"))
+        self.assertIsNone(li.get(Tissue, name="Brain"))
+        self.assertEqual(self.brain, li.get(Tissue, name="x"))
+        self.assertEqual([], li.journal)
+
+    def test_atomic_nested_rollback(self):
+        li = LookupIndex()
+        with li.atomic():
+            li.add(self.brain, name="Brain")
+            try:
+                with li.atomic():
+                    li.add(self.serum, name="Serum")
+                    raise ValueError("rolled back")
+            except ValueError:
+                pass
+            # Only the changes made inside the inner block are undone
+            self.assertEqual(self.brain, li.get(Tissue, name="Brain"))
+            self.assertIsNone(li.get(Tissue, name="Serum"))
+        self.assertEqual(self.brain, li.get(Tissue, name="Brain"))
+        self.assertEqual([], li.journal)
@@ -0,0 +1,89 @@
+from DataRepo.loaders.base.staging_table import StagingTable
+from DataRepo.models import Compound, CompoundSynonym, Tissue
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+
+
+class StagingTableTests(TracebaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.brain = Tissue.objects.create(name="Brain", description="Brain tissue")
+        cls.lysine = Compound.objects.create(
+            name="lysine", formula="C6H14N2O2", hmdb_id="HMDB0000182"
+        )
+        super().setUpTestData()
+
+    def test_add_assigns_ids(self):
+        stage = StagingTable(Tissue)
+        rec1 = stage.add(Tissue(name="Liver", description=""))
+        rec2 = stage.add(Tissue(name="Kidney", description=""))
+        self.assertIsNotNone(rec1.pk)
+        self.assertLess(rec1.pk, rec2.pk)
+        self.assertEqual(2, len(stage))
+        self.assertIn(rec1.pk, stage)
+        # No records are created until the flush
+        self.assertEqual(1, Tissue.objects.count())
+
+    def test_flush(self):
+        stage = StagingTable(Tissue)
+        liver = stage.add(Tissue(name="Liver", description='"quoted", and ""'))
+        kidney = stage.add(Tissue(name="Kidney", description=""))
+        # The number of queries does not depend on the number of records: savepoint, create, copy, validate, insert,
+        # drop, and release
+        with self.assertNumQueries(7):
+            inserted_ids, rejected_ids = stage.flush()
+        self.assertEqual([liver.pk, kidney.pk], inserted_ids)
+        self.assertEqual([], rejected_ids)
+        self.assertEqual(0, len(stage))
+        self.assertEqual(
+            '"quoted", and ""', Tissue.objects.get(pk=liver.pk).description
+        )
+        # An empty string is not loaded as NULL
+        self.assertEqual("", Tissue.objects.get(name="Kidney").description)
+        self.assertFalse(kidney._state.adding)
+
+    def test_flush_rejects_unique_conflicts(self):
+        stage = StagingTable(Tissue)
+        # Conflicts with an existing record
+        brain = stage.add(Tissue(name="Brain", description=""))
+        liver1 = stage.add(Tissue(name="Liver", description="first"))
+        # Conflicts with a staged record
+        liver2 = stage.add(Tissue(name="Liver", description="second"))
+        inserted_ids, rejected_ids = stage.flush()
+        self.assertEqual([liver1.pk], inserted_ids)
+        self.assertEqual(sorted([brain.pk, liver2.pk]), rejected_ids)
+        self.assertEqual("first", Tissue.objects.get(name="Liver").description)
+        self.assertEqual(2, Tissue.objects.count())
+
+    def test_flush_rejects_unresolved_foreign_keys(self):
+        stage = StagingTable(CompoundSynonym)
+        lys = stage.add(CompoundSynonym(name="Lys", compound=self.lysine))
+        bad = stage.add(CompoundSynonym(name="K", compound_id=self.lysine.pk + 1000))
+        inserted_ids, rejected_ids = stage.flush()
+        self.assertEqual([lys.pk], inserted_ids)
+        self.assertEqual([bad.pk], rejected_ids)
+        self.assertEqual(self.lysine, CompoundSynonym.objects.get(name="Lys").compound)
+
+    def test_flush_empty(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(([], []), StagingTable(Tissue).flush())
+
+    def test_get_duplicate_ids(self):
+        stage = StagingTable(Tissue)
+        stage.add(Tissue(name="Liver", description="first"))
+        liver2 = stage.add(Tissue(name="Liver", description="second"))
+        # Conflicts with a live record are not checked
+        stage.add(Tissue(name="Brain", description=""))
+        with self.assertNumQueries(0):
+            self.assertEqual(set([liver2.pk]), stage.get_duplicate_ids())
+        stage.clear()
+        self.assertEqual(0, len(stage))
+        self.assertEqual(1, Tissue.objects.count())
+
+    def test_get_unique_field_sets(self):
+        self.assertEqual([["name"]], StagingTable(Tissue).get_unique_field_sets())
+
+    def test_to_csv_value(self):
+        self.assertEqual("", StagingTable.to_csv_value(None))
+        self.assertEqual('""', StagingTable.to_csv_value(""))
+        self.assertEqual('"a ""b"""', StagingTable.to_csv_value('a "b"'))
+        self.assertEqual("1.5", StagingTable.to_csv_value(1.5))
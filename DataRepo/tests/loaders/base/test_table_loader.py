@@ -1015,6 +1015,22 @@ class TableLoaderTests(TracebaseTestCase):
         self.assertEqual("A", n)
         self.assertEqual("1", c)
 
+    def test_get_column_values(self):
+        pddata = pd.DataFrame.from_dict(
+            {
+                "Name": ["A", " A ", "nan", "B"],
+                "Choice": ["1", "2", "2", "1"],
+            },
+        )
+        tl = self.test_loader_class(df=pddata)
+        self.assertEqual(["A", "B"], sorted(tl.get_column_values("Name")))
+        self.assertEqual([], tl.get_column_values("Unknown"))
+
+    def test_lookup_index_shared(self):
+        tl1 = self.test_loader_class()
+        tl2 = self.test_loader_class(lookup_index=tl1.lookup_index)
+        self.assertIs(tl1.lookup_index, tl2.lookup_index)
+
     def test_get_skip_row_indexes(self):
         tl = self.test_loader_class()
         tl.skip_row_indexes = [1, 9, 22]
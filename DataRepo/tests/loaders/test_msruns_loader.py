@@ -1,5 +1,6 @@
 import os
 import re
+import tempfile
 from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -23,6 +24,7 @@ from DataRepo.models import (
     Tissue,
 )
 from DataRepo.models.compound import Compound
+from DataRepo.storage import COMPRESSED_SUFFIX, BlockedGzipWriter
 from DataRepo.tests.tracebase_test_case import (
     TracebaseArchiveTestCase,
     TracebaseTestCase,
@@ -343,6 +345,20 @@ class MSRunsLoaderTests(TracebaseTestCase):
         self.assertEqual(expected, mz_dict)
         self.assertEqual(0, len(errs.exceptions))
 
+    def test_parse_mzxml_compressed(self):
+        path = Path(
+            "DataRepo/data/tests/small_obob_mzxmls/small_obob_maven_6eaas_inf_glucose_mzxmls/BAT-xz971.mzXML"
+        )
+        expected, _ = MSRunsLoader.parse_mzxml(path)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            compressed_path = Path(tmpdir) / f"{path.name}{COMPRESSED_SUFFIX}"
+            with compressed_path.open("wb") as raw_file:
+                with BlockedGzipWriter(raw_file, block_size=1024) as writer:
+                    writer.write(path.read_bytes())
+            mz_dict, errs = MSRunsLoader.parse_mzxml(compressed_path)
+        self.assertEqual(expected, mz_dict)
+        self.assertEqual(0, len(errs.exceptions))
+
     def test_separate_placeholder_peak_groups_match_med_mz_none(self):
         PeakData.objects.update(med_mz=None)
         self.assertEqual(4, PeakData.objects.filter(med_mz__isnull=True).count())
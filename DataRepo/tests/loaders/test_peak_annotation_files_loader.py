@@ -120,6 +120,51 @@ class PeakAnnotationFilesLoaderTests(TracebaseTestCase):
             str(pafl.aggregated_errors_object.exceptions[0]),
         )
 
+    def test_pafl_prefetch(self):
+        file1 = "DataRepo/data/tests/small_multitracer/6eaafasted1_cor.xlsx"
+        file2 = "DataRepo/data/tests/singly_labeled_isocorr/small_cor.csv"
+        pafl = PeakAnnotationFilesLoader(
+            df=pd.DataFrame.from_dict(
+                {
+                    PeakAnnotationFilesLoader.DataHeaders.FILE: [
+                        file1,
+                        file2,
+                        file1,
+                        "does_not_exist.xlsx",
+                    ],
+                }
+            ),
+            max_workers=2,
+        )
+        pafl.prefetch()
+        self.assertIsNotNone(pafl.executor)
+        self.assertEqual(set([file1, file2]), set(pafl.annot_dfs.keys()))
+        df1 = pafl.get_annot_df(file1)
+        self.assertIsInstance(df1, dict)
+        # The parsed data is retained
+        self.assertIs(df1, pafl.annot_dfs[file1])
+        self.assertIs(df1, pafl.get_annot_df(file1))
+        self.assertIsInstance(pafl.get_annot_df(file2), pd.DataFrame)
+        pafl.shutdown_prefetch()
+        self.assertIsNone(pafl.executor)
+        self.assertEqual(0, len(pafl.annot_dfs.keys()))
+        self.assertEqual(0, len(pafl.aggregated_errors_object.exceptions))
+
+    def test_pafl_prefetch_single_worker(self):
+        pafl = PeakAnnotationFilesLoader(
+            df=pd.DataFrame.from_dict(
+                {
+                    PeakAnnotationFilesLoader.DataHeaders.FILE: [
+                        "DataRepo/data/tests/small_multitracer/6eaafasted1_cor.xlsx",
+                    ],
+                }
+            ),
+            max_workers=1,
+        )
+        pafl.prefetch()
+        self.assertIsNone(pafl.executor)
+        self.assertEqual(0, len(pafl.annot_dfs.keys()))
+
     def test_pafl_get_or_create_annot_file(self):
         pafl = PeakAnnotationFilesLoader()
         file = "DataRepo/data/tests/small_multitracer/6eaafasted1_cor.xlsx"
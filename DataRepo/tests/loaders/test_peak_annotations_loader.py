@@ -28,6 +28,10 @@ from DataRepo.models import (
     Tissue,
 )
 from DataRepo.models.animal import Animal
+from DataRepo.models.maintained_model import (
+    MaintainedModel,
+    MaintainedModelCoordinator,
+)
 from DataRepo.tests.tracebase_test_case import TracebaseTestCase
 from DataRepo.utils.exceptions import (
     AggregatedErrors,
@@ -409,6 +413,32 @@ class PeakAnnotationsLoaderTests(DerivedPeakAnnotationsLoaderTestCase):
         # and 1 label in each peakdata row
         self.assertEqual(8, PeakDataLabel.objects.count())
 
+    def test_load_data_unstaged(self):
+        al = AccucorLoader(
+            df=self.ACCUCOR_DF_DICT,
+            peak_annotation_details_df=pd.DataFrame.from_dict(
+                {
+                    "Sample Name": ["072920_XXX1_1_TS1", "072920_XXX1_2_bra"],
+                    "Sample Data Header": ["072920_XXX1_1_TS1", "072920_XXX1_2_bra"],
+                    "mzXML File Name": [None, None],
+                    "Peak Annotation File Name": ["accucor1.xlsx", "accucor1.xlsx"],
+                    "Sequence": [
+                        f"Dick, polar-HILIC-25-min, {self.INSTRUMENT}, 1991-5-7",
+                        f"Dick, polar-HILIC-25-min, {self.INSTRUMENT}, 1991-5-7",
+                    ],
+                },
+            ),
+            file="DataRepo/data/tests/data_submission/accucor1.xlsx",
+            staged=False,
+        )
+        al.load_data()
+        # The results are the same as in staged mode (see test_load_data)
+        self.assertEqual(4, PeakGroup.objects.count())
+        self.assertEqual(8, PeakData.objects.count())
+        self.assertEqual(8, PeakDataLabel.objects.count())
+        self.assertEqual(8, al.record_counts["PeakData"]["created"])
+        self.assertEqual(8, al.record_counts["PeakDataLabel"]["created"])
+
     def test_get_or_create_annot_file(self):
         al = AccucorLoader(file="DataRepo/data/tests/data_submission/accucor1.xlsx")
         al.get_or_create_annot_file()
@@ -769,6 +799,164 @@ class PeakAnnotationsLoaderTests(DerivedPeakAnnotationsLoaderTestCase):
         self.assertEqual(rec.corrected_abundance, 5)
         self.assertEqual(rec.peak_group, pgrec)
 
+    def test_stage_peak_data(self):
+        al = AccucorLoader(staged=True)
+        row = pd.Series(
+            {
+                AccucorLoader.DataHeaders.MEDMZ: 5,
+                AccucorLoader.DataHeaders.MEDRT: 3,
+                AccucorLoader.DataHeaders.RAW: 9,
+                AccucorLoader.DataHeaders.CORRECTED: 5,
+            }
+        )
+        pgrec = self.create_peak_group()
+        al.created_peak_group_ids.add(pgrec.pk)
+        label_obs = [ObservedIsotopeData(element="C", mass_number=13, count=2)]
+
+        rec, created = al.get_or_create_peak_data(row, pgrec, label_obs)
+        self.assertTrue(created)
+        self.assertIn(rec.pk, al.peak_data_stage)
+        # An identical row gets the staged record
+        rec2, created2 = al.get_or_create_peak_data(row, pgrec, label_obs)
+        self.assertIs(rec, rec2)
+        self.assertFalse(created2)
+
+        al.get_or_create_peak_data_label(rec, "C", 2, 13)
+        # A conflicting label is rejected by the merge and then processed individually, which reports the error
+        al.get_or_create_peak_data_label(rec, "C", 1, 13)
+        self.assertEqual(0, PeakData.objects.count())
+        self.assertEqual(0, len(al.aggregated_errors_object.exceptions))
+
+        al.flush_staged_records()
+
+        self.assertEqual(rec, PeakData.objects.get())
+        self.assertEqual(2, PeakDataLabel.objects.get().count)
+        self.assertEqual(1, al.record_counts["PeakData"]["created"])
+        self.assertEqual(1, al.record_counts["PeakData"]["existed"])
+        self.assertEqual(1, al.record_counts["PeakDataLabel"]["created"])
+        self.assertEqual(1, al.record_counts["PeakDataLabel"]["errored"])
+        self.assertEqual(1, len(al.aggregated_errors_object.exceptions))
+        self.assertEqual(0, len(al.peak_data_stage))
+
+    def stage_peak_data_with_label(self, al, pgrec):
+        row = pd.Series(
+            {
+                AccucorLoader.DataHeaders.MEDMZ: 5,
+                AccucorLoader.DataHeaders.MEDRT: 3,
+                AccucorLoader.DataHeaders.RAW: 9,
+                AccucorLoader.DataHeaders.CORRECTED: 5,
+            }
+        )
+        al.created_peak_group_ids.add(pgrec.pk)
+        label_obs = [ObservedIsotopeData(element="C", mass_number=13, count=2)]
+        rec, _ = al.get_or_create_peak_data(row, pgrec, label_obs)
+        al.get_or_create_peak_data_label(rec, "C", 2, 13)
+
+    def assert_staged_peak_values(self, pgrec):
+        pgrec.refresh_from_db()
+        self.assertAlmostEqual(5, pgrec.total_abundance)
+        # Serine has 3 carbons, 2 of which are labeled in all of its (1) peak data
+        self.assertAlmostEqual(2 / 3, pgrec.labels.get(element="C").enrichment_fraction)
+
+    def test_flush_staged_records_updates_maintained_fields(self):
+        al = AccucorLoader(staged=True)
+        pgrec = self.create_peak_group()
+        PeakGroupLabel.objects.create(peak_group=pgrec, element="C")
+        self.stage_peak_data_with_label(al, pgrec)
+
+        al.flush_staged_records()
+
+        self.assert_staged_peak_values(pgrec)
+
+    def test_flush_staged_records_buffers_maintained_field_updates(self):
+        al = AccucorLoader(staged=True)
+        pgrec = self.create_peak_group()
+        PeakGroupLabel.objects.create(peak_group=pgrec, element="C")
+        with MaintainedModel.custom_coordinator(MaintainedModelCoordinator("deferred")):
+            self.stage_peak_data_with_label(al, pgrec)
+            al.flush_staged_records()
+            # Inserting the staged records bypasses save, but the peak group's update is buffered
+            self.assertEqual(
+                0,
+                PeakGroup.objects.values_list("total_abundance", flat=True).get(
+                    pk=pgrec.pk
+                ),
+            )
+
+        # The mass auto-update (upon exiting the deferred context) updates the peak group (and its labels)
+        self.assert_staged_peak_values(pgrec)
+
+    def test_validate_staged_records(self):
+        al = AccucorLoader(_validate=True)
+        self.assertTrue(al.staged)
+        row = pd.Series(
+            {
+                AccucorLoader.DataHeaders.MEDMZ: 5,
+                AccucorLoader.DataHeaders.MEDRT: 3,
+                AccucorLoader.DataHeaders.RAW: 9,
+                AccucorLoader.DataHeaders.CORRECTED: 5,
+            }
+        )
+        pgrec = self.create_peak_group()
+        al.created_peak_group_ids.add(pgrec.pk)
+        label_obs = [ObservedIsotopeData(element="C", mass_number=13, count=2)]
+        rec, _ = al.get_or_create_peak_data(row, pgrec, label_obs)
+        al.get_or_create_peak_data_label(rec, "C", 2, 13)
+
+        al.flush_staged_records()
+
+        # Nothing was inserted
+        self.assertEqual(0, PeakData.objects.count())
+        self.assertEqual(0, PeakDataLabel.objects.count())
+        self.assertEqual(1, al.record_counts["PeakData"]["created"])
+        self.assertEqual(1, al.record_counts["PeakDataLabel"]["created"])
+        self.assertEqual(0, len(al.aggregated_errors_object.exceptions))
+        self.assertEqual(0, len(al.peak_data_stage))
+        self.assertEqual(0, len(al.peak_data_label_stage))
+
+    def test_validate_staged_records_conflict(self):
+        al = AccucorLoader(_validate=True)
+        row = pd.Series(
+            {
+                AccucorLoader.DataHeaders.MEDMZ: 5,
+                AccucorLoader.DataHeaders.MEDRT: 3,
+                AccucorLoader.DataHeaders.RAW: 9,
+                AccucorLoader.DataHeaders.CORRECTED: 5,
+            }
+        )
+        pgrec = self.create_peak_group()
+        al.created_peak_group_ids.add(pgrec.pk)
+        label_obs = [ObservedIsotopeData(element="C", mass_number=13, count=2)]
+        rec, _ = al.get_or_create_peak_data(row, pgrec, label_obs)
+        al.get_or_create_peak_data_label(rec, "C", 2, 13)
+        al.get_or_create_peak_data_label(rec, "C", 1, 13)
+
+        al.flush_staged_records()
+
+        # The conflict is reported the same way as in a load
+        self.assertEqual(1, len(al.aggregated_errors_object.exceptions))
+        self.assertEqual(1, al.record_counts["PeakDataLabel"]["created"])
+        self.assertEqual(1, al.record_counts["PeakDataLabel"]["errored"])
+
+    def test_stage_peak_data_invalid(self):
+        al = AccucorLoader(staged=True)
+        row = pd.Series(
+            {
+                AccucorLoader.DataHeaders.MEDMZ: 5,
+                AccucorLoader.DataHeaders.MEDRT: 3,
+                AccucorLoader.DataHeaders.RAW: 9,
+                AccucorLoader.DataHeaders.CORRECTED: -5,
+            }
+        )
+        pgrec = self.create_peak_group()
+        al.created_peak_group_ids.add(pgrec.pk)
+        label_obs = [ObservedIsotopeData(element="C", mass_number=13, count=2)]
+        with self.assertRaises(RollbackException):
+            al.get_or_create_peak_data(row, pgrec, label_obs)
+        self.assertEqual(0, len(al.peak_data_stage))
+        self.assertEqual(1, al.record_counts["PeakData"]["errored"])
+        self.assertEqual(1, len(al.aggregated_errors_object.exceptions))
+
     def create_peak_data(self, pgrec):
         return PeakData.objects.create(
             peak_group=pgrec,
@@ -1,12 +1,14 @@
 from typing import Dict, Type
 
 from django.core.management import call_command
+from django.db import ProgrammingError
 from django.db.models import Model
 
 from DataRepo.loaders.animals_loader import AnimalsLoader
 from DataRepo.loaders.base.table_loader import TableLoader
 from DataRepo.loaders.protocols_loader import ProtocolsLoader
 from DataRepo.loaders.study_loader import StudyLoader, StudyV3Loader
+from DataRepo.loaders.tracers_loader import TracersLoader
 from DataRepo.models import (
     Animal,
     ArchiveFile,
@@ -39,6 +41,7 @@ from DataRepo.utils.exceptions import (
     AllUnskippedBlanks,
     AnimalsWithoutSamples,
     AnimalsWithoutSerumSamples,
+    CompoundDoesNotExist,
     MissingTissues,
     MissingTreatments,
     MultiLoadStatus,
@@ -86,6 +89,68 @@ class StudyLoaderTests(TracebaseTestCase):
         self.assertEqual(2, PeakGroupCompound.objects.count())
         self.assertEqual(0, len(sl.aggregated_errors_object.exceptions))
 
+    def test_study_loader_progress_callback(self):
+        file = "DataRepo/data/tests/submission_v3/multitracer_v3/study.xlsx"
+        progress = []
+
+        def progress_callback(loader, num_loaded, num_sheets):
+            progress.append((loader.DataSheetName, num_loaded, num_sheets))
+            # Stop after the second sheet
+            return num_loaded < 2
+
+        sl = StudyV3Loader(
+            df=read_from_file(file, sheet=None),
+            file=file,
+            progress_callback=progress_callback,
+        )
+        sl.load_data()
+        self.assertEqual([("Study", 1, 12), ("Compounds", 2, 12)], progress)
+        self.assertEqual(1, Study.objects.count())
+        self.assertEqual(2, Compound.objects.count())
+        self.assertEqual(0, Tracer.objects.count())
+
+    def test_study_loader_get_load_order(self):
+        self.assertEqual(
+            [
+                "STUDY",
+                "COMPOUNDS",
+                "TRACERS",
+                "INFUSATES",
+                "TREATMENTS",
+                "ANIMALS",
+                "TISSUES",
+                "SAMPLES",
+                "LCPROTOCOLS",
+                "SEQUENCES",
+                "HEADERS",
+                "FILES",
+                "PGCONFLICTS",
+            ],
+            StudyLoader.get_load_order(),
+        )
+
+    def test_study_loader_get_load_order_dependencies_first(self):
+        class TestStudyLoader(StudyV3Loader):
+            LoaderDependencies = StudyLoader.LoaderDependencies._replace(
+                TREATMENTS=["TISSUES"]
+            )
+
+        load_order = TestStudyLoader.get_load_order()
+        self.assertEqual(
+            ["STUDY", "COMPOUNDS", "TRACERS", "INFUSATES", "TISSUES", "TREATMENTS"],
+            load_order[:6],
+        )
+
+    def test_study_loader_get_load_order_cycle(self):
+        class TestStudyLoader(StudyV3Loader):
+            LoaderDependencies = StudyLoader.LoaderDependencies._replace(
+                COMPOUNDS=["INFUSATES"]
+            )
+
+        with self.assertRaises(ProgrammingError) as ar:
+            TestStudyLoader.get_load_order()
+        self.assertIn("cycle", str(ar.exception))
+
     def test_study_loader_get_class_dtypes(self):
         sl = StudyV3Loader()
         dt = sl.get_loader_class_dtypes(AnimalsLoader)
@@ -237,6 +302,27 @@ class StudyLoaderTests(TracebaseTestCase):
             ].exception_type_exists(AllMissingSamples)
         )
 
+    def test_study_loader_rollback_evicts_lookup_index(self):
+        """The compounds sheet loads successfully, but the study load fails, so the compound records are rolled back.
+        A later loader sharing the lookup index must not resolve them from the index."""
+        file = (
+            "DataRepo/data/tests/submission_v3/multitracer_v3/study_missing_data.xlsx"
+        )
+        sl = StudyV3Loader(
+            df=read_from_file(file, sheet=None),
+            file=file,
+        )
+        with self.assertRaises(AggregatedErrorsSet):
+            sl.load_data()
+        self.assertEqual(0, Compound.objects.count())
+        self.assertIsNone(sl.lookup_index.get_compound("alanine"))
+
+        tl = TracersLoader(lookup_index=sl.lookup_index)
+        self.assertIsNone(tl.get_compound("alanine"))
+        self.assertTrue(
+            tl.aggregated_errors_object.exception_type_exists(CompoundDoesNotExist)
+        )
+
     def test_study_loader_create_grouped_exceptions(self):
         file = (
             "DataRepo/data/tests/submission_v3/multitracer_v3/study_missing_data.xlsx"
@@ -1,7 +1,9 @@
 import os
+import tempfile
 from pathlib import Path
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files import File
 from django.db import transaction
 from django.test import override_settings
@@ -55,6 +57,31 @@ class ArchiveFileTests(TracebaseTestCase):
         expected_hash = "c95f714d690bdd2ad069a7a0345dee9cb7cc1e23"
         self.assertEqual(expected_hash, ArchiveFile.hash_file(Path(fn)))
 
+    def test_scan_file(self):
+        fn = "DataRepo/data/tests/small_obob_mzxmls/small_obob_maven_6eaas_inf_lactate_mzxmls/BAT-xz971.mzXML"
+        self.assertEqual(
+            ("c95f714d690bdd2ad069a7a0345dee9cb7cc1e23", False),
+            ArchiveFile.scan_file(Path(fn)),
+        )
+        fn = "DataRepo/data/tests/small_obob/small_obob_study.xlsx"
+        _, is_binary = ArchiveFile.scan_file(Path(fn))
+        self.assertTrue(is_binary)
+
+    @override_settings(ARCHIVE_CHECKSUM_CACHE=True)
+    def test_scan_file_checksum_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.txt"
+            path.write_text("test")
+            key = ArchiveFile.get_checksum_cache_key(path)
+            self.assertIsNone(cache.get(key))
+            checksum, _ = ArchiveFile.scan_file(path)
+            self.assertEqual((checksum, False), cache.get(key))
+
+            # Modifying the file changes the key
+            path.write_text("modified test")
+            self.assertNotEqual(key, ArchiveFile.get_checksum_cache_key(path))
+            self.assertNotEqual(checksum, ArchiveFile.hash_file(path))
+
     def test_file_is_binary_true(self):
         fn = "DataRepo/data/tests/small_obob/small_obob_study.xlsx"
         self.assertTrue(ArchiveFile.file_is_binary(fn))
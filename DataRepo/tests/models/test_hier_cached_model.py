@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
 from django.core.management import call_command
+from django.test import override_settings
 
 from DataRepo.models import (
     Animal,
@@ -6,17 +10,30 @@ from DataRepo.models import (
     MSRunSample,
     PeakGroup,
     Sample,
+    hier_cached_model,
 )
 from DataRepo.models.hier_cached_model import (
+    FUNC_ACCESS_STATS_KEY,
+    ROOT_ACCESS_STATS_KEY,
+    bump_namespace,
+    caching_updates_enabled,
     delete_all_caches,
     disable_caching_retrievals,
     disable_caching_updates,
     enable_caching_retrievals,
     enable_caching_updates,
+    flush_access_stats,
+    get_access_stats,
     get_cache,
     get_cache_key,
     get_cached_method_names,
+    get_namespace_keys,
+    get_namespace_stamps,
+    is_cache_warm,
+    memoized_namespace_stamps,
+    record_access,
     set_cache,
+    warm_caches,
 )
 from DataRepo.tests.tracebase_test_case import TracebaseTestCase
 
@@ -234,12 +251,46 @@ class GlobalCacheTests(TracebaseTestCase):
     def test_get_cache_key(self):
         a = Animal.objects.all().first()
         f = "last_serum_sample"
-        expected_key = f"Animal.{a.id}.{f}"
+        gs, ms, rs = get_namespace_stamps(a)
+        expected_key = f"Animal.{a.id}.{f}.v{gs}-{ms}-{rs}"
         res = get_cache_key(a, f)
         self.assertEqual(
             res, expected_key, msg="Cache key is not in the expected format"
         )
 
+    def test_delete_all_caches_bumps_global_namespace(self):
+        a = Animal.objects.all().first()
+        f = "last_serum_sample"
+        enable_caching_updates()
+        enable_caching_retrievals()
+        set_cache(a, f, a.last_serum_sample)
+        key1 = get_cache_key(a, f)
+        delete_all_caches()
+        key2 = get_cache_key(a, f)
+        self.assertNotEqual(key1, key2)
+        _, sts = get_cache(a, f)
+        self.assertFalse(sts)
+
+    def test_delete_model_caches(self):
+        a = Animal.objects.all().first()
+        smp = a.samples.first()
+        enable_caching_updates()
+        enable_caching_retrievals()
+        set_cache(a, "last_serum_sample", a.last_serum_sample)
+        getattr(smp, "last_tracer_peak_groups")
+        Sample.delete_model_caches()
+        _, ssts = get_cache(smp, "last_tracer_peak_groups")
+        _, asts = get_cache(a, "last_serum_sample")
+        self.assertFalse(ssts)
+        # Other models' cached values are unaffected
+        self.assertTrue(asts)
+
+    def test_bump_namespace_missing_version(self):
+        ns_key = get_namespace_keys(Animal.objects.all().first())[2]
+        cache.delete(ns_key)
+        bump_namespace(ns_key)
+        self.assertIsNotNone(cache.get(ns_key))
+
     def test_get_cached_method_names(self):
         res = get_cached_method_names()
         expected_structure = {
@@ -277,8 +328,6 @@ class GlobalCacheTests(TracebaseTestCase):
                 "rate_appearance_average_per_animal",
             ],
             "PeakGroupLabel": [
-                "enrichment_fraction",
-                "enrichment_abundance",
                 "normalized_labeling",
                 "tracer",
                 "tracer_label_count",
@@ -399,7 +448,7 @@ class HierCachedModelTests(TracebaseTestCase):
         # the test's decorator
         delete_all_caches()
         pgl = PeakGroup.objects.all().first().labels.first()
-        f = "enrichment_fraction"
+        f = "normalized_labeling"
 
         enable_caching_retrievals()
         enable_caching_updates()
@@ -512,7 +561,7 @@ class HierCachedModelTests(TracebaseTestCase):
             .first()
             .labels.first()
         )
-        pgf = "enrichment_fraction"
+        pgf = "normalized_labeling"
 
         res1 = s1.caches_exist()
         self.assertFalse(
@@ -523,7 +572,7 @@ class HierCachedModelTests(TracebaseTestCase):
             ),
         )
 
-        # Cache sample 2's first peak group's enrichment_fraction value
+        # Cache sample 2's first peak group's normalized_labeling value
         enable_caching_retrievals()
         enable_caching_updates()
         getattr(s2pg, pgf)
@@ -597,3 +646,130 @@ class HierCachedModelTests(TracebaseTestCase):
             a.id,
             msg="The root model record returned by get_root_record is directly related",
         )
+
+    def test_get_animal_path(self):
+        self.assertEqual("", Animal.get_animal_path())
+        self.assertEqual("animal__", Sample.get_animal_path())
+        self.assertEqual("msrun_sample__sample__animal__", PeakGroup.get_animal_path())
+
+    def test_get_root_pk(self):
+        smp = Sample.objects.all().first()
+        pg = PeakGroup.objects.filter(msrun_sample__sample=smp).first()
+        # The root key of a child of the root is read from its foreign key field
+        with self.assertNumQueries(0):
+            self.assertEqual(smp.animal_id, smp.get_root_pk())
+        # Deeper records retrieve the root key with a single query
+        with self.assertNumQueries(1):
+            self.assertEqual(smp.animal_id, pg.get_root_pk())
+        # Parents that are already loaded are used
+        pg = PeakGroup.objects.select_related("msrun_sample__sample").get(pk=pg.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(smp.animal_id, pg.get_root_pk())
+
+    def test_get_root_namespace_key_memoized(self):
+        smp = Sample.objects.all().first()
+        pg = PeakGroup.objects.filter(msrun_sample__sample=smp).first()
+        expected = get_namespace_keys(smp.animal)[2]
+        self.assertEqual(expected, pg.get_root_namespace_key())
+        with self.assertNumQueries(0):
+            self.assertEqual(expected, pg.get_root_namespace_key())
+
+    def test_caching_updates_per_thread(self):
+        disable_caching_updates()
+        try:
+            # E.g. a load in a web server worker thread does not disable caching for concurrent requests
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertTrue(executor.submit(caching_updates_enabled).result())
+            self.assertFalse(caching_updates_enabled())
+        finally:
+            enable_caching_updates()
+
+    def test_memoized_namespace_stamps(self):
+        a = Animal.objects.all().first()
+        ns_key = get_namespace_keys(a)[2]
+        with memoized_namespace_stamps():
+            stamps = get_namespace_stamps(a)
+            # Versions changed elsewhere are not retrieved again
+            cache.set(ns_key, stamps[2] + 10, timeout=None)
+            self.assertEqual(stamps, get_namespace_stamps(a))
+            # Versions bumped in this thread are
+            bump_namespace(ns_key)
+            self.assertEqual(stamps[2] + 11, get_namespace_stamps(a)[2])
+        cache.set(ns_key, stamps[2] + 20, timeout=None)
+        self.assertEqual(stamps[2] + 20, get_namespace_stamps(a)[2])
+
+
+class CacheWarmupTests(TracebaseTestCase):
+    fixtures = ["data_types.yaml", "data_formats.yaml", "lc_methods.yaml"]
+
+    @classmethod
+    def setUpTestData(cls):
+        load_data()
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+        cache.delete_many([FUNC_ACCESS_STATS_KEY, ROOT_ACCESS_STATS_KEY])
+        enable_caching_retrievals()
+        enable_caching_updates()
+        delete_all_caches()
+
+    @override_settings(CACHE_ACCESS_STATS_FLUSH_INTERVAL=1000)
+    def test_record_access(self):
+        smp = Sample.objects.all().first()
+        record_access(smp, "last_tracer_peak_groups")
+        record_access(smp, "last_tracer_peak_groups")
+        flush_access_stats()
+        func_stats, root_stats = get_access_stats()
+        self.assertEqual({"Sample.last_tracer_peak_groups": 2}, func_stats)
+        self.assertEqual({f"Animal.{smp.animal.pk}": 2}, root_stats)
+
+    @override_settings(CACHE_ACCESS_STATS_FLUSH_INTERVAL=1000)
+    def test_record_access_no_queries(self):
+        pg = PeakGroup.objects.all().first()
+        # The cache lookup memoizes the root namespace key
+        get_namespace_keys(pg)
+        with self.assertNumQueries(0):
+            record_access(pg, "peak_labeled_elements")
+
+    @override_settings(CACHE_ACCESS_STATS_FLUSH_INTERVAL=1)
+    def test_record_access_flushes_in_background(self):
+        smp = Sample.objects.all().first()
+        record_access(smp, "last_tracer_peak_groups")
+        # Wait for the background flush (the worker runs one task at a time)
+        hier_cached_model.WARMUP_EXECUTOR.submit(lambda: None).result()
+        self.assertFalse(hier_cached_model.ACCESS_FLUSH_PENDING.is_set())
+        func_stats, root_stats = get_access_stats()
+        self.assertIn("Sample.last_tracer_peak_groups", func_stats)
+        self.assertIn(f"Animal.{smp.animal.pk}", root_stats)
+
+    @override_settings(CACHE_ACCESS_STATS_FLUSH_INTERVAL=1000)
+    def test_warm_caches(self):
+        smp = Sample.objects.all().first()
+        record_access(smp, "last_tracer_peak_groups")
+        flush_access_stats()
+
+        self.assertTrue(warm_caches())
+
+        self.assertTrue(is_cache_warm())
+        for rec in Sample.objects.all():
+            _, sts = get_cache(rec, "last_tracer_peak_groups")
+            self.assertTrue(sts)
+        # Unaccessed functions are not warmed
+        _, sts = get_cache(Animal.objects.all().first(), "tracers")
+        self.assertFalse(sts)
+        # Warmup accesses are not counted
+        self.assertEqual({"Sample.last_tracer_peak_groups": 1}, get_access_stats()[0])
+
+    @override_settings(CACHE_ACCESS_STATS_FLUSH_INTERVAL=1000)
+    def test_warm_caches_budget_exhausted(self):
+        record_access(Sample.objects.all().first(), "last_tracer_peak_groups")
+        flush_access_stats()
+        self.assertFalse(warm_caches(budget=-1))
+        self.assertFalse(is_cache_warm())
+
+    def test_invalidation_unsets_warm(self):
+        self.assertTrue(warm_caches())
+        self.assertTrue(is_cache_warm())
+        Animal.objects.all().first().delete_related_caches()
+        self.assertFalse(is_cache_warm())
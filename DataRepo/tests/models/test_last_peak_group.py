@@ -0,0 +1,110 @@
+from django.conf import settings
+from django.core.management import call_command
+from django.test import override_settings
+
+from DataRepo.models import (
+    Animal,
+    LastSerumTracerPeakGroup,
+    LastTracerPeakGroup,
+    PeakGroup,
+)
+from DataRepo.models.hier_cached_model import delete_all_caches
+from DataRepo.models.last_peak_group import (
+    get_current_animal_ids,
+    is_current,
+    refresh_last_peak_groups,
+)
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+
+
+@override_settings(CACHES=settings.TEST_CACHES)
+class LastPeakGroupTests(TracebaseTestCase):
+    fixtures = ["lc_methods.yaml", "data_types.yaml", "data_formats.yaml"]
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "load_study",
+            infile="DataRepo/data/tests/small_obob2/obob_animal_sample_table_v3.xlsx",
+        )
+        call_command(
+            "load_study",
+            infile="DataRepo/data/tests/small_obob2/serum_lactate_sample_table.xlsx",
+        )
+        call_command(
+            "load_peak_annotations",
+            infile="DataRepo/data/tests/small_obob2/obob_maven_6eaas_serum.xlsx",
+        )
+        cls.animal = Animal.objects.get(name="971")
+        cls.tracer = cls.animal.infusate.tracers.get()
+        super().setUpTestData()
+
+    def test_compute(self):
+        serum_links = LastSerumTracerPeakGroup.compute(animal_ids=[self.animal.id])
+        expected_pg = PeakGroup.objects.get(
+            msrun_sample__sample=self.animal.last_serum_sample,
+            compounds=self.tracer.compound,
+        )
+        self.assertEqual(
+            [
+                (self.tracer.id, label.element, expected_pg.id)
+                for label in self.tracer.labels.order_by("element")
+            ],
+            [(ln.tracer_id, ln.element, ln.peak_group_id) for ln in serum_links],
+        )
+
+        tracer_links = LastTracerPeakGroup.compute(animal_ids=[self.animal.id])
+        self.assertIn(
+            (self.animal.last_serum_sample.id, self.tracer.id, expected_pg.id),
+            [(ln.sample_id, ln.tracer_id, ln.peak_group_id) for ln in tracer_links],
+        )
+
+    def test_refresh_last_peak_groups(self):
+        computed = LastSerumTracerPeakGroup.get_peak_group_ids(self.animal)
+        # The loads refreshed the tables, but they are only current once a refresh is committed
+        self.assertFalse(is_current(self.animal))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_last_peak_groups(animal_ids=[self.animal.id])
+        self.assertTrue(is_current(self.animal))
+        self.assertEqual(
+            self.tracer.labels.count(),
+            LastSerumTracerPeakGroup.objects.filter(animal=self.animal).count(),
+        )
+        self.assertEqual(
+            computed, LastSerumTracerPeakGroup.get_peak_group_ids(self.animal)
+        )
+        self.assertEqual(
+            self.animal.last_serum_sample.last_tracer_peak_groups.get().id,
+            computed[self.tracer.id],
+        )
+
+        # Changes to the animal's data make the tables stale for the animal
+        self.animal.last_serum_sample.delete_related_caches()
+        self.assertFalse(is_current(self.animal))
+
+    def test_refresh_last_peak_groups_current_animal_ids(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_last_peak_groups()
+        self.assertIn(self.animal.id, get_current_animal_ids())
+
+        # A load that did not change the animal's data keeps the tables current for the animal
+        current_animal_ids = get_current_animal_ids()
+        delete_all_caches()
+        self.assertFalse(is_current(self.animal))
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_last_peak_groups(
+                animal_ids=[], current_animal_ids=current_animal_ids
+            )
+        self.assertTrue(is_current(self.animal))
+
+        # Unless the animal's data changed after the tables were current
+        current_animal_ids = get_current_animal_ids()
+        delete_all_caches()
+        self.animal.last_serum_sample.delete_related_caches()
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_last_peak_groups(
+                animal_ids=[], current_animal_ids=current_animal_ids
+            )
+        self.assertFalse(is_current(self.animal))
+        self.assertNotIn(self.animal.id, get_current_animal_ids())
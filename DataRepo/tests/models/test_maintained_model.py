@@ -1,19 +1,26 @@
 import time
+from collections import defaultdict
+from io import StringIO
+from unittest.mock import patch
 
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
+from django.db import connection
 from django.test import tag
+from django.test.utils import CaptureQueriesContext
 
 from DataRepo.models import (
     Animal,
     Compound,
     FCirc,
     Infusate,
+    InfusateTracer,
     MaintainedModel,
     Sample,
     Study,
     Tracer,
     TracerLabel,
 )
+from DataRepo.models.maintained_field_repair import MaintainedFieldRepair
 from DataRepo.models.maintained_model import (
     AutoUpdateFailed,
     MaintainedModelCoordinator,
@@ -465,6 +472,61 @@ class MaintainedModelDeferredTests(TracebaseTestCase):
         # Ensure the buffer was emptied by perform_buffered_updates
         self.assertEqual(self.test_coordinator.buffer_size(), 0)
 
+    def test_buffer_update_deduplicates(self):
+        buffer_size = len(self.test_coordinator.update_buffer)
+        infusate = next(
+            obj
+            for obj in self.test_coordinator.update_buffer.values()
+            if isinstance(obj, Infusate)
+        )
+        # A different object for the same record with the same filters is not buffered again
+        self.test_coordinator.buffer_update(Infusate.objects.get(pk=infusate.pk))
+        self.assertEqual(buffer_size, len(self.test_coordinator.update_buffer))
+        # The same record with different filters is buffered again
+        filtered_infusate = Infusate.objects.get(pk=infusate.pk)
+        filtered_infusate.label_filters = ["name"]
+        self.test_coordinator.buffer_update(filtered_infusate)
+        self.assertEqual(buffer_size + 1, len(self.test_coordinator.update_buffer))
+
+    def test_get_dfs_related_records(self):
+        tracer_label = TracerLabel.objects.first()
+        related = tracer_label.get_dfs_related_records()
+        self.assertEqual(tracer_label, related[tracer_label.get_record_signature()])
+        self.assertIn(tracer_label.tracer.get_record_signature(), related)
+        self.assertIn(tracer_label.tracer.compound.get_record_signature(), related)
+        self.assertIn(
+            tracer_label.tracer.infusates.first().get_record_signature(), related
+        )
+        # Every record is collected once
+        self.assertEqual(
+            len(related),
+            len(set(rec.get_record_signature() for rec in related.values())),
+        )
+
+    def test_mass_autoupdate_generation_order(self):
+        """
+        Ensures that each record is updated once, from the leaves (largest generation) to the root (generation 0).
+        """
+        saved = []
+        orig_save = MaintainedModel.save
+
+        def record_save(rec, *args, **kwargs):
+            if kwargs.get("mass_updates") is True:
+                saved.append(rec)
+            return orig_save(rec, *args, **kwargs)
+
+        with patch.object(MaintainedModel, "save", autospec=True) as save:
+            save.side_effect = record_save
+            self.test_coordinator.perform_buffered_updates()
+
+        signatures = [rec.get_record_signature() for rec in saved]
+        self.assertEqual(len(signatures), len(set(signatures)))
+        self.assertIn(Infusate.objects.first().get_record_signature(), signatures)
+        generations = [
+            rec.get_max_generation(rec.get_my_updaters()) or 0 for rec in saved
+        ]
+        self.assertEqual(sorted(generations, reverse=True), generations)
+
     def test_lazy_autoupdate_blocked_in_deferred_mode(self):
         """
         Since a parent coordinator is deferred, auto-update should not happen.
@@ -567,6 +629,32 @@ class MaintainedModelImmediateTests(MaintainedModelTestBase):
         Tracer.objects.create(compound=lys)
         Tracer.objects.get(name="lysine2")
 
+    def test_get_my_input_fields(self):
+        self.assertEqual(
+            ["tracer", "element", "count", "positions", "mass_number"],
+            TracerLabel.get_my_input_fields(),
+        )
+        self.assertEqual(["compound"], Tracer.get_my_input_fields())
+        # FCirc's decorator does not declare its input fields
+        self.assertIsNone(FCirc.get_my_input_fields())
+
+    def test_save_skips_autoupdates_when_inputs_unchanged(self):
+        create_infusate_records()
+        tracer_label = TracerLabel.objects.filter(count=2, element="C").first()
+        self.assertFalse(tracer_label.maintained_inputs_changed())
+        with patch.object(
+            TracerLabel, "call_dfs_related_updaters"
+        ) as call_dfs_related_updaters:
+            tracer_label.save()
+            call_dfs_related_updaters.assert_not_called()
+
+            tracer_label.count = 3
+            self.assertTrue(tracer_label.maintained_inputs_changed())
+            tracer_label.save()
+            call_dfs_related_updaters.assert_called_once()
+        self.assertEqual(tracer_label._name(), tracer_label.name)
+        self.assertFalse(tracer_label.maintained_inputs_changed())
+
     def test_buffer_cleared_after_sample_load(self):
         """Ensure the sample load doesn't leave stuff in the buffer when it exits successfully"""
         # The sample load only auto-updates fields with the "name" label in the decorator, so the sample_table_loader
@@ -631,6 +719,197 @@ class RebuildMaintainedModelFieldsTests(TracebaseTestCase):
         # Ensure the buffer was emptied by rebuild_maintained_fields
         self.assertEqual(coordinator.buffer_size(), 0)
 
+    def test_bulk_rebuild_maintained_fields(self):
+        changed_counts = MaintainedModel.bulk_rebuild_maintained_fields(chunk_size=2)
+        for i in Infusate.objects.all():
+            self.assertIsNotNone(i.name)
+            self.assertEqual(i.name, i._name())
+        for t in Tracer.objects.all():
+            self.assertIsNotNone(t.name)
+            self.assertEqual(t.name, t._name())
+        for tl in TracerLabel.objects.all():
+            self.assertIsNotNone(tl.name)
+            self.assertEqual(tl.name, tl._name())
+        self.assertEqual(Infusate.objects.count(), changed_counts["Infusate.name"])
+        self.assertEqual(Tracer.objects.count(), changed_counts["Tracer.name"])
+        self.assertEqual(
+            TracerLabel.objects.count(), changed_counts["TracerLabel.name"]
+        )
+        # Only changed values are written
+        changed_counts = MaintainedModel.bulk_rebuild_maintained_fields(
+            label_filters=["name"]
+        )
+        self.assertEqual(
+            {"Infusate.name": 0, "Tracer.name": 0, "TracerLabel.name": 0},
+            changed_counts,
+        )
+
+    def test_bulk_rebuild_maintained_fields_prefetches(self):
+        # The setters use the prefetched relations, so the number of queries does not grow with the number of records
+        with CaptureQueriesContext(connection) as context:
+            MaintainedModel.bulk_rebuild_maintained_fields()
+        num_queries = len(context.captured_queries)
+
+        disabled_coordinator = MaintainedModelCoordinator("disabled")
+        with MaintainedModel.custom_coordinator(disabled_coordinator):
+            lac = Compound.objects.create(
+                name="lactate", formula="C3H6O3", hmdb_id="HMDB0000190"
+            )
+            ala = Compound.objects.create(
+                name="alanine", formula="C3H7NO2", hmdb_id="HMDB0000161"
+            )
+            lac_t = Tracer.objects.create(compound=lac)
+            TracerLabel.objects.create(
+                tracer=lac_t, count=3, element="C", mass_number=13
+            )
+            ala_t = Tracer.objects.create(compound=ala)
+            TracerLabel.objects.create(
+                tracer=ala_t, count=3, element="C", mass_number=13
+            )
+            TracerLabel.objects.create(
+                tracer=ala_t, count=1, element="N", mass_number=15
+            )
+            io = Infusate.objects.create(tracer_group_name="la")
+            InfusateTracer.objects.create(infusate=io, tracer=lac_t, concentration=1.0)
+            InfusateTracer.objects.create(infusate=io, tracer=ala_t, concentration=2.0)
+        # Clear the values, so that every record is changed again
+        Infusate.objects.update(name=None, label_combo=None)
+        Tracer.objects.update(name=None, label_combo=None)
+        TracerLabel.objects.update(name=None)
+
+        with self.assertNumQueries(num_queries):
+            MaintainedModel.bulk_rebuild_maintained_fields()
+        for i in Infusate.objects.all():
+            self.assertEqual(i.name, i._name())
+            self.assertEqual(i.label_combo, i._label_combo())
+        for t in Tracer.objects.all():
+            self.assertEqual(t.name, t._name())
+            self.assertEqual(t.label_combo, t._label_combo())
+
+    def test_setters_use_prefetched_relations(self):
+        infusates = list(
+            Infusate.objects.prefetch_related(
+                "tracer_links__tracer__compound",
+                "tracer_links__tracer__labels",
+                "tracers__labels",
+            )
+        )
+        with self.assertNumQueries(0):
+            names = [i._name() for i in infusates]
+            label_combos = [i._label_combo() for i in infusates]
+        self.assertIn(
+            "ti {C16:0-[5,6-13C2,17O2][2];glucose-[2,3-13C2,4-17O1][1]}", names
+        )
+        self.assertEqual(["C+O", "C+O"], label_combos)
+
+
+class MaintainedModelPropagationPlanTests(TracebaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_infusate_records()
+
+    def test_get_dependency_graph(self):
+        graph = MaintainedModel.get_dependency_graph()
+        self.assertEqual(
+            {"infusates": "Infusate", "compound": "Compound"}, graph["Tracer"]
+        )
+        self.assertEqual({"tracer": "Tracer"}, graph["TracerLabel"])
+        self.assertEqual({}, graph["Compound"])
+
+    def test_estimate_propagation(self):
+        for tracer in Tracer.objects.all():
+            # The records collected by the depth-first traversal are the ones that would be updated
+            expected_counts = defaultdict(int)
+            for rec in tracer.get_dfs_related_records().values():
+                expected_counts[rec.__class__.__name__] += 1
+            self.assertEqual(
+                dict(expected_counts),
+                MaintainedModel.estimate_propagation({"Tracer": [tracer.pk]}),
+            )
+        # The changed record is counted
+        self.assertEqual(
+            {"TracerLabel": 1},
+            MaintainedModel.estimate_propagation(
+                {"TracerLabel": [TracerLabel.objects.first().pk]}, max_depth=0
+            ),
+        )
+
+    def test_plan_maintained_field_updates(self):
+        tracer = Tracer.objects.first()
+        out = StringIO()
+        call_command(
+            "plan_maintained_field_updates",
+            f"Tracer.{tracer.pk}",
+            "--graph",
+            stdout=out,
+        )
+        self.assertIn("TracerLabel.tracer -> Tracer", out.getvalue())
+        self.assertIn("Infusate: 2 records", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("plan_maintained_field_updates", "Study.1")
+
+
+class MaintainedModelReadOnlyTests(MaintainedModelTestBase):
+    def setUp(self):
+        super().setUp()
+        # Create records with empty maintained fields
+        with MaintainedModel.custom_coordinator(MaintainedModelCoordinator("disabled")):
+            create_infusate_records()
+
+    def tearDown(self):
+        MaintainedModel._reset_coordinators()
+        super().tearDown()
+
+    def test_readonly_queries_queue_repairs(self):
+        readonly_coordinator = MaintainedModelCoordinator("readonly")
+        with MaintainedModel.custom_coordinator(readonly_coordinator):
+            with self.assertNumQueries(1):
+                infusates = list(Infusate.objects.all())
+            self.assertIsNone(infusates[0].name)
+            # Nested readonly coordinators pass their queue to the outermost one
+            with MaintainedModel.custom_coordinator(
+                MaintainedModelCoordinator("readonly")
+            ):
+                list(Tracer.objects.all())
+            self.assertEqual(0, MaintainedFieldRepair.objects.count())
+        self.assertEqual(
+            Infusate.objects.count() + Tracer.objects.count(),
+            MaintainedFieldRepair.objects.count(),
+        )
+        self.assertEqual({}, readonly_coordinator.repair_queue)
+        # Query the raw values, because loading the records outside of readonly mode triggers a lazy auto-update
+        self.assertEqual(
+            [None], list(Infusate.objects.values_list("name", flat=True).distinct())
+        )
+
+        changed_counts = MaintainedModel.repair_maintained_fields()
+
+        self.assertEqual(Infusate.objects.count(), changed_counts["Infusate.name"])
+        self.assertEqual(Tracer.objects.count(), changed_counts["Tracer.name"])
+        for i in Infusate.objects.all():
+            self.assertEqual(i._name(), i.name)
+        self.assertEqual(0, MaintainedFieldRepair.objects.count())
+        self.assert_coordinator_state_is_initialized()
+
+    def test_readonly_saves_queue_propagated_repairs(self):
+        tracer_label = TracerLabel.objects.first()
+        with MaintainedModel.custom_coordinator(MaintainedModelCoordinator("readonly")):
+            tracer_label.count = 4
+            tracer_label.save()
+        repair = MaintainedFieldRepair.objects.get()
+        self.assertEqual(
+            ("TracerLabel", tracer_label.pk), (repair.model_name, repair.record_id)
+        )
+        self.assertTrue(repair.propagate)
+
+        MaintainedModel.repair_maintained_fields()
+
+        tracer_label.refresh_from_db()
+        self.assertEqual(tracer_label._name(), tracer_label.name)
+        # The change was propagated to the tracer
+        self.assertEqual(tracer_label.tracer._name(), tracer_label.tracer.name)
+        self.assertEqual(0, MaintainedFieldRepair.objects.count())
+
 
 class MaintainedModelMainTests(TracebaseTestCase):
     def test_model_not_maintained(self):
@@ -21,6 +21,7 @@ from DataRepo.models import (
 )
 from DataRepo.models.compound import Compound
 from DataRepo.models.maintained_model import MaintainedModel
+from DataRepo.models.peak_group import PeakGroupConflictDetector
 from DataRepo.tests.tracebase_test_case import TracebaseTestCase
 from DataRepo.utils.exceptions import (
     ComplexPeakGroupDuplicate,
@@ -212,6 +213,25 @@ class PeakGroupTests(TracebaseTestCase):
     def test_total_abundance(self):
         self.assertAlmostEqual(self.pg.total_abundance, 3000)
 
+    def test_total_abundance_maintained(self):
+        # The value is stored in the database, so it can be filtered on
+        self.assertEqual(
+            1,
+            PeakGroup.objects.filter(
+                pk=self.pg.pk, total_abundance__gt=2999, total_abundance__lt=3001
+            ).count(),
+        )
+        # And it is updated when a peak data record changes
+        pd = self.pg.peak_data.get(med_mz=2.0)
+        pd.corrected_abundance = 500.0
+        pd.save()
+        self.assertAlmostEqual(
+            1500,
+            PeakGroup.objects.values_list("total_abundance", flat=True).get(
+                pk=self.pg.pk
+            ),
+        )
+
     def test_unique_constraint(self):
         with self.assertRaises(IntegrityError) as ar:
             PeakGroup.objects.create(
@@ -426,3 +446,56 @@ class MultiLabelPeakGroupTests(TracebaseTestCase):
         )
         with self.assertRaises(MultiplePeakGroupRepresentation):
             new_pg.check_for_multiple_representations()
+
+    @MaintainedModel.no_autoupdates()
+    def test_peak_group_conflict_detector(self):
+        existing_pg = PeakGroup.objects.filter(
+            msrun_sample__sample__name="xzl5_panc"
+        ).get(name="glutamine")
+        msrun_sample = existing_pg.msrun_sample
+        paaf = ArchiveFile.objects.create(
+            filename="some_other_file.xlsx",
+            file_location=None,
+            checksum="23456789012",
+            data_type=DataType.objects.get(code="ms_peak_annotation"),
+            data_format=DataFormat.objects.get(code="accucor"),
+        )
+        new_pg = PeakGroup(
+            name=existing_pg.name,
+            msrun_sample=msrun_sample,
+            formula=existing_pg.formula,
+            peak_annotation_file=paaf,
+        )
+
+        detector = PeakGroupConflictDetector()
+        detector.preload(["glutamine", "lactate"], [msrun_sample.sample_id])
+
+        # Lookups and checks of preloaded peak groups do not query the database
+        with self.assertNumQueries(0):
+            rec = detector.get(
+                name=existing_pg.name,
+                msrun_sample=msrun_sample,
+                formula=existing_pg.formula,
+                peak_annotation_file=existing_pg.peak_annotation_file,
+            )
+            self.assertEqual(existing_pg, rec)
+            self.assertIsNone(
+                detector.get(
+                    name=existing_pg.name,
+                    msrun_sample=msrun_sample,
+                    formula=existing_pg.formula,
+                    peak_annotation_file=paaf,
+                )
+            )
+        with self.assertRaises(MultiplePeakGroupRepresentation):
+            detector.check(new_pg)
+
+        # Deleted peak groups are removed
+        detector.remove(existing_pg)
+        with self.assertNumQueries(0):
+            detector.check(new_pg)
+
+        # Created peak groups are added
+        detector.add(existing_pg)
+        with self.assertRaises(MultiplePeakGroupRepresentation):
+            detector.check(new_pg)
@@ -198,7 +198,6 @@ class PeakGroupLabelMultiLabelTests(TracebaseTestCase):
 
         super().setUpTestData()
 
-    @MaintainedModel.no_autoupdates()
     def test_enrichment_abundance(self):
         pg = PeakGroup.objects.filter(msrun_sample__sample__name="xzl5_panc").get(
             name="glutamine"
@@ -211,7 +210,6 @@ class PeakGroupLabelMultiLabelTests(TracebaseTestCase):
         self.assertAlmostEqual(expectedc, pgc)
         self.assertAlmostEqual(expectedn, pgn)
 
-    @MaintainedModel.no_autoupdates()
     def test_normalized_labeling_2_elements(self):
         pg = PeakGroup.objects.filter(msrun_sample__sample__name="xzl5_panc").get(
             name="glutamine"
@@ -224,7 +222,6 @@ class PeakGroupLabelMultiLabelTests(TracebaseTestCase):
         self.assertAlmostEqual(expectedc, pgc)
         self.assertAlmostEqual(expectedn, pgn)
 
-    @MaintainedModel.no_autoupdates()
     def test_normalized_labeling_2_elems_divbyzero(self):
         """This test asserts that a ZeroDivisionError is caught in PeakDataLabel.normalized_labeling and that it issues
         a warning and returns None."""
@@ -347,6 +344,20 @@ class PeakGroupLabelPropertyTests(TracebaseTestCase):
             peak_group, 9599112.684, 0.001555566789, 14932.06089, 0.009119978074
         )
 
+    def test_enrichment_fraction_maintained(self):
+        # The value is stored in the database, so it can be filtered on
+        self.assertAlmostEqual(
+            0.001555566789,
+            PeakGroupLabel.objects.values_list("enrichment_fraction", flat=True).get(
+                peak_group=self.pg
+            ),
+        )
+        self.assertTrue(
+            PeakGroupLabel.objects.filter(
+                peak_group=self.pg, enrichment_fraction__lt=0.002
+            ).exists()
+        )
+
     def test_enrichment_abundance(self):
         # Remove existing peak groups so that we can load alternate data that has no original sheet.
         PeakGroup.objects.filter(msrun_sample__sample__name="BAT-xz971").delete()
@@ -486,7 +497,7 @@ class PeakGroupLabelPropertyTests(TracebaseTestCase):
                 "element C (from the tracers in the infusate [methionine-(15N1)[200]])."
             ),
         ):
-            pg.labels.first().enrichment_fraction  # pylint: disable=no-member
+            pg.labels.first()._enrichment_fraction()  # pylint: disable=no-member
 
     def test_enrichment_fraction_missing_formula_warning(self):
         peak_group = (
@@ -496,7 +507,7 @@ class PeakGroupLabelPropertyTests(TracebaseTestCase):
         )
         peak_group.formula = None
         with self.assertWarns(UserWarning):
-            self.assertIsNone(peak_group.labels.first().enrichment_fraction)
+            self.assertIsNone(peak_group.labels.first()._enrichment_fraction())
 
     def test_enrichment_fraction_formula_missing_label_error(self):
         peak_group = (
@@ -506,7 +517,7 @@ class PeakGroupLabelPropertyTests(TracebaseTestCase):
         )
         peak_group.formula = "H2O"
         with self.assertRaises(NoCommonLabel):
-            peak_group.labels.first().enrichment_fraction
+            peak_group.labels.first()._enrichment_fraction()
 
     def test_enrichment_fraction_missing_formula_return_is_none(self):
         peak_group = (
@@ -865,10 +876,10 @@ class PeakGroupLabelPropertyTests(TracebaseTestCase):
         self.assertTrue(pgl.can_compute_average_tracer_label_rates)
 
     def test_can_compute_average_tracer_label_rates_false(self):
-        # need to invalidate the computed/cached enrichment_fraction, somehow
+        # need to invalidate the maintained enrichment_fraction (in memory only)
         animal = self.MAIN_SERUM_ANIMAL
         pg = animal.last_serum_tracer_peak_groups.first()
         pgl = pg.labels.first()
-        set_cache(pgl, "enrichment_fraction", None)
+        pgl.enrichment_fraction = None
         with self.assertWarns(UserWarning):
             self.assertFalse(pgl.can_compute_average_tracer_label_rates)
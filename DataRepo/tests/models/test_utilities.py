@@ -132,6 +132,8 @@ class ModelUtilitiesTests(TracebaseTransactionTestCase):
             "InfusateTracer",
             "Protocol",
             "Study",
+            "MaintainedFieldRepair",
+            "SearchDocument",
         ]
         self.assertEqual(
             ordered_model_name_list,
@@ -0,0 +1,65 @@
+from django.test import override_settings
+from django.urls import reverse
+
+from DataRepo.models import Infusate, MaintainedFieldRepair, MaintainedModel
+from DataRepo.models.maintained_model import MaintainedModelCoordinator
+from DataRepo.tests.models.test_infusate import create_infusate_records
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+
+
+class ReadOnlyMaintainedFieldsMiddlewareTests(TracebaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # Create records with empty maintained fields
+        with MaintainedModel.custom_coordinator(MaintainedModelCoordinator("disabled")):
+            self.infusate, _ = create_infusate_records()
+
+    @override_settings(MAINTAINED_FIELDS_READONLY_REQUESTS=True)
+    def test_requests_queue_repairs(self):
+        response = self.client.get(reverse("infusate_list"))
+        self.assertEqual(200, response.status_code)
+        self.assertIsNone(
+            Infusate.objects.values_list("name", flat=True).get(pk=self.infusate.pk)
+        )
+        self.assertTrue(
+            MaintainedFieldRepair.objects.filter(
+                model_name="Infusate", record_id=self.infusate.pk
+            ).exists()
+        )
+        # The coordinator stack is empty after the request
+        self.assertEqual(0, len(MaintainedModel._get_coordinator_stack()))
+
+    @override_settings(MAINTAINED_FIELDS_READONLY_REQUESTS=False)
+    def test_requests_lazy_update(self):
+        self.client.get(reverse("infusate_list"))
+        self.assertIsNotNone(
+            Infusate.objects.values_list("name", flat=True).get(pk=self.infusate.pk)
+        )
+        self.assertEqual(0, MaintainedFieldRepair.objects.count())
+
+
+class RequestProfilingMiddlewareTests(TracebaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_infusate_records()
+
+    @override_settings(REQUEST_PROFILING=True)
+    def test_profile_json(self):
+        response = self.client.get(reverse("infusate_list"), {"profile": "json"})
+        self.assertEqual(200, response.status_code)
+        profile = response.json()
+        self.assertGreater(profile["queries"], 0)
+        self.assertTrue(
+            any(scope.startswith("bst_column:") for scope in profile["scopes"].keys())
+        )
+
+    @override_settings(REQUEST_PROFILING=True)
+    def test_server_timing(self):
+        response = self.client.get(reverse("infusate_list"))
+        self.assertIn("queries", response["Server-Timing"])
+
+    @override_settings(REQUEST_PROFILING=False)
+    def test_profiling_disabled(self):
+        response = self.client.get(reverse("infusate_list"), {"profile": "json"})
+        self.assertNotIn("Server-Timing", response)
+        self.assertIn("text/html", response["Content-Type"])
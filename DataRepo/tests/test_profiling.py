@@ -0,0 +1,60 @@
+from django.template import Context, Template
+
+from DataRepo.models import Infusate, Tissue
+from DataRepo.profiling import (
+    ROOT_SCOPE,
+    get_current_profile,
+    profile_scope,
+    profiling,
+    record_cache_access,
+)
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+
+
+class ProfilingTests(TracebaseTestCase):
+    def test_profile_scope_without_profile(self):
+        self.assertIsNone(get_current_profile())
+        with profile_scope("bst_column", "name"):
+            Tissue.objects.count()
+        self.assertIsNone(get_current_profile())
+
+    def test_profiling_attributes_queries_to_scopes(self):
+        with profiling("test") as profile:
+            Tissue.objects.count()
+            with profile_scope("bst_column", "name"):
+                for pk in range(3):
+                    Tissue.objects.filter(pk=pk).exists()
+        self.assertIsNone(get_current_profile())
+        data = profile.as_dict()
+        self.assertEqual(4, data["queries"])
+        self.assertEqual(1, data["scopes"][ROOT_SCOPE]["queries"])
+        column_scope = data["scopes"]["bst_column:name"]
+        self.assertEqual(1, column_scope["calls"])
+        self.assertEqual(3, column_scope["queries"])
+        self.assertEqual(3, column_scope["max_repeated_query"])
+        self.assertGreaterEqual(data["time"], column_scope["time"])
+        # Scopes are ordered by decreasing query count
+        self.assertEqual("bst_column:name", list(data["scopes"].keys())[0])
+
+    def test_record_cache_access(self):
+        with profiling("test") as profile:
+            with profile_scope("search_format", "pgtemplate"):
+                record_cache_access(Infusate(), "name", True)
+                record_cache_access(Infusate(), "name", False)
+                record_cache_access(Infusate(), "name", False)
+        scope = profile.as_dict()["scopes"]["search_format:pgtemplate"]
+        self.assertEqual(1, scope["cache_hits"])
+        self.assertEqual(2, scope["cache_misses"])
+        self.assertDictEqual(
+            {"Infusate.name": {"hits": 1, "misses": 2}}, scope["cached_functions"]
+        )
+
+    def test_profile_scope_tag(self):
+        template = Template(
+            "{% load customtags %}"
+            "{% profile_scope 'bst_column' name %}{{ value }}{% endprofile_scope %}"
+        )
+        with profiling("test") as profile:
+            output = template.render(Context({"name": "tissue", "value": "x"}))
+        self.assertEqual("x", output)
+        self.assertEqual(1, profile.as_dict()["scopes"]["bst_column:tissue"]["calls"])
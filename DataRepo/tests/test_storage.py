@@ -0,0 +1,136 @@
+import gzip
+import os
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.urls import reverse
+
+from DataRepo.models import ArchiveFile
+from DataRepo.storage import (
+    COMPRESSED_SUFFIX,
+    CONTENT_ADDRESSED_DIR,
+    ArchiveStorage,
+    BlockedGzipWriter,
+    get_uncompressed_size,
+    open_compressed,
+)
+from DataRepo.tests.tracebase_test_case import (
+    TracebaseArchiveTestCase,
+    TracebaseTestCase,
+)
+
+
+@override_settings(ARCHIVE_CONTENT_ADDRESSED=True, ARCHIVE_COMPRESS_MIN_SIZE=0)
+class ArchiveStorageTests(TracebaseArchiveTestCase):
+    fixtures = ["data_types.yaml", "data_formats.yaml"]
+    name = f"{CONTENT_ADDRESSED_DIR}/ab/abcdef/test.txt"
+
+    def test_default_storage(self):
+        self.assertIsInstance(default_storage, ArchiveStorage)
+
+    def test_save_content_addressed_once(self):
+        saved_name = default_storage.save(self.name, ContentFile(b"test"))
+        self.assertEqual(self.name, saved_name)
+        # Saving the same content addressed name does not append a random suffix or copy the file again
+        self.assertEqual(
+            self.name, default_storage.save(self.name, ContentFile(b"test"))
+        )
+        self.assertEqual(
+            ["test.txt"], os.listdir(os.path.dirname(default_storage.path(self.name)))
+        )
+
+    def test_save_not_content_addressed(self):
+        name = "archive_files/2024-01/ms_data/test.txt"
+        self.assertEqual(name, default_storage.save(name, ContentFile(b"test")))
+        self.assertNotEqual(name, default_storage.save(name, ContentFile(b"test")))
+
+    def test_get_available_name_truncated(self):
+        name = default_storage.get_available_name(self.name, max_length=40)
+        self.assertEqual(40 - len(COMPRESSED_SUFFIX), len(name))
+        self.assertTrue(name.endswith(".txt"))
+
+    @override_settings(ARCHIVE_COMPRESS_MIN_SIZE=4)
+    def test_save_compressed(self):
+        content = b"test content"
+        saved_name = default_storage.save(self.name, ContentFile(content))
+        self.assertEqual(f"{self.name}{COMPRESSED_SUFFIX}", saved_name)
+        self.assertTrue(os.path.isfile(default_storage.path(saved_name)))
+        self.assertEqual(len(content), default_storage.size(saved_name))
+        with default_storage.open(saved_name) as fl:
+            self.assertEqual(content, fl.read())
+        # The uncompressed name finds the compressed file
+        self.assertEqual(
+            saved_name, default_storage.save(self.name, ContentFile(content))
+        )
+
+    def test_get_or_create_content_addressed(self):
+        fn = "DataRepo/data/tests/small_obob_mzxmls/small_obob_maven_6eaas_inf_lactate_mzxmls/BAT-xz971.mzXML"
+        rec_dict = {
+            "file_location": fn,
+            "data_type": "ms_data",
+            "data_format": "mzxml",
+        }
+        rec, created = ArchiveFile.objects.get_or_create(**rec_dict)
+        self.assertTrue(created)
+        self.assertEqual(
+            f"{CONTENT_ADDRESSED_DIR}/c9/c95f714d690bdd2ad069a7a0345dee9cb7cc1e23/BAT-xz971.mzXML",
+            rec.file_location.name,
+        )
+        self.assertTrue(os.path.isfile(rec.file_location.path))
+
+        # Deleting the record (outside of a transaction) deletes the file
+        path = rec.file_location.path
+        rec.delete()
+        self.assertFalse(os.path.isfile(path))
+
+    @override_settings(ARCHIVE_COMPRESS_MZXML=True)
+    def test_get_or_create_compressed_mzxml(self):
+        fn = "DataRepo/data/tests/small_obob_mzxmls/small_obob_maven_6eaas_inf_lactate_mzxmls/BAT-xz971.mzXML"
+        with open(fn, "rb") as fl:
+            content = fl.read()
+        rec, _ = ArchiveFile.objects.get_or_create(
+            file_location=fn, data_type="ms_data", data_format="mzxml"
+        )
+        self.assertTrue(rec.file_location.name.endswith(COMPRESSED_SUFFIX))
+        self.assertLess(os.path.getsize(rec.file_location.path), len(content))
+        self.assertEqual(len(content), rec.file_location.size)
+        with rec.file_location.open("rb") as fl:
+            self.assertEqual(content, fl.read())
+        # The archived file is still a valid gzip file
+        with gzip.open(rec.file_location.path) as fl:
+            self.assertEqual(content, fl.read())
+
+        # Downloads are decompressed
+        response = self.client.get(reverse("archive_file_download", args=[rec.id]))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(str(len(content)), response["Content-Length"])
+        self.assertEqual(content, b"".join(response.streaming_content))
+
+
+class BlockedGzipTests(TracebaseTestCase):
+    def test_random_access(self):
+        content = b"".join(f"<scan num={i}/>".encode() for i in range(10000))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, f"test.mzXML{COMPRESSED_SUFFIX}")
+            with open(path, "wb") as raw_file:
+                with BlockedGzipWriter(raw_file, block_size=1000) as writer:
+                    writer.write(content)
+            self.assertEqual(len(content), get_uncompressed_size(path))
+            with open_compressed(path) as fl:
+                fl.seek(54321)
+                self.assertEqual(content[54321:57000], fl.read(57000 - 54321))
+                fl.seek(-10, os.SEEK_END)
+                self.assertEqual(content[-10:], fl.read())
+            with gzip.open(path) as fl:
+                self.assertEqual(content, fl.read())
+
+    def test_open_compressed_single_member(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, f"test.txt{COMPRESSED_SUFFIX}")
+            with gzip.open(path, "wb") as fl:
+                fl.write(b"test")
+            self.assertEqual(4, get_uncompressed_size(path))
+            with open_compressed(path) as fl:
+                self.assertEqual(b"test", fl.read())
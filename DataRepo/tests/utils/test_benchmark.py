@@ -0,0 +1,72 @@
+import random
+import tempfile
+
+from django.core.management import call_command
+
+from DataRepo.models import Animal, PeakData, PeakGroup, Sample
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+from DataRepo.utils.benchmark import Benchmark, SyntheticStudyGenerator
+
+
+class SyntheticStudyGeneratorTests(TracebaseTestCase):
+    fixtures = ["data_types.yaml", "data_formats.yaml", "lc_methods.yaml"]
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir_obj = tempfile.TemporaryDirectory()
+        self.generator = SyntheticStudyGenerator(
+            self.tmpdir_obj.name,
+            studies=1,
+            animals=2,
+            samples=2,
+            peak_groups=3,
+            labels=2,
+        )
+
+    def tearDown(self):
+        self.tmpdir_obj.cleanup()
+        super().tearDown()
+
+    def generator_rng(self):
+        return random.Random(self.generator.seed)
+
+    def test_get_peak_annotations_df(self):
+        df1 = self.generator.get_peak_annotations_df(0, self.generator_rng())
+        df2 = self.generator.get_peak_annotations_df(0, self.generator_rng())
+        # 3 compounds, each with a parent and 2 labeled rows
+        self.assertEqual(9, len(df1.index))
+        # 4 samples
+        self.assertIn("bench_s0_a1_benchtissue1", df1.columns)
+        # Reproducible
+        self.assertTrue(df1.equals(df2))
+
+    def test_generate_and_load(self):
+        study_files = self.generator.generate()
+        self.assertEqual(1, len(study_files))
+        call_command("load_study", infile=study_files[0], skip_mzxmls=True)
+        self.assertEqual(2, Animal.objects.count())
+        self.assertEqual(4, Sample.objects.count())
+        self.assertEqual(12, PeakGroup.objects.count())
+        self.assertEqual(36, PeakData.objects.count())
+
+
+class BenchmarkTests(TracebaseTestCase):
+    def test_time(self):
+        bm = Benchmark(SyntheticStudyGenerator("unused"), repeat=2)
+        res = bm.time("test", "ok", lambda: {"records": 1}, extra="x")
+        self.assertEqual("test", res["category"])
+        self.assertEqual(2, res["runs"])
+        self.assertEqual(1, res["records"])
+        self.assertEqual("x", res["extra"])
+        self.assertLessEqual(res["min"], res["max"])
+        self.assertEqual([res], bm.results)
+
+    def test_time_error(self):
+        bm = Benchmark(SyntheticStudyGenerator("unused"), repeat=2)
+
+        def fail():
+            raise ValueError("bad")
+
+        res = bm.time("test", "fail", fail)
+        self.assertEqual("ValueError: bad", res["error"])
+        self.assertNotIn("runs", res)
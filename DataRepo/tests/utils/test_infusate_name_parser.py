@@ -300,6 +300,17 @@ class InfusateParsingTests(InfusateTestData):
         self.assertIsNotNone(tcr_data["isotopes"][0])
         self.assertEqual(148.88, conc)
 
+    def test_parse_infusate_name_memoized_results_unchanged_by_callers(self):
+        inf_data = parse_infusate_name("lactate-[1,2-13C2]", [148.88])
+        inf_data["tracers"][0]["tracer"]["isotopes"][0]["positions"].append(3)
+        inf_data["tracers"].pop()
+        self.assertEqual(
+            [1, 2],
+            parse_infusate_name("lactate-[1,2-13C2]", [148.88])["tracers"][0]["tracer"][
+                "isotopes"
+            ][0]["positions"],
+        )
+
 
 class InfusateValidationTests(InfusateTestData):
     tracer_labeled_elements = ObservedIsotopeData(
@@ -629,6 +640,30 @@ class InfusateValidationTests(InfusateTestData):
         obs = parse_isotope_label(label, possible_obs)
         self.assertEqual(expected, obs)
 
+    def test_parse_isotope_label_memoized_by_possible_observations(self):
+        possible_obs = [
+            ObservedIsotopeData(element="C", mass_number=13, count=5, parent=False),
+        ]
+        obs = parse_isotope_label("C13-label-3", possible_obs)
+        obs[0]["count"] = 1
+        obs = parse_isotope_label("C13-label-3", possible_obs)
+        self.assertEqual(3, obs[0]["count"])
+        possible_obs.append(
+            ObservedIsotopeData(element="N", mass_number=15, count=1, parent=False)
+        )
+        self.assertEqual(
+            [
+                ObservedIsotopeData(element="C", mass_number=13, count=3, parent=False),
+                ObservedIsotopeData(element="N", mass_number=15, count=0, parent=False),
+            ],
+            parse_isotope_label("C13-label-3", possible_obs),
+        )
+        # Errors are not memoized
+        with self.assertRaises(UnexpectedLabel):
+            parse_isotope_label("C13N15-label-3-1", possible_obs[:1])
+        with self.assertRaises(UnexpectedLabel):
+            parse_isotope_label("C13N15-label-3-1", possible_obs[:1])
+
     def test_parse_isotope_label_observed_isotope_unbalanced_error(self):
         label = "C13N15-label-3-1-5"
         with self.assertRaises(ObservedIsotopeUnbalancedError):
@@ -1,11 +1,15 @@
 from django.db.models import CharField, Q
 from django.test import override_settings
 
+from DataRepo.models.hier_cached_model import delete_all_caches
 from DataRepo.tests.tracebase_test_case import (
     TracebaseTestCase,
     create_test_model,
 )
-from DataRepo.views.models.bst.column.filterer.base import BSTBaseFilterer
+from DataRepo.views.models.bst.column.filterer.base import (
+    BSTBaseFilterer,
+    get_choices_cache_key,
+)
 
 BSTBFStudyTestModel = create_test_model(
     "BSTBFStudyTestModel",
@@ -17,6 +21,10 @@ class FiltererTest(BSTBaseFilterer):
     pass
 
 
+def get_study_names():
+    return list(BSTBFStudyTestModel.objects.values_list("name", flat=True))
+
+
 @override_settings(DEBUG=True)
 class BSTFiltererTests(TracebaseTestCase):
 
@@ -59,3 +67,23 @@ class BSTFiltererTests(TracebaseTestCase):
     def test_create_q_exp(self):
         f = FiltererTest("name")
         self.assertEqual(Q(**{"name__isnull": True}), f.create_q_exp("None"))
+
+    @TracebaseTestCase.assertNotWarns()
+    def test_init_choices_callable_cached(self):
+        BSTBFStudyTestModel.objects.create(name="name1")
+        f1 = FiltererTest("name", choices=get_study_names)
+        self.assertDictEqual({"name1": "name1"}, f1.choices)
+        BSTBFStudyTestModel.objects.create(name="name2")
+        f2 = FiltererTest("name", choices=get_study_names)
+        self.assertDictEqual({"name1": "name1"}, f2.choices)
+        delete_all_caches()
+        f3 = FiltererTest("name", choices=get_study_names)
+        self.assertDictEqual({"name1": "name1", "name2": "name2"}, f3.choices)
+
+    def test_get_choices_cache_key(self):
+        self.assertEqual(
+            "DataRepo.tests.views.models.bst.column.filterer.test_base.get_study_names",
+            get_choices_cache_key(get_study_names),
+        )
+        # Nested functions and lambdas cannot be identified across processes, so they are not cached
+        self.assertIsNone(get_choices_cache_key(lambda: ["A"]))
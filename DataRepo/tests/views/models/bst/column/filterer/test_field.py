@@ -8,6 +8,8 @@ from django.db.models import (
 )
 from django.test import override_settings
 
+from DataRepo.models.hier_cached_model import delete_all_caches
+from DataRepo.models.study import Study
 from DataRepo.tests.tracebase_test_case import (
     TracebaseTestCase,
     create_test_model,
@@ -199,3 +201,32 @@ class BSTFiltererTests(TracebaseTestCase):
             BSTFStudyTestModel,
         )
         self.assertEqual(Q(**{"name__icontains": "test"}), f.create_q_exp("test"))
+
+    @TracebaseTestCase.assertNotWarns()
+    def test_init_distinct_choices_cached(self):
+        BSTFStudyTestModel.objects.create(name="S1")
+        BSTFStudyTestModel.objects.create(name="S2")
+        f1 = BSTFilterer("name", BSTFStudyTestModel, distinct_choices=True)
+        self.assertDictEqual({"S1": "S1", "S2": "S2"}, f1.choices)
+
+        # Constructing the filterer again uses the cached choices instead of querying the model
+        BSTFStudyTestModel.objects.create(name="S3")
+        f2 = BSTFilterer("name", BSTFStudyTestModel, distinct_choices=True)
+        self.assertDictEqual({"S1": "S1", "S2": "S2"}, f2.choices)
+
+        # A data version change (e.g. after a load) makes the cached choices stale
+        delete_all_caches()
+        f3 = BSTFilterer("name", BSTFStudyTestModel, distinct_choices=True)
+        self.assertDictEqual({"S1": "S1", "S2": "S2", "S3": "S3"}, f3.choices)
+
+    @TracebaseTestCase.assertNotWarns()
+    def test_distinct_choices_after_record_write(self):
+        Study.objects.create(name="S1")
+        f1 = BSTFilterer("name", Study, distinct_choices=True)
+        self.assertDictEqual({"S1": "S1"}, f1.choices)
+
+        # Committed record writes (e.g. in the admin interface) make the cached choices stale
+        with self.captureOnCommitCallbacks(execute=True):
+            Study.objects.create(name="S2")
+        f2 = BSTFilterer("name", Study, distinct_choices=True)
+        self.assertDictEqual({"S1": "S1", "S2": "S2"}, f2.choices)
@@ -7,6 +7,7 @@ from django.db.models import (
     ForeignKey,
     Func,
     IntegerField,
+    Subquery,
     Value,
     When,
 )
@@ -223,3 +224,27 @@ class BSTAnnotColumnTests(TracebaseTestCase):
         )
         self.assertTrue(c.is_related_to_many_related_model_path("samples"))
         self.assertFalse(c.is_related_to_many_related_model_path("studies"))
+
+    def test_correlated_count(self):
+        brain = BACTissueTestModel.objects.create(name="brain")
+        BACTissueTestModel.objects.create(name="heart")
+        BACSampleTestModel.objects.create(name="s1", tissue=brain)
+        BACSampleTestModel.objects.create(name="s2", tissue=brain)
+        converter = Count("samples", output_field=IntegerField(), distinct=True)
+        c = BSTAnnotColumn("sample_count", converter, model=BACTissueTestModel)
+        self.assertTrue(c.correlated)
+        self.assertIsInstance(c.expression, Subquery)
+        self.assertEqual(converter, c.converter)
+        self.assertDictEqual(
+            {"brain": 2, "heart": 0},
+            dict(
+                BACTissueTestModel.objects.annotate(
+                    sample_count=c.expression
+                ).values_list("name", "sample_count")
+            ),
+        )
+
+        # Without a model, the count is annotated as is
+        c = BSTAnnotColumn("sample_count", converter)
+        self.assertFalse(c.correlated)
+        self.assertEqual(converter, c.expression)
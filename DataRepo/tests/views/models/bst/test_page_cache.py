@@ -0,0 +1,90 @@
+from django.http import HttpRequest, QueryDict
+from django.test import override_settings
+from django.urls import reverse
+
+from DataRepo.models.hier_cached_model import delete_all_caches
+from DataRepo.models.study import Study
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+from DataRepo.views.models.bst.page_cache import BSTPageCache
+from DataRepo.views.models.study import StudyListView
+
+
+@override_settings(BST_PAGE_CACHE=True)
+class BSTPageCacheTests(TracebaseTestCase):
+    def test_from_view_key(self):
+        view = StudyListView()
+        request1 = HttpRequest()
+        request1.COOKIES = {
+            "StudyListView-sortcol": "name",
+            "StudyListView-search": "",
+            "AnimalListView-sortcol": "name",
+        }
+        request2 = HttpRequest()
+        request2.COOKIES = {"StudyListView-sortcol": "name"}
+        pc1 = BSTPageCache.from_view(view, request1)
+
+        # Empty cookies and other views' cookies do not affect the key
+        self.assertEqual(pc1.key, BSTPageCache.from_view(view, request2).key)
+
+        # URL parameters do
+        request2.GET = QueryDict("page=2")
+        self.assertNotEqual(pc1.key, BSTPageCache.from_view(view, request2).key)
+
+        # So does the data version
+        delete_all_caches()
+        pc2 = BSTPageCache.from_view(view, request1)
+        self.assertNotEqual(pc1.key, pc2.key)
+        self.assertNotEqual(pc1.etag, pc2.etag)
+
+    def test_list_view_page_cache(self):
+        url = reverse("study_list")
+        response1 = self.client.get(url)
+        self.assertEqual(200, response1.status_code)
+        self.assertIsNotNone(response1.context)
+        etag = response1["ETag"]
+
+        # The second request is served from the cache (i.e. no template is rendered)
+        response2 = self.client.get(url)
+        self.assertEqual(200, response2.status_code)
+        self.assertIsNone(response2.context)
+        self.assertEqual(etag, response2["ETag"])
+
+        # A browser revalidating its copy gets a 304
+        response3 = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(304, response3.status_code)
+
+        # Different cookies are a different page
+        self.client.cookies["StudyListView-sortcol"] = "name"
+        response4 = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response4.status_code)
+        self.assertNotEqual(etag, response4["ETag"])
+
+        # Data changes make cached pages stale
+        del self.client.cookies["StudyListView-sortcol"]
+        delete_all_caches()
+        response5 = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response5.status_code)
+        self.assertIsNotNone(response5.context)
+        self.assertNotEqual(etag, response5["ETag"])
+
+    def test_page_cache_after_edit(self):
+        study = Study.objects.create(name="cached study")
+        url = reverse("study_list")
+        response1 = self.client.get(url)
+        etag = response1["ETag"]
+
+        # Committed edits of records (e.g. in the admin interface) make cached pages stale
+        with self.captureOnCommitCallbacks(execute=True):
+            study.name = "edited study"
+            study.save()
+        response2 = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response2.status_code)
+        self.assertNotEqual(etag, response2["ETag"])
+        self.assertIn("edited study", response2.content.decode())
+        self.assertNotIn("cached study", response2.content.decode())
+
+    @override_settings(BST_PAGE_CACHE=False)
+    def test_page_cache_disabled(self):
+        response = self.client.get(reverse("study_list"))
+        self.assertEqual(200, response.status_code)
+        self.assertFalse(response.has_header("ETag"))
@@ -0,0 +1,279 @@
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.http import HttpRequest
+
+from DataRepo.models.hier_cached_model import (
+    connect_data_write_signals,
+    delete_all_caches,
+)
+from DataRepo.models.search_document import SearchDocument
+from DataRepo.models.study import Study
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+from DataRepo.tests.views.models.bst.test_query import (
+    AnimalWithMultipleStudyColsLV,
+    BSTLVAnimalTestModel,
+    BSTLVStudyTestModel,
+    BSTLVTreatmentTestModel,
+)
+from DataRepo.views.models.bst.column.filterer.field import BSTFilterer
+from DataRepo.views.models.bst.search_index import (
+    BSTSearchIndex,
+    get_search_indexed_views,
+)
+from DataRepo.views.models.study import StudyListView
+
+
+class AnimalSearchIndexLV(AnimalWithMultipleStudyColsLV):
+    search_index = True
+
+
+class BSTSearchIndexTests(TracebaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Only the DataRepo models' write signals are connected (when the app is ready)
+        connect_data_write_signals(
+            [BSTLVAnimalTestModel, BSTLVStudyTestModel, BSTLVTreatmentTestModel]
+        )
+
+    @classmethod
+    def setUpTestData(cls):
+        t1 = BSTLVTreatmentTestModel.objects.create(name="T1", desc="t1")
+        t2 = BSTLVTreatmentTestModel.objects.create(name="oddball", desc="t2")
+        s1 = BSTLVStudyTestModel.objects.create(name="S1", desc="s1")
+        cls.s2 = BSTLVStudyTestModel.objects.create(name="S2", desc="s2")
+        cls.a1 = BSTLVAnimalTestModel.objects.create(name="A1", desc="a1", treatment=t1)
+        cls.a1.studies.add(s1)
+        cls.a2 = BSTLVAnimalTestModel.objects.create(name="A2", desc="a2", treatment=t2)
+        cls.a2.studies.add(s1)
+        cls.a2.studies.add(cls.s2)
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+        # Make any index refreshed by a previous test stale
+        delete_all_caches()
+
+    def get_search_view(self, term, view_class=AnimalSearchIndexLV):
+        request = HttpRequest()
+        request.COOKIES.update({f"{view_class.__name__}-search": term})
+        alv = view_class(request=request)
+        alv.init_interface()
+        return alv
+
+    def test_from_view(self):
+        index = BSTSearchIndex.from_view(AnimalSearchIndexLV())
+        self.assertEqual("AnimalSearchIndexLV", index.name)
+        self.assertEqual(
+            ["name", "desc", "treatment__name", "studies__name", "studies__desc"],
+            index.field_paths,
+        )
+        self.assertEqual({}, index.annotations)
+        self.assertEqual([], index.exact_field_paths)
+        # Count columns use the strict filterer
+        self.assertEqual(["studies_mm_count"], list(index.exact_annotations.keys()))
+        self.assertEqual([], index.unindexed_filterers)
+
+    def test_from_view_exact_columns(self):
+        index = BSTSearchIndex.from_view(StudyListView())
+        # Select list columns are matched whole
+        self.assertIn("animals__samples__researcher", index.exact_field_paths)
+        self.assertNotIn("animals__samples__researcher", index.field_paths)
+        self.assertIn("name", index.field_paths)
+
+    def test_get_documents(self):
+        index = BSTSearchIndex.from_view(AnimalSearchIndexLV())
+        self.assertDictEqual(
+            {
+                self.a1.pk: ("a1\ns1\nt1", "\n1\n"),
+                self.a2.pk: ("a2\noddball\ns1\ns2", "\n2\n"),
+            },
+            index.get_documents([self.a1.pk, self.a2.pk]),
+        )
+
+    def test_refresh(self):
+        index = BSTSearchIndex.from_view(AnimalSearchIndexLV())
+        self.assertFalse(index.is_current())
+        self.assertEqual(2, index.refresh())
+        self.assertTrue(index.is_current())
+        # Unchanged documents are not rewritten
+        self.assertEqual(0, index.refresh())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.a1.desc = "changed"
+            self.a1.save()
+        self.assertFalse(index.is_current())
+        self.assertEqual(1, index.refresh())
+        self.assertIn(
+            "changed",
+            SearchDocument.objects.get(
+                index_name=index.name, record_id=self.a1.pk
+            ).document,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.a1.delete()
+        self.assertEqual(1, index.refresh())
+        self.assertEqual(
+            1, SearchDocument.objects.filter(index_name=index.name).count()
+        )
+
+        # Data changes (e.g. loads) make the index stale
+        delete_all_caches()
+        self.assertFalse(index.is_current())
+
+    def test_refresh_written_records(self):
+        index = BSTSearchIndex.from_view(AnimalSearchIndexLV())
+        index.refresh()
+
+        # Only the documents of the animals linked to an edited study are recomputed
+        with self.captureOnCommitCallbacks(execute=True):
+            self.s2.desc = "edited"
+            self.s2.save()
+        with patch.object(
+            index, "get_documents", wraps=index.get_documents
+        ) as get_documents:
+            self.assertEqual(1, index.refresh())
+        get_documents.assert_called_once_with([self.a2.pk])
+
+        # Linking records affects the documents of the records on both sides
+        with self.captureOnCommitCallbacks(execute=True):
+            self.a1.studies.add(self.s2)
+        with patch.object(
+            index, "get_documents", wraps=index.get_documents
+        ) as get_documents:
+            self.assertEqual(1, index.refresh())
+        get_documents.assert_called_once_with(sorted([self.a1.pk, self.a2.pk]))
+        self.assertEqual(
+            [self.a2, self.a1],
+            list(BSTLVAnimalTestModel.objects.filter(index.create_q_exp("edited"))),
+        )
+
+        # The written records are unknown after bulk changes (e.g. loads), so every document is recomputed
+        delete_all_caches()
+        with patch.object(
+            index, "get_documents", wraps=index.get_documents
+        ) as get_documents:
+            self.assertEqual(0, index.refresh())
+        get_documents.assert_called_once_with(sorted([self.a1.pk, self.a2.pk]))
+
+        # Unless a full refresh is requested, a current index has no documents to recompute
+        with patch.object(
+            index, "get_documents", wraps=index.get_documents
+        ) as get_documents:
+            self.assertEqual(0, index.refresh())
+            self.assertEqual(0, index.refresh(full=True))
+        get_documents.assert_called_once_with(sorted([self.a1.pk, self.a2.pk]))
+
+    def test_get_relation_paths(self):
+        index = BSTSearchIndex.from_view(AnimalSearchIndexLV())
+        self.assertDictEqual(
+            {
+                "BSTLVTreatmentTestModel": ["treatment"],
+                "BSTLVStudyTestModel": ["studies"],
+            },
+            index.get_relation_paths(),
+        )
+
+    def test_create_q_exp(self):
+        index = BSTSearchIndex.from_view(AnimalSearchIndexLV())
+        index.refresh()
+        self.assertEqual(
+            [self.a2],
+            list(BSTLVAnimalTestModel.objects.filter(index.create_q_exp("ODDb"))),
+        )
+        self.assertEqual(
+            [self.a2, self.a1],
+            list(BSTLVAnimalTestModel.objects.filter(index.create_q_exp("S1"))),
+        )
+
+    def test_create_q_exp_exact(self):
+        index = BSTSearchIndex(
+            "ExactSearchIndex",
+            BSTLVAnimalTestModel,
+            ["studies__name"],
+            {},
+            exact_field_paths=["desc"],
+        )
+        self.assertDictEqual(
+            {self.a1.pk: ("s1", "\na1\n")}, index.get_documents([self.a1.pk])
+        )
+        index.refresh()
+        self.assertEqual(
+            [self.a1],
+            list(BSTLVAnimalTestModel.objects.filter(index.create_q_exp("A1"))),
+        )
+        # Exact values are not substring matched
+        self.assertEqual(
+            [], list(BSTLVAnimalTestModel.objects.filter(index.create_q_exp("a")))
+        )
+        self.assertEqual(
+            [self.a2, self.a1],
+            list(BSTLVAnimalTestModel.objects.filter(index.create_q_exp("s"))),
+        )
+
+    def test_create_q_exp_unindexed_filterers(self):
+        filterer = BSTFilterer(
+            "name", BSTLVAnimalTestModel, _server_filterer="istartswith"
+        )
+        index = BSTSearchIndex(
+            "UnindexedSearchIndex",
+            BSTLVAnimalTestModel,
+            ["treatment__name"],
+            {},
+            unindexed_filterers=[filterer],
+        )
+        index.refresh()
+        # Columns with lookups that the documents cannot match are searched using their filterers
+        self.assertIn("name__istartswith", str(index.create_q_exp("a")))
+        self.assertEqual(
+            [self.a2, self.a1],
+            list(BSTLVAnimalTestModel.objects.filter(index.create_q_exp("a"))),
+        )
+
+    def test_search_uses_current_index(self):
+        # The column lookups are used while the index is stale
+        self.assertIn("name__icontains", str(self.get_search_view("oddb").search()))
+
+        BSTSearchIndex.from_view(AnimalSearchIndexLV()).refresh()
+        alv = self.get_search_view("oddb")
+        self.assertNotIn("name__icontains", str(alv.search()))
+        self.assertEqual([self.a2], list(alv.get_queryset()))
+
+    def test_search_after_edit(self):
+        study = Study.objects.create(name="indexed study")
+        index = BSTSearchIndex.from_view(StudyListView())
+        index.refresh()
+        self.assertTrue(index.is_current())
+
+        # Committed edits of records (e.g. in the admin interface) make the index stale
+        with self.captureOnCommitCallbacks(execute=True):
+            study.name = "edited study"
+            study.save()
+        self.assertFalse(index.is_current())
+
+        # So the search does not miss the edited record
+        slv = self.get_search_view("edited", view_class=StudyListView)
+        self.assertEqual([study], list(slv.get_queryset()))
+
+    def test_search_index_columns(self):
+        # The study list's researcher columns are only searched when the index is current
+        slv = self.get_search_view("jimmy", view_class=StudyListView)
+        self.assertNotIn("researcher__", str(slv.search()))
+        index = BSTSearchIndex.from_view(StudyListView())
+        self.assertIn("animals__samples__researcher", index.exact_field_paths)
+
+    def test_search_none_does_not_use_index(self):
+        BSTSearchIndex.from_view(AnimalSearchIndexLV()).refresh()
+        self.assertIn("isnull", str(self.get_search_view("None").search()))
+
+    def test_get_search_indexed_views(self):
+        views = get_search_indexed_views()
+        self.assertIn(StudyListView, views)
+        self.assertIn(AnimalSearchIndexLV, views)
+        self.assertNotIn(AnimalWithMultipleStudyColsLV, views)
+
+    def test_build_search_index(self):
+        call_command("build_search_index", views=["StudyListView"])
+        self.assertTrue(BSTSearchIndex.from_view(StudyListView()).is_current())
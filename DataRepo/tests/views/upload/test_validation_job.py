@@ -0,0 +1,192 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from django.test import override_settings
+from django.urls import reverse
+
+from DataRepo.tests.tracebase_test_case import TracebaseTestCase
+from DataRepo.views.upload.validation_job import ValidationJob
+
+
+class FakeLoader:
+    DataSheetName = "Samples"
+
+    def __init__(self, num_errors=0, num_warnings=0):
+        self.aggregated_errors_object = type(
+            "FakeAggregatedErrors",
+            (),
+            {"num_errors": num_errors, "num_warnings": num_warnings},
+        )()
+
+
+class ValidationJobTests(TracebaseTestCase):
+    fixtures = ["lc_methods.yaml", "data_types.yaml", "data_formats.yaml"]
+
+    study_file = "DataRepo/data/tests/data_submission/animal_sample_good_v3.xlsx"
+    annot_file = "DataRepo/data/tests/data_submission/accucor1.xlsx"
+
+    job_id = "0123456789abcdef0123456789abcdef"
+
+    def setUp(self):
+        super().setUp()
+        self.job_dir = tempfile.mkdtemp()
+        self.job_dir_settings = override_settings(VALIDATION_JOB_DIR=self.job_dir)
+        self.job_dir_settings.enable()
+
+    def tearDown(self):
+        self.job_dir_settings.disable()
+        shutil.rmtree(self.job_dir)
+        super().tearDown()
+
+    def create_job(self, **status) -> ValidationJob:
+        job = ValidationJob(self.job_id)
+        job.set_status({"state": ValidationJob.QUEUED, "sheets": {}, **status})
+        return job
+
+    def test_get_checksum(self):
+        checksum = ValidationJob.get_checksum(
+            self.study_file, "study.xlsx", [self.annot_file], ["accucor1.xlsx"], {}
+        )
+        # The same content under a different (temporary) path yields the same checksum
+        self.assertEqual(
+            checksum,
+            ValidationJob.get_checksum(
+                "./" + self.study_file,
+                "study.xlsx",
+                [self.annot_file],
+                ["accucor1.xlsx"],
+                {},
+            ),
+        )
+        # The submitted file names and metadata are included
+        self.assertNotEqual(
+            checksum,
+            ValidationJob.get_checksum(
+                self.study_file, "study2.xlsx", [self.annot_file], ["accucor1.xlsx"], {}
+            ),
+        )
+        self.assertNotEqual(
+            checksum,
+            ValidationJob.get_checksum(
+                self.study_file,
+                "study.xlsx",
+                [self.annot_file],
+                ["accucor1.xlsx"],
+                {"accucor1.xlsx": {"operator": "Anonymous"}},
+            ),
+        )
+
+    def test_run(self):
+        job = self.create_job(checksum="test_checksum")
+        job.run(self.study_file, "study.xlsx", [], [], {})
+        status = job.get_status()
+        self.assertEqual(ValidationJob.DONE, status["state"])
+        self.assertIn("study.xlsx", status["result"]["results"])
+        # Partial results were recorded for each sheet
+        self.assertGreater(status["num_loaded"], 0)
+        self.assertEqual(status["num_sheets"], status["num_loaded"])
+        self.assertIn("Samples", status["sheets"])
+        # The results are saved by checksum
+        self.assertEqual(
+            status["result"],
+            ValidationJob.read_json(ValidationJob.get_result_path("test_checksum")),
+        )
+
+    def test_run_result_write_failed(self):
+        job = self.create_job(checksum="test_checksum")
+        # The result path is a directory, so the results cannot be saved by checksum
+        os.makedirs(ValidationJob.get_result_path("test_checksum"))
+        job.run(self.study_file, "study.xlsx", [], [], {})
+        status = job.get_status()
+        self.assertEqual(ValidationJob.FAILED, status["state"])
+        self.assertIn("Error", status["error"])
+
+    def test_get_status_dead_job(self):
+        job = self.create_job(state=ValidationJob.RUNNING)
+        # A running job without a heartbeat (e.g. after a web server restart) failed
+        self.assertEqual(ValidationJob.FAILED, job.get_status()["state"])
+        job.beat()
+        self.assertEqual(ValidationJob.RUNNING, job.get_status()["state"])
+        # As does a job whose heartbeat is too old
+        old_beat = time.time() - ValidationJob.HEARTBEAT_TIMEOUT - 1
+        os.utime(job.heartbeat_path, (old_beat, old_beat))
+        self.assertEqual(ValidationJob.FAILED, job.get_status()["state"])
+        response = self.client.get(reverse("validation_job_status", args=[self.job_id]))
+        self.assertEqual(ValidationJob.FAILED, json.loads(response.content)["state"])
+
+    def test_submit_cached(self):
+        checksum = ValidationJob.get_checksum(self.study_file, "study.xlsx", [], [], {})
+        ValidationJob.write_json(
+            ValidationJob.get_result_path(checksum), {"valid": True}
+        )
+        job = ValidationJob.submit(self.study_file, "study.xlsx", [], [], {})
+        status = job.get_status()
+        self.assertEqual(ValidationJob.DONE, status["state"])
+        self.assertTrue(status["cached"])
+        self.assertEqual({"valid": True}, status["result"])
+
+    @override_settings(VALIDATION_RESULT_TIMEOUT=-1)
+    def test_remove_expired(self):
+        job = self.create_job()
+        ValidationJob.write_json(ValidationJob.get_result_path("test_checksum"), {})
+        ValidationJob.remove_expired()
+        self.assertIsNone(job.get_status())
+        self.assertEqual([], os.listdir(ValidationJob.get_results_dir()))
+
+    def test_get_status_invalid_id(self):
+        self.create_job()
+        self.assertIsNone(ValidationJob("../jobs/" + self.job_id).get_status())
+
+    def test_cancel(self):
+        job = self.create_job()
+        self.assertTrue(job.report_progress(FakeLoader(num_errors=2), 1, 5))
+        self.assertEqual(
+            {"errors": 2, "warnings": 0}, job.get_status()["sheets"]["Samples"]
+        )
+        self.assertTrue(job.cancel())
+        self.assertFalse(job.report_progress(FakeLoader(), 2, 5))
+        job.run(self.study_file, "study.xlsx", [], [], {})
+        self.assertEqual(ValidationJob.CANCELLED, job.get_status()["state"])
+        # A finished job cannot be cancelled
+        self.assertFalse(job.cancel())
+
+    def test_job_status_views(self):
+        self.create_job(num_loaded=1, num_sheets=5, result={"big": "data"})
+        response = self.client.get(reverse("validation_job_status", args=[self.job_id]))
+        self.assertEqual(200, response.status_code)
+        status = json.loads(response.content)
+        self.assertEqual(self.job_id, status["id"])
+        self.assertEqual(ValidationJob.QUEUED, status["state"])
+        self.assertNotIn("result", status)
+
+        response = self.client.get(reverse("cancel_validation_job", args=[self.job_id]))
+        self.assertEqual(405, response.status_code)
+        response = self.client.post(
+            reverse("cancel_validation_job", args=[self.job_id])
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(ValidationJob(self.job_id).is_cancelled())
+
+        response = self.client.get(reverse("validation_job_status", args=["f" * 32]))
+        self.assertEqual(404, response.status_code)
+
+    @override_settings(READONLY=True)
+    def test_job_status_views_readonly(self):
+        response = self.client.get(reverse("validation_job_status", args=[self.job_id]))
+        self.assertEqual(403, response.status_code)
+
+    def test_submission_view_job_results(self):
+        self.create_job()
+        response = self.client.get(reverse("submission"), {"job": self.job_id})
+        self.assertEqual(self.job_id, response.context["job_id"])
+
+        self.create_job(
+            state=ValidationJob.DONE,
+            result={"results": {"study.xlsx": "PASSED"}, "valid": True},
+        )
+        response = self.client.get(reverse("submission"), {"job": self.job_id})
+        self.assertTrue(response.context["valid"])
+        self.assertEqual({"study.xlsx": "PASSED"}, response.context["results"])
@@ -10,6 +10,7 @@ from .views import (
     AnimalListView,
     AnimalTreatmentListView,
     ArchiveFileDetailView,
+    ArchiveFileDownloadView,
     ArchiveFileListView,
     BuildSubmissionView,
     CompoundDetailView,
@@ -34,15 +35,27 @@ from .views import (
     TissueListView,
     TracerDetailView,
     TracerListView,
+    cancel_validation_job,
     home,
     search_basic,
     study_summary,
+    validation_job_status,
     view_search_results,
 )
 
 urlpatterns = [
     path("", home, name="home"),
     path("submission", BuildSubmissionView.as_view(), name="submission"),
+    path(
+        "submission/jobs/<str:job_id>/",
+        validation_job_status,
+        name="validation_job_status",
+    ),
+    path(
+        "submission/jobs/<str:job_id>/cancel/",
+        cancel_validation_job,
+        name="cancel_validation_job",
+    ),
     path(
         "search_basic/<str:mdl>/<str:fld>/<str:cmp>/<str:val>/<str:fmt>/",
         search_basic,
@@ -145,6 +158,11 @@ urlpatterns = [
         ArchiveFileDetailView.as_view(),
         name=ArchiveFileDetailView.model.detail_name,
     ),
+    path(
+        "archive_file/<int:pk>/download/",
+        ArchiveFileDownloadView.as_view(),
+        name="archive_file_download",
+    ),
     path("peakgroups/", PeakGroupListView.as_view(), name="peakgroup_list"),
     path(
         "peakgroups/<int:pk>/",
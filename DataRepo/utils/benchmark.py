@@ -0,0 +1,616 @@
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import django
+import pandas as pd
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from DataRepo.loaders.animals_loader import AnimalsLoader
+from DataRepo.loaders.compounds_loader import CompoundsLoader
+from DataRepo.loaders.infusates_loader import InfusatesLoader
+from DataRepo.loaders.msruns_loader import MSRunsLoader
+from DataRepo.loaders.peak_annotation_files_loader import (
+    PeakAnnotationFilesLoader,
+)
+from DataRepo.loaders.peak_annotations_loader import IsocorrLoader
+from DataRepo.loaders.protocols_loader import ProtocolsLoader
+from DataRepo.loaders.samples_loader import SamplesLoader
+from DataRepo.loaders.sequences_loader import SequencesLoader
+from DataRepo.loaders.studies_loader import StudiesLoader
+from DataRepo.loaders.tissues_loader import TissuesLoader
+from DataRepo.loaders.tracers_loader import TracersLoader
+from DataRepo.models.hier_cached_model import (
+    delete_all_caches,
+    disable_caching_retrievals,
+    disable_caching_updates,
+    enable_caching_retrievals,
+    enable_caching_updates,
+    get_cached_method_names,
+)
+from DataRepo.models.msrun_sequence import MSRunSequence
+from DataRepo.models.tissue import Tissue
+from DataRepo.models.utilities import get_model_by_name
+from DataRepo.profiling import profiling
+
+
+class SyntheticStudyGenerator:
+    """Generates synthetic study docs (and their isocorr peak annotation files) of a configurable size, for
+    benchmarking.  The generated data only depends on the size parameters and the seed, so that benchmark results are
+    comparable across runs.
+
+    Every study has its own animals (each infused with the same tracer), the first of each animal's samples is a serum
+    sample, and every sample has a peak group for every compound, each with a parent and a number of labeled peak
+    data.
+    """
+
+    LC_PROTOCOL_NAME = "polar-HILIC-25-min"  # From the lc_methods.yaml fixture
+    OPERATOR = "Benchmark Operator"
+    DATE = "2024-01-01"
+    TREATMENT = "no treatment"
+    SERUM_TISSUE = f"{Tissue.SERUM_TISSUE_PREFIX}_plasma_tail"
+
+    def __init__(
+        self,
+        outdir: str,
+        studies: int = 1,
+        animals: int = 2,
+        samples: int = 3,
+        peak_groups: int = 10,
+        labels: int = 3,
+        seed: int = 0,
+    ):
+        """Constructor.
+
+        Args:
+            outdir (str): Directory where the study docs and peak annotation files are written.
+            studies (int): Number of studies.
+            animals (int): Number of animals per study.
+            samples (int): Number of samples per animal.
+            peak_groups (int): Number of peak groups (i.e. compounds) per sample.
+            labels (int): Number of labeled peak data per peak group (and the number of carbons in every compound).
+            seed (int): Seed of the random abundances.
+        Exceptions:
+            ValueError
+        Returns:
+            None
+        """
+        if min(studies, animals, samples, peak_groups, labels) < 1:
+            raise ValueError(
+                "The numbers of studies, animals, samples, peak groups, and labels must be at least 1."
+            )
+        self.outdir = outdir
+        self.studies = studies
+        self.animals = animals
+        self.samples = samples
+        self.peak_groups = peak_groups
+        self.labels = labels
+        self.seed = seed
+
+    def get_parameters(self) -> dict:
+        return {
+            "studies": self.studies,
+            "animals": self.animals,
+            "samples": self.samples,
+            "peak_groups": self.peak_groups,
+            "labels": self.labels,
+            "seed": self.seed,
+        }
+
+    @property
+    def formula(self) -> str:
+        return f"C{self.labels}H{2 * self.labels}O2"
+
+    @property
+    def compound_names(self) -> List[str]:
+        return [f"benchcompound{i}" for i in range(self.peak_groups)]
+
+    @property
+    def tracer_name(self) -> str:
+        return f"{self.compound_names[0]}-[13C{self.labels}]"
+
+    @property
+    def infusate_name(self) -> str:
+        return f"{self.tracer_name}[100]"
+
+    @property
+    def tissue_names(self) -> List[str]:
+        return [self.SERUM_TISSUE] + [f"benchtissue{i}" for i in range(1, self.samples)]
+
+    def get_study_name(self, study_num: int) -> str:
+        return f"benchmark study {study_num}"
+
+    def get_animal_name(self, study_num: int, animal_num: int) -> str:
+        return f"bench_s{study_num}_a{animal_num}"
+
+    def get_sample_name(self, study_num: int, animal_num: int, sample_num: int) -> str:
+        animal_name = self.get_animal_name(study_num, animal_num)
+        return f"{animal_name}_{self.tissue_names[sample_num]}"
+
+    def get_sequence_name(self) -> str:
+        return MSRunSequence.create_sequence_name(
+            self.OPERATOR,
+            self.LC_PROTOCOL_NAME,
+            MSRunSequence.INSTRUMENT_DEFAULT,
+            self.DATE,
+        )
+
+    def generate(self) -> List[str]:
+        """Writes the study docs and peak annotation files.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            study_files (List[str]): Paths of the study docs, in the order they should be loaded.
+        """
+        os.makedirs(self.outdir, exist_ok=True)
+        rng = random.Random(self.seed)
+        study_files = []
+        for study_num in range(self.studies):
+            annot_file = os.path.join(
+                self.outdir, f"benchmark_study_{study_num}_cor.csv"
+            )
+            self.get_peak_annotations_df(study_num, rng).to_csv(annot_file, index=False)
+            study_file = os.path.join(self.outdir, f"benchmark_study_{study_num}.xlsx")
+            with pd.ExcelWriter(  # pylint: disable=abstract-class-instantiated
+                study_file, engine="xlsxwriter"
+            ) as xlsx_writer:
+                for sheet, df in self.get_study_dfs(
+                    study_num, os.path.basename(annot_file)
+                ).items():
+                    df.to_excel(xlsx_writer, sheet_name=sheet, index=False)
+            study_files.append(study_file)
+        return study_files
+
+    def get_study_dfs(
+        self, study_num: int, annot_filename: str
+    ) -> Dict[str, pd.DataFrame]:
+        """Returns the sheets of a study doc, keyed on sheet name.
+
+        Args:
+            study_num (int)
+            annot_filename (str): Name of the peak annotation file (in the same directory as the study doc).
+        Exceptions:
+            None
+        Returns:
+            dfs (Dict[str, pd.DataFrame])
+        """
+        study_name = self.get_study_name(study_num)
+        seqname = self.get_sequence_name()
+        sample_names = []
+        animal_rows = []
+        sample_rows = []
+        for animal_num in range(self.animals):
+            animal_name = self.get_animal_name(study_num, animal_num)
+            animal_rows.append(
+                {
+                    AnimalsLoader.DataHeaders.NAME: animal_name,
+                    AnimalsLoader.DataHeaders.AGE: 14,
+                    AnimalsLoader.DataHeaders.SEX: "M",
+                    AnimalsLoader.DataHeaders.GENOTYPE: "WT",
+                    AnimalsLoader.DataHeaders.WEIGHT: 25.0,
+                    AnimalsLoader.DataHeaders.INFUSATE: self.infusate_name,
+                    AnimalsLoader.DataHeaders.INFUSIONRATE: 0.1,
+                    AnimalsLoader.DataHeaders.DIET: "benchmark diet",
+                    AnimalsLoader.DataHeaders.FEEDINGSTATUS: "fasted",
+                    AnimalsLoader.DataHeaders.TREATMENT: self.TREATMENT,
+                    AnimalsLoader.DataHeaders.STUDY: study_name,
+                }
+            )
+            for sample_num in range(self.samples):
+                sample_name = self.get_sample_name(study_num, animal_num, sample_num)
+                sample_names.append(sample_name)
+                sample_rows.append(
+                    {
+                        SamplesLoader.DataHeaders.SAMPLE: sample_name,
+                        SamplesLoader.DataHeaders.DATE: self.DATE,
+                        SamplesLoader.DataHeaders.HANDLER: self.OPERATOR,
+                        SamplesLoader.DataHeaders.TISSUE: self.tissue_names[sample_num],
+                        SamplesLoader.DataHeaders.DAYS_INFUSED: 150,
+                        SamplesLoader.DataHeaders.ANIMAL: animal_name,
+                    }
+                )
+
+        return {
+            StudiesLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        StudiesLoader.DataHeaders.NAME: study_name,
+                        StudiesLoader.DataHeaders.DESCRIPTION: (
+                            "Synthetic benchmark study"
+                        ),
+                    }
+                ]
+            ),
+            CompoundsLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        CompoundsLoader.DataHeaders.NAME: name,
+                        CompoundsLoader.DataHeaders.FORMULA: self.formula,
+                        CompoundsLoader.DataHeaders.HMDB_ID: f"HMDB9{i:06d}",
+                    }
+                    for i, name in enumerate(self.compound_names)
+                ]
+            ),
+            TracersLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        TracersLoader.DataHeaders.ID: 1,
+                        TracersLoader.DataHeaders.COMPOUND: self.compound_names[0],
+                        TracersLoader.DataHeaders.ELEMENT: "C",
+                        TracersLoader.DataHeaders.MASSNUMBER: 13,
+                        TracersLoader.DataHeaders.LABELCOUNT: self.labels,
+                        TracersLoader.DataHeaders.NAME: self.tracer_name,
+                    }
+                ]
+            ),
+            InfusatesLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        InfusatesLoader.DataHeaders.ID: 1,
+                        InfusatesLoader.DataHeaders.TRACERNAME: self.tracer_name,
+                        InfusatesLoader.DataHeaders.TRACERCONC: 100,
+                        InfusatesLoader.DataHeaders.NAME: self.infusate_name,
+                    }
+                ]
+            ),
+            ProtocolsLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        ProtocolsLoader.DataHeadersExcel.NAME: self.TREATMENT,
+                        ProtocolsLoader.DataHeadersExcel.DESCRIPTION: "No treatment",
+                    }
+                ]
+            ),
+            TissuesLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        TissuesLoader.DataHeaders.NAME: name,
+                        TissuesLoader.DataHeaders.DESCRIPTION: name,
+                    }
+                    for name in self.tissue_names
+                ]
+            ),
+            AnimalsLoader.DataSheetName: pd.DataFrame(animal_rows),
+            SamplesLoader.DataSheetName: pd.DataFrame(sample_rows),
+            SequencesLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        SequencesLoader.DataHeaders.SEQNAME: seqname,
+                        SequencesLoader.DataHeaders.OPERATOR: self.OPERATOR,
+                        SequencesLoader.DataHeaders.LCNAME: self.LC_PROTOCOL_NAME,
+                        SequencesLoader.DataHeaders.INSTRUMENT: (
+                            MSRunSequence.INSTRUMENT_DEFAULT
+                        ),
+                        SequencesLoader.DataHeaders.DATE: self.DATE,
+                    }
+                ]
+            ),
+            PeakAnnotationFilesLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        PeakAnnotationFilesLoader.DataHeaders.FILE: annot_filename,
+                        PeakAnnotationFilesLoader.DataHeaders.FORMAT: (
+                            IsocorrLoader.format_code
+                        ),
+                        PeakAnnotationFilesLoader.DataHeaders.SEQNAME: seqname,
+                    }
+                ]
+            ),
+            MSRunsLoader.DataSheetName: pd.DataFrame(
+                [
+                    {
+                        MSRunsLoader.DataHeaders.SAMPLENAME: sample_name,
+                        MSRunsLoader.DataHeaders.SAMPLEHEADER: sample_name,
+                        MSRunsLoader.DataHeaders.ANNOTNAME: annot_filename,
+                        MSRunsLoader.DataHeaders.SEQNAME: seqname,
+                    }
+                    for sample_name in sample_names
+                ]
+            ),
+        }
+
+    def get_peak_annotations_df(
+        self, study_num: int, rng: random.Random
+    ) -> pd.DataFrame:
+        """Returns the (isocorr formatted) peak annotations of every sample in a study.
+
+        Args:
+            study_num (int)
+            rng (random.Random)
+        Exceptions:
+            None
+        Returns:
+            df (pd.DataFrame)
+        """
+        hdrs = IsocorrLoader.OrigDataHeaders
+        sample_names = [
+            self.get_sample_name(study_num, animal_num, sample_num)
+            for animal_num in range(self.animals)
+            for sample_num in range(self.samples)
+        ]
+        rows = []
+        for cpd_num, compound in enumerate(self.compound_names):
+            parent_mz = 100.0 + cpd_num
+            for label_count in range(self.labels + 1):
+                if label_count == 0:
+                    isotope_label = "C12 PARENT"
+                else:
+                    isotope_label = f"C13-label-{label_count}"
+                row = {
+                    hdrs.COMPOUNDID: compound,
+                    hdrs.FORMULA: self.formula,
+                    hdrs.MEDMZ: parent_mz + label_count * 1.00335,
+                    hdrs.MEDRT: 10.0,
+                    hdrs.ISOTOPELABEL: isotope_label,
+                    hdrs.COMPOUND: compound,
+                    hdrs.PARENT: parent_mz,
+                }
+                for sample_name in sample_names:
+                    row[sample_name] = rng.uniform(0, 1000000.0)
+                rows.append(row)
+        return pd.DataFrame(rows)
+
+
+class Benchmark:
+    """Times loaders, cached functions, BST list pages, advanced searches, and downloads against synthetic studies (see
+    SyntheticStudyGenerator), and reports the results as machine-readable (JSON) data for regression tracking.
+
+    The database must be a disposable (e.g. test) database.  See the benchmark management command.
+    """
+
+    RESULTS_VERSION = 1
+
+    # URL names of the BST list pages
+    LIST_PAGES = [
+        "study_list",
+        "animal_list",
+        "sample_list",
+        "msrunsample_list",
+        "peakgroup_list",
+        "peakdata_list",
+        "compound_list",
+    ]
+
+    # Advanced search formats
+    SEARCH_FORMATS = ["pgtemplate", "pdtemplate", "fctemplate"]
+
+    def __init__(self, generator: SyntheticStudyGenerator, repeat: int = 3):
+        """Constructor.
+
+        Args:
+            generator (SyntheticStudyGenerator)
+            repeat (int): Number of times every (non-load) benchmark is run.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.generator = generator
+        self.repeat = repeat
+        self.results: List[dict] = []
+        self.client = Client()
+
+    def time(
+        self,
+        category: str,
+        name: str,
+        func: Callable,
+        repeat: Optional[int] = None,
+        setup: Optional[Callable] = None,
+        **metadata,
+    ) -> dict:
+        """Times a function and records the result.
+
+        Args:
+            category (str): E.g. "load", "cached_function", "list_page", "search", or "download".
+            name (str): Name of what is being timed.
+            func (Callable): Timed function.  If it returns a dict, that dict is added to the result.
+            repeat (Optional[int]): Number of runs.  Default: self.repeat.
+            setup (Optional[Callable]): Untimed function called before every run.
+            metadata (dict): Additional result data.
+        Exceptions:
+            None
+        Returns:
+            result (dict)
+        """
+        if repeat is None:
+            repeat = self.repeat
+        timings = []
+        result = {"category": category, "name": name, **metadata}
+        try:
+            for _ in range(repeat):
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                output = func()
+                timings.append(time.perf_counter() - start)
+                if isinstance(output, dict):
+                    result.update(output)
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        if len(timings) > 0:
+            result.update(
+                {
+                    "runs": len(timings),
+                    "min": min(timings),
+                    "median": statistics.median(timings),
+                    "mean": statistics.mean(timings),
+                    "max": max(timings),
+                }
+            )
+        self.results.append(result)
+        return result
+
+    def run(self) -> dict:
+        """Generates and loads the synthetic studies and runs every benchmark.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            results (dict): See get_results.
+        """
+        self.benchmark_loads(self.generator.generate())
+        self.benchmark_cached_functions()
+        self.benchmark_list_pages()
+        self.benchmark_searches()
+        self.benchmark_downloads()
+        return self.get_results()
+
+    def benchmark_loads(self, study_files: List[str]):
+        def load(study_file):
+            with profiling(study_file) as profile:
+                call_command("load_study", infile=study_file, skip_mzxmls=True)
+            # Attribute the queries and time to the loader phases
+            return {"profile": profile.as_dict()["scopes"]}
+
+        # Every study is only loaded once
+        for study_file in study_files:
+            self.time(
+                "load",
+                os.path.basename(study_file),
+                lambda study_file=study_file: load(study_file),
+                repeat=1,
+            )
+
+    def benchmark_cached_functions(self):
+        for class_name, func_names in get_cached_method_names().items():
+            model = get_model_by_name(class_name)
+            for func_name in func_names:
+
+                def call_func(model=model, func_name=func_name):
+                    nrecs = 0
+                    for rec in model.objects.all():
+                        getattr(rec, func_name)
+                        nrecs += 1
+                    return {"records": nrecs}
+
+                # Uncached
+                disable_caching_retrievals()
+                disable_caching_updates()
+                try:
+                    uncached = self.time(
+                        "cached_function",
+                        f"{class_name}.{func_name}",
+                        call_func,
+                        cached=False,
+                    )
+                finally:
+                    enable_caching_retrievals()
+                    enable_caching_updates()
+
+                # Cached (built first, untimed)
+                delete_all_caches()
+                call_func()
+                cached = self.time(
+                    "cached_function",
+                    f"{class_name}.{func_name}",
+                    call_func,
+                    cached=True,
+                )
+                if "median" in uncached.keys() and cached.get("median"):
+                    cached["speedup"] = uncached["median"] / cached["median"]
+
+    def benchmark_list_pages(self):
+        for url_name in self.LIST_PAGES:
+            self.time(
+                "list_page",
+                url_name,
+                lambda url_name=url_name: self.get_response_data(
+                    self.client.get(reverse(url_name))
+                ),
+                setup=delete_all_caches,
+            )
+
+    def get_search_args(self, fmt: str) -> list:
+        """Returns the basic search arguments (model, field, comparison, value, and format) of a search for the
+        first study's records.
+        """
+        return ["Study", "name", "iexact", self.generator.get_study_name(0), fmt]
+
+    def benchmark_searches(self):
+        for fmt in self.SEARCH_FORMATS:
+            self.time(
+                "search",
+                fmt,
+                lambda fmt=fmt: self.get_response_data(
+                    self.client.get(
+                        reverse("search_basic", args=self.get_search_args(fmt))
+                    )
+                ),
+                setup=delete_all_caches,
+            )
+
+    def benchmark_downloads(self):
+        from DataRepo.formats.search_group import SearchGroup
+
+        basv_metadata = SearchGroup()
+        for fmt in self.SEARCH_FORMATS:
+            qry = basv_metadata.create_new_basic_query(*self.get_search_args(fmt))
+            self.time(
+                "download",
+                fmt,
+                lambda qry=qry: self.get_response_data(
+                    self.client.post(
+                        reverse("search_advanced_tsv"),
+                        {"qryjson": json.dumps(qry)},
+                    )
+                ),
+                setup=delete_all_caches,
+            )
+
+    @classmethod
+    def get_response_data(cls, response) -> dict:
+        """Consumes a response's content (so that streamed content is generated within the timing) and returns its
+        status code and size.
+
+        Args:
+            response (HttpResponse)
+        Exceptions:
+            None
+        Returns:
+            (dict)
+        """
+        if response.streaming:
+            size = sum(len(chunk) for chunk in response.streaming_content)
+        else:
+            size = len(response.content)
+        return {"status_code": response.status_code, "bytes": size}
+
+    def get_results(self) -> dict:
+        """Returns the results along with the parameters and environment they were obtained with.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (dict)
+        """
+        return {
+            "version": self.RESULTS_VERSION,
+            "timestamp": datetime.now().isoformat(),
+            "parameters": {
+                **self.generator.get_parameters(),
+                "repeat": self.repeat,
+            },
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "platform": platform.platform(),
+            },
+            "results": self.results,
+        }
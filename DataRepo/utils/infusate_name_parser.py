@@ -1,6 +1,5 @@
 import re
-from collections import defaultdict
-from copy import deepcopy
+from functools import lru_cache
 from itertools import zip_longest
 from typing import List, Optional, Tuple, TypedDict
 
@@ -46,6 +45,10 @@ ISOTOPE_LABEL_PATTERN = regex.compile(
     # Match either " PARENT" or repeated counts (e.g. "-labels-2-1")
     + r"(?: (?P<parent>PARENT)|-label(?:-(?P<counts>\d+))+)$"
 )
+# The maximum number of distinct arguments whose parse results are memoized by each parsing function.  Peak annotation
+# files repeat the same few hundred isotope labels thousands of times, and study docs repeat infusate and tracer names.
+# The memoized results are immutable (tuples), from which every call builds new (mutable) dicts for the caller.
+PARSE_CACHE_SIZE = 4096
 
 
 class IsotopeData(TypedDict):
@@ -106,7 +109,7 @@ def parse_infusate_name(
 ) -> InfusateData:
     """
     Takes a complex infusate, coded as a string, and parses it into its optional
-    name, lists of tracer(s) and compounds.
+    name, lists of tracer(s) and compounds.  Results are memoized (see PARSE_CACHE_SIZE).
 
     Args:
         infusate_string (string): A string representation of an infusate
@@ -120,6 +123,13 @@ def parse_infusate_name(
         InfusateParsingError: If unable to properly parse the infusate_string
             and list of concentrations.
     """
+    return _thaw_infusate(_parse_infusate_name(infusate_string, tuple(concentrations)))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_infusate_name(infusate_string: str, concentrations: tuple) -> tuple:
+    """Memoized parse_infusate_name.  Returns the result of _freeze_infusate."""
+    concentrations = list(concentrations)
 
     # defaults
     # assume the string lacks the optional name, and it is all tracer encodings
@@ -148,7 +158,7 @@ def parse_infusate_name(
         }
         parsed_data["tracers"].append(infusate_tracer)
 
-    return parsed_data
+    return _freeze_infusate(parsed_data)
 
 
 # TODO: The infusate name (and tracer name, for that matter) employs a significant digits mechanism to make
@@ -173,6 +183,12 @@ def parse_infusate_name_with_concs(infusate_string: str) -> InfusateData:
     Returns:
         parsed_data (InfusateData): An InfusateData object built using the parsed values.
     """
+    return _thaw_infusate(_parse_infusate_name_with_concs(infusate_string))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_infusate_name_with_concs(infusate_string: str) -> tuple:
+    """Memoized parse_infusate_name_with_concs.  Returns the result of _freeze_infusate."""
 
     # defaults
     # assume the string lacks the optional name, and it is all tracer encodings
@@ -195,7 +211,7 @@ def parse_infusate_name_with_concs(infusate_string: str) -> InfusateData:
         }
         parsed_data["tracers"].append(infusate_tracer)
 
-    return parsed_data
+    return _freeze_infusate(parsed_data)
 
 
 def split_encoded_tracers_string(tracers_string: str) -> List[str]:
@@ -204,6 +220,12 @@ def split_encoded_tracers_string(tracers_string: str) -> List[str]:
 
 
 def parse_tracer_string(tracer: str) -> TracerData:
+    return _thaw_tracer(_parse_tracer_string(tracer))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_tracer_string(tracer: str) -> tuple:
+    """Memoized parse_tracer_string.  Returns the result of _freeze_tracer."""
     tracer_data: TracerData = {
         "unparsed_string": tracer,
         "compound_name": "",
@@ -225,7 +247,7 @@ def parse_tracer_string(tracer: str) -> TracerData:
             f'Encoded tracer "{tracer}" cannot be parsed.  A compound name cannot contain an isotope encoding string.'
         )
 
-    return tracer_data
+    return _freeze_tracer(tracer_data)
 
 
 def parse_tracer_with_conc_string(tracer_string: str) -> Tuple[TracerData, float]:
@@ -240,6 +262,13 @@ def parse_tracer_with_conc_string(tracer_string: str) -> Tuple[TracerData, float
         tracer_data (TracerData)
         concentration (float)
     """
+    tracer, concentration = _parse_tracer_with_conc_string(tracer_string)
+    return _thaw_tracer(tracer), concentration
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_tracer_with_conc_string(tracer_string: str) -> Tuple[tuple, float]:
+    """Memoized parse_tracer_with_conc_string.  Returns the result of _freeze_tracer and the concentration."""
     tracer_data: TracerData = {
         "unparsed_string": "",  # Conc removed below to be compatible with the patterns that omit concentrations...
         "compound_name": "",
@@ -265,10 +294,16 @@ def parse_tracer_with_conc_string(tracer_string: str) -> Tuple[TracerData, float
             "string."
         )
 
-    return tracer_data, concentration
+    return _freeze_tracer(tracer_data), concentration
 
 
 def parse_isotope_string(isotopes_string: str) -> List[IsotopeData]:
+    return _thaw_isotopes(_parse_isotope_string(isotopes_string))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_isotope_string(isotopes_string: str) -> tuple:
+    """Memoized parse_isotope_string.  Returns the result of _freeze_isotopes."""
     if not isotopes_string:
         raise IsotopeParsingError("parse_isotope_string requires a defined string.")
 
@@ -313,7 +348,74 @@ def parse_isotope_string(isotopes_string: str) -> List[IsotopeData]:
             f"parsed: [{parsed_string}]."
         )
 
-    return isotope_data
+    return _freeze_isotopes(isotope_data)
+
+
+def _freeze_isotopes(isotopes: List[IsotopeData]) -> tuple:
+    return tuple(
+        (
+            isotope["element"],
+            isotope["mass_number"],
+            isotope["count"],
+            None if isotope["positions"] is None else tuple(isotope["positions"]),
+        )
+        for isotope in isotopes
+    )
+
+
+def _thaw_isotopes(frozen: tuple) -> List[IsotopeData]:
+    return [
+        IsotopeData(
+            element=element,
+            mass_number=mass_number,
+            count=count,
+            positions=None if positions is None else list(positions),
+        )
+        for element, mass_number, count, positions in frozen
+    ]
+
+
+def _freeze_tracer(tracer_data: TracerData) -> tuple:
+    return (
+        tracer_data["unparsed_string"],
+        tracer_data["compound_name"],
+        _freeze_isotopes(tracer_data["isotopes"]),
+    )
+
+
+def _thaw_tracer(frozen: tuple) -> TracerData:
+    unparsed_string, compound_name, isotopes = frozen
+    return TracerData(
+        unparsed_string=unparsed_string,
+        compound_name=compound_name,
+        isotopes=_thaw_isotopes(isotopes),
+    )
+
+
+def _freeze_infusate(infusate_data: InfusateData) -> tuple:
+    return (
+        infusate_data["unparsed_string"],
+        infusate_data["infusate_name"],
+        tuple(
+            (
+                _freeze_tracer(infusate_tracer["tracer"]),
+                infusate_tracer["concentration"],
+            )
+            for infusate_tracer in infusate_data["tracers"]
+        ),
+    )
+
+
+def _thaw_infusate(frozen: tuple) -> InfusateData:
+    unparsed_string, infusate_name, tracers = frozen
+    return InfusateData(
+        unparsed_string=unparsed_string,
+        infusate_name=infusate_name,
+        tracers=[
+            InfusateTracerData(tracer=_thaw_tracer(tracer), concentration=concentration)
+            for tracer, concentration in tracers
+        ],
+    )
 
 
 def parse_tracer_concentrations(tracer_concs_str: str) -> List[float]:
@@ -350,6 +452,9 @@ def parse_isotope_label(
     string, that element will not be parsed from the string. For example, on "PARENT" rows, even though "C12" exists
     in the string, an empty list is returned unless possible_observations is supplied.
 
+    Results are memoized by label and possible observations (see PARSE_CACHE_SIZE), since peak annotation files repeat
+    the same labels for every compound.
+
     Args:
         label (str): The isotopeLabel string from the DataFrame.
         possible_observations (Optional[List[ObservedIsotopeData]]): A list of isotopes that are potentially present
@@ -363,80 +468,98 @@ def parse_isotope_label(
         isotope_observations (List[ObservedIsotopeData]): List of isotopes.  Note, PARENT records have no isotopes, but
             a list of possible_observations with 0 counts is returned.
     """
+    # Labels are parsed before possible_observations is used, so that unparseable labels always raise a parsing error
+    _match_isotope_label(label)
+
+    if possible_observations is None:
+        possible = None
+    else:
+        possible = tuple(
+            (pos["element"], pos["mass_number"], pos["count"], pos["parent"])
+            for pos in possible_observations
+        )
+    return [
+        ObservedIsotopeData(
+            element=element, mass_number=mass_number, count=count, parent=parent
+        )
+        for element, mass_number, count, parent in _parse_isotope_label(label, possible)
+    ]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_isotope_label(label, possible: Optional[tuple]) -> tuple:
+    """Memoized parse_isotope_label.  The possible observations and the returned observations are (element,
+    mass_number, count, parent) tuples.
+    """
+    elements, mass_numbers, counts, parent_str = _match_isotope_label(label)
+
+    if parent_str is not None and parent_str == "PARENT":
+        if possible is None:
+            return ()
+        # Every possible observation, with a 0 count (without duplicates)
+        return tuple(
+            dict.fromkeys(
+                (element, mass_number, 0, parent)
+                for element, mass_number, _, parent in possible
+            )
+        )
+
+    if len(elements) != len(mass_numbers) or len(elements) != len(counts):
+        raise ObservedIsotopeUnbalancedError(
+            list(elements), list(mass_numbers), list(counts), label
+        )
+
     isotope_observations = []
+    seen_elements = set()
+    dupe_indexes = []
+    for index, element in enumerate(elements):
+        isotope_observations.append(
+            (element, int(mass_numbers[index]), int(counts[index]), False)
+        )
+        if element in seen_elements:
+            dupe_indexes.append(index)
+        seen_elements.add(element)
+
+    # Add 0-counts for isotopes that were not observed, but could have been
+    if possible is not None:
+        observed = set(isotope_observations)
+        for element, mass_number, _, _ in possible:
+            zero_obs = (element, mass_number, 0, False)
+            if element not in seen_elements and zero_obs not in observed:
+                isotope_observations.append(zero_obs)
+                observed.add(zero_obs)
+        parent_elements = [pos[0] for pos in possible]
+        unexpected_observations = [
+            element for element in elements if element not in parent_elements
+        ]
+        if len(unexpected_observations) > 0:
+            raise UnexpectedLabel(unexpected_observations, parent_elements)
+
+    if len(dupe_indexes) > 0:
+        # If there are multiple isotope measurements that match the same parent tracer labeled element
+        # E.g. C13N15C13-label-2-1-1 would match C13 twice
+        # We only need to call attention to 1
+        dupe_elems_str = ", ".join(
+            [f"{elements[i]}{mass_numbers[i]}" for i in dupe_indexes]
+        )
+        raise IsotopeStringDupe(label, dupe_elems_str)
+
+    return tuple(isotope_observations)
 
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _match_isotope_label(label) -> tuple:
+    """Memoized match of ISOTOPE_LABEL_PATTERN.  Returns the elements, mass numbers, and counts (tuples of strings) and
+    the parent string.
+    """
     match = regex.match(ISOTOPE_LABEL_PATTERN, label)
 
-    if match:
-        elements = match.captures("elements")
-        mass_numbers = match.captures("mass_numbers")
-        counts = match.captures("counts")
-        parent_str = match.group("parent")
-        parent = False
-
-        if parent_str is not None and parent_str == "PARENT":
-            if possible_observations is not None:
-                for pos_obs in possible_observations:
-                    zero_obs = deepcopy(pos_obs)
-                    zero_obs["count"] = 0
-                    if zero_obs not in isotope_observations:
-                        isotope_observations.append(zero_obs)
-                return isotope_observations
-            return []
-        else:
-            if len(elements) != len(mass_numbers) or len(elements) != len(counts):
-                raise ObservedIsotopeUnbalancedError(
-                    elements, mass_numbers, counts, label
-                )
-            else:
-                dupe_check = defaultdict(list)
-                dupe_indexes = []
-                for index in range(len(elements)):
-                    obs = ObservedIsotopeData(
-                        element=elements[index],
-                        mass_number=int(mass_numbers[index]),
-                        count=int(counts[index]),
-                        parent=parent,
-                    )
-                    isotope_observations.append(obs)
-                    dupe_check[elements[index]].append(obs)
-                    if len(dupe_check[elements[index]]) > 1:
-                        dupe_indexes.append(index)
-
-                # Add 0-counts for isotopes that were not observed, but could have been
-                if possible_observations is not None:
-                    for pos_obs in possible_observations:
-                        if pos_obs["element"] not in elements:
-                            zero_obs = deepcopy(pos_obs)
-                            zero_obs["count"] = 0
-                            zero_obs["parent"] = False
-                            if zero_obs not in isotope_observations:
-                                isotope_observations.append(zero_obs)
-                    parent_elements = [
-                        pos_obs["element"] for pos_obs in possible_observations
-                    ]
-                    unexpected_observations = []
-                    for element in elements:
-                        if element not in parent_elements:
-                            unexpected_observations.append(element)
-                    if len(unexpected_observations) > 0:
-                        raise UnexpectedLabel(
-                            unexpected_observations,
-                            [pe["element"] for pe in possible_observations],
-                        )
-
-                if len(dupe_indexes) > 0:
-                    # If there are multiple isotope measurements that match the same parent tracer labeled element
-                    # E.g. C13N15C13-label-2-1-1 would match C13 twice
-                    # We only need to call attention to 1
-                    dupe_elems_str = ", ".join(
-                        [f"{elements[i]}{mass_numbers[i]}" for i in dupe_indexes]
-                    )
-                    raise IsotopeStringDupe(
-                        label,
-                        dupe_elems_str,
-                    )
-    else:
+    if not match:
         raise ObservedIsotopeParsingError(f"Unable to parse isotope label: [{label}]")
 
-    return isotope_observations
+    return (
+        tuple(match.captures("elements")),
+        tuple(match.captures("mass_numbers")),
+        tuple(match.captures("counts")),
+        match.group("parent"),
+    )
@@ -3,6 +3,7 @@ from .models import (
     AnimalListView,
     AnimalTreatmentListView,
     ArchiveFileDetailView,
+    ArchiveFileDownloadView,
     ArchiveFileListView,
     CompoundDetailView,
     CompoundListView,
@@ -36,17 +37,24 @@ from .search import (
     search_basic,
     view_search_results,
 )
-from .upload import BuildSubmissionView
+from .upload import (
+    BuildSubmissionView,
+    cancel_validation_job,
+    validation_job_status,
+)
 
 __all__ = [
     "home",
     "BuildSubmissionView",
+    "cancel_validation_job",
+    "validation_job_status",
     "search_basic",
     "view_search_results",
     "AdvancedSearchView",
     "AdvancedSearchDownloadView",
     "AdvancedSearchDownloadMzxmlZIPView",
     "ArchiveFileDetailView",
+    "ArchiveFileDownloadView",
     "ArchiveFileListView",
     "CompoundListView",
     "CompoundDetailView",
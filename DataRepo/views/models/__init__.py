@@ -1,5 +1,9 @@
 from .animal import AnimalDetailView, AnimalListView
-from .archive_file import ArchiveFileDetailView, ArchiveFileListView
+from .archive_file import (
+    ArchiveFileDetailView,
+    ArchiveFileDownloadView,
+    ArchiveFileListView,
+)
 from .compound import CompoundDetailView, CompoundListView
 from .infusate import InfusateDetailView, InfusateListView
 from .lcmethod import LCMethodDetailView, LCMethodListView
@@ -15,6 +19,7 @@ from .tracer import TracerDetailView, TracerListView
 
 __all__ = [
     "ArchiveFileDetailView",
+    "ArchiveFileDownloadView",
     "ArchiveFileListView",
     "CompoundListView",
     "CompoundDetailView",
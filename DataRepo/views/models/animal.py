@@ -10,6 +10,7 @@ from DataRepo.views.models.bst.query import BSTListView
 
 class AnimalListView(BSTListView):
     model = Animal
+    search_index = True
     column_ordering = [
         "name",
         "studies",
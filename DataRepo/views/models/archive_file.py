@@ -9,6 +9,7 @@ from django.db.models import (
     When,
 )
 from django.db.models.aggregates import Count, Min
+from django.http import Http404, StreamingHttpResponse
 from django.views.generic import DetailView
 
 from DataRepo.models import DATETIME_FORMAT, DBSTRING_FUNCTION, ArchiveFile
@@ -117,3 +118,30 @@ class ArchiveFileDetailView(DetailView):
 
     model = ArchiveFile
     template_name = "models/archive_file/archive_file_detail.html"
+
+
+class ArchiveFileDownloadView(DetailView):
+    """Streams the content of an ArchiveFile's saved file as an attachment named after the file.  Files that the archive
+    stores compressed (see ArchiveStorage) are streamed decompressed (in chunks), so that the download is the file that
+    was archived, not its compressed copy (which is what the file's storage URL serves).
+    """
+
+    model = ArchiveFile
+
+    def render_to_response(self, context, **response_kwargs):
+        if not self.object.file_location:
+            raise Http404(f"Archive file '{self.object.filename}' has no saved file.")
+
+        def file_iterator():
+            with self.object.file_location.open("rb") as fl:
+                for chunk in fl.chunks():
+                    yield chunk
+
+        return StreamingHttpResponse(
+            file_iterator(),
+            content_type="application/octet-stream",
+            headers={
+                "Content-Disposition": f'attachment; filename="{self.object.filename}"',
+                "Content-Length": str(self.object.file_location.size),
+            },
+        )
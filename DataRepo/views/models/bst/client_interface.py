@@ -10,6 +10,7 @@ from DataRepo.models.utilities import model_title, model_title_plural
 from DataRepo.utils.exceptions import DeveloperWarning
 from DataRepo.utils.text_utils import camel_to_title
 from DataRepo.views.models.bst.column.base import BSTBaseColumn
+from DataRepo.views.models.bst.page_cache import BSTPageCache
 from DataRepo.views.models.bst.utils import SizedPaginator
 from DataRepo.views.utils import delete_cookie, get_cookie, get_cookie_dict
 
@@ -35,6 +36,8 @@ class BSTClientInterface:
         title (Optional[str]): The page title
         above_template (Optional[str]): Path to a template to include above the table.
         below_template (Optional[str]): Path to a template to include below the table.
+        page_cache (bool) [True]: Whether rendered pages are cached (if settings.BST_PAGE_CACHE is True).  See
+            BSTPageCache.
     Instance Attributes:
         warnings (List[str]) [[]]
     """
@@ -52,9 +55,33 @@ class BSTClientInterface:
     above_template: Optional[str] = None
     below_template: Optional[str] = None
 
+    page_cache: bool = True
+
     def __init__(self):
         self.warnings: List[str] = []
 
+    def get_page_cache(self) -> Optional[BSTPageCache]:
+        """Returns the page cache for the current request, or None if page caching is disabled.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (Optional[BSTPageCache])
+        """
+        if (
+            not self.page_cache
+            or not settings.BST_PAGE_CACHE
+            or self.request.method not in ("GET", "HEAD")
+        ):
+            return None
+        return BSTPageCache.from_view(self, self.request)
+
+    def is_page_cacheable(self) -> bool:
+        """Whether the rendered page can be cached, i.e. it does not contain warnings specific to the request."""
+        return len(self.warnings) == 0
+
 
 class BSTListViewClient(BSTClientInterface, ListView):
     """This is a server-side interface to the Bootstrap Table javascript and cookies in the client's browser,
@@ -570,6 +597,14 @@ class BSTListViewClient(BSTClientInterface, ListView):
         for col in columns:
             self.reset_column_cookie(col, name)
 
+    def is_page_cacheable(self) -> bool:
+        """An extension of the superclass method that excludes pages that reset the browser's cookies."""
+        return (
+            super().is_page_cacheable()
+            and not self.clear_cookies
+            and len(self.cookie_resets) == 0
+        )
+
     def reset_cookie(self, name: str):
         """Adds a cookie to the cookie_resets list and removes the cookie from the request object.
 
@@ -3,8 +3,8 @@ from warnings import warn
 
 from django.conf import settings
 from django.db import ProgrammingError
-from django.db.models import Field, Model
-from django.db.models.aggregates import Count
+from django.db.models import Field, Model, OuterRef, Subquery
+from django.db.models.aggregates import Aggregate, Count
 from django.db.models.expressions import Combinable, Expression
 
 from DataRepo.models.utilities import (
@@ -12,6 +12,7 @@ from DataRepo.models.utilities import (
     field_path_to_model_path,
     get_model_by_name,
     is_key_field,
+    is_many_related_to_root,
     is_number_field,
     is_string_field,
     model_path_to_model,
@@ -63,6 +64,9 @@ class BSTAnnotColumn(BSTBaseColumn):
     # Overrides BSTBaseColumn.is_annotation
     is_annotation = True
 
+    # The name of the aggregate annotation inside correlated subqueries (see correlate_aggregate)
+    correlated_annot_name = "bstcorrelated"
+
     def __init__(
         self,
         name: str,
@@ -106,6 +110,8 @@ class BSTAnnotColumn(BSTBaseColumn):
                     help_text and populate (or add to) the column header's tooltip.
                 2. self.related_model_paths will be set, which can be used to populate the arguments to prefetch_related
                     in order to make queries faster when filtering on an annotations value.
+                3. If the converter is a Count of a many-related field path, it will be annotated as a correlated
+                    subquery (see correlate_aggregate).
             help_text (bool) [True]: Whether to use the field extracted from the converter's help_text to populate the
                 tooltip.  Ignored if model is None.
         Exceptions:
@@ -153,6 +159,18 @@ class BSTAnnotColumn(BSTBaseColumn):
                     f"'{name}' expression '{converter}'.  {te}"
                 )
 
+        # Many-related counts are compiled into correlated subqueries, so that multiple counts do not join all of their
+        # paths in the main query (multiplying its rows) and so that they can be evaluated for a page of records only
+        self.correlated = (
+            isinstance(converter, Count)
+            and isinstance(model, type)
+            and any(is_many_related_to_root(fp, model) for fp in self.field_paths)
+        )
+        # The expression to annotate (and sort by)
+        self.expression: Combinable = (
+            self.correlate_aggregate(converter, model) if self.correlated else converter
+        )
+
         if (
             settings.DEBUG
             and model is None
@@ -238,7 +256,30 @@ class BSTAnnotColumn(BSTBaseColumn):
             )
         if "name" not in kwargs.keys() or kwargs["name"] is None:
             kwargs["name"] = self.name
-        return BSTAnnotSorter(self.converter, **kwargs)
+        return BSTAnnotSorter(self.expression, **kwargs)
+
+    @classmethod
+    def correlate_aggregate(cls, aggregate: Aggregate, model: Type[Model]) -> Subquery:
+        """Compiles an aggregate (e.g. a Count of many-related records) into a correlated subquery that computes the
+        aggregate for each root model record independently.  Unlike the aggregate itself, the subquery does not add
+        joins (or a GROUP BY) to the query it is annotated on, so it is unaffected by that query's filters, and multiple
+        such annotations do not multiply the number of intermediate rows.
+
+        Args:
+            aggregate (Aggregate)
+            model (Type[Model]): The root model the aggregate's field paths start from.
+        Exceptions:
+            None
+        Returns:
+            (Subquery)
+        """
+        return Subquery(
+            model.objects.filter(pk=OuterRef("pk"))
+            .order_by()
+            .annotate(**{cls.correlated_annot_name: aggregate})
+            .values(cls.correlated_annot_name),
+            output_field=aggregate.output_field,
+        )
 
     def create_filterer(
         self, field: Optional[str] = None, **kwargs
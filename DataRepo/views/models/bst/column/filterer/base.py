@@ -7,10 +7,57 @@ from typing import Callable, Dict, List, NamedTuple, Optional, Union
 from warnings import warn
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 
+from DataRepo.models import hier_cached_model
 from DataRepo.utils.exceptions import DeveloperWarning, trace
 
+# The cache key prefix of select list choices (see get_cached_choices)
+CHOICES_KEY_PREFIX = "BSTFilterer.choices"
+
+
+def get_cached_choices(key: str, get_choices: Callable):
+    """Returns select list choices from the cache, computing and caching them if they are not cached.  Choices are
+    derived from the data, so the cache key includes the data version (see get_data_version), which changes after loads,
+    maintained field updates, and every committed save or delete of a record.  The cached choices are shared by every
+    request and process using the cache.
+
+    Args:
+        key (str): Uniquely identifies the choices, e.g. "<model name>.<field path>".
+        get_choices (Callable): A function without arguments that returns the choices.
+    Exceptions:
+        Raises exceptions from the cache only if caching errors are enabled.
+    Returns:
+        choices (Union[Dict[str, str], List[str]])
+    """
+    if not hier_cached_model.caching_retrievals_enabled():
+        return get_choices()
+    try:
+        cache_key = f"{CHOICES_KEY_PREFIX}.{key}.{hier_cached_model.get_data_version()}"
+        choices = cache.get(cache_key)
+        if choices is None:
+            choices = get_choices()
+            if hier_cached_model.caching_updates_enabled():
+                cache.set(cache_key, choices)
+        return choices
+    except Exception as e:
+        if hier_cached_model.THROW_CACHE_ERRORS:
+            raise e
+        print(f"WARNING: Choices cache error for '{key}': {type(e).__name__}: {e}")
+        return get_choices()
+
+
+def get_choices_cache_key(func: Callable) -> Optional[str]:
+    """Returns the key under which the choices returned by a choices function are cached, or None if the function
+    cannot be identified across processes (e.g. lambdas and nested functions, whose results are not cached).
+    """
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        return None
+    return f"{module}.{qualname}"
+
 
 class InputMethods(NamedTuple):
     TEXT: str
@@ -191,7 +238,8 @@ class BSTBaseFilterer(ABC):
                 See https://docs.djangoproject.com/en/5.1/topics/db/queries/#field-lookups.
             choices (Optional[Union[Dict[str, str], List[str], Callable]]): Values to populate a select list, if
                 input_method is "select".  If a function name is provided, the function must not take any arguments.  It
-                must return either a list or dict of strings.
+                must return either a list or dict of strings.  The return of module-level functions and methods is
+                cached (see get_cached_choices).
                 NOTE: Supplying this value will automatically set the input_method to "select".
                 TODO: choices could be used for auto-complete in the text input method.
             initial (Optional[str]): Initial filter search term.
@@ -213,7 +261,11 @@ class BSTBaseFilterer(ABC):
 
         if choices is not None and not isinstance(choices, (dict, list)):
             if callable(choices):
-                choices = choices()
+                key = get_choices_cache_key(choices)
+                if key is None:
+                    choices = choices()
+                else:
+                    choices = get_cached_choices(key, choices)
             else:
                 raise TypeError(
                     f"choices must be a 'Dict[str, str]', 'List[str]', or 'Callable', not '{type(choices).__name__}'."
@@ -455,6 +507,11 @@ class BSTBaseFilterer(ABC):
             return Q(**{f"{self.name}__isnull": True})
         return Q(**{f"{self.name}__{self._server_filterer.lookup}": term})
 
+    @property
+    def lookup(self) -> str:
+        """The Django field lookup (e.g. "icontains") that create_q_exp uses."""
+        return self._server_filterer.lookup
+
     @property
     def choices_json(self):
         """Returns the json to supply to Bootstrap Table's data-filter-data attribute (which must be preceded by
@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Dict, Type
 
 from django.db.models import Model
 
@@ -8,7 +8,10 @@ from DataRepo.models.utilities import (
     is_many_related_to_root,
     is_number_field,
 )
-from DataRepo.views.models.bst.column.filterer.base import BSTBaseFilterer
+from DataRepo.views.models.bst.column.filterer.base import (
+    BSTBaseFilterer,
+    get_cached_choices,
+)
 
 
 class BSTFilterer(BSTBaseFilterer):
@@ -87,17 +90,10 @@ class BSTFilterer(BSTBaseFilterer):
                 f"choices {choices} and distinct_choices '{distinct_choices}' are mutually exclusive."
             )
         elif choices is None and distinct_choices:
-            # If field_path is a foreign key, the way to construct the query is by getting all of the related model's
-            # ordering fields, to avoid errors
-            distinct_fields = get_distinct_fields(self.model, self.field_path)
-            choices = {}
-            for val in list(
-                self.model.objects.order_by(*distinct_fields)
-                .distinct(*distinct_fields)
-                .values_list(self.field_path, flat=True)
-            ):
-                # The displayed and filterable values will be how the related model's objects render in string context
-                choices[str(val)] = str(val)
+            # The distinct values query covers the whole model, so it is cached across requests (per data version)
+            choices = get_cached_choices(
+                f"{self.model.__name__}.{self.field_path}", self.get_distinct_choices
+            )
         elif (
             choices is None
             and hasattr(self.field, "choices")
@@ -153,6 +149,29 @@ class BSTFilterer(BSTBaseFilterer):
 
         super().__init__(name, *args, **kwargs)
 
+    def get_distinct_choices(self) -> Dict[str, str]:
+        """Queries the distinct values of the field path to populate a select list.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            choices (Dict[str, str])
+        """
+        # If field_path is a foreign key, the way to construct the query is by getting all of the related model's
+        # ordering fields, to avoid errors
+        distinct_fields = get_distinct_fields(self.model, self.field_path)
+        choices = {}
+        for val in list(
+            self.model.objects.order_by(*distinct_fields)
+            .distinct(*distinct_fields)
+            .values_list(self.field_path, flat=True)
+        ):
+            # The displayed and filterable values will be how the related model's objects render in string context
+            choices[str(val)] = str(val)
+        return choices
+
     def get_default_client_filterer(self, choices):
         """Returns a default client_filterer.
 
@@ -0,0 +1,140 @@
+import hashlib
+import re
+from typing import Optional
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    quote_etag,
+)
+
+from DataRepo.models.hier_cached_model import get_data_version
+
+# The cache key prefix of rendered BST pages
+PAGE_CACHE_KEY_PREFIX = "BSTPageCache"
+# CSRF tokens are specific to the browser, so they are swapped out for a placeholder in the cached pages
+CSRF_TOKEN_PATTERN = re.compile(r'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+CSRF_TOKEN_PLACEHOLDER = "BSTPAGECACHECSRFTOKEN"
+
+
+class BSTPageCache:
+    """A cache of the rendered pages of a BST list or detail view, keyed on the view class, the state of the request
+    that the view's content depends on (the view's cookies, the URL parameters [e.g. page, limit, and subquery search
+    terms], the URL keyword arguments [e.g. a detail view's primary key], and the user), and the data version (see
+    get_data_version), which changes after loads, maintained field updates, and every committed save or delete of a
+    record.
+
+    The key also serves as the pages' ETag, so that browsers revalidating a page (e.g. when navigating back and forth
+    through a list) get a 304 (Not Modified) response without the page being rendered or retrieved from the cache.
+
+    Usage:
+        See BSTClientInterface.get_page_cache and settings.BST_PAGE_CACHE.
+    """
+
+    def __init__(self, view_name: str, state: str):
+        """Constructor.
+
+        Args:
+            view_name (str): The view class's module-qualified name.
+            state (str): A normalized representation of the request state that the page's content depends on.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.view_name = view_name
+        self.state = state
+        # Retrieved once, so that the ETag and the cached page always refer to the same data version
+        self.version = get_data_version()
+
+    @classmethod
+    def from_view(cls, view, request: HttpRequest) -> "BSTPageCache":
+        """Creates the page cache of a BST view instance for a request.
+
+        Empty cookies are ignored, because BSTClientInterface.get_cookie treats them as absent.
+
+        Args:
+            view (BSTClientInterface)
+            request (HttpRequest)
+        Exceptions:
+            None
+        Returns:
+            (BSTPageCache)
+        """
+        cookie_prefix = getattr(view, "cookie_prefix", None)
+        cookies = sorted(
+            (name, val)
+            for name, val in request.COOKIES.items()
+            if cookie_prefix is not None and name.startswith(cookie_prefix) and val
+        )
+        params = sorted((name, request.GET.getlist(name)) for name in request.GET)
+        kwargs = sorted((name, str(val)) for name, val in view.kwargs.items())
+        user = getattr(request, "user", None)
+        user_id = user.pk if user is not None and user.is_authenticated else None
+        view_name = f"{type(view).__module__}.{type(view).__qualname__}"
+        return cls(view_name, repr((cookies, params, kwargs, user_id)))
+
+    @property
+    def key(self) -> str:
+        digest = hashlib.md5(self.state.encode()).hexdigest()
+        return f"{PAGE_CACHE_KEY_PREFIX}.{self.view_name}.{digest}.{self.version}"
+
+    @property
+    def etag(self) -> str:
+        return quote_etag(hashlib.md5(self.key.encode()).hexdigest())
+
+    def add_headers(self, response: HttpResponse):
+        """Adds the ETag to a response and makes browsers revalidate it (so that data changes are not missed)."""
+        response["ETag"] = self.etag
+        patch_cache_control(response, private=True, no_cache=True)
+
+    def get_response(self, request: HttpRequest) -> Optional[HttpResponse]:
+        """Returns a 304 (Not Modified) response if the request's If-None-Match header matches the page's ETag, the
+        cached page if it is cached, or None.
+
+        Args:
+            request (HttpRequest)
+        Exceptions:
+            None
+        Returns:
+            response (Optional[HttpResponse])
+        """
+        response = get_conditional_response(request, etag=self.etag)
+        if response is not None:
+            self.add_headers(response)
+            return response
+
+        cached = cache.get(self.key)
+        if cached is None:
+            return None
+
+        content, content_type = cached
+        if CSRF_TOKEN_PLACEHOLDER in content:
+            content = content.replace(CSRF_TOKEN_PLACEHOLDER, get_token(request))
+        response = HttpResponse(content, content_type=content_type)
+        self.add_headers(response)
+        return response
+
+    def set_response(self, response: HttpResponse):
+        """Renders (if necessary) and caches a successful response, and adds the page's ETag to it.
+
+        Args:
+            response (HttpResponse): E.g. the TemplateResponse returned by the view's get method.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        if response.status_code != 200 or response.streaming:
+            return
+        if hasattr(response, "render"):
+            response.render()
+        content = CSRF_TOKEN_PATTERN.sub(
+            rf"\g<1>{CSRF_TOKEN_PLACEHOLDER}\g<2>",
+            response.content.decode(response.charset),
+        )
+        cache.set(self.key, (content, response["Content-Type"]))
+        self.add_headers(response)
@@ -18,6 +18,7 @@ from DataRepo.models.utilities import (
     get_many_related_field_val_by_subquery,
     is_many_related_to_root,
 )
+from DataRepo.profiling import profile_scope
 from DataRepo.utils.exceptions import DeveloperWarning, trace
 from DataRepo.views.models.bst.column.annotation import BSTAnnotColumn
 from DataRepo.views.models.bst.column.base import BSTBaseColumn
@@ -33,6 +34,7 @@ from DataRepo.views.models.bst.column_setup import (
     BSTBaseDetailView,
     BSTBaseListView,
 )
+from DataRepo.views.models.bst.search_index import BSTSearchIndex
 
 
 # TODO: Figure out how to move this to .utils without a circular import error
@@ -352,6 +354,31 @@ class BSTDetailView(BSTBaseDetailView, BSTQueryView):
         # We can get the annotations right away, because none of it is based on cookies.
         self.annots: Dict[str, Combinable] = self.get_annotations()
 
+    def get(self, request, *args, **kwargs):
+        """Extends DetailView.get to serve unchanged pages from the page cache (see BSTPageCache).
+
+        Args:
+            request (HttpRequest)
+        Exceptions:
+            None
+        Returns:
+            response (HttpResponse)
+        """
+        self.request = request
+
+        page_cache = self.get_page_cache()
+        if page_cache is not None:
+            cached_response = page_cache.get_response(request)
+            if cached_response is not None:
+                return cached_response
+
+        response = super().get(request, *args, **kwargs)
+
+        if page_cache is not None and self.is_page_cacheable():
+            page_cache.set_response(response)
+
+        return response
+
     def get_object(self, **kwargs):
         object: Model = super().get_object(**kwargs)
 
@@ -415,7 +442,7 @@ class BSTDetailView(BSTBaseDetailView, BSTQueryView):
         annotations: Dict[str, Combinable] = {}
         for column in self.columns.values():
             if isinstance(column, BSTAnnotColumn):
-                annotations[column.name] = column.converter
+                annotations[column.name] = column.expression
         return annotations
 
 
@@ -466,8 +493,19 @@ class BSTListView(BSTBaseListView, BSTQueryView):
     to this list view.  The supplied value must be an exact search term (case sensitive) for the related field.  The
     queryset will be limited to JUST records linked with that related model record/field and the title will be changed
     to specify the search fields and values.
+
+    ## Search index
+
+    Set search_index = True to perform the global search using a trigram-indexed search document per record (see
+    BSTSearchIndex) instead of an icontains lookup on every searchable column.  Columns that are not searchable (e.g.
+    because their lookups are too slow) can be searched via the index only, by adding them to search_index_columns.
     """
 
+    # Whether the global search uses a BSTSearchIndex (when it is current)
+    search_index: bool = False
+    # Names of unsearchable columns whose values are searched when the global search uses the BSTSearchIndex
+    search_index_columns: List[str] = []
+
     def __init__(self, *args, query_mode=None, **kwargs):
         BSTBaseListView.__init__(self, *args, **kwargs)
         BSTQueryView.__init__(self, query_mode=query_mode)
@@ -477,6 +515,7 @@ class BSTListView(BSTBaseListView, BSTQueryView):
         self.presubset_annots: Dict[str, Combinable] = {}
         self.prefilter_annots: Dict[str, Combinable] = {}
         self.postfilter_annots: Dict[str, Combinable] = {}
+        self.page_annots: Dict[str, Combinable] = {}
 
     def get(self, request, *args, **kwargs):
         """Extends BSTBaseListView.get, and is used here to set the filters, sorts, and annotations based on the cookies
@@ -512,6 +551,13 @@ class BSTListView(BSTBaseListView, BSTQueryView):
             subquery_url = f"{base_url}&{subquery_param}"
             return redirect(subquery_url)
 
+        # Serve unchanged pages from the page cache (or tell the browser that its copy is current)
+        page_cache = self.get_page_cache()
+        if page_cache is not None:
+            cached_response = page_cache.get_response(request)
+            if cached_response is not None:
+                return cached_response
+
         self.init_interface()
 
         # Now that the search criteria and other query elements are initialized from the cookies, trigger the query
@@ -540,6 +586,9 @@ class BSTListView(BSTBaseListView, BSTQueryView):
             except Exception:
                 raise e
 
+        if page_cache is not None and self.is_page_cacheable():
+            page_cache.set_response(response)
+
         return response
 
     def init_interface(self):
@@ -577,6 +626,7 @@ class BSTListView(BSTBaseListView, BSTQueryView):
             self.prefilter_annots,
             self.postfilter_annots,
         ) = self.get_annotations()
+        self.page_annots = self.get_page_annotations()
 
     def init_subquery(self):
         """Initializes the presubset_annots.  Some annotations' values can be affected by subquery search terms, so
@@ -722,6 +772,10 @@ class BSTListView(BSTBaseListView, BSTQueryView):
             *args, **kwargs
         )
 
+        # The counts of the many-related columns' values (which limit the values collected below) can be among these
+        if len(self.page_annots.keys()) > 0:
+            self.apply_page_annotations(object_list)
+
         # If there are any many-related or annotated columns
         if any(
             isinstance(c, (BSTManyRelatedColumn, BSTAnnotColumn))
@@ -739,25 +793,27 @@ class BSTListView(BSTBaseListView, BSTQueryView):
                     # If this is a many-related column
                     if isinstance(column, BSTManyRelatedColumn):
 
-                        if self.query_mode == QueryMode.SUBQUERY:
-                            subrecs = self.get_many_related_column_val_by_subquery(
-                                rec, column
-                            )
-                        elif self.query_mode == QueryMode.ITERATE:
-                            subrecs = self.get_column_val_by_iteration(rec, column)
-                        else:
-                            raise NotImplementedError(
-                                f"QueryMode {self.query_mode} not implemented."
-                            )
+                        with profile_scope("bst_column", column.name):
+                            if self.query_mode == QueryMode.SUBQUERY:
+                                subrecs = self.get_many_related_column_val_by_subquery(
+                                    rec, column
+                                )
+                            elif self.query_mode == QueryMode.ITERATE:
+                                subrecs = self.get_column_val_by_iteration(rec, column)
+                            else:
+                                raise NotImplementedError(
+                                    f"QueryMode {self.query_mode} not implemented."
+                                )
 
                         column.set_list_attr(rec, subrecs)
 
                     elif isinstance(column, BSTAnnotColumn) and column.is_fk:
 
                         # See if there are any foreign key annotations
-                        model_obj: Model = column.get_model_object(
-                            getattr(rec, column.name)
-                        )
+                        with profile_scope("bst_column", column.name):
+                            model_obj: Model = column.get_model_object(
+                                getattr(rec, column.name)
+                            )
 
                         if model_obj is not None:
                             setattr(rec, column.name, model_obj)
@@ -819,6 +875,14 @@ class BSTListView(BSTBaseListView, BSTQueryView):
         if self.search_term is None:
             return q_exp
 
+        # The search term "None" matches empty values, which are not in the search documents
+        if self.search_index and self.search_term != "None":
+            search_index = BSTSearchIndex.from_view(self)
+            if search_index.is_current():
+                return search_index.create_q_exp(self.search_term)
+            # Fall back to searching the columns until the index has been refreshed
+            search_index.schedule_refresh()
+
         for column in self.columns.values():
             if column.searchable:
                 # TODO: Consider making it possible to use icontains when the input method is select (for a particular
@@ -895,7 +959,10 @@ class BSTListView(BSTBaseListView, BSTQueryView):
                     or column.name not in self.presubset_annots.keys()
                 )
             ):
-                if (
+                if self.is_page_annotation(column, filter_dict):
+                    # Evaluated for the paginated records only (see get_page_annotations)
+                    pass
+                elif (
                     self.search_term is None
                     and column.name not in filter_dict.keys()
                     and not any(
@@ -903,9 +970,9 @@ class BSTListView(BSTBaseListView, BSTQueryView):
                         for mrmp in filtered_mr_model_paths
                     )
                 ):
-                    annotations_after_filter[column.name] = column.converter
+                    annotations_after_filter[column.name] = column.expression
                 else:
-                    annotations_before_filter[column.name] = column.converter
+                    annotations_before_filter[column.name] = column.expression
             if column.name == self.sort_col.name:
                 annotations_after_filter[column.sorter.annot_name] = (
                     column.sorter.expression
@@ -915,6 +982,74 @@ class BSTListView(BSTBaseListView, BSTQueryView):
 
         return annotations_before_filter, annotations_after_filter
 
+    def is_page_annotation(
+        self, column: BSTBaseColumn, filter_dict: Dict[str, str]
+    ) -> bool:
+        """Determines whether a column's annotation can be deferred until after pagination, i.e. whether it is a
+        correlated subquery (e.g. a many-related count, whose value is unaffected by the filters) that is not searched,
+        filtered, or sorted.
+
+        Args:
+            column (BSTBaseColumn)
+            filter_dict (Dict[str, str]): A dict of the active filters (see get_annotations).
+        Exceptions:
+            None
+        Returns:
+            (bool)
+        """
+        return (
+            isinstance(column, BSTAnnotColumn)
+            and column.correlated
+            and self.search_term is None
+            and column.name not in filter_dict.keys()
+            and column.name != self.sort_col.name
+        )
+
+    def get_page_annotations(self) -> Dict[str, Combinable]:
+        """Generates a dict of the annotations that are only evaluated for the records on the current page, after
+        pagination (see is_page_annotation and apply_page_annotations).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            page_annotations (Dict[str, Combinable]): A dict of Combinable objects keyed on annotation names.
+        """
+        page_annotations: Dict[str, Combinable] = {}
+        for column in self.columns.values():
+            if (
+                self.presubset_annots is None
+                or column.name not in self.presubset_annots.keys()
+            ) and self.is_page_annotation(column, self.filter_terms):
+                page_annotations[column.name] = column.expression
+        return page_annotations
+
+    def apply_page_annotations(self, object_list: QuerySet):
+        """Evaluates self.page_annots for the paginated records using a single query (keyed on primary key) and sets
+        the values as attributes of the records, as if they had been annotated on the queryset.
+
+        Args:
+            object_list (QuerySet): The current page's records.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        recs = list(object_list)
+        if len(recs) == 0:
+            return
+
+        qs = self.apply_annotations(
+            self.model.objects.filter(pk__in=[rec.pk for rec in recs]),
+            self.page_annots,
+        )
+        values = {row["pk"]: row for row in qs.values("pk", *self.page_annots.keys())}
+
+        for rec in recs:
+            for annot_name in self.page_annots.keys():
+                setattr(rec, annot_name, values.get(rec.pk, {}).get(annot_name))
+
     # TODO: Figure out a way to move this to BSTQueryView without it having to know about the client interface elements
     # like cookeis and filters.
     def apply_filters(self, qs: QuerySet) -> QuerySet:
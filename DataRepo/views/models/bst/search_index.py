@@ -0,0 +1,507 @@
+import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Type
+from warnings import warn
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import F, Model, OuterRef, Q, TextField
+from django.db.models.expressions import Combinable
+from django.db.models.functions import Cast
+
+from DataRepo.models.hier_cached_model import get_data_version, get_data_writes
+from DataRepo.models.search_document import SearchDocument
+from DataRepo.models.utilities import (
+    extract_field_paths_from_q,
+    field_path_to_model_path,
+    model_path_to_model,
+)
+from DataRepo.utils.exceptions import DeveloperWarning
+
+# The cache key prefix of the data versions that the search indexes were last refreshed at
+VERSION_KEY_PREFIX = "BSTSearchIndex.version"
+# The background search index refreshes of this process (see BSTSearchIndex.schedule_refresh)
+REFRESH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+REFRESH_FUTURES: Dict[str, Future] = {}
+REFRESH_LOCK = threading.Lock()
+
+
+class BSTSearchIndex:
+    """A denormalized search document (see SearchDocument) for every record of a BST list view's model, containing the
+    values of the view's searchable columns (including many-related and annotation columns), so that the list view's
+    global search is a single trigram-indexed substring lookup on the documents, joined back to the model by primary
+    key, instead of an icontains lookup (with joins and DISTINCT) on every searchable column.
+
+    The values are the database's text representations of the values that the columns' filterers search (i.e. what
+    icontains compares to), lower-cased.  The values of columns whose filterers match whole values (iexact, e.g. select
+    list columns) are in a separate (exact) document, where the search term must match a whole line.  Columns whose
+    filterers use any other lookup are not indexed and are searched using their filterers.
+
+    An index is current if it was refreshed at the current data version (see get_data_version), which changes after
+    loads, maintained field updates, and every committed save or delete of a record (e.g. in the admin interface).
+    Searches do not use indexes that are not current.  Refresh indexes using the
+    build_search_index management command or (in the web server processes) in the background (see
+    settings.SEARCH_INDEX_BACKGROUND_REFRESH).  A refresh after saves and deletes of records only recomputes the
+    documents of the records related to the written records (see get_data_writes), whereas a refresh after loads (or
+    other bulk changes) recomputes every document.
+
+    Usage:
+        Set search_index = True in a BSTListView.
+    """
+
+    DELIMITER = "\n"
+    REFRESH_CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        name: str,
+        model: Type[Model],
+        field_paths: List[str],
+        annotations: Dict[str, Combinable],
+        exact_field_paths: Optional[List[str]] = None,
+        exact_annotations: Optional[Dict[str, Combinable]] = None,
+        unindexed_filterers: Optional[list] = None,
+    ):
+        """Constructor.
+
+        Args:
+            name (str): The index name (the BST list view class name).
+            model (Type[Model]): The list view's model.
+            field_paths (List[str]): Field paths (from model) of the searchable field columns' icontains filterers.
+            annotations (Dict[str, Combinable]): Expressions of the searchable annotation columns with icontains
+                filterers, keyed on their names.
+            exact_field_paths (Optional[List[str]]) [[]]: Field paths (from model) of the searchable field columns'
+                iexact filterers.
+            exact_annotations (Optional[Dict[str, Combinable]]) [{}]: Expressions of the searchable annotation columns
+                with iexact filterers, keyed on their names.
+            unindexed_filterers (Optional[List[BSTBaseFilterer]]) [[]]: Filterers of the searchable columns with other
+                lookups, which the documents cannot match the same way.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        self.name = name
+        self.model = model
+        self.field_paths = field_paths
+        self.annotations = annotations
+        self.exact_field_paths = exact_field_paths if exact_field_paths else []
+        self.exact_annotations = exact_annotations if exact_annotations else {}
+        self.unindexed_filterers = unindexed_filterers if unindexed_filterers else []
+
+    @classmethod
+    def from_view(cls, view) -> "BSTSearchIndex":
+        """Creates the search index of a BSTListView instance from its searchable columns and its search_index_columns.
+
+        Args:
+            view (BSTListView)
+        Exceptions:
+            None
+        Returns:
+            (BSTSearchIndex)
+        """
+        # Field paths and annotations, keyed on the lookups that the documents can match
+        field_paths: Dict[str, List[str]] = {"icontains": [], "iexact": []}
+        annotations: Dict[str, Dict[str, Combinable]] = {"icontains": {}, "iexact": {}}
+        unindexed_filterers = []
+        for column in view.columns.values():
+            if not column.searchable and column.name not in view.search_index_columns:
+                continue
+            lookup = column.filterer.lookup
+            if lookup not in field_paths.keys():
+                unindexed_filterers.append(column.filterer)
+            elif column.filterer.is_annotation:
+                annotations[lookup][column.name] = column.converter
+            elif column.filterer.name not in field_paths[lookup]:
+                field_paths[lookup].append(column.filterer.name)
+        return cls(
+            type(view).__name__,
+            view.model,
+            field_paths["icontains"],
+            annotations["icontains"],
+            exact_field_paths=field_paths["iexact"],
+            exact_annotations=annotations["iexact"],
+            unindexed_filterers=unindexed_filterers,
+        )
+
+    @property
+    def signature(self) -> str:
+        """A digest of the index's definition, so that changes to a view's columns make its index stale."""
+        definition = repr(
+            (
+                self.model.__name__,
+                self.field_paths,
+                sorted(self.annotations.keys()),
+                self.exact_field_paths,
+                sorted(self.exact_annotations.keys()),
+            )
+        )
+        return hashlib.md5(definition.encode()).hexdigest()
+
+    @property
+    def version_key(self) -> str:
+        return f"{VERSION_KEY_PREFIX}.{self.name}.{self.signature}"
+
+    def is_current(self) -> bool:
+        """Returns whether the index was refreshed at the current data version."""
+        return cache.get(self.version_key) == get_data_version()
+
+    def create_q_exp(self, term: str) -> Q:
+        """Returns a Q expression that matches the model records whose searchable column values match the term the same
+        way as the columns' filterers, i.e. contain the term or (for iexact columns) equal the term (case insensitive).
+
+        Args:
+            term (str): The search term.
+        Exceptions:
+            None
+        Returns:
+            q_exp (Q)
+        """
+        q_exp = Q(
+            pk__in=SearchDocument.objects.filter(
+                Q(document__contains=term.lower())
+                | Q(
+                    exact_document__contains=(
+                        f"{self.DELIMITER}{term.lower()}{self.DELIMITER}"
+                    )
+                ),
+                index_name=self.name,
+            ).values("record_id")
+        )
+        for filterer in self.unindexed_filterers:
+            q_exp |= filterer.create_q_exp(term)
+        return q_exp
+
+    def get_documents(self, pks: List[int]) -> Dict[int, Tuple[str, str]]:
+        """Returns the search documents and exact search documents (see SearchDocument) of the supplied model records.
+
+        Args:
+            pks (List[int]): Primary keys of model records.
+        Exceptions:
+            None
+        Returns:
+            (Dict[int, Tuple[str, str]]): Search documents and exact search documents keyed on primary key.
+        """
+        values = self.get_values(pks, self.field_paths, self.annotations)
+        exact_values = self.get_values(
+            pks, self.exact_field_paths, self.exact_annotations
+        )
+        return {
+            pk: (
+                self.DELIMITER.join(sorted(values[pk])),
+                (
+                    self.DELIMITER.join([""] + sorted(exact_values[pk]) + [""])
+                    if len(exact_values[pk]) > 0
+                    else ""
+                ),
+            )
+            for pk in pks
+        }
+
+    def get_values(
+        self,
+        pks: List[int],
+        field_paths: List[str],
+        annotations: Dict[str, Combinable],
+    ) -> Dict[int, set]:
+        """Returns the distinct, lower-cased text values of the supplied field paths and annotations of the supplied
+        model records.
+
+        Every field path is retrieved using a separate query, so that many-related paths do not multiply each other's
+        rows.  Annotations are also retrieved using a separate query each, since aggregations are affected by joins.
+
+        Args:
+            pks (List[int]): Primary keys of model records.
+            field_paths (List[str]): Field paths from self.model.
+            annotations (Dict[str, Combinable]): Annotation expressions keyed on their names.
+        Exceptions:
+            None
+        Returns:
+            values (Dict[int, set]): Values keyed on primary key.
+        """
+        values: Dict[int, set] = {pk: set() for pk in pks}
+
+        qs = self.model.objects.filter(pk__in=pks)
+        for field_path in field_paths:
+            for pk, val in qs.values_list(
+                "pk", Cast(field_path, output_field=TextField())
+            ):
+                if val is not None:
+                    values[pk].add(val.lower())
+
+        for annot_name, expression in annotations.items():
+            try:
+                # A savepoint, so that a database error does not break an enclosing transaction
+                with transaction.atomic():
+                    rows = list(
+                        qs.annotate(**{annot_name: expression}).values_list(
+                            "pk", Cast(annot_name, output_field=TextField())
+                        )
+                    )
+            except Exception as e:
+                # The list view disables searching of annotation columns whose expression raises an exception too
+                if settings.DEBUG:
+                    warn(
+                        f"Annotation column '{annot_name}' excluded from search index '{self.name}'.  "
+                        f"{type(e).__name__}: {e}",
+                        DeveloperWarning,
+                    )
+                continue
+            for pk, val in rows:
+                if val is not None:
+                    values[pk].add(val.lower())
+
+        return values
+
+    def refresh(self, chunk_size: Optional[int] = None, full: bool = False) -> int:
+        """Creates, updates, and deletes search documents to match the current data, and marks the index as current.
+
+        Only the documents of the records affected by the records written since the last refresh are recomputed, if
+        they are known (see get_data_writes).  Otherwise, every document is recomputed.
+
+        Args:
+            chunk_size (Optional[int]) [REFRESH_CHUNK_SIZE]: The number of documents to compute at a time.
+            full (bool) [False]: Recompute every document.
+        Exceptions:
+            None
+        Returns:
+            changed (int): The number of created, updated, and deleted documents.
+        """
+        if chunk_size is None:
+            chunk_size = self.REFRESH_CHUNK_SIZE
+
+        # Data changes during the refresh will change the data version again, leaving the index stale
+        version = get_data_version()
+        changed = 0
+
+        last_version = cache.get(self.version_key)
+        writes = None
+        if last_version is not None and not full:
+            writes = get_data_writes(last_version, version)
+        written_pks = None if writes is None else self.get_written_pks(writes["pks"])
+
+        if writes is None or written_pks is None or writes["deleted"]:
+            # Records can be deleted without a signal (e.g. cascading bulk deletes of peak data)
+            deleted, _ = (
+                SearchDocument.objects.filter(index_name=self.name)
+                .exclude(record_id__in=self.model.objects.values("pk"))
+                .delete()
+            )
+            changed += deleted
+
+        if written_pks is None:
+            pks = list(self.model.objects.order_by("pk").values_list("pk", flat=True))
+        else:
+            existing_pks = set(
+                self.model.objects.filter(pk__in=written_pks).values_list(
+                    "pk", flat=True
+                )
+            )
+            deleted, _ = SearchDocument.objects.filter(
+                index_name=self.name, record_id__in=written_pks - existing_pks
+            ).delete()
+            changed += deleted
+            pks = sorted(existing_pks)
+
+        for start in range(0, len(pks), chunk_size):
+            changed += self.update_documents(pks[start : start + chunk_size])
+
+        cache.set(self.version_key, version, timeout=None)
+
+        return changed
+
+    def update_documents(self, pks: List[int]) -> int:
+        """Creates and updates the search documents of the supplied model records, if they changed.
+
+        Args:
+            pks (List[int]): Primary keys of existing model records.
+        Exceptions:
+            None
+        Returns:
+            (int): The number of created and updated documents.
+        """
+        documents = self.get_documents(pks)
+        existing = {
+            doc.record_id: doc
+            for doc in SearchDocument.objects.filter(
+                index_name=self.name, record_id__in=pks
+            )
+        }
+        creates = []
+        updates = []
+        for pk, (document, exact_document) in documents.items():
+            if pk not in existing.keys():
+                creates.append(
+                    SearchDocument(
+                        index_name=self.name,
+                        record_id=pk,
+                        document=document,
+                        exact_document=exact_document,
+                    )
+                )
+            elif (existing[pk].document, existing[pk].exact_document) != (
+                document,
+                exact_document,
+            ):
+                existing[pk].document = document
+                existing[pk].exact_document = exact_document
+                updates.append(existing[pk])
+        SearchDocument.objects.bulk_create(creates)
+        SearchDocument.objects.bulk_update(updates, ["document", "exact_document"])
+        return len(creates) + len(updates)
+
+    def get_written_pks(self, written: Dict[str, set]) -> Optional[set]:
+        """Returns the primary keys of the model records whose documents can be affected by the supplied written
+        records.
+
+        Args:
+            written (Dict[str, set]): Primary keys of written records keyed on model name (see get_data_writes).
+        Exceptions:
+            None
+        Returns:
+            pks (Optional[set]): None if the affected records cannot be determined.  The primary keys of deleted model
+                records are included.
+        """
+        relation_paths = self.get_relation_paths()
+        if relation_paths is None:
+            return None
+        pks = set(written.get(self.model.__name__, set()))
+        for model_name, model_pks in written.items():
+            for relation_path in relation_paths.get(model_name, []):
+                pks.update(
+                    self.model.objects.filter(
+                        **{f"{relation_path}__pk__in": model_pks}
+                    ).values_list("pk", flat=True)
+                )
+        return pks
+
+    def get_relation_paths(self) -> Optional[Dict[str, List[str]]]:
+        """Returns the paths from self.model to the related models whose values are in the documents (i.e. every
+        model along the searchable columns' field paths and the paths referenced by the annotations).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            relation_paths (Optional[Dict[str, List[str]]]): Relation paths keyed on model name.  None if the related
+                models cannot be determined (e.g. an annotation contains a subquery).
+        """
+        field_paths = self.field_paths + self.exact_field_paths
+        for expression in list(self.annotations.values()) + list(
+            self.exact_annotations.values()
+        ):
+            expression_paths = self.get_expression_paths(expression)
+            if expression_paths is None:
+                return None
+            field_paths.extend(expression_paths)
+
+        relation_paths: Dict[str, List[str]] = defaultdict(list)
+        for field_path in field_paths:
+            try:
+                path = field_path_to_model_path(self.model, field_path).split("__")
+                for depth in range(1, len(path) + 1):
+                    if path[0] == "":
+                        break
+                    relation_path = "__".join(path[:depth])
+                    model_name = model_path_to_model(self.model, relation_path).__name__
+                    if relation_path not in relation_paths[model_name]:
+                        relation_paths[model_name].append(relation_path)
+            except Exception:
+                return None
+        return relation_paths
+
+    @classmethod
+    def get_expression_paths(cls, expression) -> Optional[List[str]]:
+        """Returns the field paths that the supplied annotation expression references.
+
+        Args:
+            expression (Combinable)
+        Exceptions:
+            None
+        Returns:
+            field_paths (Optional[List[str]]): None if the expression references fields of other querysets (e.g. a
+                subquery).
+        """
+        if isinstance(expression, OuterRef) or hasattr(expression, "query"):
+            return None
+        if isinstance(expression, F):
+            return [expression.name]
+        if isinstance(expression, Q):
+            # E.g. an aggregate's filter
+            return extract_field_paths_from_q(expression)
+        field_paths: List[str] = []
+        if hasattr(expression, "get_source_expressions"):
+            for source_expression in expression.get_source_expressions():
+                source_paths = cls.get_expression_paths(source_expression)
+                if source_paths is None:
+                    return None
+                field_paths.extend(source_paths)
+        return field_paths
+
+    def schedule_refresh(self) -> Optional[Future]:
+        """Starts a background refresh of the index in this process, unless background refreshes are disabled (see
+        settings.SEARCH_INDEX_BACKGROUND_REFRESH) or a refresh of the index is already running.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (Optional[Future])
+        """
+        global REFRESH_EXECUTOR
+
+        if not settings.SEARCH_INDEX_BACKGROUND_REFRESH:
+            return None
+
+        with REFRESH_LOCK:
+            future = REFRESH_FUTURES.get(self.name)
+            if future is not None and not future.done():
+                return None
+            if REFRESH_EXECUTOR is None:
+                REFRESH_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="search_index_refresh"
+                )
+            future = REFRESH_EXECUTOR.submit(self.refresh_in_worker)
+            REFRESH_FUTURES[self.name] = future
+        return future
+
+    def refresh_in_worker(self) -> Optional[int]:
+        """Runs refresh in a worker thread, which must close the database connections it opens."""
+        try:
+            return self.refresh()
+        except Exception as e:
+            print(
+                f"WARNING: Search index '{self.name}' refresh failed: {type(e).__name__}: {e}"
+            )
+            return None
+        finally:
+            connections.close_all()
+
+
+def get_search_indexed_views() -> list:
+    """Returns every BSTListView class with a search index (see BSTSearchIndex).
+
+    Args:
+        None
+    Exceptions:
+        None
+    Returns:
+        (List[Type[BSTListView]])
+    """
+    # Import the views so that every BSTListView subclass is defined
+    import DataRepo.views  # noqa: F401  # pylint: disable=unused-import
+    from DataRepo.views.models.bst.query import BSTListView
+
+    views = []
+    subclasses = BSTListView.__subclasses__()
+    while len(subclasses) > 0:
+        view_class = subclasses.pop(0)
+        subclasses.extend(view_class.__subclasses__())
+        if view_class.search_index and view_class not in views:
+            views.append(view_class)
+    return views
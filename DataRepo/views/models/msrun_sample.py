@@ -12,6 +12,7 @@ class MSRunSampleDetailView(DetailView):
 
 class MSRunSampleListView(BSTListView):
     model = MSRunSample
+    search_index = True
     exclude = ["id", "peak_groups"]
     column_ordering = [
         "details",
@@ -4,6 +4,7 @@ from DataRepo.views.models.bst.query import BSTDetailView, BSTListView
 
 class PeakDataListView(BSTListView):
     model = PeakData
+    search_index = True
     paginate_by = 200
     column_settings = {
         "labels": {
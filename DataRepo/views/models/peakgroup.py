@@ -6,6 +6,7 @@ from DataRepo.views.models.bst.query import BSTListView
 
 class PeakGroupListView(BSTListView):
     model = PeakGroup
+    search_index = True
     exclude = ["id", "peak_data", "msrun_sample"]
     column_settings = {
         "name": {"header": "Peak Group"},
@@ -14,6 +14,7 @@ from DataRepo.views.models.bst.query import BSTListView
 
 class SampleListView(BSTListView):
     model = Sample
+    search_index = True
 
     # Column order
     column_ordering = [
@@ -10,6 +10,12 @@ from DataRepo.views.models.bst.query import BSTListView
 
 class StudyListView(BSTListView):
     model = Study
+    search_index = True
+    # The researcher columns are only searched when the search index is current
+    search_index_columns = [
+        "animals__samples__researcher",
+        "animals__samples__msrun_samples__msrun_sequence__researcher",
+    ]
     below_template = "models/study/below_table.html"
     exclude = ["id", "animals"]
     column_ordering = [
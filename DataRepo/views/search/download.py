@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime
 from typing import List, Optional, Tuple
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZipFile
 
 import _csv
 from django.conf import settings
@@ -24,6 +24,7 @@ from DataRepo.forms import AdvSearchDownloadForm, AdvSearchForm
 from DataRepo.models.msrun_sample import MSRunSample
 from DataRepo.models.peak_data import PeakData
 from DataRepo.models.peak_group import PeakGroup
+from DataRepo.profiling import profile_scope
 from DataRepo.utils.file_utils import date_to_string
 from DataRepo.views.search.advanced import AdvancedSearchView
 from DataRepo.views.utils import Echo, ZipBuffer
@@ -156,9 +157,10 @@ class AdvancedSearchDownloadView(FormView):
 
     @classmethod
     def tsv_template_iterator(cls, rowtmplt, headtmplt, res, qry, dt):
-        yield headtmplt.render({"qry": qry, "dt": dt})
-        for row in res:
-            yield rowtmplt.render({"qry": qry, "row": row})
+        with profile_scope("search_format", qry["selectedtemplate"]):
+            yield headtmplt.render({"qry": qry, "dt": dt})
+            for row in res:
+                yield rowtmplt.render({"qry": qry, "row": row})
 
 
 class RecordToMzxmlTSV(ABC):
@@ -603,9 +605,15 @@ class AdvancedSearchDownloadMzxmlZIPView(AdvancedSearchDownloadView):
             yield buffer.take()
             for file_tuple in self.converter.queryset_to_files_iterator(self.res):
                 export_path, file_obj = file_tuple
-                with file_obj.file.open("r") as fl:
-                    zipf.writestr(export_path, fl.read())
-                    yield buffer.take()
+                # Streamed in chunks (decompressed, if compressed in the archive), so that whole files are not read
+                # into memory
+                with file_obj.file.open("rb") as fl, zipf.open(
+                    export_path, "w", force_zip64=file_obj.size > ZIP64_LIMIT
+                ) as zipped_file:
+                    for chunk in fl.chunks():
+                        zipped_file.write(chunk)
+                        yield buffer.take()
+                yield buffer.take()
 
         yield buffer.end()
 
@@ -1,5 +1,8 @@
 from .submission import BuildSubmissionView
+from .validation_job import cancel_validation_job, validation_job_status
 
 __all__ = [
     "BuildSubmissionView",
+    "cancel_validation_job",
+    "validation_job_status",
 ]
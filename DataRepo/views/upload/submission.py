@@ -77,6 +77,7 @@ from DataRepo.utils.infusate_name_parser import (
     parse_tracer_string,
 )
 from DataRepo.utils.text_utils import autowrap
+from DataRepo.views.upload.validation_job import ValidationJob
 
 
 class BuildSubmissionView(FormView):
@@ -269,6 +270,8 @@ class BuildSubmissionView(FormView):
         self.peak_annot_files = None
         self.peak_annot_filenames = []
         self.annot_file_metadata = {}
+        # Called by the StudyLoader after each sheet is validated.  See ValidationJob.report_progress.
+        self.progress_callback = None
 
         # Data validation (e.g. dropdown menus) will be applied to the last fleshed row plus this offset
         self.validation_offset = 20
@@ -780,19 +783,6 @@ class BuildSubmissionView(FormView):
                     "date": rowform.get("run_date"),
                 }
 
-        self.load_status_data.clear_load()
-
-        self.set_files(
-            study_file,
-            study_filename=study_filename,
-            peak_annot_files=peak_annot_files,
-            peak_annot_filenames=peak_annot_filenames,
-        )
-
-        debug = f"sf: {self.study_file} num pafs: {len(self.peak_annot_files)}"
-
-        study_data = self.get_download_data()
-
         # Determine the page based on the mode submitted in the form (validate or autofill)
         # Example of cleaned_data:
         #   [
@@ -829,23 +819,129 @@ class BuildSubmissionView(FormView):
         # the initial value using the constructor method.
         form = form_class(initial={"mode": mode})
 
+        if mode == "validate" and settings.VALIDATION_MAX_WORKERS > 0:
+            # Validation can take longer than the GATEWAY_TIMEOUT, so it is run as a background job that the page polls
+            job = ValidationJob.submit(
+                study_file,
+                study_filename,
+                peak_annot_files,
+                peak_annot_filenames,
+                self.annot_file_metadata,
+            )
+            results_context = self.get_job_context(job)
+        else:
+            results_context = self.get_results_context(
+                study_file,
+                study_filename=study_filename,
+                peak_annot_files=peak_annot_files,
+                peak_annot_filenames=peak_annot_filenames,
+            )
+
         return self.render_to_response(
             self.get_context_data(
-                results=self.results,
-                debug=debug,
-                valid=self.valid,
-                state=self.state,
                 form=form,
                 page=page,
-                exceptions=self.exceptions,
                 submission_url=self.submission_url,
-                ordered_keys=self.ordered_keys,
-                study_data=study_data,
-                study_filename=self.output_study_filename,
-                quiet_mode=self.autofill_only_mode,
+                **results_context,
             ),
         )
 
+    def get(self, request, *args, **kwargs):
+        # A page polling a validation job reloads with the job ID once the job is finished, to display its results
+        job_id = request.GET.get("job")
+        if job_id is not None:
+            return self.render_to_response(
+                self.get_context_data(
+                    page="Validate",
+                    submission_url=self.submission_url,
+                    **self.get_job_context(ValidationJob(job_id)),
+                ),
+            )
+        return super().get(request, *args, **kwargs)
+
+    def get_results_context(
+        self,
+        study_file,
+        study_filename: Optional[str] = None,
+        peak_annot_files=None,
+        peak_annot_filenames=None,
+    ) -> dict:
+        """Processes the submitted files (see set_files and get_download_data) and returns the results, to be added to
+        the template context.
+
+        Args:
+            study_file (Optional[str]): Path to the study doc.
+            study_filename (Optional[str]): The study doc's name, as submitted.
+            peak_annot_files (Optional[List[str]]): Paths to the peak annotation files.
+            peak_annot_filenames (Optional[List[str]]): The peak annotation files' names, as submitted.
+        Exceptions:
+            None
+        Returns:
+            (dict): Template context values.  Note, these are saved as JSON by ValidationJob, so they must be JSON-
+                serializable.
+        """
+        self.load_status_data.clear_load()
+
+        self.set_files(
+            study_file,
+            study_filename=study_filename,
+            peak_annot_files=peak_annot_files,
+            peak_annot_filenames=peak_annot_filenames,
+        )
+
+        debug = f"sf: {self.study_file} num pafs: {len(self.peak_annot_files)}"
+
+        study_data = self.get_download_data()
+
+        return {
+            "results": self.results,
+            "debug": debug,
+            "valid": self.valid,
+            "state": self.state,
+            "exceptions": self.exceptions,
+            "ordered_keys": self.ordered_keys,
+            "study_data": study_data,
+            "study_filename": self.output_study_filename,
+            "quiet_mode": self.autofill_only_mode,
+        }
+
+    def get_job_context(self, job: ValidationJob) -> dict:
+        """Returns the template context values for a validation job: its results if it is done, otherwise its status
+        (so that the page can poll it).
+
+        Args:
+            job (ValidationJob)
+        Exceptions:
+            None
+        Returns:
+            (dict): Template context values.
+        """
+        status = job.get_status()
+        if status is None:
+            return {
+                "form_errors": [
+                    "The validation results have expired.  Please resubmit your files."
+                ],
+                "quiet_mode": self.autofill_only_mode,
+            }
+        if status["state"] == ValidationJob.DONE:
+            return status["result"]
+        if status["state"] == ValidationJob.FAILED:
+            return {
+                "form_errors": [f"Validation failed: {status.get('error')}"],
+                "quiet_mode": self.autofill_only_mode,
+            }
+        if status["state"] == ValidationJob.CANCELLED:
+            return {
+                "form_errors": ["Validation was cancelled."],
+                "quiet_mode": self.autofill_only_mode,
+            }
+        return {
+            "job_id": job.job_id,
+            "job_status": status,
+            "quiet_mode": self.autofill_only_mode,
+        }
+
     def form_invalid(self, formset):
         """
         Upon valid file submission, adds validation messages to the context of the validation page.
@@ -3383,6 +3479,7 @@ class BuildSubmissionView(FormView):
                 filename=self.study_filename,
                 _validate=True,
                 annot_files_dict=self.annot_files_dict,
+                progress_callback=self.progress_callback,
             )
             sl.load_data()
         except (
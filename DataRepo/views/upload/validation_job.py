@@ -0,0 +1,555 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.db import connections
+from django.http import Http404, HttpResponseNotAllowed, JsonResponse
+
+from DataRepo.loaders.base.table_loader import TableLoader
+from DataRepo.models.archive_file import ArchiveFile
+
+
+class ValidationJob:
+    """A submission validation run in a background worker thread, so that the validation of large peak annotation files
+    does not run into the web server's GATEWAY_TIMEOUT.
+
+    Each job has a directory (in VALIDATION_JOB_DIR) containing a copy of the submitted files and a JSON status file
+    (its state, progress, per-sheet partial results, and the final results), so that it can be polled (and cancelled)
+    from any web server process.  The status is not kept in the database (or the database cache), because validation
+    rolls back everything it writes to the database.  A running job also touches a heartbeat file, so that jobs whose
+    worker died (e.g. when the web server was restarted) are reported as FAILED instead of RUNNING forever.
+
+    The final results are also saved under a checksum of the submitted files (and their metadata), so that resubmitting
+    the same files returns the results immediately (for up to VALIDATION_RESULT_TIMEOUT seconds).  Note that the results
+    also depend on the database's contents, which is why they are not kept indefinitely.
+
+    Example:
+        job = ValidationJob.submit(study_file, study_filename, peak_annot_files, peak_annot_filenames, metadata)
+        status = job.get_status()  # poll until status["state"] in ValidationJob.FINISHED_STATES
+        context = status["result"]
+
+    Instance Attributes:
+        job_id (str)
+    """
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+    FINISHED_STATES = [DONE, FAILED, CANCELLED]
+
+    # Job IDs are generated by uuid4().hex.  Anything else (e.g. a path) is rejected.
+    JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+    # Seconds between the heartbeats of a running job, and after which a running job without a heartbeat is FAILED
+    HEARTBEAT_INTERVAL = 10
+    HEARTBEAT_TIMEOUT = 120
+
+    # Shared by every job in the web server process.  See get_executor.
+    executor: Optional[ThreadPoolExecutor] = None
+    executor_lock = threading.Lock()
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """Returns the worker thread pool, creating it upon first use.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (ThreadPoolExecutor)
+        """
+        with cls.executor_lock:
+            if cls.executor is None:
+                cls.executor = ThreadPoolExecutor(
+                    max_workers=settings.VALIDATION_MAX_WORKERS,
+                    thread_name_prefix="validation_job",
+                )
+        return cls.executor
+
+    @classmethod
+    def get_checksum(
+        cls,
+        study_file: Optional[str],
+        study_filename: Optional[str],
+        peak_annot_files: List[str],
+        peak_annot_filenames: List[str],
+        annot_file_metadata: dict,
+    ) -> str:
+        """Returns a sha1 checksum of the submitted files' contents, their names (which are reported in the results and
+        referenced by the study doc), and the peak annotation file metadata (which is autofilled in the study doc).
+
+        Args:
+            study_file (Optional[str]): Path to the study doc.
+            study_filename (Optional[str]): The study doc's name, as submitted.
+            peak_annot_files (List[str]): Paths to the peak annotation files.
+            peak_annot_filenames (List[str]): The peak annotation files' names, as submitted.
+            annot_file_metadata (dict): Metadata dicts keyed on peak annotation file name.
+        Exceptions:
+            None
+        Returns:
+            (str)
+        """
+        hash_obj = hashlib.sha1()
+        for path, name in [
+            (study_file, study_filename),
+            *zip(peak_annot_files, peak_annot_filenames),
+        ]:
+            hash_obj.update(str(name).encode())
+            if path is not None:
+                hash_obj.update(ArchiveFile.hash_file(Path(path)).encode())
+        for name in sorted(annot_file_metadata.keys()):
+            metadata = annot_file_metadata[name]
+            hash_obj.update(
+                str((name, sorted((k, str(v)) for k, v in metadata.items()))).encode()
+            )
+        return hash_obj.hexdigest()
+
+    @classmethod
+    def get_jobs_dir(cls) -> str:
+        return os.path.join(settings.VALIDATION_JOB_DIR, "jobs")
+
+    @classmethod
+    def get_results_dir(cls) -> str:
+        return os.path.join(settings.VALIDATION_JOB_DIR, "results")
+
+    @classmethod
+    def get_result_path(cls, checksum: str) -> str:
+        return os.path.join(cls.get_results_dir(), f"{checksum}.json")
+
+    @property
+    def job_dir(self) -> str:
+        return os.path.join(self.get_jobs_dir(), self.job_id)
+
+    @property
+    def status_path(self) -> str:
+        return os.path.join(self.job_dir, "status.json")
+
+    @property
+    def cancel_path(self) -> str:
+        return os.path.join(self.job_dir, "cancelled")
+
+    @property
+    def heartbeat_path(self) -> str:
+        return os.path.join(self.job_dir, "heartbeat")
+
+    @property
+    def files_dir(self) -> str:
+        return os.path.join(self.job_dir, "files")
+
+    @classmethod
+    def read_json(cls, path: str) -> Optional[dict]:
+        """Returns the contents of a JSON file, or None if it does not exist.
+
+        Args:
+            path (str)
+        Exceptions:
+            None
+        Returns:
+            (Optional[dict])
+        """
+        try:
+            with open(path) as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return None
+
+    @classmethod
+    def write_json(cls, path: str, data: dict):
+        """Writes a JSON file atomically (via a rename), so that it can be read from other processes at any time.
+
+        Args:
+            path (str)
+            data (dict)
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(data, fh)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise e
+
+    @classmethod
+    def remove_expired(cls):
+        """Deletes the job directories and saved results that are older than VALIDATION_RESULT_TIMEOUT seconds.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        expiry = time.time() - settings.VALIDATION_RESULT_TIMEOUT
+        for parent_dir in [cls.get_jobs_dir(), cls.get_results_dir()]:
+            if not os.path.isdir(parent_dir):
+                continue
+            for entry in os.scandir(parent_dir):
+                if entry.stat().st_mtime >= expiry:
+                    continue
+                if entry.is_dir():
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    os.remove(entry.path)
+
+    @classmethod
+    def submit(
+        cls,
+        study_file: Optional[str],
+        study_filename: Optional[str],
+        peak_annot_files: List[str],
+        peak_annot_filenames: List[str],
+        annot_file_metadata: dict,
+    ):
+        """Creates a validation job for the submitted files and queues it in the worker thread pool, unless the results
+        of an identical submission were saved, in which case the job is created already DONE.
+
+        The submitted files are copied into the job directory, because the web server deletes uploaded files at the end
+        of the request.
+
+        Args:
+            study_file (Optional[str]): Path to the study doc.
+            study_filename (Optional[str]): The study doc's name, as submitted.
+            peak_annot_files (List[str]): Paths to the peak annotation files.
+            peak_annot_filenames (List[str]): The peak annotation files' names, as submitted.
+            annot_file_metadata (dict): Metadata dicts keyed on peak annotation file name.
+        Exceptions:
+            None
+        Returns:
+            job (ValidationJob)
+        """
+        cls.remove_expired()
+
+        checksum = cls.get_checksum(
+            study_file,
+            study_filename,
+            peak_annot_files,
+            peak_annot_filenames,
+            annot_file_metadata,
+        )
+        job = cls(uuid4().hex)
+
+        result = cls.read_json(cls.get_result_path(checksum))
+        if result is not None:
+            job.set_status(
+                {
+                    "state": cls.DONE,
+                    "checksum": checksum,
+                    "cached": True,
+                    "result": result,
+                }
+            )
+            return job
+
+        job_study_file = None
+        if study_file is not None:
+            job_study_file = job.copy_file(study_file, "study")
+        job_peak_annot_files = [
+            job.copy_file(f, f"peak_annotation_{i}")
+            for i, f in enumerate(peak_annot_files)
+        ]
+
+        job.set_status(
+            {
+                "state": cls.QUEUED,
+                "checksum": checksum,
+                "cached": False,
+                "num_loaded": 0,
+                "num_sheets": None,
+                "sheets": {},
+            }
+        )
+        cls.get_executor().submit(
+            job.run_in_worker,
+            job_study_file,
+            study_filename,
+            job_peak_annot_files,
+            peak_annot_filenames,
+            annot_file_metadata,
+        )
+
+        return job
+
+    def copy_file(self, path: str, name: str) -> str:
+        """Copies a submitted file into the job directory, retaining its extension (which is used to determine the file
+        type).
+
+        Args:
+            path (str)
+            name (str): The base name of the copy.
+        Exceptions:
+            None
+        Returns:
+            (str): The path of the copy.
+        """
+        os.makedirs(self.files_dir, exist_ok=True)
+        _, ext = os.path.splitext(path)
+        job_path = os.path.join(self.files_dir, f"{name}{ext}")
+        shutil.copyfile(path, job_path)
+        return job_path
+
+    def get_status(self) -> Optional[dict]:
+        """Returns the job's status dict, or None if the job does not exist (or has expired).  A RUNNING job whose
+        heartbeat stopped (see is_alive) is reported as FAILED.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (Optional[dict])
+        """
+        status = self.read_status()
+        if (
+            status is not None
+            and status.get("state") == self.RUNNING
+            and not self.is_alive()
+        ):
+            status.update(
+                state=self.FAILED,
+                error=(
+                    "The validation stopped unexpectedly (e.g. because the web server was restarted).  Please "
+                    "resubmit your files."
+                ),
+            )
+        return status
+
+    def read_status(self) -> Optional[dict]:
+        """Returns the job's status dict as recorded by the job, or None if the job does not exist (or has expired).
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (Optional[dict])
+        """
+        if not self.JOB_ID_PATTERN.fullmatch(self.job_id):
+            return None
+        return self.read_json(self.status_path)
+
+    def set_status(self, status: dict):
+        self.write_json(self.status_path, status)
+
+    def update_status(self, **kwargs):
+        status = self.read_status() or {}
+        status.update(kwargs)
+        self.set_status(status)
+
+    def beat(self):
+        Path(self.heartbeat_path).touch()
+
+    def is_alive(self) -> bool:
+        """Returns whether the job's worker recorded a heartbeat within the last HEARTBEAT_TIMEOUT seconds.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (bool)
+        """
+        try:
+            last_beat = os.path.getmtime(self.heartbeat_path)
+        except FileNotFoundError:
+            return False
+        return time.time() - last_beat < self.HEARTBEAT_TIMEOUT
+
+    def cancel(self) -> bool:
+        """Requests cancellation of the job.  The job stops after the sheet that is currently being validated.
+
+        Args:
+            None
+        Exceptions:
+            None
+        Returns:
+            (bool): Whether the job was still unfinished.
+        """
+        status = self.get_status()
+        if status is None or status["state"] in self.FINISHED_STATES:
+            return False
+        Path(self.cancel_path).touch()
+        return True
+
+    def is_cancelled(self) -> bool:
+        return os.path.exists(self.cancel_path)
+
+    def report_progress(
+        self, loader: TableLoader, num_loaded: int, num_sheets: int
+    ) -> bool:
+        """StudyLoader progress_callback that records the partial results of each validated sheet.
+
+        Args:
+            loader (TableLoader): The loader of the sheet that was just validated.
+            num_loaded (int)
+            num_sheets (int)
+        Exceptions:
+            None
+        Returns:
+            (bool): False if the job was cancelled (to stop the validation).
+        """
+        status = self.read_status() or {"sheets": {}}
+        aes = loader.aggregated_errors_object
+        status["sheets"][loader.DataSheetName] = {
+            "errors": aes.num_errors,
+            "warnings": aes.num_warnings,
+        }
+        status["num_loaded"] = num_loaded
+        status["num_sheets"] = num_sheets
+        self.set_status(status)
+        return not self.is_cancelled()
+
+    def run(
+        self,
+        study_file: Optional[str],
+        study_filename: Optional[str],
+        peak_annot_files: List[str],
+        peak_annot_filenames: List[str],
+        annot_file_metadata: dict,
+    ):
+        """Validates the files and saves the results in the job status and under the submission's checksum.
+
+        Args:
+            study_file (Optional[str]): Path to the study doc.
+            study_filename (Optional[str]): The study doc's name, as submitted.
+            peak_annot_files (List[str]): Paths to the peak annotation files.
+            peak_annot_filenames (List[str]): The peak annotation files' names, as submitted.
+            annot_file_metadata (dict): Metadata dicts keyed on peak annotation file name.
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        # This avoids circular import
+        from DataRepo.views.upload.submission import BuildSubmissionView
+
+        if self.is_cancelled():
+            self.update_status(state=self.CANCELLED)
+            return
+
+        self.update_status(state=self.RUNNING, started=time.time())
+
+        try:
+            view = BuildSubmissionView()
+            view.annot_file_metadata = annot_file_metadata
+            view.progress_callback = self.report_progress
+            result = view.get_results_context(
+                study_file,
+                study_filename=study_filename,
+                peak_annot_files=peak_annot_files,
+                peak_annot_filenames=peak_annot_filenames,
+            )
+        except Exception as e:
+            self.update_status(state=self.FAILED, error=f"{type(e).__name__}: {e}")
+            return
+
+        if self.is_cancelled():
+            self.update_status(state=self.CANCELLED)
+            return
+
+        try:
+            status = self.read_status() or {}
+            if "checksum" in status.keys():
+                self.write_json(self.get_result_path(status["checksum"]), result)
+            self.update_status(state=self.DONE, result=result)
+        except Exception as e:
+            # E.g. a full disk or results that cannot be serialized
+            self.update_status(state=self.FAILED, error=f"{type(e).__name__}: {e}")
+
+    def run_in_worker(self, *args):
+        """Runs the job in a worker thread (while a heartbeat thread touches the heartbeat file every HEARTBEAT_INTERVAL
+        seconds), then deletes the copies of the submitted files and closes the thread's database connections.
+
+        Args:
+            args (list): See run().
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        # The first heartbeat precedes the RUNNING state, so that the job is never reported as having died before it
+        # started
+        self.beat()
+        stopped = threading.Event()
+        heartbeat = threading.Thread(
+            target=self.beat_until,
+            args=(stopped,),
+            name="validation_job_heartbeat",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            self.run(*args)
+        finally:
+            stopped.set()
+            heartbeat.join()
+            shutil.rmtree(self.files_dir, ignore_errors=True)
+            connections.close_all()
+
+    def beat_until(self, stopped: threading.Event):
+        """Touches the heartbeat file every HEARTBEAT_INTERVAL seconds until stopped is set.
+
+        Args:
+            stopped (threading.Event)
+        Exceptions:
+            None
+        Returns:
+            None
+        """
+        while not stopped.wait(self.HEARTBEAT_INTERVAL):
+            try:
+                self.beat()
+            except OSError as e:
+                print(f"WARNING: Validation job {self.job_id} heartbeat failed: {e}")
+
+
+def validation_job_status(request, job_id):
+    """Returns the status of a validation job (without its final results) as JSON, for polling."""
+    if settings.READONLY:
+        raise PermissionDenied
+    status = ValidationJob(job_id).get_status()
+    if status is None:
+        raise Http404(f"Validation job {job_id} does not exist.")
+    return JsonResponse(
+        {
+            "id": job_id,
+            **{k: v for k, v in status.items() if k != "result"},
+        }
+    )
+
+
+def cancel_validation_job(request, job_id):
+    """Requests the cancellation of a validation job and returns its status as JSON."""
+    if settings.READONLY:
+        raise PermissionDenied
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+    job = ValidationJob(job_id)
+    if job.get_status() is None:
+        raise Http404(f"Validation job {job_id} does not exist.")
+    job.cancel()
+    return validation_job_status(request, job_id)
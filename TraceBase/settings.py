@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Dict
 
@@ -49,6 +50,79 @@ READONLY = env.bool("READONLY", default=False)
 # Web Server timout in seconds
 GATEWAY_TIMEOUT = env.int("GATEWAY_TIMEOUT", default=60)
 
+# The maximum number of worker threads a study load uses to read peak annotation files while the study doc's sheets are
+# being loaded.  Set to 1 to read them one at a time, as they are loaded.
+LOAD_MAX_WORKERS = env.int("LOAD_MAX_WORKERS", default=4)
+
+# Whether loads insert the bulk of the peak data (i.e. the PeakData and PeakDataLabel records of new peak groups) via
+# temporary staging tables and a single set-based merge, instead of one record at a time.
+LOAD_STAGED_INSERTS = env.bool("LOAD_STAGED_INSERTS", default=True)
+
+# The maximum number of worker threads (per web server process) that run submission validation jobs in the background,
+# so that validation is not limited by the GATEWAY_TIMEOUT.  Set to 0 to validate within the request.
+VALIDATION_MAX_WORKERS = env.int("VALIDATION_MAX_WORKERS", default=2)
+
+# The number of seconds that validation job statuses and results are kept.  Resubmitting identical files within this
+# time returns the cached results.
+VALIDATION_RESULT_TIMEOUT = env.int("VALIDATION_RESULT_TIMEOUT", default=3600)
+
+# Where validation jobs keep the submitted files and their statuses.  It must be shared by every web server process.
+VALIDATION_JOB_DIR = env.str(
+    "VALIDATION_JOB_DIR",
+    default=os.path.join(tempfile.gettempdir(), "tracebase_validation_jobs"),
+)
+
+# Whether web requests are read-only with respect to maintained fields (see MaintainedModel).  Instead of updating empty
+# maintained fields while query results are iterated over (and after saves), records are queued for repair by the
+# repair_maintained_fields management command, which must then be run periodically (e.g. by cron).  Off by default, so
+# that deployments without that scheduled command keep updating maintained fields lazily.
+MAINTAINED_FIELDS_READONLY_REQUESTS = env.bool(
+    "MAINTAINED_FIELDS_READONLY_REQUESTS", default=False
+)
+
+# The number of cached function accesses (per web server process) after which the access counts (used to prioritize
+# cache warmups) are added to the access statistics in the cache.
+CACHE_ACCESS_STATS_FLUSH_INTERVAL = env.int(
+    "CACHE_ACCESS_STATS_FLUSH_INTERVAL", default=100
+)
+
+# The maximum number of seconds a background cache warmup (of the most accessed cached functions and studies) runs
+# before yielding.  Warmups are rescheduled (upon access statistics flushes) until the cache is warm.  Set to 0 to
+# disable background warmups.
+CACHE_WARMUP_BUDGET = env.int("CACHE_WARMUP_BUDGET", default=0)
+
+# Whether the BST list views' search indexes (which are not used by searches after data changes until they have been
+# refreshed) are refreshed by a background thread in the web server process upon the first search after a change.  See
+# the build_search_index management command.
+SEARCH_INDEX_BACKGROUND_REFRESH = env.bool(
+    "SEARCH_INDEX_BACKGROUND_REFRESH", default=False
+)
+
+# Whether every request's database query counts and times, cached function hits and misses, and render times are
+# profiled per BST column, advanced search format, and loader phase (see DataRepo.profiling).  Add the URL parameter
+# "profile=json" to a page's URL to get its profile as JSON.
+REQUEST_PROFILING = env.bool("REQUEST_PROFILING", default=False)
+
+# Whether the rendered pages of the BST list and detail views are cached (keyed on the view, its cookies, the URL
+# parameters, the user, and the data version, which changes after loads) and revalidated by browsers using ETags.
+BST_PAGE_CACHE = env.bool("BST_PAGE_CACHE", default=False)
+
+# Whether the checksums of archived files (see ArchiveFile.scan_file) are cached, keyed on the file's path, size, and
+# modification time, so that files that are validated and loaded (or loaded repeatedly) are not re-hashed.
+ARCHIVE_CHECKSUM_CACHE = env.bool("ARCHIVE_CHECKSUM_CACHE", default=False)
+
+# Whether newly archived files are stored by checksum (see DataRepo.storage.ArchiveStorage), so that each distinct file
+# is stored once and re-archiving an identical file skips the copy.
+ARCHIVE_CONTENT_ADDRESSED = env.bool("ARCHIVE_CONTENT_ADDRESSED", default=False)
+
+# The minimum size (in bytes) of content-addressed archive files that are stored gzip compressed.  0 disables
+# compression.
+ARCHIVE_COMPRESS_MIN_SIZE = env.int("ARCHIVE_COMPRESS_MIN_SIZE", default=0)
+
+# Whether content-addressed mzXML archive files are stored compressed (regardless of ARCHIVE_COMPRESS_MIN_SIZE), in
+# independently compressed blocks that allow random access reads (see DataRepo.storage.BlockedGzipWriter).
+ARCHIVE_COMPRESS_MZXML = env.bool("ARCHIVE_COMPRESS_MZXML", default=False)
+
 ALLOWED_HOSTS = env.list("ALLOWED_HOSTS", default=["localhost", "127.0.0.1"])
 
 # Application definition
@@ -76,6 +150,9 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "DataRepo.middleware.RequestProfilingMiddleware",
+    "DataRepo.middleware.ReadOnlyMaintainedFieldsMiddleware",
+    "DataRepo.middleware.NamespaceStampsMiddleware",
 ]
 
 ROOT_URLCONF = "TraceBase.urls"
@@ -197,15 +274,15 @@ TEST_MEDIA_ROOT = env.str(
 )
 
 DEFAULT_STORAGES = {
-    # Django defaults:
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "DataRepo.storage.ArchiveStorage",
     },
+    # Django default:
     "staticfiles": {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
     },
     "production": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "DataRepo.storage.ArchiveStorage",
     },
 }
 TEST_STORAGES = {
@@ -218,7 +295,7 @@ TEST_STORAGES = {
 }
 TEST_FILE_STORAGES = {
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "DataRepo.storage.ArchiveStorage",
     },
     "staticfiles": {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
@@ -315,6 +392,9 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "DataRepo.middleware.RequestProfilingMiddleware",
+    "DataRepo.middleware.ReadOnlyMaintainedFieldsMiddleware",
+    "DataRepo.middleware.NamespaceStampsMiddleware",
 ]
 
 # See: django-debug-toolbar.readthedocs.io/en/latest/installation.html#disable-the-toolbar-when-running-tests-optional
@@ -356,6 +436,10 @@ if DEBUG_TOOLBAR is True:
         # See https://django-debug-toolbar.readthedocs.io/en/latest/installation.html#add-the-middleware
         MIDDLEWARE.insert(0, "debug_toolbar.middleware.DebugToolbarMiddleware")
         INTERNAL_IPS = ALLOWED_HOSTS[:]
+        # Add the request profile panel (see DataRepo.profiling) to the default panels
+        from debug_toolbar.settings import PANELS_DEFAULTS
+
+        DEBUG_TOOLBAR_PANELS = PANELS_DEFAULTS + ["DataRepo.panels.RequestProfilePanel"]
         # Override the debug toolbar's logic to decide whether to run or not (we're using the conditional logic above)
         DEBUG_TOOLBAR_CONFIG = {
             "SHOW_TOOLBAR_CALLBACK": lambda _: True,
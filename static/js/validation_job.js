@@ -0,0 +1,61 @@
+/*
+ * Polls the status of a background validation job, displaying its progress and the per-sheet partial results, and
+ * reloads the page with the job ID (to display the final results) once the job is finished.
+ *
+ * Example usage:
+ *      initValidationJob(statusUrl, cancelUrl, resultsUrl, document.getElementById('validation-job'))
+ */
+const finishedJobStates = ['DONE', 'FAILED', 'CANCELLED']
+const jobPollInterval = 2000
+
+function initValidationJob (statusUrl, cancelUrl, resultsUrl, jobElem) { // eslint-disable-line no-unused-vars
+  const cancelButton = jobElem.querySelector('.validation-job-cancel')
+  cancelButton.addEventListener('click', function () {
+    cancelButton.disabled = true
+    fetch(cancelUrl, {
+      method: 'POST',
+      headers: { 'X-CSRFToken': jobElem.querySelector('[name=csrfmiddlewaretoken]').value }
+    })
+  })
+  pollValidationJob(statusUrl, resultsUrl, jobElem)
+}
+
+function pollValidationJob (statusUrl, resultsUrl, jobElem) {
+  fetch(statusUrl)
+    .then(function (response) {
+      if (!response.ok) {
+        // The job no longer exists.  The results page will report it.
+        window.location.href = resultsUrl
+        return null
+      }
+      return response.json()
+    })
+    .then(function (status) {
+      if (status === null) {
+        return
+      }
+      if (finishedJobStates.includes(status.state)) {
+        window.location.href = resultsUrl
+        return
+      }
+      displayValidationJobStatus(status, jobElem)
+      setTimeout(pollValidationJob, jobPollInterval, statusUrl, resultsUrl, jobElem)
+    })
+}
+
+function displayValidationJobStatus (status, jobElem) {
+  const progressElem = jobElem.querySelector('.validation-job-progress')
+  if (status.num_sheets) {
+    progressElem.innerHTML = status.num_loaded + ' of ' + status.num_sheets + ' sheets validated'
+  } else {
+    progressElem.innerHTML = status.state === 'QUEUED' ? 'Waiting to start...' : 'Reading files...'
+  }
+
+  const sheetsElem = jobElem.querySelector('.validation-job-sheets')
+  sheetsElem.innerHTML = ''
+  for (const [sheet, counts] of Object.entries(status.sheets)) {
+    const item = document.createElement('li')
+    item.textContent = sheet + ': ' + counts.errors + ' errors, ' + counts.warnings + ' warnings'
+    sheetsElem.appendChild(item)
+  }
+}